@@ -0,0 +1,179 @@
+"""A local stand-in for the API and payloads of a realistic size.
+
+Run the benchmarks with `make benchmark` or `pytest benchmarks`.
+Besides the table of pytest-benchmark, the latency percentiles
+and the throughput of each benchmark are printed at the end.
+"""
+
+from __future__ import annotations
+
+import base64
+import statistics
+from typing import Callable, TypeVar
+
+import pytest
+
+import click_and_drop_api
+from click_and_drop_api.mock_server import (
+    API_KEY,
+    MockRequest,
+    MockResponse,
+    MockServer,
+    new_order,
+    order_details,
+    order_info,
+    pages,
+)
+from click_and_drop_api.models import CreateOrdersRequest
+from click_and_drop_api.simple import ClickAndDrop, CreateOrder
+
+T = TypeVar("T")
+
+ORDERS = 1000
+"""The number of orders on the server."""
+
+LABEL = b"%PDF-1.4\n" + bytes(range(256)) * 4096 * 5
+"""A label PDF of about 5 MB as returned for 100 orders."""
+
+MANIFEST = base64.b64encode(LABEL[: 1024 * 1024]).decode()
+"""A manifest PDF of 1 MB, base64 encoded."""
+
+RESULTS: list[tuple[str, list[float], int]] = []
+"""The name, durations and number of items of each benchmark."""
+
+
+def order_with_packages(reference: str) -> CreateOrder:
+    """An order with a package of three items."""
+    order = new_order(reference).to_dict()
+    order["packages"] = [
+        {
+            "weightInGrams": 750,
+            "packageFormatIdentifier": "smallParcel",
+            "contents": [
+                {
+                    "name": f"Item {i}",
+                    "SKU": f"SKU-{i}",
+                    "quantity": 1,
+                    "unitValue": 9.99,
+                    "unitWeightInGrams": 250,
+                }
+                for i in range(3)
+            ],
+        }
+    ]
+    return CreateOrder.from_dict(order)
+
+
+def create_orders_request(count: int) -> CreateOrdersRequest:
+    """A request to create count orders."""
+    return CreateOrdersRequest(
+        items=[order_with_packages(f"ref-{i}") for i in range(count)]
+    )
+
+
+def create_orders(request: MockRequest) -> MockResponse:
+    """Create the orders of a request."""
+    items = request.json()["items"]
+    return {
+        "successCount": len(items),
+        "errorsCount": 0,
+        "createdOrders": [
+            {
+                "orderIdentifier": i,
+                "orderReference": item["orderReference"],
+                "createdOn": "2026-01-01T12:00:00Z",
+                "trackingNumber": f"TT{i:09}GB",
+            }
+            for i, item in enumerate(items)
+        ],
+        "failedOrders": [],
+    }
+
+
+def get_orders(request: MockRequest) -> MockResponse:
+    """Return the orders of the identifiers in the path."""
+    return [order_info(int(i)) for i in request.match.group(1).split(";")]
+
+
+def serve_api(server: MockServer) -> None:
+    """Emulate the endpoints of the API that carry most data."""
+    server.route("POST", "/orders", create_orders)
+    server.route("GET", "/orders/([^/]+)", get_orders)
+    server.route(
+        "GET", "/orders/full", pages([order_details(i) for i in range(ORDERS)])
+    )
+    server.route("GET", "/orders/([^/]+)/label", body=LABEL)
+    server.route(
+        "POST",
+        "/manifests",
+        status=201,
+        body={"manifestNumber": 1, "documentPdf": MANIFEST},
+    )
+
+
+@pytest.fixture(scope="session")
+def server():
+    """A local server that emulates the API."""
+    server = MockServer()
+    serve_api(server)
+    server.start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture(autouse=True)
+def forget_requests(server: MockServer):
+    """Do not keep the requests of one benchmark in memory for the next."""
+    yield
+    server.requests.clear()
+
+
+@pytest.fixture(scope="session")
+def api(server: MockServer) -> ClickAndDrop:
+    """A ClickAndDrop API talking to the local server."""
+    return ClickAndDrop(API_KEY, host=server.host)
+
+
+@pytest.fixture(scope="session")
+def manifests_api(server: MockServer) -> click_and_drop_api.ManifestsApi:
+    """The generated manifests API talking to the local server."""
+    configuration = click_and_drop_api.Configuration(host=server.host)
+    configuration.api_key["Bearer"] = API_KEY
+    return click_and_drop_api.ManifestsApi(click_and_drop_api.ApiClient(configuration))
+
+
+@pytest.fixture
+def measure(benchmark, request) -> Callable[..., T]:
+    """Benchmark a function and record its latency and throughput.
+
+    Call measure(function, items=n) with the number of items,
+    e.g. orders, that the function handles.
+    """
+
+    def measure(function: Callable[[], T], items: int = 1) -> T:
+        result = benchmark(function)
+        if benchmark.stats is not None:  # None with --benchmark-disable
+            RESULTS.append((request.node.name, benchmark.stats.stats.data, items))
+        return result
+
+    return measure
+
+
+def pytest_terminal_summary(terminalreporter):
+    """Print the latency percentiles and the throughput."""
+    if not RESULTS:
+        return
+    terminalreporter.section("latency and throughput")
+    terminalreporter.write_line(
+        f"{'Name':<50} {'p50 (ms)':>10} {'p99 (ms)':>10} {'items/s':>12}"
+    )
+    for name, durations, items in RESULTS:
+        if len(durations) > 1:
+            percentiles = statistics.quantiles(durations, n=100, method="inclusive")
+            p50, p99 = percentiles[49], percentiles[98]
+        else:
+            p50 = p99 = durations[0]
+        throughput = items / statistics.mean(durations)
+        terminalreporter.write_line(
+            f"{name:<50} {p50 * 1000:>10.2f} {p99 * 1000:>10.2f} {throughput:>12.0f}"
+        )
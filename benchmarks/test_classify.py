@@ -0,0 +1,59 @@
+"""Choose the package size of 10,000 parcels by weight and dimensions.
+
+Run with: pytest benchmarks/test_classify.py
+"""
+
+import random
+
+import pytest
+
+from click_and_drop_api.simple import classify_package_sizes, package_sizes
+
+PARCELS = 10_000
+
+random.seed(0)
+WEIGHTS = [random.randint(1, 30000) for _ in range(PARCELS)]
+DIMENSIONS = [tuple(random.randint(1, 700) for _ in range(3)) for _ in range(PARCELS)]
+
+
+def choose_one_by_one():
+    """Check each package size for each parcel, the path without a classifier."""
+    return [
+        next(
+            (
+                size.code
+                for size in package_sizes.packages_sizes
+                if size.weight_can_be_shipped(weight)
+                and size.dimensions_can_be_shipped(*dimensions)
+            ),
+            None,
+        )
+        for weight, dimensions in zip(WEIGHTS, DIMENSIONS)
+    ]
+
+
+@pytest.mark.benchmark(group="classify 10,000 parcels")
+def test_one_by_one(measure):
+    measure(choose_one_by_one, items=PARCELS)
+
+
+@pytest.mark.benchmark(group="classify 10,000 parcels")
+def test_classify_python(measure, monkeypatch):
+    monkeypatch.setattr(package_sizes, "NUMPY_MIN_PARCELS", float("inf"))
+    codes = measure(lambda: classify_package_sizes(WEIGHTS, DIMENSIONS), items=PARCELS)
+    assert codes == choose_one_by_one()
+
+
+@pytest.mark.benchmark(group="classify 10,000 parcels")
+def test_classify_numpy(measure):
+    pytest.importorskip("numpy")
+    codes = measure(lambda: classify_package_sizes(WEIGHTS, DIMENSIONS), items=PARCELS)
+    assert codes == choose_one_by_one()
+
+
+@pytest.mark.benchmark(group="classify 10,000 parcels")
+def test_classify_numpy_arrays(measure):
+    numpy = pytest.importorskip("numpy")
+    weights, dimensions = numpy.array(WEIGHTS), numpy.array(DIMENSIONS)
+    codes = measure(lambda: classify_package_sizes(weights, dimensions), items=PARCELS)
+    assert codes == choose_one_by_one()
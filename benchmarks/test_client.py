@@ -0,0 +1,59 @@
+"""Measure the client against the local stand-in for the API.
+
+The times include the HTTP round trips to the local server
+but no network latency or rate limit.
+"""
+
+import io
+
+import pytest
+
+from .conftest import ORDERS, create_orders_request
+
+
+@pytest.mark.parametrize("count", [100, 500])
+@pytest.mark.benchmark(group="create_orders")
+def test_create_orders(measure, api, count):
+    orders = create_orders_request(count).items
+    response = measure(lambda: api.create_orders(orders), items=count)
+    assert response.success_count == count
+
+
+@pytest.mark.parametrize("count", [100, ORDERS])
+@pytest.mark.benchmark(group="get_orders")
+def test_get_orders(measure, api, count):
+    ids = list(range(count))
+    orders = measure(lambda: api.get_orders(ids), items=count)
+    assert len(orders) == count
+
+
+@pytest.mark.parametrize("prefetch", [False, True])
+@pytest.mark.benchmark(group="iter_orders_with_details")
+def test_iter_orders_with_details(measure, api, prefetch):
+    orders = measure(
+        lambda: list(api.iter_orders_with_details(page_size=100, prefetch=prefetch)),
+        items=ORDERS,
+    )
+    assert len(orders) == ORDERS
+
+
+@pytest.mark.benchmark(group="label")
+def test_get_label(measure, api):
+    label = measure(lambda: api.get_label(list(range(100)), "postageLabel", False))
+    assert label.startswith(b"%PDF")
+
+
+@pytest.mark.benchmark(group="label")
+def test_get_label_to(measure, api):
+    def download():
+        file = io.BytesIO()
+        api.get_label_to(file, list(range(100)), "postageLabel", False)
+        return file
+
+    assert measure(download).getvalue().startswith(b"%PDF")
+
+
+@pytest.mark.benchmark(group="manifest")
+def test_manifest_eligible(measure, manifests_api):
+    response = measure(manifests_api.manifest_eligible_async)
+    assert response.manifest_number == 1
@@ -0,0 +1,33 @@
+"""Create an API object per request, as web request handlers often do.
+
+Run with: pytest benchmarks/test_connection_pool.py
+"""
+
+import pytest
+
+from click_and_drop_api.mock_server import API_KEY
+from click_and_drop_api.simple import (
+    ClickAndDrop,
+    close_shared_connection_pools,
+    shared_connection_pool,
+)
+
+
+@pytest.fixture
+def shared_pool(server):
+    yield shared_connection_pool(API_KEY, server.host, prewarm=1)
+    close_shared_connection_pools()
+
+
+@pytest.mark.benchmark(group="new API object per request")
+def test_new_connections(measure, server):
+    measure(lambda: ClickAndDrop(API_KEY, host=server.host).get_orders([1]))
+
+
+@pytest.mark.benchmark(group="new API object per request")
+def test_shared_connection_pool(measure, server, shared_pool):
+    measure(
+        lambda: ClickAndDrop(
+            API_KEY, host=server.host, connection_pool=shared_pool
+        ).get_orders([1])
+    )
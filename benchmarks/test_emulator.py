@@ -0,0 +1,53 @@
+"""Run a shipping pipeline against the emulator, e.g. to load test it.
+
+Run with: pytest benchmarks/test_emulator.py
+"""
+
+import itertools
+
+import pytest
+
+import click_and_drop_api
+from click_and_drop_api.emulator import Emulator
+from click_and_drop_api.mock_server import API_KEY
+from click_and_drop_api.simple import ClickAndDrop, CreateOrder
+
+from .conftest import order_with_packages
+
+ORDERS = 100
+"""The number of orders shipped per round."""
+
+
+@pytest.fixture(scope="module")
+def emulator():
+    with Emulator() as emulator:
+        yield emulator
+
+
+def with_postage(reference: str) -> CreateOrder:
+    order = order_with_packages(reference).to_dict()
+    order["postageDetails"] = {"serviceCode": "TPN24", "carrierName": "Royal Mail"}
+    return CreateOrder.from_dict(order)
+
+
+@pytest.mark.parametrize("transport", ["http", "in-process"])
+def test_pipeline(measure, emulator, transport):
+    api = (
+        ClickAndDrop(API_KEY, host=emulator.host)
+        if transport == "http"
+        else ClickAndDrop(API_KEY, transport=emulator.transport)
+    )
+    manifests = click_and_drop_api.ManifestsApi(api._api_client)
+    rounds = itertools.count()
+
+    def ship():
+        number = next(rounds)
+        created = api.create_orders(
+            [with_postage(f"{transport}-{number}-{i}") for i in range(ORDERS)]
+        ).created_orders
+        identifiers = [order.order_identifier for order in created]
+        api.get_labels(identifiers, "postageLabel", include_returns_label=False)
+        manifests.manifest_eligible_async()
+        api.delete_orders(identifiers)
+
+    measure(ship, items=ORDERS)
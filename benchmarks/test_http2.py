@@ -0,0 +1,76 @@
+"""Generate 50 labels at the same time over HTTP/1.1 and HTTP/2.
+
+The local servers answer each label request after 20 ms, like a remote API.
+Over HTTP/1.1 every request in flight needs its own connection,
+over HTTP/2 they share one.
+
+Run with: pytest benchmarks/test_http2.py
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+import pytest
+
+from click_and_drop_api.mock_server import API_KEY, H2MockServer, MockServer
+from click_and_drop_api.simple import ClickAndDrop
+
+httpx = pytest.importorskip("httpx")
+pytest.importorskip("h2")
+
+from click_and_drop_api.http2 import HTTP2RESTClientObject  # noqa: E402
+
+REQUESTS = 50
+LABEL = b"%PDF-1.4\n" + bytes(range(256)) * 200
+"""A label PDF of about 50 KB."""
+
+
+def label(request):
+    time.sleep(0.02)
+    return LABEL
+
+
+def serve(server_class):
+    server = server_class()
+    server.route("GET", "/orders/([^/]+)/label", label)
+    server.start()
+    return server
+
+
+@pytest.fixture(scope="module")
+def http1_server():
+    server = serve(MockServer)
+    yield server
+    server.stop()
+
+
+@pytest.fixture(scope="module")
+def http2_server():
+    server = serve(H2MockServer)
+    yield server
+    server.stop()
+
+
+def get_labels(api: ClickAndDrop) -> list[bytearray]:
+    with ThreadPoolExecutor(REQUESTS) as executor:
+        return list(
+            executor.map(lambda i: api.get_label(i, "postageLabel"), range(REQUESTS))
+        )
+
+
+@pytest.mark.benchmark(group="50 concurrent label requests")
+def test_http1(measure, http1_server):
+    api = ClickAndDrop(API_KEY, host=http1_server.host)
+    assert measure(lambda: get_labels(api), items=REQUESTS) == [LABEL] * REQUESTS
+
+
+@pytest.mark.benchmark(group="50 concurrent label requests")
+def test_http2(measure, http2_server):
+    api = ClickAndDrop(
+        API_KEY,
+        host=http2_server.host,
+        transport=partial(HTTP2RESTClientObject, http1=False),
+    )
+    assert measure(lambda: get_labels(api), items=REQUESTS) == [LABEL] * REQUESTS
+    assert http2_server.connections == 1
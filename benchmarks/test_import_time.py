@@ -0,0 +1,25 @@
+"""Measure the time to start Python and import the package.
+
+Run with: pytest benchmarks/test_import_time.py
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "pass",
+        "import click_and_drop_api",
+        "import click_and_drop_api.simple",
+        "from click_and_drop_api.simple import ClickAndDrop",
+        "from click_and_drop_api import *",
+    ],
+)
+@pytest.mark.benchmark(group="import")
+def test_import(measure, statement):
+    """A cold start of a new interpreter, "pass" is the baseline."""
+    measure(lambda: subprocess.run([sys.executable, "-c", statement], check=True))
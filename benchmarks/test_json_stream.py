@@ -0,0 +1,103 @@
+"""Compare deserializing whole pages of orders with parsing them incrementally.
+
+Run with: pytest benchmarks/test_json_stream.py
+
+The peak memory of parsing a page is stored in the extra info of the benchmarks.
+"""
+
+import json
+import tracemalloc
+
+import pytest
+
+from click_and_drop_api.api_client import json_type_adapter
+from click_and_drop_api.models import GetOrderDetailsResource
+from click_and_drop_api.simple.json_stream import JSONArrayParser
+from click_and_drop_api.simple.stream import CHUNK_SIZE
+
+from .conftest import ORDERS
+from .test_views import detailed_order
+
+PAGE = json.dumps({"orders": [detailed_order(i) for i in range(100)]}).encode()
+"""A page of 100 orders with details."""
+
+CHUNKS = [PAGE[i : i + CHUNK_SIZE] for i in range(0, len(PAGE), CHUNK_SIZE)]
+"""The page as it is read from the response."""
+
+
+def deserialize(chunks: list[bytes]) -> list:
+    """Join the body and deserialize it like ApiClient.response_deserialize."""
+    body = b"".join(chunks)
+    return json_type_adapter("GetOrdersDetailsResponse").validate_json(body).orders
+
+
+def parse_incrementally(chunks: list[bytes]) -> list:
+    parser = JSONArrayParser("orders")
+    orders = [
+        GetOrderDetailsResource.model_validate(order)
+        for chunk in chunks
+        for order in parser.feed(chunk)
+    ]
+    orders.extend(map(GetOrderDetailsResource.model_validate, parser.close()))
+    return orders
+
+
+def first_order(chunks: list[bytes]):
+    parser = JSONArrayParser("orders")
+    for chunk in chunks:
+        for order in parser.feed(chunk):
+            return GetOrderDetailsResource.model_validate(order)
+
+
+PARSERS = {"whole": deserialize, "incremental": parse_incrementally}
+
+
+@pytest.mark.parametrize("parser", PARSERS)
+@pytest.mark.benchmark(group="parse a page of orders with details")
+def test_parse_page(measure, parser):
+    assert len(measure(lambda: PARSERS[parser](CHUNKS), items=100)) == 100
+
+
+@pytest.mark.benchmark(group="parse a page of orders with details")
+def test_first_order(measure):
+    assert measure(lambda: first_order(CHUNKS)).order_identifier == 0
+
+
+@pytest.mark.parametrize("parser", PARSERS)
+@pytest.mark.benchmark(group="peak memory of a page")
+def test_peak_memory(benchmark, parser):
+    """Process the orders one by one without keeping them."""
+
+    def process():
+        if parser == "whole":
+            for _order in deserialize(CHUNKS):
+                pass
+            return
+        parser_ = JSONArrayParser("orders")
+        for chunk in CHUNKS:
+            for order in parser_.feed(chunk):
+                GetOrderDetailsResource.model_validate(order)
+
+    chunks = list(CHUNKS)
+    tracemalloc.start()
+    try:
+        process()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    del chunks
+    benchmark.extra_info["peak_bytes"] = peak
+    print(f"{parser}: peak {peak} bytes for a page of {len(PAGE)} bytes")
+    benchmark(process)
+
+
+@pytest.mark.parametrize("incremental", [False, True])
+@pytest.mark.benchmark(group="iter_orders_with_details")
+def test_iter_orders_with_details(measure, api, incremental):
+    orders = measure(
+        lambda: list(
+            api.iter_orders_with_details(page_size=100, incremental=incremental)
+        ),
+        items=ORDERS,
+    )
+    assert len(orders) == ORDERS
@@ -0,0 +1,66 @@
+"""Quote the cheapest shipping option for 100,000 parcels.
+
+Run with: pytest benchmarks/test_quotes.py
+"""
+
+import random
+from decimal import Decimal
+
+import pytest
+
+from click_and_drop_api.simple import ShippingQuoter, packages_sizes
+
+PARCELS = 100_000
+
+random.seed(0)
+WEIGHTS = [random.randint(1, 25000) for _ in range(PARCELS)]
+DIMENSIONS = [
+    (random.randint(1, 700), random.randint(1, 500), random.randint(1, 500))
+    for _ in range(PARCELS)
+]
+
+
+def scan(weight, dimensions, min_compensation):
+    """Check every option of every package size, the path without a quoter."""
+    options = [
+        (option.gross, option)
+        for size in packages_sizes
+        if size.weight_can_be_shipped(weight)
+        and size.dimensions_can_be_shipped(*dimensions)
+        for option in size.shipping_options
+        if option.compensation >= min_compensation
+    ]
+    return min(options, key=lambda option: option[0], default=None)
+
+
+@pytest.mark.benchmark(group="quote 10,000 parcels")
+def test_scan_all_options(measure):
+    measure(
+        lambda: [
+            scan(weight, dimensions, Decimal(100))
+            for weight, dimensions in zip(WEIGHTS[:10_000], DIMENSIONS)
+        ],
+        items=10_000,
+    )
+
+
+@pytest.mark.benchmark(group="quote 10,000 parcels")
+def test_shipping_quoter(measure):
+    quoter = ShippingQuoter()
+    quotes = measure(
+        lambda: quoter.cheapest(
+            WEIGHTS[:10_000], DIMENSIONS[:10_000], min_compensation=Decimal(100)
+        ),
+        items=10_000,
+    )
+    assert len(quotes) == 10_000
+
+
+@pytest.mark.benchmark(group="quote 100,000 parcels")
+def test_shipping_quoter_100k(measure):
+    quoter = ShippingQuoter()
+    quotes = measure(
+        lambda: quoter.cheapest(WEIGHTS, DIMENSIONS, max_delivery_hours=24),
+        items=PARCELS,
+    )
+    assert len(quotes) == PARCELS
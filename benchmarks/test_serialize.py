@@ -0,0 +1,30 @@
+"""Serialize the body of a request that creates 500 orders.
+
+Run with: pytest benchmarks/test_serialize.py
+"""
+
+import json
+
+import pytest
+
+from click_and_drop_api import ApiClient, Configuration
+
+from .conftest import create_orders_request
+
+BODY = create_orders_request(500)
+
+
+@pytest.fixture(scope="module")
+def client():
+    return ApiClient(Configuration())
+
+
+@pytest.mark.benchmark(group="serialize CreateOrdersRequest")
+def test_sanitize_and_json_dumps(benchmark, client):
+    """The path before ApiClient.serialize_body() was added."""
+    benchmark(lambda: json.dumps(client.sanitize_for_serialization(BODY)).encode())
+
+
+@pytest.mark.benchmark(group="serialize CreateOrdersRequest")
+def test_serialize_body(benchmark, client):
+    benchmark(client.serialize_body, BODY)
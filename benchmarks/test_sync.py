@@ -0,0 +1,81 @@
+"""Compare listing all orders again with syncing the changes into a store.
+
+Run with: pytest benchmarks/test_sync.py
+
+The emulator has 100 days of orders, 10 per day.
+The orders are manifested after 3 days, so 30 orders may still change.
+The number of requests per round is stored in the extra info of the benchmarks.
+"""
+
+import itertools
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+import click_and_drop_api
+from click_and_drop_api.emulator import Emulator
+from click_and_drop_api.mock_server import API_KEY
+from click_and_drop_api.simple import ClickAndDrop, OrderStore
+
+from .test_emulator import with_postage
+
+DAYS = 100
+PER_DAY = 10
+START = datetime(2026, 1, 1, tzinfo=timezone.utc)
+END = START + timedelta(days=DAYS)
+
+
+class Clock:
+    """A clock that is set by the benchmark."""
+
+    def __init__(self):
+        self.now = START
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+@pytest.fixture(scope="module")
+def emulator():
+    clock = Clock()
+    emulator = Emulator(clock=clock)
+    api = ClickAndDrop(API_KEY, transport=emulator.transport)
+    manifests = click_and_drop_api.ManifestsApi(api._api_client)
+    for day in range(DAYS):
+        clock.now = START + timedelta(days=day)
+        created = api.create_orders(
+            [with_postage(f"{day}-{i}") for i in range(PER_DAY)]
+        ).created_orders
+        if day < DAYS - 3:
+            api.get_labels(
+                [order.order_identifier for order in created],
+                "postageLabel",
+                include_returns_label=False,
+            )
+            manifests.manifest_eligible_async()
+    return emulator
+
+
+@pytest.fixture(scope="module")
+def api(emulator):
+    return ClickAndDrop(API_KEY, transport=emulator.transport)
+
+
+@pytest.mark.parametrize("method", ["list all", "sync"])
+@pytest.mark.benchmark(group="find the changed orders")
+def test_find_changes(measure, benchmark, emulator, api, method):
+    store = OrderStore()
+    list(api.sync_orders(store, end=END))
+    rounds = itertools.count(1)
+
+    def find_changes():
+        if method == "list all":
+            return list(api.iter_orders_with_details())
+        end = END + timedelta(minutes=next(rounds))
+        return list(api.sync_orders(store, end=end))
+
+    requests = emulator.requests
+    find_changes()
+    benchmark.extra_info["requests"] = emulator.requests - requests
+    measure(find_changes, items=DAYS * PER_DAY)
+    store.close()
@@ -0,0 +1,109 @@
+"""Compare the pydantic models of orders with views that validate on access.
+
+Run with: pytest benchmarks/test_views.py
+
+The memory per order is stored in the extra info of the benchmarks
+and shown with --benchmark-columns or in the saved JSON.
+"""
+
+import json
+import tracemalloc
+
+import pytest
+
+from click_and_drop_api.api_client import json_type_adapter
+from click_and_drop_api.simple.views import OrdersDetailsPageView
+
+from .conftest import ORDERS, order_details
+
+
+def detailed_order(order_identifier: int) -> dict:
+    """The JSON of an order with three lines as listed by /orders/full."""
+    order = order_details(order_identifier)
+    order.update(
+        orderStatus="despatched",
+        channel="eBay",
+        currencyCode="GBP",
+        packageSize="smallParcel",
+        printedOn="2026-01-02T10:00:00Z",
+        orderLines=[
+            {
+                "SKU": f"SKU-{i}",
+                "name": f"Item {i}",
+                "quantity": 1,
+                "unitValue": 9.99,
+                "lineTotal": 9.99,
+            }
+            for i in range(3)
+        ],
+    )
+    return order
+
+
+PAGE = json.dumps({"orders": [detailed_order(i) for i in range(100)]}).encode()
+"""A page of 100 orders with details."""
+
+MODELS = json_type_adapter("GetOrdersDetailsResponse")
+
+
+def parse_models(data: bytes):
+    return MODELS.validate_json(data).orders
+
+
+def parse_views(data: bytes):
+    return OrdersDetailsPageView(json.loads(data)).orders
+
+
+PARSERS = {"models": parse_models, "views": parse_views}
+
+
+@pytest.mark.parametrize("parser", PARSERS)
+@pytest.mark.benchmark(group="deserialize orders with details")
+def test_deserialize(measure, parser):
+    orders = measure(lambda: PARSERS[parser](PAGE), items=100)
+    assert len(orders) == 100
+
+
+@pytest.mark.parametrize("parser", PARSERS)
+@pytest.mark.benchmark(group="deserialize orders with details")
+def test_deserialize_and_read_fields(measure, parser):
+    """Read the fields a packing list needs."""
+
+    def read():
+        return [
+            (order.order_reference, order.shipping_info.country_code, line.sku)
+            for order in PARSERS[parser](PAGE)
+            for line in order.order_lines
+        ]
+
+    assert len(measure(read, items=100)) == 300
+
+
+@pytest.mark.parametrize("parser", PARSERS)
+@pytest.mark.benchmark(group="memory of orders with details")
+def test_memory(benchmark, parser):
+    """Measure the memory of 10 pages and the time to parse them."""
+    tracemalloc.start()
+    try:
+        orders = [order for _ in range(10) for order in PARSERS[parser](PAGE)]
+        size = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    benchmark.extra_info["bytes_per_order"] = size // len(orders)
+    print(f"{parser}: {size // len(orders)} bytes per order")
+    benchmark(lambda: [PARSERS[parser](PAGE) for _ in range(10)])
+    if parser == "views":
+        # half the memory of the models
+        assert size // len(orders) < 4000
+
+
+@pytest.mark.parametrize("lightweight", [False, True])
+@pytest.mark.benchmark(group="iter_orders_with_details")
+def test_iter_orders_with_details(measure, api, lightweight):
+    orders = measure(
+        lambda: list(
+            api.iter_orders_with_details(page_size=100, lightweight=lightweight)
+        ),
+        items=ORDERS,
+    )
+    assert len(orders) == ORDERS
@@ -16,6 +16,9 @@
 
 __version__ = "1.0.0"
 
+import importlib
+from typing import TYPE_CHECKING
+
 # Define package exports
 __all__ = [
     "LabelsApi",
@@ -77,66 +80,145 @@ __all__ = [
     "UpdatedOrderInfo",
 ]
 
-# import apis into sdk package
-from click_and_drop_api.api.labels_api import LabelsApi as LabelsApi
-from click_and_drop_api.api.manifests_api import ManifestsApi as ManifestsApi
-from click_and_drop_api.api.orders_api import OrdersApi as OrdersApi
-from click_and_drop_api.api.version_api import VersionApi as VersionApi
-
-# import ApiClient
-from click_and_drop_api.api_response import ApiResponse as ApiResponse
-from click_and_drop_api.api_client import ApiClient as ApiClient
-from click_and_drop_api.configuration import Configuration as Configuration
-from click_and_drop_api.exceptions import OpenApiException as OpenApiException
-from click_and_drop_api.exceptions import ApiTypeError as ApiTypeError
-from click_and_drop_api.exceptions import ApiValueError as ApiValueError
-from click_and_drop_api.exceptions import ApiKeyError as ApiKeyError
-from click_and_drop_api.exceptions import ApiAttributeError as ApiAttributeError
-from click_and_drop_api.exceptions import ApiException as ApiException
-
-# import models into sdk package
-from click_and_drop_api.models.address_request import AddressRequest as AddressRequest
-from click_and_drop_api.models.billing_details_request import BillingDetailsRequest as BillingDetailsRequest
-from click_and_drop_api.models.create_order_error_response import CreateOrderErrorResponse as CreateOrderErrorResponse
-from click_and_drop_api.models.create_order_label_error_response import CreateOrderLabelErrorResponse as CreateOrderLabelErrorResponse
-from click_and_drop_api.models.create_order_request import CreateOrderRequest as CreateOrderRequest
-from click_and_drop_api.models.create_order_response import CreateOrderResponse as CreateOrderResponse
-from click_and_drop_api.models.create_orders_request import CreateOrdersRequest as CreateOrdersRequest
-from click_and_drop_api.models.create_orders_response import CreateOrdersResponse as CreateOrdersResponse
-from click_and_drop_api.models.create_packages_response import CreatePackagesResponse as CreatePackagesResponse
-from click_and_drop_api.models.delete_orders_resource import DeleteOrdersResource as DeleteOrdersResource
-from click_and_drop_api.models.deleted_order_info import DeletedOrderInfo as DeletedOrderInfo
-from click_and_drop_api.models.dimensions_request import DimensionsRequest as DimensionsRequest
-from click_and_drop_api.models.error_response import ErrorResponse as ErrorResponse
-from click_and_drop_api.models.failed_order_response import FailedOrderResponse as FailedOrderResponse
-from click_and_drop_api.models.get_order_details_resource import GetOrderDetailsResource as GetOrderDetailsResource
-from click_and_drop_api.models.get_order_info_resource import GetOrderInfoResource as GetOrderInfoResource
-from click_and_drop_api.models.get_order_line_result import GetOrderLineResult as GetOrderLineResult
-from click_and_drop_api.models.get_orders_details_response import GetOrdersDetailsResponse as GetOrdersDetailsResponse
-from click_and_drop_api.models.get_orders_response import GetOrdersResponse as GetOrdersResponse
-from click_and_drop_api.models.get_postal_details_result import GetPostalDetailsResult as GetPostalDetailsResult
-from click_and_drop_api.models.get_shipping_details_result import GetShippingDetailsResult as GetShippingDetailsResult
-from click_and_drop_api.models.get_tag_details_result import GetTagDetailsResult as GetTagDetailsResult
-from click_and_drop_api.models.get_version_resource import GetVersionResource as GetVersionResource
-from click_and_drop_api.models.importer import Importer as Importer
-from click_and_drop_api.models.label_generation_request import LabelGenerationRequest as LabelGenerationRequest
-from click_and_drop_api.models.manifest_details_response import ManifestDetailsResponse as ManifestDetailsResponse
-from click_and_drop_api.models.manifest_eligible_orders_request import ManifestEligibleOrdersRequest as ManifestEligibleOrdersRequest
-from click_and_drop_api.models.manifest_errors_error_details_response import ManifestErrorsErrorDetailsResponse as ManifestErrorsErrorDetailsResponse
-from click_and_drop_api.models.manifest_errors_response import ManifestErrorsResponse as ManifestErrorsResponse
-from click_and_drop_api.models.manifest_orders_response import ManifestOrdersResponse as ManifestOrdersResponse
-from click_and_drop_api.models.order_error_info import OrderErrorInfo as OrderErrorInfo
-from click_and_drop_api.models.order_error_response import OrderErrorResponse as OrderErrorResponse
-from click_and_drop_api.models.order_field_response import OrderFieldResponse as OrderFieldResponse
-from click_and_drop_api.models.order_update_error import OrderUpdateError as OrderUpdateError
-from click_and_drop_api.models.postage_details_request import PostageDetailsRequest as PostageDetailsRequest
-from click_and_drop_api.models.product_item_request import ProductItemRequest as ProductItemRequest
-from click_and_drop_api.models.recipient_details_request import RecipientDetailsRequest as RecipientDetailsRequest
-from click_and_drop_api.models.sender_details_request import SenderDetailsRequest as SenderDetailsRequest
-from click_and_drop_api.models.shipment_package_request import ShipmentPackageRequest as ShipmentPackageRequest
-from click_and_drop_api.models.tag_request import TagRequest as TagRequest
-from click_and_drop_api.models.update_order_status_request import UpdateOrderStatusRequest as UpdateOrderStatusRequest
-from click_and_drop_api.models.update_order_status_response import UpdateOrderStatusResponse as UpdateOrderStatusResponse
-from click_and_drop_api.models.update_orders_status_request import UpdateOrdersStatusRequest as UpdateOrdersStatusRequest
-from click_and_drop_api.models.updated_order_info import UpdatedOrderInfo as UpdatedOrderInfo
+# The attributes are imported on first access (PEP 562)
+# so that importing the package does not build all models.
+_LAZY_ATTRIBUTES = {
+    "LabelsApi": "click_and_drop_api.api.labels_api",
+    "ManifestsApi": "click_and_drop_api.api.manifests_api",
+    "OrdersApi": "click_and_drop_api.api.orders_api",
+    "VersionApi": "click_and_drop_api.api.version_api",
+    "ApiResponse": "click_and_drop_api.api_response",
+    "ApiClient": "click_and_drop_api.api_client",
+    "Configuration": "click_and_drop_api.configuration",
+    "OpenApiException": "click_and_drop_api.exceptions",
+    "ApiTypeError": "click_and_drop_api.exceptions",
+    "ApiValueError": "click_and_drop_api.exceptions",
+    "ApiKeyError": "click_and_drop_api.exceptions",
+    "ApiAttributeError": "click_and_drop_api.exceptions",
+    "ApiException": "click_and_drop_api.exceptions",
+    "AddressRequest": "click_and_drop_api.models.address_request",
+    "BillingDetailsRequest": "click_and_drop_api.models.billing_details_request",
+    "CreateOrderErrorResponse": "click_and_drop_api.models.create_order_error_response",
+    "CreateOrderLabelErrorResponse": "click_and_drop_api.models.create_order_label_error_response",
+    "CreateOrderRequest": "click_and_drop_api.models.create_order_request",
+    "CreateOrderResponse": "click_and_drop_api.models.create_order_response",
+    "CreateOrdersRequest": "click_and_drop_api.models.create_orders_request",
+    "CreateOrdersResponse": "click_and_drop_api.models.create_orders_response",
+    "CreatePackagesResponse": "click_and_drop_api.models.create_packages_response",
+    "DeleteOrdersResource": "click_and_drop_api.models.delete_orders_resource",
+    "DeletedOrderInfo": "click_and_drop_api.models.deleted_order_info",
+    "DimensionsRequest": "click_and_drop_api.models.dimensions_request",
+    "ErrorResponse": "click_and_drop_api.models.error_response",
+    "FailedOrderResponse": "click_and_drop_api.models.failed_order_response",
+    "GetOrderDetailsResource": "click_and_drop_api.models.get_order_details_resource",
+    "GetOrderInfoResource": "click_and_drop_api.models.get_order_info_resource",
+    "GetOrderLineResult": "click_and_drop_api.models.get_order_line_result",
+    "GetOrdersDetailsResponse": "click_and_drop_api.models.get_orders_details_response",
+    "GetOrdersResponse": "click_and_drop_api.models.get_orders_response",
+    "GetPostalDetailsResult": "click_and_drop_api.models.get_postal_details_result",
+    "GetShippingDetailsResult": "click_and_drop_api.models.get_shipping_details_result",
+    "GetTagDetailsResult": "click_and_drop_api.models.get_tag_details_result",
+    "GetVersionResource": "click_and_drop_api.models.get_version_resource",
+    "Importer": "click_and_drop_api.models.importer",
+    "LabelGenerationRequest": "click_and_drop_api.models.label_generation_request",
+    "ManifestDetailsResponse": "click_and_drop_api.models.manifest_details_response",
+    "ManifestEligibleOrdersRequest": "click_and_drop_api.models.manifest_eligible_orders_request",
+    "ManifestErrorsErrorDetailsResponse": "click_and_drop_api.models.manifest_errors_error_details_response",
+    "ManifestErrorsResponse": "click_and_drop_api.models.manifest_errors_response",
+    "ManifestOrdersResponse": "click_and_drop_api.models.manifest_orders_response",
+    "OrderErrorInfo": "click_and_drop_api.models.order_error_info",
+    "OrderErrorResponse": "click_and_drop_api.models.order_error_response",
+    "OrderFieldResponse": "click_and_drop_api.models.order_field_response",
+    "OrderUpdateError": "click_and_drop_api.models.order_update_error",
+    "PostageDetailsRequest": "click_and_drop_api.models.postage_details_request",
+    "ProductItemRequest": "click_and_drop_api.models.product_item_request",
+    "RecipientDetailsRequest": "click_and_drop_api.models.recipient_details_request",
+    "SenderDetailsRequest": "click_and_drop_api.models.sender_details_request",
+    "ShipmentPackageRequest": "click_and_drop_api.models.shipment_package_request",
+    "TagRequest": "click_and_drop_api.models.tag_request",
+    "UpdateOrderStatusRequest": "click_and_drop_api.models.update_order_status_request",
+    "UpdateOrderStatusResponse": "click_and_drop_api.models.update_order_status_response",
+    "UpdateOrdersStatusRequest": "click_and_drop_api.models.update_orders_status_request",
+    "UpdatedOrderInfo": "click_and_drop_api.models.updated_order_info",
+}
+_SUBMODULES = {"api", "api_client", "api_response", "configuration", "exceptions", "models", "rest"}
+
+
+def __getattr__(name: str):
+    if name in _SUBMODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+if TYPE_CHECKING:
+    # import apis into sdk package
+    from click_and_drop_api.api.labels_api import LabelsApi as LabelsApi
+    from click_and_drop_api.api.manifests_api import ManifestsApi as ManifestsApi
+    from click_and_drop_api.api.orders_api import OrdersApi as OrdersApi
+    from click_and_drop_api.api.version_api import VersionApi as VersionApi
+
+    # import ApiClient
+    from click_and_drop_api.api_response import ApiResponse as ApiResponse
+    from click_and_drop_api.api_client import ApiClient as ApiClient
+    from click_and_drop_api.configuration import Configuration as Configuration
+    from click_and_drop_api.exceptions import OpenApiException as OpenApiException
+    from click_and_drop_api.exceptions import ApiTypeError as ApiTypeError
+    from click_and_drop_api.exceptions import ApiValueError as ApiValueError
+    from click_and_drop_api.exceptions import ApiKeyError as ApiKeyError
+    from click_and_drop_api.exceptions import ApiAttributeError as ApiAttributeError
+    from click_and_drop_api.exceptions import ApiException as ApiException
 
+    # import models into sdk package
+    from click_and_drop_api.models.address_request import AddressRequest as AddressRequest
+    from click_and_drop_api.models.billing_details_request import BillingDetailsRequest as BillingDetailsRequest
+    from click_and_drop_api.models.create_order_error_response import CreateOrderErrorResponse as CreateOrderErrorResponse
+    from click_and_drop_api.models.create_order_label_error_response import CreateOrderLabelErrorResponse as CreateOrderLabelErrorResponse
+    from click_and_drop_api.models.create_order_request import CreateOrderRequest as CreateOrderRequest
+    from click_and_drop_api.models.create_order_response import CreateOrderResponse as CreateOrderResponse
+    from click_and_drop_api.models.create_orders_request import CreateOrdersRequest as CreateOrdersRequest
+    from click_and_drop_api.models.create_orders_response import CreateOrdersResponse as CreateOrdersResponse
+    from click_and_drop_api.models.create_packages_response import CreatePackagesResponse as CreatePackagesResponse
+    from click_and_drop_api.models.delete_orders_resource import DeleteOrdersResource as DeleteOrdersResource
+    from click_and_drop_api.models.deleted_order_info import DeletedOrderInfo as DeletedOrderInfo
+    from click_and_drop_api.models.dimensions_request import DimensionsRequest as DimensionsRequest
+    from click_and_drop_api.models.error_response import ErrorResponse as ErrorResponse
+    from click_and_drop_api.models.failed_order_response import FailedOrderResponse as FailedOrderResponse
+    from click_and_drop_api.models.get_order_details_resource import GetOrderDetailsResource as GetOrderDetailsResource
+    from click_and_drop_api.models.get_order_info_resource import GetOrderInfoResource as GetOrderInfoResource
+    from click_and_drop_api.models.get_order_line_result import GetOrderLineResult as GetOrderLineResult
+    from click_and_drop_api.models.get_orders_details_response import GetOrdersDetailsResponse as GetOrdersDetailsResponse
+    from click_and_drop_api.models.get_orders_response import GetOrdersResponse as GetOrdersResponse
+    from click_and_drop_api.models.get_postal_details_result import GetPostalDetailsResult as GetPostalDetailsResult
+    from click_and_drop_api.models.get_shipping_details_result import GetShippingDetailsResult as GetShippingDetailsResult
+    from click_and_drop_api.models.get_tag_details_result import GetTagDetailsResult as GetTagDetailsResult
+    from click_and_drop_api.models.get_version_resource import GetVersionResource as GetVersionResource
+    from click_and_drop_api.models.importer import Importer as Importer
+    from click_and_drop_api.models.label_generation_request import LabelGenerationRequest as LabelGenerationRequest
+    from click_and_drop_api.models.manifest_details_response import ManifestDetailsResponse as ManifestDetailsResponse
+    from click_and_drop_api.models.manifest_eligible_orders_request import ManifestEligibleOrdersRequest as ManifestEligibleOrdersRequest
+    from click_and_drop_api.models.manifest_errors_error_details_response import ManifestErrorsErrorDetailsResponse as ManifestErrorsErrorDetailsResponse
+    from click_and_drop_api.models.manifest_errors_response import ManifestErrorsResponse as ManifestErrorsResponse
+    from click_and_drop_api.models.manifest_orders_response import ManifestOrdersResponse as ManifestOrdersResponse
+    from click_and_drop_api.models.order_error_info import OrderErrorInfo as OrderErrorInfo
+    from click_and_drop_api.models.order_error_response import OrderErrorResponse as OrderErrorResponse
+    from click_and_drop_api.models.order_field_response import OrderFieldResponse as OrderFieldResponse
+    from click_and_drop_api.models.order_update_error import OrderUpdateError as OrderUpdateError
+    from click_and_drop_api.models.postage_details_request import PostageDetailsRequest as PostageDetailsRequest
+    from click_and_drop_api.models.product_item_request import ProductItemRequest as ProductItemRequest
+    from click_and_drop_api.models.recipient_details_request import RecipientDetailsRequest as RecipientDetailsRequest
+    from click_and_drop_api.models.sender_details_request import SenderDetailsRequest as SenderDetailsRequest
+    from click_and_drop_api.models.shipment_package_request import ShipmentPackageRequest as ShipmentPackageRequest
+    from click_and_drop_api.models.tag_request import TagRequest as TagRequest
+    from click_and_drop_api.models.update_order_status_request import UpdateOrderStatusRequest as UpdateOrderStatusRequest
+    from click_and_drop_api.models.update_order_status_response import UpdateOrderStatusResponse as UpdateOrderStatusResponse
+    from click_and_drop_api.models.update_orders_status_request import UpdateOrdersStatusRequest as UpdateOrdersStatusRequest
+    from click_and_drop_api.models.updated_order_info import UpdatedOrderInfo as UpdatedOrderInfo
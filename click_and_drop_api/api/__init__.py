@@ -1,8 +1,40 @@
 # flake8: noqa
 
-# import apis into api package
-from click_and_drop_api.api.labels_api import LabelsApi
-from click_and_drop_api.api.manifests_api import ManifestsApi
-from click_and_drop_api.api.orders_api import OrdersApi
-from click_and_drop_api.api.version_api import VersionApi
+import importlib
+from typing import TYPE_CHECKING
 
+__all__ = [
+    "LabelsApi",
+    "ManifestsApi",
+    "OrdersApi",
+    "VersionApi",
+]
+
+# The attributes are imported on first access (PEP 562).
+_LAZY_ATTRIBUTES = {
+    "LabelsApi": "click_and_drop_api.api.labels_api",
+    "ManifestsApi": "click_and_drop_api.api.manifests_api",
+    "OrdersApi": "click_and_drop_api.api.orders_api",
+    "VersionApi": "click_and_drop_api.api.version_api",
+}
+
+
+def __getattr__(name: str):
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+if TYPE_CHECKING:
+    # import apis into api package
+    from click_and_drop_api.api.labels_api import LabelsApi
+    from click_and_drop_api.api.manifests_api import ManifestsApi
+    from click_and_drop_api.api.orders_api import OrdersApi
+    from click_and_drop_api.api.version_api import VersionApi
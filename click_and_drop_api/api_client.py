@@ -16,21 +16,23 @@ import datetime
 from dateutil.parser import parse
 from enum import Enum
 import decimal
+import functools
 import json
 import mimetypes
 import os
 import re
 import tempfile
+import time
 import uuid
 
 from urllib.parse import quote
-from typing import Tuple, Optional, List, Dict, Union
-from pydantic import SecretStr
+from typing import Any, Callable, Tuple, Optional, List, Dict, Union
+from pydantic import BaseModel, SecretStr, TypeAdapter
 
 from click_and_drop_api.configuration import Configuration
 from click_and_drop_api.api_response import ApiResponse, T as ApiResponseT
 import click_and_drop_api.models
-from click_and_drop_api import rest
+from click_and_drop_api import metrics, rest
 from click_and_drop_api.exceptions import (
     ApiValueError,
     ApiException,
@@ -43,6 +45,27 @@ from click_and_drop_api.exceptions import (
 
 RequestSerialized = Tuple[str, str, Dict[str, str], Optional[str], List[str]]
 
+JSON_CONTENT_TYPE = re.compile(r'^application/(json|[\w!#$&.+\-^_]+\+json)\s*(;|$)', re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=None)
+def json_type_adapter(response_type: str) -> Optional[TypeAdapter]:
+    """Return a TypeAdapter that validates the JSON of a response type directly.
+
+    Only models and lists of models have one,
+    the other types are deserialized by ApiClient.deserialize().
+
+    :param response_type: a model name like `GetOrdersResponse`
+        or a list of models like `List[GetOrderInfoResource]`.
+    :return: the TypeAdapter or None.
+    """
+    m = re.fullmatch(r'List\[(\w+)]', response_type)
+    klass = getattr(click_and_drop_api.models, m.group(1) if m else response_type, None)
+    if not isinstance(klass, type) or not issubclass(klass, BaseModel):
+        return None
+    return TypeAdapter(List[Optional[klass]] if m else klass)
+
+
 class ApiClient:
     """Generic API client for OpenAPI client library builds.
 
@@ -85,7 +108,7 @@ class ApiClient:
             configuration = Configuration.get_default()
         self.configuration = configuration
 
-        self.rest_client = rest.RESTClientObject(configuration)
+        self.rest_client = self._create_rest_client(configuration)
         self.default_headers = {}
         if header_name is not None:
             self.default_headers[header_name] = header_value
@@ -93,6 +116,14 @@ class ApiClient:
         # Set default User-Agent.
         self.user_agent = 'OpenAPI-Generator/1.0.0/python'
         self.client_side_validation = configuration.client_side_validation
+        # type string -> compiled deserializer
+        self._deserializers: Dict[str, Callable[[Any], Any]] = {}
+
+    def _create_rest_client(self, configuration):
+        """Create the REST client that sends the requests of this client."""
+        return (configuration.rest_client_class or rest.RESTClientObject)(
+            configuration
+        )
 
     def __enter__(self):
         return self
@@ -177,6 +208,10 @@ class ApiClient:
         """
 
         config = self.configuration
+        hooks = config.request_hooks
+        if hooks:
+            started = time.perf_counter()
+            resource_path_template = resource_path
 
         # header parameters
         header_params = header_params or {}
@@ -227,7 +262,7 @@ class ApiClient:
 
         # body
         if body:
-            body = self.sanitize_for_serialization(body)
+            body = self.serialize_body(body)
 
         # request url
         if _host is None or self.configuration.ignore_operation_servers:
@@ -245,6 +280,10 @@ class ApiClient:
             )
             url += "?" + url_query
 
+        if hooks:
+            metrics.request_serialized(
+                hooks, method, resource_path_template, url, body, started
+            )
         return method, url, header_params, body, post_params
 
 
@@ -269,6 +308,8 @@ class ApiClient:
         :return: RESTResponse
         """
 
+        hooks = self.configuration.request_hooks
+        request = metrics.request_sending(hooks, method, url, body) if hooks else None
         try:
             # perform request and return response
             response_data = self.rest_client.request(
@@ -278,9 +319,13 @@ class ApiClient:
                 _request_timeout=_request_timeout
             )
 
-        except ApiException as e:
+        except BaseException as e:
+            if request is not None:
+                metrics.request_sent(request, error=e)
             raise e
 
+        if request is not None:
+            metrics.request_sent(request, response_data)
         return response_data
 
     def response_deserialize(
@@ -297,6 +342,27 @@ class ApiClient:
         msg = "RESTResponse.read() must be called before passing it to response_deserialize()"
         assert response_data.data is not None, msg
 
+        request = (
+            metrics.response_deserializing(response_data)
+            if self.configuration.request_hooks
+            else None
+        )
+        if request is None:
+            return self._response_deserialize(response_data, response_types_map)
+        try:
+            result = self._response_deserialize(response_data, response_types_map)
+        except BaseException as e:
+            metrics.response_deserialized(request, e)
+            raise
+        metrics.response_deserialized(request)
+        return result
+
+    def _response_deserialize(
+        self,
+        response_data: rest.RESTResponse,
+        response_types_map: Optional[Dict[str, ApiResponseT]]=None
+    ) -> ApiResponse[ApiResponseT]:
+
         response_type = response_types_map.get(str(response_data.status), None)
         if not response_type and isinstance(response_data.status, int) and 100 <= response_data.status <= 599:
             # if not found, look for '1XX', '2XX', etc.
@@ -316,8 +382,20 @@ class ApiClient:
                 if content_type is not None:
                     match = re.search(r"charset=([a-zA-Z\-\d]+)[\s;]?", content_type)
                 encoding = match.group(1) if match else "utf-8"
-                response_text = response_data.data.decode(encoding)
-                return_data = self.deserialize(response_text, response_type, content_type)
+                adapter = json_type_adapter(response_type)
+                if (
+                    adapter is not None
+                    and 200 <= response_data.status <= 299
+                    and response_data.data
+                    and content_type is not None
+                    and JSON_CONTENT_TYPE.match(content_type)
+                    and encoding.lower() in ("utf-8", "utf8")
+                ):
+                    # validate the bytes without json.loads and from_dict
+                    return_data = adapter.validate_json(response_data.data)
+                else:
+                    response_text = response_data.data.decode(encoding)
+                    return_data = self.deserialize(response_text, response_type, content_type)
         finally:
             if not 200 <= response_data.status <= 299:
                 raise ApiException.from_response(
@@ -333,6 +411,20 @@ class ApiClient:
             raw_data = response_data.data
         )
 
+    def serialize_body(self, body):
+        """Builds the body of a request.
+
+        OpenAPI models are serialized to JSON bytes by pydantic in one pass
+        which is faster than sanitize_for_serialization() and json.dumps().
+        Other objects are sanitized and serialized by the REST client.
+
+        :param body: The data to serialize.
+        :return: bytes or the sanitized body.
+        """
+        if isinstance(body, BaseModel):
+            return body.model_dump_json(by_alias=True, exclude_none=True).encode()
+        return self.sanitize_for_serialization(body)
+
     def sanitize_for_serialization(self, obj):
         """Builds a JSON POST object.
 
@@ -438,40 +530,68 @@ class ApiClient:
             return None
 
         if isinstance(klass, str):
-            if klass.startswith('List['):
-                m = re.match(r'List\[(.*)]', klass)
-                assert m is not None, "Malformed List type definition"
-                sub_kls = m.group(1)
-                return [self.__deserialize(sub_data, sub_kls)
-                        for sub_data in data]
-
-            if klass.startswith('Dict['):
-                m = re.match(r'Dict\[([^,]*), (.*)]', klass)
-                assert m is not None, "Malformed Dict type definition"
-                sub_kls = m.group(2)
-                return {k: self.__deserialize(v, sub_kls)
-                        for k, v in data.items()}
-
-            # convert str to class
-            if klass in self.NATIVE_TYPES_MAPPING:
-                klass = self.NATIVE_TYPES_MAPPING[klass]
-            else:
-                klass = getattr(click_and_drop_api.models, klass)
+            return self.__get_deserializer(klass)(data)
+
+        return self.__deserializer_for_class(klass)(data)
+
+    def __get_deserializer(self, klass):
+        """Returns the cached deserializer of a type string.
+
+        :param klass: string of class name.
+        :return: function taking dict, list or str.
+        """
+        deserializer = self._deserializers.get(klass)
+        if deserializer is None:
+            deserializer = self._deserializers[klass] = self.__compile_deserializer(klass)
+        return deserializer
+
+    def __compile_deserializer(self, klass):
+        """Returns a function that deserializes data of a type.
 
+        The type string is parsed and the classes are looked up once.
+
+        :param klass: string of class name like `List[GetOrderInfoResource]`.
+        :return: function taking dict, list or str.
+        """
+        if klass.startswith('List['):
+            m = re.match(r'List\[(.*)]', klass)
+            assert m is not None, "Malformed List type definition"
+            item = self.__get_deserializer(m.group(1))
+            return lambda data: [None if sub_data is None else item(sub_data)
+                                 for sub_data in data]
+
+        if klass.startswith('Dict['):
+            m = re.match(r'Dict\[([^,]*), (.*)]', klass)
+            assert m is not None, "Malformed Dict type definition"
+            value = self.__get_deserializer(m.group(2))
+            return lambda data: {k: None if v is None else value(v)
+                                 for k, v in data.items()}
+
+        # convert str to class
+        if klass in self.NATIVE_TYPES_MAPPING:
+            return self.__deserializer_for_class(self.NATIVE_TYPES_MAPPING[klass])
+        return self.__deserializer_for_class(getattr(click_and_drop_api.models, klass))
+
+    def __deserializer_for_class(self, klass):
+        """Returns a function that deserializes data of a class.
+
+        :param klass: class literal.
+        :return: function taking dict, list or str.
+        """
         if klass in self.PRIMITIVE_TYPES:
-            return self.__deserialize_primitive(data, klass)
+            return lambda data: self.__deserialize_primitive(data, klass)
         elif klass is object:
-            return self.__deserialize_object(data)
+            return self.__deserialize_object
         elif klass is datetime.date:
-            return self.__deserialize_date(data)
+            return self.__deserialize_date
         elif klass is datetime.datetime:
-            return self.__deserialize_datetime(data)
+            return self.__deserialize_datetime
         elif klass is decimal.Decimal:
-            return decimal.Decimal(data)
+            return decimal.Decimal
         elif issubclass(klass, Enum):
-            return self.__deserialize_enum(data, klass)
+            return lambda data: self.__deserialize_enum(data, klass)
         else:
-            return self.__deserialize_model(data, klass)
+            return klass.from_dict
 
     def parameters_to_tuples(self, params, collection_formats):
         """Get parameters as list of tuples, formatting collections.
@@ -793,12 +913,3 @@ class ApiClient:
                 )
             )
 
-    def __deserialize_model(self, data, klass):
-        """Deserializes list or dict to model.
-
-        :param data: dict, list.
-        :param klass: class literal.
-        :return: model object.
-        """
-
-        return klass.from_dict(data)
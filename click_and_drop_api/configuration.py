@@ -18,11 +18,17 @@ import logging
 from logging import FileHandler
 import multiprocessing
 import sys
-from typing import Any, ClassVar, Dict, List, Literal, Optional, TypedDict, Union
+from typing import Any, Callable, ClassVar, Dict, List, Literal, Optional, TypedDict, Union, TYPE_CHECKING
 from typing_extensions import NotRequired, Self
 
 import urllib3
 
+from click_and_drop_api.metrics import RequestHook
+from click_and_drop_api.retry import RateLimiter, RetryPolicy
+
+if TYPE_CHECKING:
+    from click_and_drop_api.rest import RESTClientObject
+
 
 JSON_SCHEMA_VALIDATION_KEYWORDS = {
     'multipleOf', 'maximum', 'exclusiveMaximum',
@@ -310,6 +316,18 @@ conf = click_and_drop_api.Configuration(
            requests to the same host, which is often the case here.
            cpu_count * 5 is used as default value to increase performance.
         """
+        self.connection_pool_block = False
+        """Wait for a free connection when all connection_pool_maxsize
+           connections of a pool are in use instead of opening another one.
+        """
+        self.pool_manager: Optional[urllib3.PoolManager] = None
+        """Send the requests with this urllib3 pool manager instead of a new one,
+           see click_and_drop_api.simple.ConnectionPool.
+        """
+        self.rest_client_class: Optional[Callable[[Self], RESTClientObject]] = None
+        """Create the REST client with this instead of RESTClientObject,
+           e.g. click_and_drop_api.http2.HTTP2RESTClientObject for HTTP/2.
+        """
 
         self.proxy: Optional[str] = None
         """Proxy URL
@@ -323,6 +341,18 @@ conf = click_and_drop_api.Configuration(
         self.retries = retries
         """Retry configuration
         """
+        self.retry_policy: Optional[RetryPolicy] = None
+        """Retry policy for throttled and failed responses,
+           see click_and_drop_api.retry.RetryPolicy.
+        """
+        self.rate_limiter: Optional[RateLimiter] = None
+        """Rate limiter shared by the requests,
+           see click_and_drop_api.retry.RateLimiter.
+        """
+        self.request_hooks: List[RequestHook] = []
+        """Hooks called before and after each request,
+           see click_and_drop_api.metrics.RequestHook.
+        """
         # Enable client side validation
         self.client_side_validation = True
 
@@ -343,10 +373,16 @@ conf = click_and_drop_api.Configuration(
         result = cls.__new__(cls)
         memo[id(self)] = result
         for k, v in self.__dict__.items():
-            if k not in ('logger', 'logger_file_handler'):
+            if k not in ('logger', 'logger_file_handler', 'rate_limiter', 'request_hooks', 'pool_manager'):
                 setattr(result, k, copy.deepcopy(v, memo))
         # shallow copy of loggers
         result.logger = copy.copy(self.logger)
+        # the copies share the rate limit
+        result.rate_limiter = self.rate_limiter
+        # and the hooks with their metrics
+        result.request_hooks = list(self.request_hooks)
+        # and the connections
+        result.pool_manager = self.pool_manager
         # use setters to configure loggers
         result.logger_file = self.logger_file
         result.debug = self.debug
@@ -0,0 +1,1391 @@
+"""A local stand-in for the Click & Drop API with state.
+
+The emulator implements the operations of click-and-drop-api-v1.yaml:
+it creates, lists, pages through, updates and deletes orders,
+generates label PDFs and manifests the labelled orders.
+Pipelines can be load tested without touching Royal Mail,
+with added latency, injected errors and 429 throttling.
+
+Run it in the test process:
+
+    with Emulator() as emulator:
+        api = ClickAndDrop(key, host=emulator.host)
+
+Send the requests to it without sockets:
+
+    api = ClickAndDrop(key, transport=Emulator().transport)
+
+Or start a server from the command line:
+
+    python -m click_and_drop_api.emulator --port 8080 --latency 0.05 --rate-limit 5
+
+The state is kept in memory. Orders are filtered by their creation time.
+"""
+
+from __future__ import annotations
+
+import argparse
+import base64
+import binascii
+import io
+import json
+import math
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, NamedTuple, Optional, Sequence, Union
+from urllib.parse import parse_qsl, unquote, urlsplit
+
+import urllib3
+from dateutil.parser import isoparse
+from pydantic import BaseModel, ValidationError
+
+from click_and_drop_api.configuration import Configuration
+from click_and_drop_api.models import (
+    CreateOrderErrorResponse,
+    CreateOrderLabelErrorResponse,
+    CreateOrderRequest,
+    CreateOrderResponse,
+    CreateOrdersResponse,
+    CreatePackagesResponse,
+    DeletedOrderInfo,
+    DeleteOrdersResource,
+    ErrorResponse,
+    FailedOrderResponse,
+    GetOrderDetailsResource,
+    GetOrderInfoResource,
+    GetOrderLineResult,
+    GetOrdersDetailsResponse,
+    GetOrdersResponse,
+    GetPostalDetailsResult,
+    GetShippingDetailsResult,
+    GetTagDetailsResult,
+    GetVersionResource,
+    ManifestDetailsResponse,
+    ManifestEligibleOrdersRequest,
+    ManifestErrorsErrorDetailsResponse,
+    ManifestErrorsResponse,
+    ManifestOrdersResponse,
+    OrderErrorInfo,
+    OrderErrorResponse,
+    OrderFieldResponse,
+    OrderUpdateError,
+    UpdatedOrderInfo,
+    UpdateOrdersStatusRequest,
+    UpdateOrderStatusRequest,
+    UpdateOrderStatusResponse,
+)
+from click_and_drop_api.rest import RESTClientObject, RESTResponse
+from click_and_drop_api.retry import RateLimiter
+
+BASE_PATH = "/api/v1"
+"""The path of the API on the host."""
+
+MAX_IDENTIFIERS = 100
+"""The maximum number of orders per request."""
+
+DOCUMENT_TYPES = ("postageLabel", "despatchNote", "CN22", "CN23")
+"""The documents that the labels endpoint generates."""
+
+ORDER_STATUSES = ("new", "despatchedByOtherCourier", "despatched")
+"""The statuses that can be set with update_orders_status()."""
+
+MANIFEST_STATUSES = ("labelGenerated", "despatched")
+"""The statuses of orders that can be manifested."""
+
+Identifier = Union[int, str]
+Response = tuple[int, dict[str, str], bytes]
+
+
+class EmulatorOptions(NamedTuple):
+    """How the emulator deviates from a quick and reliable API."""
+
+    latency: float = 0
+    """Seconds to wait before answering each request."""
+
+    jitter: float = 0
+    """Up to this many seconds are randomly added to the latency."""
+
+    error_rate: float = 0
+    """The share of requests that fail with error_status, from 0 to 1."""
+
+    error_status: int = 500
+    """The status code of the failing requests."""
+
+    rate_limit: Optional[float] = None
+    """Requests per second and key before 429 is returned, e.g. 5 like the API.
+
+    None does not throttle.
+    """
+
+    burst: Optional[int] = None
+    """The number of requests of a key that are allowed at once, rate_limit by default."""
+
+    key: Optional[str] = None
+    """The only API key that is accepted, any key by default."""
+
+    seed: Optional[int] = None
+    """Seed the random errors and jitter to repeat a run."""
+
+
+class EmulatedOrder(NamedTuple):
+    """An order stored by the emulator."""
+
+    order_identifier: int
+    """The number assigned by the emulator."""
+
+    request: CreateOrderRequest
+    """The order as it was created."""
+
+    created_on: datetime
+    """When the order was created."""
+
+    status: str = "new"
+    """new, labelGenerated, despatched or despatchedByOtherCourier."""
+
+    printed_on: Optional[datetime] = None
+    """When the last postage label was generated."""
+
+    shipped_on: Optional[datetime] = None
+    """When the order was despatched."""
+
+    manifested_on: Optional[datetime] = None
+    """When the order was manifested."""
+
+    manifest_number: Optional[int] = None
+    """The manifest that includes the order."""
+
+    tracking_number: Optional[str] = None
+    """The tracking number of the postage label or of another courier."""
+
+    shipping_carrier: Optional[str] = None
+    """The other courier that despatched the order."""
+
+    shipping_service: Optional[str] = None
+    """The service of the other courier."""
+
+    @property
+    def order_reference(self) -> Optional[str]:
+        """The reference given when the order was created."""
+        return self.request.order_reference
+
+    @property
+    def service_code(self) -> Optional[str]:
+        """The service code of the postage or None if no postage was applied."""
+        postage = self.request.postage_details
+        return None if postage is None else postage.service_code
+
+    @property
+    def carrier_name(self) -> Optional[str]:
+        """The carrier of the postage."""
+        postage = self.request.postage_details
+        return None if postage is None else postage.carrier_name
+
+
+class EmulatedManifest(NamedTuple):
+    """A manifest created by the emulator."""
+
+    manifest_number: int
+    """The number assigned by the emulator."""
+
+    order_identifiers: list[int]
+    """The orders on the manifest."""
+
+    created_on: datetime
+    """When the manifest was created."""
+
+    document_pdf: bytes
+    """The manifest paperwork."""
+
+
+class _Reply(Exception):
+    """Answer a request early, e.g. with an error."""
+
+    def __init__(self, status: int, body: Any, headers: Optional[dict] = None):
+        super().__init__(status)
+        self.status = status
+        self.body = body
+        self.headers = headers or {}
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _dump(body: Any) -> Any:
+    """Convert models to JSON values with the aliases of the API."""
+    if isinstance(body, BaseModel):
+        return body.model_dump(mode="json", by_alias=True, exclude_none=True)
+    if isinstance(body, list):
+        return [_dump(item) for item in body]
+    return body
+
+
+def _error(status: int, code: str, message: str) -> _Reply:
+    return _Reply(status, ErrorResponse(code=code, message=message))
+
+
+def _parse_datetime(value: Optional[str], name: str) -> Optional[datetime]:
+    """Parse a date and time of a query, naive ones are UTC."""
+    if value is None:
+        return None
+    try:
+        result = isoparse(value)
+    except ValueError:
+        raise _error(400, "InvalidParameter", f"{name} is not a date: {value!r}")
+    return result if result.tzinfo else result.replace(tzinfo=timezone.utc)
+
+
+def _parse_bool(value: Optional[str], name: str) -> Optional[bool]:
+    if value is None:
+        return None
+    if value.lower() not in ("true", "false"):
+        raise _error(400, "InvalidParameter", f"{name} is not a boolean: {value!r}")
+    return value.lower() == "true"
+
+
+def parse_order_identifiers(text: str) -> list[Identifier]:
+    """Parse the order identifiers of a path.
+
+    Parameters:
+        text:
+            The percent-encoded path segment, e.g. 1001;%22ref%22.
+            Order Identifiers are integers, Order References are
+            percent-encoded strings in double quotation marks.
+
+    Raises:
+        ValueError: If an identifier is malformed.
+    """
+    identifiers: list[Identifier] = []
+    for part in unquote(text).split(";"):
+        if len(part) >= 2 and part[0] == part[-1] == '"':
+            identifiers.append(unquote(part[1:-1]))
+        elif part.isdigit():
+            identifiers.append(int(part))
+        elif part:
+            raise ValueError(f"Invalid order identifier: {part!r}")
+    return identifiers
+
+
+def encode_continuation_token(order_identifier: int) -> str:
+    """Return the token of the page after an order."""
+    return base64.urlsafe_b64encode(str(order_identifier).encode()).decode()
+
+
+def decode_continuation_token(token: str) -> int:
+    """Return the order after which a page starts.
+
+    Raises:
+        ValueError: If the token was not created by the emulator.
+    """
+    try:
+        return int(base64.urlsafe_b64decode(token.encode()))
+    except (binascii.Error, ValueError):
+        raise ValueError(f"Invalid continuation token: {token!r}")
+
+
+def _pdf_string(text: str) -> bytes:
+    escaped = text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+    return escaped.encode("latin-1", "replace")
+
+
+def pdf(pages: Sequence[Sequence[str]]) -> bytes:
+    """Return a PDF document with one page of text lines per element."""
+    objects: list[bytes] = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"",  # the page tree, see below
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    kids = []
+    for lines in pages:
+        text = b"BT /F1 11 Tf 40 800 Td 14 TL " + b" ".join(
+            b"(" + _pdf_string(line) + b") '" for line in lines
+        )
+        stream = text + b" ET"
+        objects.append(
+            b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream)
+        )
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % len(objects)
+        )
+        kids.append(b"%d 0 R" % len(objects))
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (
+        b" ".join(kids),
+        len(kids),
+    )
+    document = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, content in enumerate(objects, 1):
+        offsets.append(len(document))
+        document += b"%d 0 obj\n%s\nendobj\n" % (number, content)
+    xref = len(document)
+    document += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for offset in offsets:
+        document += b"%010d 00000 n \n" % offset
+    document += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+        len(objects) + 1,
+        xref,
+    )
+    return bytes(document)
+
+
+def _recipient_lines(order: EmulatedOrder) -> list[str]:
+    address = order.request.recipient.address
+    if address is None:
+        return []
+    return [
+        line
+        for line in (
+            address.full_name,
+            address.company_name,
+            address.address_line1,
+            address.address_line2,
+            address.address_line3,
+            address.city,
+            address.postcode,
+            address.country_code,
+        )
+        if line
+    ]
+
+
+def _postal_details(details: Any) -> GetPostalDetailsResult:
+    """Convert recipient or billing details to the details of an order."""
+    address = None if details is None else details.address
+    if address is None:
+        return GetPostalDetailsResult()
+    first_name, _, last_name = (address.full_name or "").partition(" ")
+    return GetPostalDetailsResult(
+        first_name=first_name or None,
+        last_name=last_name or None,
+        company_name=address.company_name,
+        address_line1=address.address_line1,
+        address_line2=address.address_line2,
+        address_line3=address.address_line3,
+        city=address.city,
+        county=address.county,
+        postcode=address.postcode,
+        country_code=address.country_code,
+        phone_number=details.phone_number,
+        email_address=details.email_address,
+    )
+
+
+class Emulator:
+    """An in-memory Click & Drop API.
+
+    It can be used by any number of threads at the same time.
+    Use it as a context manager to start and stop its HTTP server.
+    """
+
+    def __init__(
+        self,
+        options: EmulatorOptions = EmulatorOptions(),
+        address: tuple[str, int] = ("127.0.0.1", 0),
+        clock: Callable[[], datetime] = _utcnow,
+    ):
+        """Create a new emulator without orders.
+
+        Parameters:
+            options: The latency, errors and throttling of the responses.
+            address: The interface and port of the HTTP server, a free port by default.
+            clock: Return the current time, e.g. to create orders in the past.
+        """
+        self.options = options
+        self.address = address
+        self.clock = clock
+        self.orders: dict[int, EmulatedOrder] = {}
+        """The orders by identifier."""
+        self.manifests: dict[int, EmulatedManifest] = {}
+        """The manifests by number."""
+        self.requests = 0
+        """The number of requests received."""
+        self._references: dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._random = random.Random(options.seed)
+        self._injected: list[int] = []
+        self._limiters: dict[str, RateLimiter] = {}
+        self._next_order = 1001
+        self._next_manifest = 1
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+        self._routes: list[tuple[str, str, Callable[..., Any], bool]] = [
+            ("GET", "/version", self._get_version, False),
+            ("GET", "/orders", self._get_orders, True),
+            ("POST", "/orders", self._create_orders, True),
+            ("GET", "/orders/full", self._get_orders_with_details, True),
+            ("PUT", "/orders/status", self._update_orders_status, True),
+            ("GET", "/orders/{}", self._get_specific_orders, True),
+            ("DELETE", "/orders/{}", self._delete_orders, True),
+            ("GET", "/orders/{}/full", self._get_specific_orders_with_details, True),
+            ("GET", "/orders/{}/label", self._get_label, True),
+            ("POST", "/manifests", self._manifest_eligible, True),
+            ("POST", "/manifests/retry/{}", self._retry_manifest, True),
+            ("GET", "/manifests/{}", self._get_manifest, True),
+        ]
+
+    @property
+    def host(self) -> str:
+        """The host to pass to ClickAndDrop once the server is started."""
+        if self._server is None:
+            raise RuntimeError("The emulator is not started.")
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}{BASE_PATH}"
+
+    def start(self) -> None:
+        """Start the HTTP server in a background thread."""
+        emulator = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Headers and body are written separately, avoid delayed ACKs.
+            disable_nagle_algorithm = True
+
+            def do_GET(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                status, headers, content = emulator.handle(
+                    self.command, self.path, dict(self.headers), self.rfile.read(length)
+                )
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(content)
+
+            do_POST = do_PUT = do_DELETE = do_GET
+
+            def log_message(self, format, *args):
+                pass
+
+        class Server(ThreadingHTTPServer):
+            daemon_threads = True
+            request_queue_size = 128
+
+        self._server = Server(self.address, Handler)
+        self._thread = threading.Thread(
+            target=self._server.serve_forever,
+            name="click_and_drop_api.emulator",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the HTTP server, the orders are kept."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> Emulator:
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def transport(self, configuration: Configuration) -> RESTClientObject:
+        """Create a REST client that sends the requests to this emulator in-process.
+
+        Pass it to ClickAndDrop(transport=...) or Configuration.rest_client_class.
+        """
+        return EmulatorRESTClientObject(configuration, self)
+
+    def inject_errors(self, count: int = 1, status: int = 500) -> None:
+        """Let the next requests fail.
+
+        Parameters:
+            count: The number of requests that fail.
+            status: Their status code, e.g. 429 or 503.
+        """
+        with self._lock:
+            self._injected.extend([status] * count)
+
+    def reset(self) -> None:
+        """Remove all orders and manifests."""
+        with self._lock:
+            self.orders.clear()
+            self.manifests.clear()
+            self._references.clear()
+            self._injected.clear()
+            self._limiters.clear()
+
+    def handle(
+        self, method: str, target: str, headers: dict[str, str], body: bytes
+    ) -> Response:
+        """Answer a request.
+
+        Parameters:
+            method: The HTTP method.
+            target: The path and query of the request.
+            headers: The headers of the request.
+            body: The body of the request.
+
+        Returns:
+            The status, the headers and the body of the response.
+        """
+        self._wait()
+        url = urlsplit(target)
+        query = dict(parse_qsl(url.query))
+        path = url.path[len(BASE_PATH) :] if url.path.startswith(BASE_PATH) else None
+        key = {name.lower(): value for name, value in headers.items()}.get(
+            "authorization"
+        )
+        with self._lock:
+            self.requests += 1
+        try:
+            for route_method, template, handler, secured in self._routes:
+                arguments = self._match(template, path)
+                if arguments is not None and route_method == method:
+                    self._check(key, secured)
+                    status, content = handler(*arguments, query=query, body=body)
+                    return self._response(status, content)
+            raise _error(404, "NotFound", f"{method} {url.path}")
+        except _Reply as reply:
+            return self._response(reply.status, reply.body, reply.headers)
+
+    # The parts of handle()
+
+    def _wait(self) -> None:
+        """Add the latency of the options."""
+        delay = self.options.latency
+        if self.options.jitter:
+            with self._lock:
+                delay += self._random.uniform(0, self.options.jitter)
+        if delay > 0:
+            time.sleep(delay)
+
+    def _check(self, key: Optional[str], secured: bool) -> None:
+        """Reject the request if unauthorised, throttled or failing.
+
+        Parameters:
+            key: The Authorization header.
+            secured: Whether the operation requires a valid key.
+        """
+        if key and key.startswith("Bearer "):
+            key = key[len("Bearer ") :]
+        if secured and (
+            not key or (self.options.key is not None and key != self.options.key)
+        ):
+            raise _error(401, "Unauthorized", "Invalid API key.")
+        key = key or ""
+        with self._lock:
+            limiter = None
+            if self.options.rate_limit is not None:
+                limiter = self._limiters.get(key)
+                if limiter is None:
+                    limiter = self._limiters[key] = RateLimiter(
+                        self.options.rate_limit, self.options.burst
+                    )
+            injected = self._injected.pop(0) if self._injected else None
+            if injected is None and self._random.random() < self.options.error_rate:
+                injected = self.options.error_status
+        if limiter is not None:
+            delay = limiter.try_acquire()
+            if delay:
+                raise _Reply(
+                    429,
+                    ErrorResponse(
+                        code="TooManyRequests", message="Rate limit exceeded."
+                    ),
+                    {"Retry-After": str(math.ceil(delay))},
+                )
+        if injected is not None:
+            headers = {"Retry-After": "0"} if injected == 429 else {}
+            raise _Reply(
+                injected,
+                ErrorResponse(code="Emulated", message="An injected error."),
+                headers,
+            )
+
+    @staticmethod
+    def _match(template: str, path: Optional[str]) -> Optional[list[str]]:
+        """Return the path parameters if the path matches the template."""
+        if path is None:
+            return None
+        expected = template.split("/")
+        parts = path.rstrip("/").split("/")
+        if len(parts) != len(expected):
+            return None
+        arguments = []
+        for part, pattern in zip(parts, expected):
+            if pattern == "{}":
+                arguments.append(part)
+            elif part != pattern:
+                return None
+        return arguments
+
+    @staticmethod
+    def _response(status: int, body: Any, headers: Optional[dict] = None) -> Response:
+        if isinstance(body, bytes):
+            content, content_type = body, "application/pdf"
+        else:
+            content, content_type = json.dumps(_dump(body)).encode(), "application/json"
+        return (
+            status,
+            {
+                "Content-Type": content_type,
+                "Content-Length": str(len(content)),
+                **(headers or {}),
+            },
+            content,
+        )
+
+    # Orders
+
+    def _parse_json(self, body: bytes) -> Any:
+        try:
+            return json.loads(body or b"null")
+        except ValueError as error:
+            raise _error(400, "InvalidJson", str(error))
+
+    def _identifiers(self, text: str, error: Callable[..., Any]) -> list[Identifier]:
+        try:
+            identifiers = parse_order_identifiers(text)
+        except ValueError as value_error:
+            raise _Reply(
+                400, [error(code="InvalidIdentifier", message=str(value_error))]
+            )
+        if not identifiers or len(identifiers) > MAX_IDENTIFIERS:
+            raise _Reply(
+                400,
+                [
+                    error(
+                        code="InvalidIdentifier",
+                        message=f"Expected 1 to {MAX_IDENTIFIERS} identifiers.",
+                    )
+                ],
+            )
+        return identifiers
+
+    def _find(self, identifier: Identifier) -> Optional[EmulatedOrder]:
+        """Return the order with an identifier or reference, the lock is held."""
+        if isinstance(identifier, str):
+            found = self._references.get(identifier)
+            return None if found is None else self.orders.get(found)
+        return self.orders.get(identifier)
+
+    def _packages(self, order: EmulatedOrder) -> list[CreatePackagesResponse]:
+        return [
+            CreatePackagesResponse(
+                package_number=number,
+                tracking_number=None
+                if order.printed_on is None
+                else self._tracking_number(order.order_identifier, number),
+            )
+            for number in range(1, len(order.request.packages or ()) + 1)
+        ]
+
+    @staticmethod
+    def _tracking_number(order_identifier: int, package_number: int = 1) -> str:
+        return f"EM{order_identifier:07d}{package_number:02d}GB"
+
+    def _info(self, order: EmulatedOrder) -> GetOrderInfoResource:
+        return GetOrderInfoResource(
+            order_identifier=order.order_identifier,
+            order_reference=order.order_reference,
+            created_on=order.created_on,
+            order_date=order.request.order_date,
+            printed_on=order.printed_on,
+            manifested_on=order.manifested_on,
+            shipped_on=order.shipped_on,
+            tracking_number=order.tracking_number,
+            packages=self._packages(order) or None,
+        )
+
+    def _details(self, order: EmulatedOrder) -> GetOrderDetailsResource:
+        request = order.request
+        contents = [
+            item
+            for package in request.packages or ()
+            for item in package.contents or ()
+        ]
+        return GetOrderDetailsResource(
+            order_identifier=order.order_identifier,
+            order_status=order.status,
+            created_on=order.created_on,
+            printed_on=order.printed_on,
+            shipped_on=order.shipped_on,
+            manifested_on=order.manifested_on,
+            order_date=request.order_date,
+            trading_name=None
+            if request.sender is None
+            else request.sender.trading_name,
+            order_reference=order.order_reference,
+            special_instructions=request.special_instructions,
+            subtotal=request.subtotal,
+            shipping_cost_charged=request.shipping_cost_charged,
+            order_discount=0,
+            total=request.total,
+            weight_in_grams=sum(
+                package.weight_in_grams for package in request.packages or ()
+            ),
+            package_size=request.packages[0].package_format_identifier
+            if request.packages
+            else None,
+            currency_code=request.currency_code,
+            shipping_details=GetShippingDetailsResult(
+                shipping_cost=request.shipping_cost_charged,
+                tracking_number=order.tracking_number,
+                service_code=order.service_code,
+                shipping_service=order.shipping_service,
+                shipping_carrier=order.shipping_carrier or order.carrier_name,
+                packages=self._packages(order) or None,
+            ),
+            shipping_info=_postal_details(request.recipient),
+            billing_info=_postal_details(request.billing or request.recipient),
+            order_lines=[
+                GetOrderLineResult(
+                    sku=item.sku,
+                    name=item.name,
+                    quantity=item.quantity,
+                    unit_value=item.unit_value,
+                    line_total=None
+                    if item.unit_value is None
+                    else item.unit_value * item.quantity,
+                    customs_code=item.customs_code,
+                )
+                for item in contents
+            ],
+            tags=[
+                GetTagDetailsResult(key=tag.key, value=tag.value)
+                for tag in request.tags
+            ]
+            if request.tags
+            else None,
+        )
+
+    def _label(self, order: EmulatedOrder, now: datetime) -> EmulatedOrder:
+        """Apply a postage label to an order, the lock is held."""
+        order = order._replace(
+            status="labelGenerated",
+            printed_on=now,
+            tracking_number=self._tracking_number(order.order_identifier),
+            manifested_on=None,
+            manifest_number=None,
+        )
+        self.orders[order.order_identifier] = order
+        return order
+
+    def _label_pages(
+        self, orders: Sequence[EmulatedOrder], document_type: str
+    ) -> list[list[str]]:
+        return [
+            [
+                f"Click & Drop emulator - {document_type}",
+                f"Order {order.order_identifier} {order.order_reference or ''}",
+                f"Service {order.service_code}",
+                f"Tracking number {order.tracking_number}",
+                *_recipient_lines(order),
+            ]
+            for order in orders
+        ]
+
+    def _create_orders(self, *, query: dict, body: bytes) -> tuple[int, Any]:
+        data = self._parse_json(body)
+        items = data.get("items") if isinstance(data, dict) else None
+        if not isinstance(items, list) or not items:
+            raise _error(400, "InvalidRequest", "Expected at least one item.")
+        if len(items) > MAX_IDENTIFIERS:
+            raise _error(
+                400, "InvalidRequest", f"Expected at most {MAX_IDENTIFIERS} items."
+            )
+        created = []
+        failed = []
+        now = self.clock()
+        for item in items:
+            try:
+                request = CreateOrderRequest.from_dict(item)
+            except ValidationError as error:
+                failed.append(
+                    FailedOrderResponse(
+                        errors=[
+                            CreateOrderErrorResponse(
+                                error_code=400,
+                                error_message=detail["msg"],
+                                fields=[
+                                    OrderFieldResponse(
+                                        field_name=".".join(map(str, detail["loc"])),
+                                        value=None
+                                        if detail.get("input") is None
+                                        else str(detail["input"]),
+                                    )
+                                ],
+                            )
+                            for detail in error.errors()
+                        ]
+                    )
+                )
+                continue
+            with self._lock:
+                reference = request.order_reference
+                if reference is not None and reference in self._references:
+                    failed.append(
+                        FailedOrderResponse(
+                            order=request,
+                            errors=[
+                                CreateOrderErrorResponse(
+                                    error_code=409,
+                                    error_message="An order with this reference already exists.",
+                                    fields=[
+                                        OrderFieldResponse(
+                                            field_name="orderReference",
+                                            value=reference,
+                                        )
+                                    ],
+                                )
+                            ],
+                        )
+                    )
+                    continue
+                order = EmulatedOrder(self._next_order, request, now)
+                self._next_order += 1
+                self.orders[order.order_identifier] = order
+                if reference is not None:
+                    self._references[reference] = order.order_identifier
+                label_errors = None
+                if request.label is not None:
+                    if order.service_code is None:
+                        label_errors = [
+                            CreateOrderLabelErrorResponse(
+                                code="PostageNotApplied",
+                                message="The order has no service code.",
+                            )
+                        ]
+                    else:
+                        order = self._label(order, now)
+            label = None
+            if (
+                request.label is not None
+                and request.label.include_label_in_response
+                and label_errors is None
+            ):
+                label = base64.b64encode(
+                    pdf(self._label_pages([order], "postageLabel"))
+                ).decode()
+            info = self._info(order)
+            created.append(
+                CreateOrderResponse(
+                    **info.model_dump(exclude_none=True),
+                    label=label,
+                    label_errors=label_errors,
+                    generated_documents=None if label is None else ["postageLabel"],
+                )
+            )
+        return 200, CreateOrdersResponse(
+            success_count=len(created),
+            errors_count=len(failed),
+            created_orders=created,
+            failed_orders=failed,
+        )
+
+    def _page(self, query: dict) -> tuple[list[EmulatedOrder], Optional[str]]:
+        """Return the orders of a page and the token of the next page."""
+        try:
+            page_size = int(query.get("pageSize", 25))
+        except ValueError:
+            page_size = 0
+        if not 1 <= page_size <= MAX_IDENTIFIERS:
+            raise _error(
+                400, "InvalidParameter", f"pageSize must be 1 to {MAX_IDENTIFIERS}."
+            )
+        start = _parse_datetime(query.get("startDateTime"), "startDateTime")
+        end = _parse_datetime(query.get("endDateTime"), "endDateTime")
+        token = query.get("continuationToken")
+        try:
+            after = 0 if not token else decode_continuation_token(token)
+        except ValueError as error:
+            raise _error(400, "InvalidParameter", str(error))
+        page: list[EmulatedOrder] = []
+        with self._lock:
+            # The orders are stored in the order of their identifiers.
+            for order in self.orders.values():
+                if order.order_identifier <= after:
+                    continue
+                if (start is None or order.created_on >= start) and (
+                    end is None or order.created_on <= end
+                ):
+                    if len(page) == page_size:
+                        return page, encode_continuation_token(
+                            page[-1].order_identifier
+                        )
+                    page.append(order)
+        return page, None
+
+    def _get_orders(self, *, query: dict, body: bytes) -> tuple[int, Any]:
+        orders, token = self._page(query)
+        return 200, GetOrdersResponse(
+            orders=[self._info(order) for order in orders], continuation_token=token
+        )
+
+    def _get_orders_with_details(self, *, query: dict, body: bytes) -> tuple[int, Any]:
+        orders, token = self._page(query)
+        return 200, GetOrdersDetailsResponse(
+            orders=[self._details(order) for order in orders], continuation_token=token
+        )
+
+    def _specific_orders(self, text: str) -> list[EmulatedOrder]:
+        identifiers = self._identifiers(text, OrderErrorResponse)
+        with self._lock:
+            found = [self._find(identifier) for identifier in identifiers]
+        return [order for order in found if order is not None]
+
+    def _get_specific_orders(
+        self, identifiers: str, *, query: dict, body: bytes
+    ) -> tuple[int, Any]:
+        return 200, [self._info(order) for order in self._specific_orders(identifiers)]
+
+    def _get_specific_orders_with_details(
+        self, identifiers: str, *, query: dict, body: bytes
+    ) -> tuple[int, Any]:
+        return 200, [
+            self._details(order) for order in self._specific_orders(identifiers)
+        ]
+
+    def _delete_orders(
+        self, identifiers: str, *, query: dict, body: bytes
+    ) -> tuple[int, Any]:
+        deleted = []
+        errors = []
+        with self._lock:
+            for identifier in self._identifiers(identifiers, OrderErrorInfo):
+                order = self._find(identifier)
+                if order is None:
+                    errors.append(
+                        OrderErrorInfo(
+                            order_identifier=identifier
+                            if isinstance(identifier, int)
+                            else None,
+                            order_reference=identifier
+                            if isinstance(identifier, str)
+                            else None,
+                            code="OrderNotFound",
+                            message="The order does not exist.",
+                        )
+                    )
+                    continue
+                del self.orders[order.order_identifier]
+                if order.order_reference is not None:
+                    self._references.pop(order.order_reference, None)
+                deleted.append(
+                    DeletedOrderInfo(
+                        order_identifier=order.order_identifier,
+                        order_reference=order.order_reference,
+                        order_info="Deleted",
+                    )
+                )
+        return 200, DeleteOrdersResource(deleted_orders=deleted, errors=errors)
+
+    def _update_orders_status(self, *, query: dict, body: bytes) -> tuple[int, Any]:
+        try:
+            request = UpdateOrdersStatusRequest.from_dict(self._parse_json(body))
+        except ValidationError as error:
+            raise _Reply(
+                400, [OrderUpdateError(code="InvalidRequest", message=str(error))]
+            )
+        items = request.items or []
+        if not items or len(items) > MAX_IDENTIFIERS:
+            raise _Reply(
+                400,
+                [
+                    OrderUpdateError(
+                        code="InvalidRequest",
+                        message=f"Expected 1 to {MAX_IDENTIFIERS} items.",
+                    )
+                ],
+            )
+        now = self.clock()
+        results = [self._update_order_status(item, now) for item in items]
+        return 200, UpdateOrderStatusResponse(
+            updated_orders=[
+                result for result in results if isinstance(result, UpdatedOrderInfo)
+            ],
+            errors=[
+                result for result in results if isinstance(result, OrderUpdateError)
+            ],
+        )
+
+    def _update_order_status(
+        self, item: UpdateOrderStatusRequest, now: datetime
+    ) -> Union[UpdatedOrderInfo, OrderUpdateError]:
+        """Set the status of one order."""
+
+        def fail(code: str, message: str) -> OrderUpdateError:
+            return OrderUpdateError(
+                order_identifier=item.order_identifier,
+                order_reference=item.order_reference,
+                status=item.status,
+                code=code,
+                message=message,
+            )
+
+        if (item.order_identifier is None) == (item.order_reference is None):
+            return fail(
+                "InvalidIdentifier",
+                "Provide either orderIdentifier or orderReference.",
+            )
+        if item.status not in ORDER_STATUSES:
+            return fail("InvalidStatus", f"The status must be one of {ORDER_STATUSES}.")
+        if (
+            item.status == "despatchedByOtherCourier"
+            and item.tracking_number
+            and not (
+                item.despatch_date and item.shipping_carrier and item.shipping_service
+            )
+        ):
+            return fail(
+                "MissingField",
+                "despatchDate, shippingCarrier and shippingService "
+                "are required with a trackingNumber.",
+            )
+        with self._lock:
+            order = self._find(
+                item.order_identifier
+                if item.order_reference is None
+                else item.order_reference
+            )
+            if order is None:
+                return fail("OrderNotFound", "The order does not exist.")
+            if item.status == "new":
+                # The label is no longer valid.
+                order = order._replace(
+                    status="new",
+                    printed_on=None,
+                    shipped_on=None,
+                    manifested_on=None,
+                    manifest_number=None,
+                    tracking_number=None,
+                    shipping_carrier=None,
+                    shipping_service=None,
+                )
+            elif item.status == "despatched":
+                order = order._replace(status="despatched", shipped_on=now)
+            else:
+                order = order._replace(
+                    status="despatchedByOtherCourier",
+                    shipped_on=item.despatch_date or now,
+                    tracking_number=item.tracking_number,
+                    shipping_carrier=item.shipping_carrier,
+                    shipping_service=item.shipping_service,
+                )
+            self.orders[order.order_identifier] = order
+        return UpdatedOrderInfo(
+            order_identifier=order.order_identifier,
+            order_reference=order.order_reference,
+            status=order.status,
+        )
+
+    # Labels
+
+    def _get_label(
+        self, identifiers: str, *, query: dict, body: bytes
+    ) -> tuple[int, Any]:
+        document_type = query.get("documentType")
+        if document_type not in DOCUMENT_TYPES:
+            raise _Reply(
+                400,
+                [
+                    OrderErrorResponse(
+                        code="InvalidParameter",
+                        message=f"documentType must be one of {DOCUMENT_TYPES}.",
+                    )
+                ],
+            )
+        include_returns_label = _parse_bool(
+            query.get("includeReturnsLabel"), "includeReturnsLabel"
+        )
+        if document_type == "postageLabel" and include_returns_label is None:
+            raise _Reply(
+                400,
+                [
+                    OrderErrorResponse(
+                        code="InvalidParameter",
+                        message="includeReturnsLabel is required for postage labels.",
+                    )
+                ],
+            )
+        _parse_bool(query.get("includeCN"), "includeCN")
+        requested = self._identifiers(identifiers, OrderErrorResponse)
+        now = self.clock()
+        with self._lock:
+            orders = [self._find(identifier) for identifier in requested]
+            missing = [
+                identifier
+                for identifier, order in zip(requested, orders)
+                if order is None
+            ]
+            if missing:
+                raise _Reply(
+                    404,
+                    [
+                        OrderErrorResponse(
+                            account_order_number=identifier
+                            if isinstance(identifier, int)
+                            else None,
+                            channel_order_reference=identifier
+                            if isinstance(identifier, str)
+                            else None,
+                            code="OrderNotFound",
+                            message="The order does not exist.",
+                        )
+                        for identifier in missing
+                    ],
+                )
+            without_postage = [order for order in orders if order.service_code is None]
+            if without_postage:
+                raise _Reply(
+                    400,
+                    [
+                        OrderErrorResponse(
+                            account_order_number=order.order_identifier,
+                            channel_order_reference=order.order_reference,
+                            code="PostageNotApplied",
+                            message="Label generation is only available for orders with postage applied.",
+                        )
+                        for order in without_postage
+                    ],
+                )
+            if document_type == "postageLabel":
+                orders = [self._label(order, now) for order in orders]
+        pages = self._label_pages(orders, document_type)
+        if include_returns_label:
+            pages += self._label_pages(orders, "returnsLabel")
+        return 200, pdf(pages)
+
+    # Manifests
+
+    def _manifest_response(self, manifest: EmulatedManifest) -> ManifestOrdersResponse:
+        return ManifestOrdersResponse(
+            manifest_number=manifest.manifest_number,
+            document_pdf=base64.b64encode(manifest.document_pdf).decode(),
+        )
+
+    def _manifest_eligible(self, *, query: dict, body: bytes) -> tuple[int, Any]:
+        data = self._parse_json(body)
+        try:
+            request = ManifestEligibleOrdersRequest.from_dict(data or {})
+        except ValidationError as error:
+            raise _Reply(
+                400,
+                ManifestErrorsResponse(
+                    errors=[
+                        ManifestErrorsErrorDetailsResponse(
+                            code="InvalidRequest", description=str(error)
+                        )
+                    ]
+                ),
+            )
+        now = self.clock()
+        with self._lock:
+            eligible = [
+                order
+                for order in self.orders.values()
+                if order.status in MANIFEST_STATUSES
+                and order.manifest_number is None
+                and (
+                    request.carrier_name is None
+                    or order.carrier_name == request.carrier_name
+                )
+            ]
+            if not eligible:
+                raise _Reply(
+                    400,
+                    ManifestErrorsResponse(
+                        errors=[
+                            ManifestErrorsErrorDetailsResponse(
+                                code="NoEligibleOrders",
+                                description="There are no orders to manifest.",
+                            )
+                        ]
+                    ),
+                )
+            number = self._next_manifest
+            self._next_manifest += 1
+            for order in eligible:
+                self.orders[order.order_identifier] = order._replace(
+                    manifested_on=now, manifest_number=number
+                )
+            manifest = self.manifests[number] = EmulatedManifest(
+                number,
+                [order.order_identifier for order in eligible],
+                now,
+                pdf(
+                    [
+                        [f"Click & Drop emulator - manifest {number}"]
+                        + [
+                            f"Order {order.order_identifier} "
+                            f"{order.service_code} {order.tracking_number}"
+                            for order in eligible
+                        ]
+                    ]
+                ),
+            )
+        return 201, self._manifest_response(manifest)
+
+    def _find_manifest(self, manifest_identifier: str) -> EmulatedManifest:
+        manifest = (
+            self.manifests.get(int(manifest_identifier))
+            if manifest_identifier.isdigit()
+            else None
+        )
+        if manifest is None:
+            raise _Reply(
+                404,
+                ManifestErrorsResponse(
+                    errors=[
+                        ManifestErrorsErrorDetailsResponse(
+                            code="ManifestNotFound",
+                            description=f"There is no manifest {manifest_identifier}.",
+                        )
+                    ]
+                ),
+            )
+        return manifest
+
+    def _retry_manifest(
+        self, manifest_identifier: str, *, query: dict, body: bytes
+    ) -> tuple[int, Any]:
+        return 201, self._manifest_response(self._find_manifest(manifest_identifier))
+
+    def _get_manifest(
+        self, manifest_identifier: str, *, query: dict, body: bytes
+    ) -> tuple[int, Any]:
+        manifest = self._find_manifest(manifest_identifier)
+        return 200, ManifestDetailsResponse(
+            manifest_number=manifest.manifest_number,
+            status="Completed",
+            document_pdf=base64.b64encode(manifest.document_pdf).decode(),
+        )
+
+    # Version
+
+    def _get_version(self, *, query: dict, body: bytes) -> tuple[int, Any]:
+        return 200, GetVersionResource(
+            commit="emulator",
+            build="emulator",
+            release="1.0.0",
+            release_date=datetime(2025, 1, 1, tzinfo=timezone.utc),
+        )
+
+
+class EmulatorRESTClientObject(RESTClientObject):
+    """A REST client that sends the requests to an Emulator in the same process.
+
+    The requests are retried and rate limited like those of RESTClientObject.
+    """
+
+    def __init__(self, configuration: Configuration, emulator: Emulator) -> None:
+        """Create a new client.
+
+        Parameters:
+            configuration: The retry policy and rate limiter.
+            emulator: The emulator that answers the requests.
+        """
+        self.emulator = emulator
+        self.retry_policy = configuration.retry_policy
+        self.rate_limiter = configuration.rate_limiter
+
+    def send(
+        self,
+        method,
+        url,
+        headers=None,
+        body=None,
+        post_params=None,
+        _request_timeout=None,
+    ) -> RESTResponse:
+        """Perform one request.
+
+        The parameters are the same as for RESTClientObject.send.
+        Only JSON bodies are supported.
+        """
+        url = urlsplit(url)
+        target = url.path + ("?" + url.query if url.query else "")
+        if body is not None and not isinstance(body, bytes):
+            body = json.dumps(body).encode()
+        status, response_headers, content = self.emulator.handle(
+            method.upper(), target, dict(headers or {}), body or b""
+        )
+        return RESTResponse(
+            urllib3.HTTPResponse(
+                body=io.BytesIO(content),
+                headers=response_headers,
+                status=status,
+                reason=HTTPStatus(status).phrase,
+                preload_content=False,
+            )
+        )
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """Run the emulator until it is interrupted."""
+    parser = argparse.ArgumentParser(
+        prog="python -m click_and_drop_api.emulator",
+        description="A local stand-in for the Click & Drop API.",
+    )
+    parser.add_argument("--host", default="127.0.0.1", help="the interface to bind")
+    parser.add_argument("--port", type=int, default=8080, help="the port to bind")
+    parser.add_argument("--key", help="the only API key to accept")
+    parser.add_argument(
+        "--latency", type=float, default=0, help="seconds before each response"
+    )
+    parser.add_argument(
+        "--jitter", type=float, default=0, help="random seconds added to the latency"
+    )
+    parser.add_argument(
+        "--error-rate",
+        type=float,
+        default=0,
+        help="the share of requests that fail, from 0 to 1",
+    )
+    parser.add_argument(
+        "--error-status", type=int, default=500, help="the status of failing requests"
+    )
+    parser.add_argument(
+        "--rate-limit",
+        type=float,
+        help="requests per second and key before 429, e.g. 5 like the API",
+    )
+    parser.add_argument("--burst", type=int, help="requests of a key allowed at once")
+    parser.add_argument("--seed", type=int, help="seed the errors and jitter")
+    arguments = parser.parse_args(argv)
+    emulator = Emulator(
+        EmulatorOptions(
+            latency=arguments.latency,
+            jitter=arguments.jitter,
+            error_rate=arguments.error_rate,
+            error_status=arguments.error_status,
+            rate_limit=arguments.rate_limit,
+            burst=arguments.burst,
+            key=arguments.key,
+            seed=arguments.seed,
+        ),
+        (arguments.host, arguments.port),
+    )
+    with emulator:
+        print(f"Serving the Click & Drop API at {emulator.host}", flush=True)
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            pass
+
+
+__all__ = [
+    "Emulator",
+    "EmulatorOptions",
+    "EmulatedOrder",
+    "EmulatedManifest",
+    "EmulatorRESTClientObject",
+    "parse_order_identifiers",
+    "encode_continuation_token",
+    "decode_continuation_token",
+    "pdf",
+]
+
+
+if __name__ == "__main__":
+    main()
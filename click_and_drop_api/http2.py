@@ -0,0 +1,260 @@
+"""Send the requests over HTTP/2 with httpx.
+
+Over HTTP/1.1, each request in flight needs its own connection,
+so 50 labels generated in parallel open 50 TCP and TLS connections.
+HTTP/2 multiplexes concurrent requests over a few connections.
+
+Install the dependencies with `pip install click_and_drop_api[http2]`
+and select the transport in the configuration:
+
+    configuration.rest_client_class = HTTP2RESTClientObject
+
+or with ClickAndDrop(key, transport=HTTP2RESTClientObject).
+
+The requests of all threads are sent by an httpx.AsyncClient
+on an event loop in a background thread.
+The synchronous HTTP/2 connections of httpx can send the streams of
+concurrent threads out of order, which the server rejects.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import re
+import ssl
+import threading
+import weakref
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Iterator, TypeVar, Union
+
+from click_and_drop_api.exceptions import ApiException, ApiValueError
+from click_and_drop_api.rest import RESTClientObject, RESTResponse
+
+if TYPE_CHECKING:
+    import httpx
+
+    from click_and_drop_api.configuration import Configuration
+
+T = TypeVar("T")
+Run = Callable[[Awaitable[T]], T]
+
+
+class HTTPXResponse:
+    """An httpx response with the interface of urllib3.HTTPResponse.
+
+    Only the parts used by the API client are provided.
+    """
+
+    def __init__(self, response: httpx.Response, run: Run):
+        """Wrap a response.
+
+        Parameters:
+            response: A streamed response of an httpx.AsyncClient.
+            run: Run a coroutine on the event loop of the client.
+        """
+        self.response = response
+        self.status = response.status_code
+        self.reason = response.reason_phrase
+        self.headers = response.headers
+        self._run = run
+
+    @property
+    def data(self) -> bytes:
+        """The body of the response, read on first access."""
+        return self._run(self.response.aread())
+
+    def stream(self, amt: int = 2**16) -> Iterator[bytes]:
+        """Yield the body in chunks of amt bytes."""
+        chunks = self.response.aiter_bytes(amt)
+        while True:
+            try:
+                yield self._run(chunks.__anext__())
+            except StopAsyncIteration:
+                return
+
+    def drain_conn(self) -> None:
+        """Read the rest of the body so that the connection can be reused."""
+        self._run(self.response.aread())
+
+    def release_conn(self) -> None:
+        """Return the connection to the pool."""
+        self._run(self.response.aclose())
+
+    def close(self) -> None:
+        """Close the response."""
+        self._run(self.response.aclose())
+
+
+def ssl_context(configuration: Configuration) -> Union[ssl.SSLContext, bool]:
+    """Return the TLS settings of the configuration for httpx."""
+    if not configuration.verify_ssl:
+        return False
+    context = ssl.create_default_context(
+        cafile=configuration.ssl_ca_cert, cadata=configuration.ca_cert_data
+    )
+    if configuration.cert_file:
+        context.load_cert_chain(configuration.cert_file, configuration.key_file)
+    if configuration.assert_hostname is False:
+        context.check_hostname = False
+    return context
+
+
+def _close(
+    loop: asyncio.AbstractEventLoop, thread: threading.Thread, client: httpx.AsyncClient
+) -> None:
+    """Close the connections of the client, then stop and close its event loop."""
+    if thread is threading.current_thread():
+        # the loop cannot wait for itself
+        loop.call_soon(loop.stop)
+        return
+    try:
+        asyncio.run_coroutine_threadsafe(client.aclose(), loop).result()
+    finally:
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+
+def timeout(_request_timeout: Any) -> Any:
+    """Convert the timeout of a request to an httpx timeout.
+
+    Parameters:
+        _request_timeout:
+            None, the total seconds or a (connect, read) tuple of seconds.
+    """
+    import httpx
+
+    if isinstance(_request_timeout, (int, float)):
+        return httpx.Timeout(_request_timeout)
+    if isinstance(_request_timeout, tuple) and len(_request_timeout) == 2:
+        return httpx.Timeout(
+            None, connect=_request_timeout[0], read=_request_timeout[1]
+        )
+    return httpx.Timeout(None)
+
+
+class HTTP2RESTClientObject(RESTClientObject):
+    """A REST client that multiplexes concurrent requests over HTTP/2.
+
+    The requests are retried and rate limited like those of RESTClientObject.
+    One httpx client with its connections is shared by all threads.
+    Call close() to close the connections and its event loop,
+    otherwise they are closed when the client is garbage collected.
+    Servers that do not support HTTP/2 are sent HTTP/1.1 requests.
+    """
+
+    def __init__(self, configuration: Configuration, http1: bool = True) -> None:
+        """Create a new client.
+
+        Parameters:
+            configuration: The TLS, proxy and pool settings.
+            http1:
+                Fall back to HTTP/1.1 for servers without HTTP/2.
+                False sends HTTP/2 without TLS to http:// URLs
+                (prior knowledge), e.g. to a local test server.
+
+        Raises:
+            ValueError: If the configuration shares a urllib3 pool manager.
+        """
+        import httpx
+
+        if configuration.pool_manager is not None:
+            raise ValueError(
+                "A ConnectionPool shares HTTP/1.1 connections, "
+                "HTTP/2 multiplexes the requests over its own."
+            )
+        self.client = httpx.AsyncClient(
+            http1=http1,
+            http2=True,
+            verify=ssl_context(configuration),
+            proxy=configuration.proxy,
+            limits=httpx.Limits(
+                max_connections=configuration.connection_pool_maxsize,
+                max_keepalive_connections=configuration.connection_pool_maxsize,
+            ),
+        )
+        self.retry_policy = configuration.retry_policy
+        self.rate_limiter = configuration.rate_limiter
+        self._loop = asyncio.new_event_loop()
+        thread = threading.Thread(
+            target=self._loop.run_forever, name="click_and_drop_api.http2", daemon=True
+        )
+        thread.start()
+        self._close = weakref.finalize(self, _close, self._loop, thread, self.client)
+
+    def _run(self, coroutine: Awaitable[T]) -> T:
+        """Run a coroutine on the event loop of the client and return its result."""
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop).result()
+
+    def close(self) -> None:
+        """Close all connections, then stop and close the event loop.
+
+        Calling close() again does nothing.
+        """
+        self._close()
+
+    def send(
+        self,
+        method,
+        url,
+        headers=None,
+        body=None,
+        post_params=None,
+        _request_timeout=None,
+    ) -> RESTResponse:
+        """Perform one request.
+
+        The parameters are the same as for RESTClientObject.send.
+        """
+        method = method.upper()
+        if post_params and body:
+            raise ApiValueError(
+                "body parameter cannot be used with post_params parameter."
+            )
+        post_params = post_params or []
+        headers = dict(headers or {})
+        arguments: dict[str, Any] = {}
+        if method in ["POST", "PUT", "PATCH", "OPTIONS", "DELETE"]:
+            content_type = headers.get("Content-Type")
+            if not content_type or re.search("json", content_type, re.IGNORECASE):
+                if isinstance(body, bytes):
+                    # serialized by ApiClient.serialize_body()
+                    arguments["content"] = body
+                elif body is not None:
+                    arguments["content"] = json.dumps(body)
+            elif content_type == "application/x-www-form-urlencoded":
+                arguments["data"] = dict(post_params)
+            elif content_type == "multipart/form-data":
+                # httpx generates the Content-Type with the boundary
+                del headers["Content-Type"]
+                arguments["data"] = {
+                    name: json.dumps(value) if isinstance(value, dict) else value
+                    for name, value in post_params
+                    if not isinstance(value, tuple)
+                }
+                arguments["files"] = [
+                    (name, value)
+                    for name, value in post_params
+                    if isinstance(value, tuple)
+                ]
+            elif isinstance(body, (str, bytes)):
+                arguments["content"] = body
+            elif content_type.startswith("text/") and isinstance(body, bool):
+                arguments["content"] = "true" if body else "false"
+            else:
+                msg = """Cannot prepare a request message for provided
+                         arguments. Please check that your arguments match
+                         declared content type."""
+                raise ApiException(status=0, reason=msg)
+        request = self.client.build_request(
+            method,
+            url,
+            headers=headers,
+            timeout=timeout(_request_timeout),
+            **arguments,
+        )
+        response = self._run(self.client.send(request, stream=True))
+        return RESTResponse(HTTPXResponse(response, self._run))
+
+
+__all__ = ["HTTP2RESTClientObject", "HTTPXResponse"]
@@ -0,0 +1,369 @@
+"""Measure the requests to the Click & Drop API.
+
+Add a RequestHook to Configuration.request_hooks
+or pass it to ClickAndDrop(request_hooks=[...]).
+Its before_request() is called before a request is sent and
+its after_request() once the response is deserialized or the request failed.
+Both receive the RequestMetrics of the request.
+
+The phases of a request are measured in the context of the caller:
+ApiClient.param_serialize() starts the measurement,
+ApiClient.call_api() sends the request and
+ApiClient.response_deserialize() finishes it.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import logging
+import time
+from typing import TYPE_CHECKING, Any, NamedTuple, Optional, Sequence
+from urllib.parse import urlsplit
+
+if TYPE_CHECKING:
+    from opentelemetry.trace import Tracer
+    from prometheus_client import CollectorRegistry
+
+logger = logging.getLogger(__name__)
+
+
+class RequestMetrics(NamedTuple):
+    """The measurements of a request.
+
+    before_request() receives the fields known before sending,
+    the others are None or 0.
+    """
+
+    method: str
+    """The HTTP method, e.g. "GET"."""
+
+    resource_path: str
+    """The path template of the operation, e.g. "/orders/{orderIdentifiers}".
+
+    This is the URL path if the request was not built by param_serialize().
+    """
+
+    url: str
+    """The URL of the request."""
+
+    bytes_out: int
+    """The size of the request body."""
+
+    serialize_seconds: float
+    """The time to build the request and serialize its body."""
+
+    started: float
+    """The time the request was sent, as returned by time.time()."""
+
+    status: Optional[int] = None
+    """The status code of the last response or None if there is none."""
+
+    bytes_in: int = 0
+    """The size of the response body."""
+
+    network_seconds: float = 0
+    """The time from sending the request until the response body was read.
+
+    This includes the retries and the waits of the rate limiter.
+    """
+
+    deserialize_seconds: float = 0
+    """The time to deserialize the response body."""
+
+    retries: int = 0
+    """The number of times the request was retried."""
+
+    error: Optional[BaseException] = None
+    """The exception raised by the request, e.g. an ApiException."""
+
+    @property
+    def seconds(self) -> float:
+        """The time from serializing the request until it finished."""
+        return self.serialize_seconds + self.network_seconds + self.deserialize_seconds
+
+
+class RequestHook:
+    """Observe the requests to the API.
+
+    Override the methods you need. Exceptions raised by them are logged.
+    The hooks are called in the thread or task that makes the request.
+    """
+
+    def before_request(self, metrics: RequestMetrics) -> None:
+        """Called before the request is sent."""
+
+    def after_request(self, metrics: RequestMetrics) -> None:
+        """Called after the response was deserialized or the request failed."""
+
+
+def body_size(body: Any) -> int:
+    """Return the number of bytes of a serialized request body."""
+    if body is None:
+        return 0
+    if isinstance(body, str):
+        return len(body.encode("utf-8"))
+    if isinstance(body, (bytes, bytearray)):
+        return len(body)
+    return 0
+
+
+class _Request:
+    """A request being measured."""
+
+    __slots__ = ("hooks", "metrics", "received", "sent")
+
+    def __init__(self, hooks: Sequence[RequestHook], metrics: RequestMetrics):
+        self.hooks = hooks
+        self.metrics = metrics
+        self.sent: Optional[float] = None
+        self.received: Optional[float] = None
+
+
+_current: contextvars.ContextVar[Optional[_Request]] = contextvars.ContextVar(
+    "click_and_drop_api_request", default=None
+)
+
+
+def _call(hooks: Sequence[RequestHook], name: str, metrics: RequestMetrics) -> None:
+    for hook in hooks:
+        try:
+            getattr(hook, name)(metrics)
+        except Exception:
+            logger.exception("%s.%s() failed", type(hook).__name__, name)
+
+
+def request_serialized(
+    hooks: Sequence[RequestHook],
+    method: str,
+    resource_path: str,
+    url: str,
+    body: Any,
+    started: float,
+) -> None:
+    """Start measuring a request that param_serialize() built.
+
+    Parameters:
+        started: The time.perf_counter() when the serialization started.
+    """
+    metrics = RequestMetrics(
+        method=method,
+        resource_path=resource_path,
+        url=url,
+        bytes_out=body_size(body),
+        serialize_seconds=time.perf_counter() - started,
+        started=0,
+    )
+    _current.set(_Request(hooks, metrics))
+
+
+def request_sending(hooks: Sequence[RequestHook], method: str, url: str, body: Any):
+    """Call the hooks before the request is sent.
+
+    Returns:
+        The request to pass to request_sent().
+    """
+    request = _current.get()
+    if (
+        request is None
+        or request.sent is not None
+        or request.metrics.url != url
+        or request.metrics.method != method
+    ):
+        request = _Request(
+            hooks,
+            RequestMetrics(
+                method=method,
+                resource_path=urlsplit(url).path,
+                url=url,
+                bytes_out=body_size(body),
+                serialize_seconds=0,
+                started=0,
+            ),
+        )
+        _current.set(request)
+    request.metrics = request.metrics._replace(started=time.time())
+    _call(request.hooks, "before_request", request.metrics)
+    request.sent = time.perf_counter()
+    return request
+
+
+def request_sent(
+    request: _Request, response: Any = None, error: Optional[BaseException] = None
+) -> None:
+    """Record the response or finish the request if it failed."""
+    if error is not None:
+        _finish(request, error=error)
+        return
+    request.metrics = request.metrics._replace(
+        status=response.status, retries=getattr(response, "retries", 0)
+    )
+
+
+def response_deserializing(response: Any) -> Optional[_Request]:
+    """Return the request of the response, its body was read.
+
+    Returns:
+        None if the request is not measured.
+    """
+    request = _current.get()
+    if request is None or request.sent is None:
+        return None
+    request.received = time.perf_counter()
+    data = getattr(response, "data", None)
+    request.metrics = request.metrics._replace(
+        bytes_in=len(data) if data is not None else 0
+    )
+    return request
+
+
+def response_deserialized(
+    request: _Request, error: Optional[BaseException] = None
+) -> None:
+    """Finish the request after the response was deserialized."""
+    _finish(request, error=error)
+
+
+def response_streamed(bytes_in: int, error: Optional[BaseException] = None) -> None:
+    """Finish the request whose response body was streamed instead of read."""
+    request = _current.get()
+    if request is None or request.sent is None:
+        return
+    request.metrics = request.metrics._replace(bytes_in=bytes_in)
+    _finish(request, error=error)
+
+
+def _finish(request: _Request, error: Optional[BaseException] = None) -> None:
+    if _current.get() is request:
+        _current.set(None)
+    now = time.perf_counter()
+    received = now if request.received is None else request.received
+    sent = received if request.sent is None else request.sent
+    request.metrics = request.metrics._replace(
+        network_seconds=received - sent,
+        deserialize_seconds=now - received,
+        error=error,
+    )
+    _call(request.hooks, "after_request", request.metrics)
+
+
+class OpenTelemetryHook(RequestHook):
+    """Record a client span for each request.
+
+    Install the dependencies with `pip install click_and_drop_api[opentelemetry]`.
+    The span is a child of the current span and named like "GET /orders/{orderIdentifiers}".
+    """
+
+    def __init__(self, tracer: Optional[Tracer] = None):
+        """Create a new hook.
+
+        Parameters:
+            tracer: The tracer to use, by default the one of this module.
+        """
+        from opentelemetry import trace
+
+        self._trace = trace
+        self.tracer = tracer or trace.get_tracer(__name__)
+
+    def after_request(self, metrics: RequestMetrics) -> None:
+        start = int(metrics.started * 1e9)
+        attributes: dict[str, Any] = {
+            "http.request.method": metrics.method,
+            "url.template": metrics.resource_path,
+            "url.full": metrics.url,
+            "http.request.body.size": metrics.bytes_out,
+            "http.response.body.size": metrics.bytes_in,
+            "http.request.resend_count": metrics.retries,
+            "click_and_drop.serialize_seconds": metrics.serialize_seconds,
+            "click_and_drop.network_seconds": metrics.network_seconds,
+            "click_and_drop.deserialize_seconds": metrics.deserialize_seconds,
+        }
+        if metrics.status is not None:
+            attributes["http.response.status_code"] = metrics.status
+        span = self.tracer.start_span(
+            f"{metrics.method} {metrics.resource_path}",
+            kind=self._trace.SpanKind.CLIENT,
+            attributes=attributes,
+            start_time=start,
+        )
+        if metrics.error is not None:
+            span.set_attribute("error.type", type(metrics.error).__qualname__)
+            span.set_status(self._trace.StatusCode.ERROR, str(metrics.error))
+        span.end(end_time=start + int(metrics.seconds * 1e9))
+
+
+class PrometheusHook(RequestHook):
+    """Record histograms of the request durations and sizes.
+
+    Install the dependencies with `pip install click_and_drop_api[prometheus]`.
+    The metrics are labelled by method and path template, not by URL,
+    to keep their number small:
+
+    - click_and_drop_request_duration_seconds{method, resource_path, status}
+    - click_and_drop_request_phase_seconds{method, resource_path, phase}
+      with the phases serialize, network and deserialize
+    - click_and_drop_response_size_bytes{method, resource_path}
+    - click_and_drop_request_retries_total{method, resource_path}
+
+    The status is "error" if there was no response.
+    """
+
+    def __init__(
+        self,
+        registry: Optional[CollectorRegistry] = None,
+        namespace: str = "click_and_drop",
+    ):
+        """Create the metrics.
+
+        Parameters:
+            registry: The registry of the metrics, by default the global one.
+            namespace: The prefix of the metric names.
+        """
+        import prometheus_client
+
+        if registry is None:
+            registry = prometheus_client.REGISTRY
+        labels = ["method", "resource_path"]
+        self.duration = prometheus_client.Histogram(
+            "request_duration_seconds",
+            "The duration of the requests to the Click & Drop API.",
+            labels + ["status"],
+            namespace=namespace,
+            registry=registry,
+        )
+        self.phase = prometheus_client.Histogram(
+            "request_phase_seconds",
+            "The duration of the phases of the requests to the Click & Drop API.",
+            labels + ["phase"],
+            namespace=namespace,
+            registry=registry,
+        )
+        self.response_size = prometheus_client.Histogram(
+            "response_size_bytes",
+            "The size of the responses of the Click & Drop API.",
+            labels,
+            namespace=namespace,
+            registry=registry,
+            buckets=(256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304),
+        )
+        self.retries = prometheus_client.Counter(
+            "request_retries",
+            "The number of retried requests to the Click & Drop API.",
+            labels,
+            namespace=namespace,
+            registry=registry,
+        )
+
+    def after_request(self, metrics: RequestMetrics) -> None:
+        labels = (metrics.method, metrics.resource_path)
+        status = "error" if metrics.status is None else str(metrics.status)
+        self.duration.labels(*labels, status).observe(metrics.seconds)
+        self.phase.labels(*labels, "serialize").observe(metrics.serialize_seconds)
+        self.phase.labels(*labels, "network").observe(metrics.network_seconds)
+        self.phase.labels(*labels, "deserialize").observe(metrics.deserialize_seconds)
+        if metrics.status is not None:
+            self.response_size.labels(*labels).observe(metrics.bytes_in)
+        if metrics.retries:
+            self.retries.labels(*labels).inc(metrics.retries)
+
+
+__all__ = ["RequestMetrics", "RequestHook", "OpenTelemetryHook", "PrometheusHook"]
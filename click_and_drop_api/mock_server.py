@@ -0,0 +1,378 @@
+"""A local HTTP server with canned responses for tests and benchmarks.
+
+Unlike the emulator, the MockServer only answers the routes it is given.
+This makes it possible to test the client against exact responses
+and to measure the client without the work of an emulated API.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import socket
+import socketserver
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, NamedTuple, Optional, Union
+from urllib.parse import parse_qsl, unquote, urlsplit
+
+from click_and_drop_api.simple import CreateOrder
+
+API_KEY = "aaaaaaaa-bbbb-cccc-dddd-eeeeeeeeeeee"
+
+
+class MockRequest(NamedTuple):
+    """A request received by the MockServer."""
+
+    method: str
+    path: str
+    query: dict[str, str]
+    headers: dict[str, str]
+    body: bytes
+    match: re.Match
+
+    def json(self) -> Any:
+        """The body as JSON."""
+        return json.loads(self.body)
+
+
+MockResponse = Union[Any, tuple[int, Any], tuple[int, Any, dict[str, str]]]
+"""What a route handler returns: body, (status, body) or (status, body, headers).
+
+bytes are sent as they are, everything else is sent as JSON.
+"""
+
+
+class MockServer:
+    """A local HTTP server that answers with canned responses.
+
+    The paths of the routes are regular expressions
+    relative to the API base path /api/v1.
+    """
+
+    def __init__(self):
+        self.routes: list[tuple[str, re.Pattern, Callable[[MockRequest], Any]]] = []
+        self.requests: list[MockRequest] = []
+        self.lock = threading.Lock()
+        self._server = self._create_server()
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, args=(0.01,), daemon=True
+        )
+
+    @property
+    def host(self) -> str:
+        """The host to pass to ClickAndDrop."""
+        return f"http://127.0.0.1:{self._server.server_address[1]}/api/v1"
+
+    def route(
+        self,
+        method: str,
+        path: str,
+        handler: Optional[Callable[[MockRequest], MockResponse]] = None,
+        *,
+        status: int = 200,
+        body: Any = None,
+    ) -> None:
+        """Answer requests to the path with the handler or a static response."""
+        if handler is None:
+
+            def handler(request: MockRequest) -> MockResponse:
+                return status, body
+
+        self.routes.insert(0, (method, re.compile(path), handler))
+
+    def requests_to(self, method: str, path: str) -> list[MockRequest]:
+        """The requests that fully matched the path."""
+        return [
+            request
+            for request in self.requests
+            if request.method == method and re.fullmatch(path, request.path)
+        ]
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def handle(
+        self, method: str, target: str, headers: dict[str, str], body: bytes
+    ) -> tuple[int, dict[str, str], bytes]:
+        """Answer a request.
+
+        Returns:
+            The status, the headers and the body of the response.
+        """
+        url = urlsplit(target)
+        path = unquote(url.path.removeprefix("/api/v1"))
+        for route_method, pattern, handler in self.routes:
+            match = pattern.fullmatch(path)
+            if route_method == method and match:
+                request = MockRequest(
+                    method, path, dict(parse_qsl(url.query)), headers, body, match
+                )
+                with self.lock:
+                    self.requests.append(request)
+                result = handler(request)
+                break
+        else:
+            result = (404, {"code": "NotFound", "message": path})
+        if not isinstance(result, tuple):
+            result = (200, result)
+        status, content, extra_headers = (result + ({},))[:3]
+        if isinstance(content, bytes):
+            content_type = "application/pdf"
+        else:
+            content = json.dumps(content).encode()
+            content_type = "application/json"
+        response_headers = {
+            "Content-Type": content_type,
+            "Content-Length": str(len(content)),
+            **extra_headers,
+        }
+        return status, response_headers, content
+
+    def _respond(self, request_handler: BaseHTTPRequestHandler) -> None:
+        length = int(request_handler.headers.get("Content-Length") or 0)
+        status, headers, content = self.handle(
+            request_handler.command,
+            request_handler.path,
+            dict(request_handler.headers),
+            request_handler.rfile.read(length),
+        )
+        request_handler.send_response(status)
+        for key, value in headers.items():
+            request_handler.send_header(key, value)
+        request_handler.end_headers()
+        request_handler.wfile.write(content)
+
+    def _create_server(self) -> socketserver.ThreadingTCPServer:
+        return ThreadingHTTPServer(("127.0.0.1", 0), self._handler_class())
+
+    def _handler_class(self) -> type[BaseHTTPRequestHandler]:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Headers and body are written separately, avoid delayed ACKs.
+            disable_nagle_algorithm = True
+
+            def do_GET(self):
+                server._respond(self)
+
+            do_POST = do_PUT = do_DELETE = do_GET
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+
+class H2MockServer(MockServer):
+    """A MockServer that speaks HTTP/2 without TLS.
+
+    Clients must use HTTP/2 with prior knowledge.
+    The streams of a connection are answered in parallel.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.connections = 0
+        """The number of connections accepted."""
+
+    def _create_server(self) -> socketserver.ThreadingTCPServer:
+        server = self
+
+        class Handler(socketserver.BaseRequestHandler):
+            def handle(self):
+                server._serve_connection(self.request)
+
+        return socketserver.ThreadingTCPServer(("127.0.0.1", 0), Handler)
+
+    def _serve_connection(self, sock: socket.socket) -> None:
+        import h2.config
+        import h2.connection
+        import h2.events
+
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        with self.lock:
+            self.connections += 1
+        connection = h2.connection.H2Connection(
+            h2.config.H2Configuration(client_side=False, header_encoding="utf-8")
+        )
+        # guards the connection and the socket, notified when windows open
+        condition = threading.Condition()
+        streams: dict[int, tuple[dict[str, str], bytearray]] = {}
+        closed = False
+        with condition:
+            connection.initiate_connection()
+            sock.sendall(connection.data_to_send())
+        try:
+            while True:
+                data = sock.recv(65536)
+                if not data:
+                    return
+                with condition:
+                    for event in connection.receive_data(data):
+                        if isinstance(event, h2.events.RequestReceived):
+                            streams[event.stream_id] = (
+                                dict(event.headers),
+                                bytearray(),
+                            )
+                        elif isinstance(event, h2.events.DataReceived):
+                            streams[event.stream_id][1].extend(event.data)
+                            connection.acknowledge_received_data(
+                                event.flow_controlled_length, event.stream_id
+                            )
+                        elif isinstance(event, h2.events.StreamEnded):
+                            headers, body = streams.pop(event.stream_id)
+                            threading.Thread(
+                                target=self._respond_to_stream,
+                                args=(
+                                    sock,
+                                    connection,
+                                    condition,
+                                    lambda: closed,
+                                    event.stream_id,
+                                    headers,
+                                    bytes(body),
+                                ),
+                                daemon=True,
+                            ).start()
+                        elif isinstance(event, h2.events.ConnectionTerminated):
+                            return
+                    condition.notify_all()
+                    sock.sendall(connection.data_to_send())
+        except OSError:
+            pass
+        finally:
+            with condition:
+                closed = True
+                condition.notify_all()
+
+    def _respond_to_stream(
+        self,
+        sock: socket.socket,
+        connection: Any,
+        condition: threading.Condition,
+        is_closed: Callable[[], bool],
+        stream_id: int,
+        headers: dict[str, str],
+        body: bytes,
+    ) -> None:
+        import h2.exceptions
+
+        status, response_headers, content = self.handle(
+            headers[":method"],
+            headers[":path"],
+            {key: value for key, value in headers.items() if not key.startswith(":")},
+            body,
+        )
+        view = memoryview(content)
+        with condition:
+            try:
+                connection.send_headers(
+                    stream_id,
+                    [(":status", str(status))]
+                    + [(key.lower(), value) for key, value in response_headers.items()],
+                    end_stream=not content,
+                )
+                sock.sendall(connection.data_to_send())
+                while view:
+                    window = min(
+                        connection.local_flow_control_window(stream_id),
+                        connection.max_outbound_frame_size,
+                        len(view),
+                    )
+                    if window <= 0:
+                        if is_closed():
+                            return
+                        condition.wait()
+                        continue
+                    connection.send_data(
+                        stream_id,
+                        view[:window].tobytes(),
+                        end_stream=window == len(view),
+                    )
+                    view = view[window:]
+                    sock.sendall(connection.data_to_send())
+            except (OSError, h2.exceptions.StreamClosedError):
+                pass
+
+
+def order_info(order_identifier: int, reference: Optional[str] = None) -> dict:
+    """The JSON of a GetOrderInfoResource."""
+    return {
+        "orderIdentifier": order_identifier,
+        "orderReference": reference or f"ref-{order_identifier}",
+        "createdOn": "2026-01-01T12:00:00Z",
+    }
+
+
+def new_order(reference: str = "ref") -> CreateOrder:
+    """A minimal order to create."""
+    return CreateOrder.from_dict(
+        {
+            "orderReference": reference,
+            "recipient": {
+                "address": {
+                    "fullName": "Jane Doe",
+                    "addressLine1": "1 High Street",
+                    "city": "London",
+                    "countryCode": "GB",
+                }
+            },
+            "orderDate": "2026-01-01T00:00:00Z",
+            "subtotal": 1,
+            "shippingCostCharged": 1,
+            "total": 2,
+        }
+    )
+
+
+def order_details(order_identifier: int, created_on: str = "2026-01-01T12:00:00Z"):
+    """The JSON of a GetOrderDetailsResource."""
+    address = {"addressLine1": "1 High Street", "city": "London", "countryCode": "GB"}
+    return {
+        "orderIdentifier": order_identifier,
+        "orderReference": f"ref-{order_identifier}",
+        "createdOn": created_on,
+        "subtotal": 1,
+        "shippingCostCharged": 1,
+        "orderDiscount": 0,
+        "total": 2,
+        "weightInGrams": 100,
+        "shippingDetails": {"shippingCost": 1},
+        "shippingInfo": address,
+        "billingInfo": address,
+        "orderLines": [{"quantity": 1}],
+    }
+
+
+def pages(orders: list[dict]) -> Callable[[MockRequest], MockResponse]:
+    """A handler that returns the orders in pages with continuation tokens."""
+
+    def handler(request: MockRequest) -> MockResponse:
+        start = int(request.query.get("continuationToken", 0))
+        end = start + int(request.query.get("pageSize", 25))
+        page = {"orders": orders[start:end]}
+        if end < len(orders):
+            page["continuationToken"] = str(end)
+        return page
+
+    return handler
+
+
+__all__ = [
+    "API_KEY",
+    "H2MockServer",
+    "MockRequest",
+    "MockResponse",
+    "MockServer",
+    "new_order",
+    "order_details",
+    "order_info",
+    "pages",
+]
@@ -12,49 +12,161 @@
     Do not edit the class manually.
 """  # noqa: E501
 
-# import models into model package
-from click_and_drop_api.models.address_request import AddressRequest
-from click_and_drop_api.models.billing_details_request import BillingDetailsRequest
-from click_and_drop_api.models.create_order_error_response import CreateOrderErrorResponse
-from click_and_drop_api.models.create_order_label_error_response import CreateOrderLabelErrorResponse
-from click_and_drop_api.models.create_order_request import CreateOrderRequest
-from click_and_drop_api.models.create_order_response import CreateOrderResponse
-from click_and_drop_api.models.create_orders_request import CreateOrdersRequest
-from click_and_drop_api.models.create_orders_response import CreateOrdersResponse
-from click_and_drop_api.models.create_packages_response import CreatePackagesResponse
-from click_and_drop_api.models.delete_orders_resource import DeleteOrdersResource
-from click_and_drop_api.models.deleted_order_info import DeletedOrderInfo
-from click_and_drop_api.models.dimensions_request import DimensionsRequest
-from click_and_drop_api.models.error_response import ErrorResponse
-from click_and_drop_api.models.failed_order_response import FailedOrderResponse
-from click_and_drop_api.models.get_order_details_resource import GetOrderDetailsResource
-from click_and_drop_api.models.get_order_info_resource import GetOrderInfoResource
-from click_and_drop_api.models.get_order_line_result import GetOrderLineResult
-from click_and_drop_api.models.get_orders_details_response import GetOrdersDetailsResponse
-from click_and_drop_api.models.get_orders_response import GetOrdersResponse
-from click_and_drop_api.models.get_postal_details_result import GetPostalDetailsResult
-from click_and_drop_api.models.get_shipping_details_result import GetShippingDetailsResult
-from click_and_drop_api.models.get_tag_details_result import GetTagDetailsResult
-from click_and_drop_api.models.get_version_resource import GetVersionResource
-from click_and_drop_api.models.importer import Importer
-from click_and_drop_api.models.label_generation_request import LabelGenerationRequest
-from click_and_drop_api.models.manifest_details_response import ManifestDetailsResponse
-from click_and_drop_api.models.manifest_eligible_orders_request import ManifestEligibleOrdersRequest
-from click_and_drop_api.models.manifest_errors_error_details_response import ManifestErrorsErrorDetailsResponse
-from click_and_drop_api.models.manifest_errors_response import ManifestErrorsResponse
-from click_and_drop_api.models.manifest_orders_response import ManifestOrdersResponse
-from click_and_drop_api.models.order_error_info import OrderErrorInfo
-from click_and_drop_api.models.order_error_response import OrderErrorResponse
-from click_and_drop_api.models.order_field_response import OrderFieldResponse
-from click_and_drop_api.models.order_update_error import OrderUpdateError
-from click_and_drop_api.models.postage_details_request import PostageDetailsRequest
-from click_and_drop_api.models.product_item_request import ProductItemRequest
-from click_and_drop_api.models.recipient_details_request import RecipientDetailsRequest
-from click_and_drop_api.models.sender_details_request import SenderDetailsRequest
-from click_and_drop_api.models.shipment_package_request import ShipmentPackageRequest
-from click_and_drop_api.models.tag_request import TagRequest
-from click_and_drop_api.models.update_order_status_request import UpdateOrderStatusRequest
-from click_and_drop_api.models.update_order_status_response import UpdateOrderStatusResponse
-from click_and_drop_api.models.update_orders_status_request import UpdateOrdersStatusRequest
-from click_and_drop_api.models.updated_order_info import UpdatedOrderInfo
+import importlib
+from typing import TYPE_CHECKING
 
+__all__ = [
+    "AddressRequest",
+    "BillingDetailsRequest",
+    "CreateOrderErrorResponse",
+    "CreateOrderLabelErrorResponse",
+    "CreateOrderRequest",
+    "CreateOrderResponse",
+    "CreateOrdersRequest",
+    "CreateOrdersResponse",
+    "CreatePackagesResponse",
+    "DeleteOrdersResource",
+    "DeletedOrderInfo",
+    "DimensionsRequest",
+    "ErrorResponse",
+    "FailedOrderResponse",
+    "GetOrderDetailsResource",
+    "GetOrderInfoResource",
+    "GetOrderLineResult",
+    "GetOrdersDetailsResponse",
+    "GetOrdersResponse",
+    "GetPostalDetailsResult",
+    "GetShippingDetailsResult",
+    "GetTagDetailsResult",
+    "GetVersionResource",
+    "Importer",
+    "LabelGenerationRequest",
+    "ManifestDetailsResponse",
+    "ManifestEligibleOrdersRequest",
+    "ManifestErrorsErrorDetailsResponse",
+    "ManifestErrorsResponse",
+    "ManifestOrdersResponse",
+    "OrderErrorInfo",
+    "OrderErrorResponse",
+    "OrderFieldResponse",
+    "OrderUpdateError",
+    "PostageDetailsRequest",
+    "ProductItemRequest",
+    "RecipientDetailsRequest",
+    "SenderDetailsRequest",
+    "ShipmentPackageRequest",
+    "TagRequest",
+    "UpdateOrderStatusRequest",
+    "UpdateOrderStatusResponse",
+    "UpdateOrdersStatusRequest",
+    "UpdatedOrderInfo",
+]
+
+# The attributes are imported on first access (PEP 562).
+_LAZY_ATTRIBUTES = {
+    "AddressRequest": "click_and_drop_api.models.address_request",
+    "BillingDetailsRequest": "click_and_drop_api.models.billing_details_request",
+    "CreateOrderErrorResponse": "click_and_drop_api.models.create_order_error_response",
+    "CreateOrderLabelErrorResponse": "click_and_drop_api.models.create_order_label_error_response",
+    "CreateOrderRequest": "click_and_drop_api.models.create_order_request",
+    "CreateOrderResponse": "click_and_drop_api.models.create_order_response",
+    "CreateOrdersRequest": "click_and_drop_api.models.create_orders_request",
+    "CreateOrdersResponse": "click_and_drop_api.models.create_orders_response",
+    "CreatePackagesResponse": "click_and_drop_api.models.create_packages_response",
+    "DeleteOrdersResource": "click_and_drop_api.models.delete_orders_resource",
+    "DeletedOrderInfo": "click_and_drop_api.models.deleted_order_info",
+    "DimensionsRequest": "click_and_drop_api.models.dimensions_request",
+    "ErrorResponse": "click_and_drop_api.models.error_response",
+    "FailedOrderResponse": "click_and_drop_api.models.failed_order_response",
+    "GetOrderDetailsResource": "click_and_drop_api.models.get_order_details_resource",
+    "GetOrderInfoResource": "click_and_drop_api.models.get_order_info_resource",
+    "GetOrderLineResult": "click_and_drop_api.models.get_order_line_result",
+    "GetOrdersDetailsResponse": "click_and_drop_api.models.get_orders_details_response",
+    "GetOrdersResponse": "click_and_drop_api.models.get_orders_response",
+    "GetPostalDetailsResult": "click_and_drop_api.models.get_postal_details_result",
+    "GetShippingDetailsResult": "click_and_drop_api.models.get_shipping_details_result",
+    "GetTagDetailsResult": "click_and_drop_api.models.get_tag_details_result",
+    "GetVersionResource": "click_and_drop_api.models.get_version_resource",
+    "Importer": "click_and_drop_api.models.importer",
+    "LabelGenerationRequest": "click_and_drop_api.models.label_generation_request",
+    "ManifestDetailsResponse": "click_and_drop_api.models.manifest_details_response",
+    "ManifestEligibleOrdersRequest": "click_and_drop_api.models.manifest_eligible_orders_request",
+    "ManifestErrorsErrorDetailsResponse": "click_and_drop_api.models.manifest_errors_error_details_response",
+    "ManifestErrorsResponse": "click_and_drop_api.models.manifest_errors_response",
+    "ManifestOrdersResponse": "click_and_drop_api.models.manifest_orders_response",
+    "OrderErrorInfo": "click_and_drop_api.models.order_error_info",
+    "OrderErrorResponse": "click_and_drop_api.models.order_error_response",
+    "OrderFieldResponse": "click_and_drop_api.models.order_field_response",
+    "OrderUpdateError": "click_and_drop_api.models.order_update_error",
+    "PostageDetailsRequest": "click_and_drop_api.models.postage_details_request",
+    "ProductItemRequest": "click_and_drop_api.models.product_item_request",
+    "RecipientDetailsRequest": "click_and_drop_api.models.recipient_details_request",
+    "SenderDetailsRequest": "click_and_drop_api.models.sender_details_request",
+    "ShipmentPackageRequest": "click_and_drop_api.models.shipment_package_request",
+    "TagRequest": "click_and_drop_api.models.tag_request",
+    "UpdateOrderStatusRequest": "click_and_drop_api.models.update_order_status_request",
+    "UpdateOrderStatusResponse": "click_and_drop_api.models.update_order_status_response",
+    "UpdateOrdersStatusRequest": "click_and_drop_api.models.update_orders_status_request",
+    "UpdatedOrderInfo": "click_and_drop_api.models.updated_order_info",
+}
+
+
+def __getattr__(name: str):
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+if TYPE_CHECKING:
+    # import models into model package
+    from click_and_drop_api.models.address_request import AddressRequest
+    from click_and_drop_api.models.billing_details_request import BillingDetailsRequest
+    from click_and_drop_api.models.create_order_error_response import CreateOrderErrorResponse
+    from click_and_drop_api.models.create_order_label_error_response import CreateOrderLabelErrorResponse
+    from click_and_drop_api.models.create_order_request import CreateOrderRequest
+    from click_and_drop_api.models.create_order_response import CreateOrderResponse
+    from click_and_drop_api.models.create_orders_request import CreateOrdersRequest
+    from click_and_drop_api.models.create_orders_response import CreateOrdersResponse
+    from click_and_drop_api.models.create_packages_response import CreatePackagesResponse
+    from click_and_drop_api.models.delete_orders_resource import DeleteOrdersResource
+    from click_and_drop_api.models.deleted_order_info import DeletedOrderInfo
+    from click_and_drop_api.models.dimensions_request import DimensionsRequest
+    from click_and_drop_api.models.error_response import ErrorResponse
+    from click_and_drop_api.models.failed_order_response import FailedOrderResponse
+    from click_and_drop_api.models.get_order_details_resource import GetOrderDetailsResource
+    from click_and_drop_api.models.get_order_info_resource import GetOrderInfoResource
+    from click_and_drop_api.models.get_order_line_result import GetOrderLineResult
+    from click_and_drop_api.models.get_orders_details_response import GetOrdersDetailsResponse
+    from click_and_drop_api.models.get_orders_response import GetOrdersResponse
+    from click_and_drop_api.models.get_postal_details_result import GetPostalDetailsResult
+    from click_and_drop_api.models.get_shipping_details_result import GetShippingDetailsResult
+    from click_and_drop_api.models.get_tag_details_result import GetTagDetailsResult
+    from click_and_drop_api.models.get_version_resource import GetVersionResource
+    from click_and_drop_api.models.importer import Importer
+    from click_and_drop_api.models.label_generation_request import LabelGenerationRequest
+    from click_and_drop_api.models.manifest_details_response import ManifestDetailsResponse
+    from click_and_drop_api.models.manifest_eligible_orders_request import ManifestEligibleOrdersRequest
+    from click_and_drop_api.models.manifest_errors_error_details_response import ManifestErrorsErrorDetailsResponse
+    from click_and_drop_api.models.manifest_errors_response import ManifestErrorsResponse
+    from click_and_drop_api.models.manifest_orders_response import ManifestOrdersResponse
+    from click_and_drop_api.models.order_error_info import OrderErrorInfo
+    from click_and_drop_api.models.order_error_response import OrderErrorResponse
+    from click_and_drop_api.models.order_field_response import OrderFieldResponse
+    from click_and_drop_api.models.order_update_error import OrderUpdateError
+    from click_and_drop_api.models.postage_details_request import PostageDetailsRequest
+    from click_and_drop_api.models.product_item_request import ProductItemRequest
+    from click_and_drop_api.models.recipient_details_request import RecipientDetailsRequest
+    from click_and_drop_api.models.sender_details_request import SenderDetailsRequest
+    from click_and_drop_api.models.shipment_package_request import ShipmentPackageRequest
+    from click_and_drop_api.models.tag_request import TagRequest
+    from click_and_drop_api.models.update_order_status_request import UpdateOrderStatusRequest
+    from click_and_drop_api.models.update_order_status_response import UpdateOrderStatusResponse
+    from click_and_drop_api.models.update_orders_status_request import UpdateOrdersStatusRequest
+    from click_and_drop_api.models.updated_order_info import UpdatedOrderInfo
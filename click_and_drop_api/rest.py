@@ -16,6 +16,7 @@ import io
 import json
 import re
 import ssl
+import time
 
 import urllib3
 
@@ -42,6 +43,7 @@ class RESTResponse(io.IOBase):
         self.status = resp.status
         self.reason = resp.reason
         self.data = None
+        self.retries = 0
 
     def read(self):
         if self.data is None:
@@ -101,10 +103,16 @@ class RESTClientObject:
         if configuration.connection_pool_maxsize is not None:
             pool_args['maxsize'] = configuration.connection_pool_maxsize
 
+        if configuration.connection_pool_block:
+            pool_args['block'] = True
+
         # https pool manager
         self.pool_manager: urllib3.PoolManager
 
-        if configuration.proxy:
+        if configuration.pool_manager is not None:
+            # share the connections with other clients
+            self.pool_manager = configuration.pool_manager
+        elif configuration.proxy:
             if is_socks_proxy_url(configuration.proxy):
                 from urllib3.contrib.socks import SOCKSProxyManager
                 pool_args["proxy_url"] = configuration.proxy
@@ -117,6 +125,9 @@ class RESTClientObject:
         else:
             self.pool_manager = urllib3.PoolManager(**pool_args)
 
+        self.retry_policy = configuration.retry_policy
+        self.rate_limiter = configuration.rate_limiter
+
     def request(
         self,
         method,
@@ -126,7 +137,47 @@ class RESTClientObject:
         post_params=None,
         _request_timeout=None
     ):
-        """Perform requests.
+        """Perform requests, respecting the rate limit and retry policy.
+
+        The parameters are the same as for send().
+        The number of retries is stored in the retries attribute of the response.
+        """
+        retries = 0
+        while True:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+            r = self.send(
+                method,
+                url,
+                headers=headers,
+                body=body,
+                post_params=post_params,
+                _request_timeout=_request_timeout
+            )
+            r.retries = retries
+            if (
+                self.retry_policy is None
+                or not self.retry_policy.is_retry(method, r.status, retries)
+            ):
+                return r
+            delay = self.retry_policy.get_backoff(
+                retries, r.getheader("Retry-After")
+            )
+            r.response.drain_conn()
+            r.response.release_conn()
+            time.sleep(delay)
+            retries += 1
+
+    def send(
+        self,
+        method,
+        url,
+        headers=None,
+        body=None,
+        post_params=None,
+        _request_timeout=None
+    ):
+        """Perform one request.
 
         :param method: http request method
         :param url: http request url
@@ -183,7 +234,10 @@ class RESTClientObject:
                     or re.search('json', content_type, re.IGNORECASE)
                 ):
                     request_body = None
-                    if body is not None:
+                    if isinstance(body, bytes):
+                        # serialized by ApiClient.serialize_body()
+                        request_body = body
+                    elif body is not None:
                         request_body = json.dumps(body)
                     r = self.pool_manager.request(
                         method,
@@ -0,0 +1,158 @@
+"""Retry and rate limit requests to the Click & Drop API.
+
+The API allows 5 calls per second.
+Exceeding the rate limit results in a 429 error.
+"""
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import NamedTuple, Optional
+
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+"""The status codes of responses that are worth retrying."""
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "DELETE"})
+"""The methods that can be repeated without side effects."""
+
+
+class RetryPolicy(NamedTuple):
+    """When to retry a request and how long to wait before doing so.
+
+    Throttled requests (429) were not processed and are retried for all methods.
+    Other status codes are only retried for idempotent methods.
+    The backoff grows exponentially with full jitter:
+    a random time between 0 and backoff_factor * 2 ** attempt, at most backoff_max.
+    A Retry-After header of the response takes precedence.
+    """
+
+    total: int = 3
+    """The maximum number of retries."""
+
+    backoff_factor: float = 0.5
+    """The maximum seconds to wait before the first retry."""
+
+    backoff_max: float = 30
+    """The maximum seconds to wait before any retry."""
+
+    status_forcelist: frozenset[int] = RETRY_STATUS_CODES
+    """The status codes to retry."""
+
+    allowed_methods: frozenset[str] = IDEMPOTENT_METHODS
+    """The methods to retry for status codes other than 429."""
+
+    respect_retry_after: bool = True
+    """Whether to wait as long as the Retry-After header says."""
+
+    def is_retry(self, method: str, status: int, attempt: int) -> bool:
+        """Whether to retry after the attempt-th retry.
+
+        Parameters:
+            method: The HTTP method of the request.
+            status: The status code of the response.
+            attempt: The number of retries so far.
+        """
+        if attempt >= self.total or status not in self.status_forcelist:
+            return False
+        return status == 429 or method.upper() in self.allowed_methods
+
+    def get_backoff(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """The seconds to wait before the next retry.
+
+        Parameters:
+            attempt: The number of retries so far.
+            retry_after: The Retry-After header of the response.
+        """
+        if retry_after and self.respect_retry_after:
+            seconds = parse_retry_after(retry_after)
+            if seconds is not None:
+                return min(seconds, self.backoff_max)
+        return random.uniform(
+            0, min(self.backoff_max, self.backoff_factor * 2**attempt)
+        )
+
+
+def parse_retry_after(retry_after: str) -> Optional[float]:
+    """Return the seconds of a Retry-After header or None if it is malformed.
+
+    The header is either a number of seconds or an HTTP date.
+    """
+    try:
+        return max(0.0, float(retry_after))
+    except ValueError:
+        pass
+    try:
+        date = parsedate_to_datetime(retry_after)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, date.timestamp() - time.time())
+
+
+class RateLimiter:
+    """A token bucket that limits the number of requests per second.
+
+    Share one RateLimiter between all clients and threads that use the same account.
+    It is safe to use from several threads.
+    """
+
+    def __init__(self, rate: float = 5, burst: Optional[int] = None):
+        """Create a new rate limiter.
+
+        Parameters:
+            rate: The number of requests per second.
+            burst: The number of requests that can be sent at once, rate by default.
+        """
+        if rate <= 0:
+            raise ValueError(f"Expected a positive rate, got {rate}.")
+        self.rate = rate
+        self.burst = max(1, int(rate if burst is None else burst))
+        self._tokens = float(self.burst)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take a token and return the seconds to wait before sending the request."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._last) * self.rate
+            )
+            self._last = now
+            self._tokens -= 1
+            return 0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def acquire(self) -> None:
+        """Block until a request can be sent."""
+        delay = self.reserve()
+        if delay:
+            time.sleep(delay)
+
+    def try_acquire(self) -> float:
+        """Take a token only if one is available.
+
+        Returns:
+            0 if a request can be sent now,
+            otherwise the seconds until the next token is available.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._last) * self.rate
+            )
+            self._last = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0
+            return (1 - self._tokens) / self.rate
+
+
+__all__ = [
+    "RetryPolicy",
+    "RateLimiter",
+    "RETRY_STATUS_CODES",
+    "IDEMPOTENT_METHODS",
+    "parse_retry_after",
+]
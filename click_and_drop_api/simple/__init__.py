@@ -1,57 +1,182 @@
 """Simple API access based on the generated API interface."""
 
-from .types import (
-    Address,
-    BillingDetails,
-    CreateOrder,
-    CreateOrders,
-    Dimensions,
-    LabelGeneration,
-    ManifestDetailsResponse,
-    ManifestEligibleOrders,
-    PostageDetails,
-    ProductItem,
-    RecipientDetails,
-    SenderDetails,
-    ShipmentPackage,
-    Tag,
-    UpdateOrderStatus,
-    UpdateOrderStatusResponse,
-    UpdateOrdersStatus,
-)
-from .api import ClickAndDrop
-from .package_sizes import (
-    PackageSize,
-    packages_sizes,
-    get_package_size,
-    choose_package_size_by_weight,
-    get_package_sizes,
-)
+import importlib
+from typing import TYPE_CHECKING
+
+# The shipping_options submodule shares its name with the mapping and is imported now.
+# It loads the tariff when the shipping options are first used.
 from .shipping_options import (
+    ShippingCatalogue,
     ShippingOption,
     add_shipping_option,
+    shipping_catalogue,
     shipping_options,
     list_service_codes,
     check_service_codes,
 )
-from .errors import InvalidWeight, InvalidDimensions
+
+# The package sizes, quotes, API clients and models are imported on first access (PEP 562).
+_LAZY_ATTRIBUTES = {
+    **dict.fromkeys(
+        [
+            "PackageSize",
+            "packages_sizes",
+            "get_package_size",
+            "choose_package_size_by_weight",
+            "classify_package_sizes",
+            "get_package_sizes",
+            "package_sizes_supporting",
+        ],
+        ".package_sizes",
+    ),
+    "InvalidWeight": ".errors",
+    "InvalidDimensions": ".errors",
+    "ShippingQuoter": ".quotes",
+    "Quote": ".quotes",
+    **dict.fromkeys(
+        [
+            "Address",
+            "BillingDetails",
+            "CreateOrder",
+            "CreateOrders",
+            "Dimensions",
+            "LabelGeneration",
+            "ManifestDetailsResponse",
+            "ManifestEligibleOrders",
+            "PostageDetails",
+            "ProductItem",
+            "RecipientDetails",
+            "SenderDetails",
+            "ShipmentPackage",
+            "Tag",
+            "UpdateOrderStatus",
+            "UpdateOrderStatusResponse",
+            "UpdateOrdersStatus",
+        ],
+        ".types",
+    ),
+    "ClickAndDrop": ".api",
+    "AsyncClickAndDrop": ".async_api",
+    "AsyncApiClient": ".async_api",
+    "OrderCache": ".cache",
+    "MemoryOrderCache": ".cache",
+    "SQLiteOrderCache": ".cache",
+    "CacheStats": ".cache",
+    "OrderLookupCoalescer": ".coalesce",
+    "AsyncOrderLookupCoalescer": ".coalesce",
+    "ConnectionPool": ".pool",
+    "PoolOptions": ".pool",
+    "shared_connection_pool": ".pool",
+    "close_shared_connection_pools": ".pool",
+    "ModelView": ".views",
+    "OrderInfoView": ".views",
+    "OrderDetailsView": ".views",
+    "OrderStore": ".sync",
+    "OrderEvent": ".sync",
+    "RetryPolicy": "click_and_drop_api.retry",
+    "RateLimiter": "click_and_drop_api.retry",
+}
+
+
+def __getattr__(name: str):
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+if TYPE_CHECKING:
+    from .package_sizes import (
+        PackageSize,
+        packages_sizes,
+        get_package_size,
+        choose_package_size_by_weight,
+        classify_package_sizes,
+        get_package_sizes,
+        package_sizes_supporting,
+    )
+    from .errors import InvalidWeight, InvalidDimensions
+    from .quotes import ShippingQuoter, Quote
+    from .types import (
+        Address,
+        BillingDetails,
+        CreateOrder,
+        CreateOrders,
+        Dimensions,
+        LabelGeneration,
+        ManifestDetailsResponse,
+        ManifestEligibleOrders,
+        PostageDetails,
+        ProductItem,
+        RecipientDetails,
+        SenderDetails,
+        ShipmentPackage,
+        Tag,
+        UpdateOrderStatus,
+        UpdateOrderStatusResponse,
+        UpdateOrdersStatus,
+    )
+    from .api import ClickAndDrop
+    from .async_api import AsyncClickAndDrop, AsyncApiClient
+    from .cache import OrderCache, MemoryOrderCache, SQLiteOrderCache, CacheStats
+    from .coalesce import OrderLookupCoalescer, AsyncOrderLookupCoalescer
+    from .pool import (
+        ConnectionPool,
+        PoolOptions,
+        shared_connection_pool,
+        close_shared_connection_pools,
+    )
+    from .views import ModelView, OrderInfoView, OrderDetailsView
+    from .sync import OrderStore, OrderEvent
+    from click_and_drop_api.retry import RetryPolicy, RateLimiter
 
 __all__ = [
     "ClickAndDrop",
+    "AsyncClickAndDrop",
+    "AsyncApiClient",
     "CreateOrder",
     "InvalidWeight",
     "InvalidDimensions",
+    "RetryPolicy",
+    "RateLimiter",
+    "ConnectionPool",
+    "PoolOptions",
+    "shared_connection_pool",
+    "close_shared_connection_pools",
+    "OrderCache",
+    "MemoryOrderCache",
+    "SQLiteOrderCache",
+    "CacheStats",
+    "OrderLookupCoalescer",
+    "AsyncOrderLookupCoalescer",
+    "ModelView",
+    "OrderInfoView",
+    "OrderDetailsView",
+    "OrderStore",
+    "OrderEvent",
+    "ShippingQuoter",
+    "Quote",
     "check_service_codes",
     "RecipientDetails",
     "list_service_codes",
     "Address",
     "get_package_sizes",
+    "package_sizes_supporting",
     "PackageSize",
     "packages_sizes",
+    "ShippingCatalogue",
     "ShippingOption",
     "add_shipping_option",
+    "shipping_catalogue",
     "shipping_options",
     "choose_package_size_by_weight",
+    "classify_package_sizes",
     "get_package_size",
     "CreateOrders",
     "UpdateOrdersStatus",
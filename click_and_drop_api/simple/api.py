@@ -1,11 +1,64 @@
 """The simple API interface."""
 
-from typing import Literal, Optional, Union
-from .types import CreateOrder
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import (
+    Any,
+    Callable,
+    Iterator,
+    Literal,
+    NamedTuple,
+    Optional,
+    Sequence,
+    TypeVar,
+    Union,
+)
+from .types import CreateOrder, UpdateOrderStatus
 import click_and_drop_api
+from click_and_drop_api import metrics
+from click_and_drop_api.exceptions import ApiException
+from click_and_drop_api.rest import RESTClientObject, RESTResponse
+from click_and_drop_api.metrics import RequestHook
+from click_and_drop_api.retry import RateLimiter, RetryPolicy
+from .cache import OrderCache, merge_cached_orders
+from .coalesce import OrderLookupCoalescer
+from .export import TimeWindow, export_orders
+from .pool import HOST, ConnectionPool
+from .response_types import (
+    GET_ORDERS_LABEL_RESPONSE_TYPES,
+    GET_ORDERS_RESPONSE_TYPES,
+    GET_ORDERS_WITH_DETAILS_RESPONSE_TYPES,
+    ResponseTypesMap,
+)
+from .stream import CHUNK_SIZE, Target, open_target
+from .sync import OrderEvent, OrderStore, sync_orders
+from .json_stream import JSONArrayParser
+from .views import (
+    ModelView,
+    OrderDetailsView,
+    OrderInfoView,
+    deserialize_view,
+    view_type,
+)
 
 from urllib.parse import quote
 
+T = TypeVar("T")
+Page = TypeVar(
+    "Page",
+    click_and_drop_api.GetOrdersResponse,
+    click_and_drop_api.GetOrdersDetailsResponse,
+)
+
+MAX_ORDER_IDENTIFIERS = 100
+"""The maximum number of order identifiers in one request."""
+
+CREATE_ORDERS_BATCH_SIZE = 100
+"""The number of orders created with one request."""
+
+MAX_PAGE_SIZE = 100
+"""The maximum number of orders in a page."""
+
 
 def order_identifier_to_string(id_or_ref: Union[int, str]) -> str:
     """Encode order ids and strings."""
@@ -25,37 +78,255 @@ def order_identifiers_to_string(
     return ";".join(map(order_identifier_to_string, order_identifiers))
 
 
+def chunk_order_identifiers(
+    order_identifiers: Union[list[Union[str, int]], str, int],
+    size: int = MAX_ORDER_IDENTIFIERS,
+) -> list[list[Union[str, int]]]:
+    """Split order ids and references into lists of at most size elements.
+
+    The order is preserved.
+    """
+    if not isinstance(order_identifiers, list):
+        order_identifiers = [order_identifiers]
+    return [
+        order_identifiers[i : i + size] for i in range(0, len(order_identifiers), size)
+    ]
+
+
+def merge_delete_orders_resources(
+    resources: list[click_and_drop_api.DeleteOrdersResource],
+) -> click_and_drop_api.DeleteOrdersResource:
+    """Combine the results of several deletions into one."""
+    deleted_orders = []
+    errors = []
+    for resource in resources:
+        deleted_orders.extend(resource.deleted_orders or [])
+        errors.extend(resource.errors or [])
+    return click_and_drop_api.DeleteOrdersResource(
+        deleted_orders=deleted_orders, errors=errors
+    )
+
+
+def check_key(key: str) -> str:
+    """Return the sanitized Click & Drop API key.
+
+    Raises:
+        TypeError: If the key is not a string.
+        ValueError: If the key is malformed.
+    """
+    if not isinstance(key, str):
+        raise TypeError(f"Expected str, got {key}.")
+    key = key.strip()
+    if not 30 < len(key) < 40:
+        raise ValueError(f"Expected 36 characters, got {len(key)}.")
+    if "".join(key.split()) != key:
+        raise ValueError(f"Expected no whitespace in {key!r}.")
+    return key
+
+
+def iter_pages(
+    get_page: Callable[[Optional[str]], Page], prefetch: bool = False
+) -> Iterator[Page]:
+    """Yield the pages of a list of orders.
+
+    Parameters:
+        get_page:
+            A function that returns the page for a continuation token.
+            The first page is requested with None.
+        prefetch:
+            Whether to request the next page in the background
+            while the current page is processed.
+    """
+    if not prefetch:
+        continuation_token = None
+        while True:
+            page = get_page(continuation_token)
+            yield page
+            continuation_token = page.continuation_token
+            if not continuation_token:
+                return
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        future = executor.submit(get_page, None)
+        while future is not None:
+            page = future.result()
+            future = (
+                executor.submit(get_page, page.continuation_token)
+                if page.continuation_token
+                else None
+            )
+            yield page
+
+
+class CreateOrdersBatch(NamedTuple):
+    """The result of creating a batch of orders."""
+
+    start: int
+    """The index of the first order of the batch in the list of all orders."""
+
+    orders: list[CreateOrder]
+    """The orders of this batch."""
+
+    response: click_and_drop_api.CreateOrdersResponse
+    """The response for the orders of this batch."""
+
+    @property
+    def indices(self) -> range:
+        """The indices of the orders of this batch in the list of all orders."""
+        return range(self.start, self.start + len(self.orders))
+
+
+def create_orders_error_response(
+    orders: list[CreateOrder], error: ApiException
+) -> click_and_drop_api.CreateOrdersResponse:
+    """Return a response that reports all orders as failed because of the error."""
+    errors = [
+        click_and_drop_api.CreateOrderErrorResponse(
+            error_code=error.status, error_message=error.reason
+        )
+    ]
+    return click_and_drop_api.CreateOrdersResponse(
+        success_count=0,
+        errors_count=len(orders),
+        created_orders=[],
+        failed_orders=[
+            click_and_drop_api.FailedOrderResponse(order=order, errors=errors)
+            for order in orders
+        ],
+    )
+
+
+def merge_create_orders_responses(
+    responses: list[click_and_drop_api.CreateOrdersResponse],
+) -> click_and_drop_api.CreateOrdersResponse:
+    """Combine the responses of several batches into one.
+
+    The counts are added and the orders are concatenated in the order of the responses.
+    """
+    created_orders = []
+    failed_orders = []
+    success_count = errors_count = 0
+    for response in responses:
+        success_count += response.success_count or 0
+        errors_count += response.errors_count or 0
+        created_orders.extend(response.created_orders or [])
+        failed_orders.extend(response.failed_orders or [])
+    return click_and_drop_api.CreateOrdersResponse(
+        success_count=success_count,
+        errors_count=errors_count,
+        created_orders=created_orders,
+        failed_orders=failed_orders,
+    )
+
+
+def _check_incremental(prefetch: bool, incremental: bool) -> None:
+    """Raise ValueError if pages that are parsed incrementally would be prefetched."""
+    if prefetch and incremental:
+        raise ValueError("Pages that are parsed incrementally cannot be prefetched.")
+
+
 class ClickAndDrop:
     """The Click & Drop API simplified."""
 
-    host = "https://api.parcel.royalmail.com/api/v1"
+    host = HOST
     """The Click & Drop API host.
     
     There seems to be only one host available.
     """
 
-    def __init__(self, key: str):
+    def __init__(
+        self,
+        key: str,
+        host: Optional[str] = None,
+        max_workers: int = 5,
+        retry_policy: Optional[RetryPolicy] = RetryPolicy(),
+        rate_limiter: Optional[RateLimiter] = None,
+        cache: Optional[OrderCache] = None,
+        coalesce_delay: Optional[float] = None,
+        request_hooks: Sequence[RequestHook] = (),
+        connection_pool: Optional[ConnectionPool] = None,
+        transport: Optional[
+            Callable[[click_and_drop_api.Configuration], RESTClientObject]
+        ] = None,
+    ):
         """Create a new API object.
 
         Parameters:
             key: The Click & Drop API authorisation key.
+            host: The API host to use instead of ClickAndDrop.host.
+            max_workers:
+                The maximum number of requests sent in parallel
+                if a call needs several requests.
+            retry_policy:
+                When to retry throttled and failed requests.
+                None disables retries.
+            rate_limiter:
+                Limit the requests per second, e.g. RateLimiter(5).
+                Share it between all API objects of the same account.
+            cache:
+                Answer get_orders() and get_order() from this cache,
+                e.g. MemoryOrderCache() or SQLiteOrderCache(path).
+            coalesce_delay:
+                Merge the get_orders() calls of several threads into one request.
+                The first call waits this many seconds for others to join, e.g. 0.01.
+                None disables merging.
+            request_hooks:
+                Observe the requests, e.g. with PrometheusHook() or OpenTelemetryHook(),
+                see click_and_drop_api.metrics.
+            connection_pool:
+                Share the connections with other API objects,
+                e.g. shared_connection_pool(key).
+                By default, the API object opens its own connections.
+            transport:
+                Create the REST client that sends the requests with this,
+                e.g. HTTP2RESTClientObject from click_and_drop_api.http2.
         """
-        if not isinstance(key, str):
-            raise TypeError(f"Expected str, got {key}.")
-        key = key.strip()
-        if not 30 < len(key) < 40:
-            raise ValueError(f"Expected 36 characters, got {len(key)}.")
-        if "".join(key.split()) != key:
-            raise ValueError(f"Expected no whitespace in {key!r}.")
-        self._key = key
+        self._key = check_key(key)
+        self.max_workers = max_workers
+        self.cache = cache
+        self.coalescer = (
+            None
+            if coalesce_delay is None
+            else OrderLookupCoalescer(self._request_orders, coalesce_delay)
+        )
+        if host is not None:
+            self.host = host
         self._configuration = click_and_drop_api.Configuration(host=self.host)
         self._configuration.api_key["Bearer"] = self._key
+        self._configuration.retry_policy = retry_policy
+        self._configuration.rate_limiter = rate_limiter
+        self._configuration.request_hooks = list(request_hooks)
+        if connection_pool is not None:
+            self._configuration.pool_manager = connection_pool.pool_manager
+        self._configuration.rest_client_class = transport
         self._api_client = click_and_drop_api.ApiClient(self._configuration)
         self._version_api = click_and_drop_api.VersionApi(self._api_client)
         self._orders_api = click_and_drop_api.OrdersApi(self._api_client)
         self._labels_api = click_and_drop_api.LabelsApi(self._api_client)
         self._manifests_api = click_and_drop_api.ManifestsApi(self._api_client)
 
+    def __enter__(self) -> "ClickAndDrop":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self) -> None:
+        """Close the connections of this API object.
+
+        A transport like HTTP2RESTClientObject is closed with its close() method.
+        The connections of a shared connection pool stay open.
+        """
+        rest_client = self._api_client.rest_client
+        if hasattr(rest_client, "close"):
+            rest_client.close()
+            return
+        pool_manager = getattr(rest_client, "pool_manager", None)
+        if (
+            pool_manager is not None
+            and pool_manager is not self._configuration.pool_manager
+        ):
+            pool_manager.clear()
+
     def get_version(self) -> click_and_drop_api.GetVersionResource:
         """Get the version of the Click & Drop API.
 
@@ -68,6 +339,18 @@ class ClickAndDrop:
         """The API key in use."""
         return self._key
 
+    def _map(self, function: Callable[..., T], chunks: list) -> list[T]:
+        """Call the function for each chunk in parallel.
+
+        The results are in the order of the chunks.
+        """
+        if len(chunks) <= 1:
+            return [function(chunk) for chunk in chunks]
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(chunks))
+        ) as executor:
+            return list(executor.map(function, chunks))
+
     def get_orders(
         self, order_identifiers: Union[list[Union[str, int]], str, int]
     ) -> list[click_and_drop_api.GetOrderInfoResource]:
@@ -78,18 +361,380 @@ class ClickAndDrop:
                 One or several Order Identifiers or Order References.
                 Order Identifiers are integer numbers.
                 Order References are strings.
-                The maximum number of identifiers is 100.
+                More than 100 identifiers are requested in parallel batches of 100.
 
         Returns:
-            A list of orders
+            A list of orders.
+            Orders in the cache are not requested.
 
         Raises:
             click_and_drop_api.exceptions.BadRequestException if an order with the same reference already exists
 
         https://api.parcel.royalmail.com/#tag/Orders/operation/GetSpecificOrdersAsync
         """
-        return self._orders_api.get_specific_orders_async(
-            order_identifiers=order_identifiers_to_string(order_identifiers)
+        if not isinstance(order_identifiers, list):
+            order_identifiers = [order_identifiers]
+        request_orders = (
+            self._request_orders
+            if self.coalescer is None
+            else self.coalescer.get_orders
+        )
+        if self.cache is None:
+            return request_orders(order_identifiers)
+        cached, missing = self.cache.lookup(order_identifiers)
+        requested = request_orders(missing) if missing else []
+        self.cache.update(requested)
+        return merge_cached_orders(order_identifiers, cached, requested)
+
+    def _request_orders(
+        self, order_identifiers: list[Union[str, int]]
+    ) -> list[click_and_drop_api.GetOrderInfoResource]:
+        """Request specific orders in parallel batches of 100."""
+        results = self._map(
+            lambda chunk: self._orders_api.get_specific_orders_async(
+                order_identifiers=order_identifiers_to_string(chunk)
+            ),
+            chunk_order_identifiers(order_identifiers),
+        )
+        return [order for orders in results for order in orders]
+
+    def _page_getter(
+        self, operation: str, response_types_map: ResponseTypesMap, lightweight: bool
+    ) -> Callable[..., Any]:
+        """Return the generated method that requests a page of orders.
+
+        Parameters:
+            operation: The name of the method of the OrdersApi.
+            response_types_map: The response types of the operation.
+            lightweight: Return a view of the page instead of its model.
+        """
+        if not lightweight:
+            return getattr(self._orders_api, operation)
+        request = getattr(self._orders_api, f"{operation}_without_preload_content")
+
+        def get_page(**params) -> ModelView:
+            response = request(**params)
+            response_data = RESTResponse(response)
+            try:
+                response_data.read()
+            finally:
+                response.release_conn()
+            return deserialize_view(self._api_client, response_data, response_types_map)
+
+        return get_page
+
+    def _stream_page(
+        self,
+        parser: JSONArrayParser,
+        operation: str,
+        response_types_map: ResponseTypesMap,
+        model: type,
+        lightweight: bool,
+        **params,
+    ) -> Iterator[Any]:
+        """Request a page of orders and yield its orders while it is received.
+
+        Parameters:
+            parser: Parses the page, its members are complete at the end.
+            operation: The name of the method of the OrdersApi.
+            response_types_map: The response types of the operation.
+            model: The model of the orders.
+            lightweight: Yield views of the orders instead of models.
+            params: The parameters of the operation.
+        """
+        convert = view_type(model) if lightweight else model.model_validate
+        request = getattr(self._orders_api, f"{operation}_without_preload_content")
+        response = request(**params)
+        received = 0
+        try:
+            if not 200 <= response.status <= 299:
+                error = RESTResponse(response)
+                error.read()
+                self._api_client.response_deserialize(error, response_types_map)
+            for chunk in response.stream(CHUNK_SIZE):
+                received += len(chunk)
+                for order in parser.feed(chunk):
+                    yield convert(order)
+            for order in parser.close():
+                yield convert(order)
+            metrics.response_streamed(received)
+        except GeneratorExit:
+            # The consumer stopped early, discard the rest of the page.
+            response.close()
+            metrics.response_streamed(received)
+            raise
+        except BaseException as error:
+            response.close()
+            metrics.response_streamed(received, error)
+            raise
+        finally:
+            response.release_conn()
+
+    def _stream_orders(
+        self,
+        operation: str,
+        response_types_map: ResponseTypesMap,
+        model: type,
+        lightweight: bool,
+        **params,
+    ) -> Iterator[Any]:
+        """Yield the orders of all pages, parsing each page while it is received.
+
+        The parameters are the same as for _stream_page().
+        """
+        continuation_token = None
+        while True:
+            parser = JSONArrayParser("orders")
+            yield from self._stream_page(
+                parser,
+                operation,
+                response_types_map,
+                model,
+                lightweight,
+                continuation_token=continuation_token,
+                **params,
+            )
+            continuation_token = parser.members.get("continuationToken")
+            if not continuation_token:
+                return
+
+    def _iter_orders(
+        self,
+        operation: str,
+        response_types_map: ResponseTypesMap,
+        model: type,
+        start: Optional[datetime],
+        end: Optional[datetime],
+        page_size: int,
+        prefetch: bool,
+        lightweight: bool,
+        incremental: bool,
+    ) -> Iterator[Any]:
+        """Yield the orders of all pages of an operation, see iter_orders()."""
+        if incremental:
+            yield from self._stream_orders(
+                operation,
+                response_types_map,
+                model,
+                lightweight,
+                page_size=page_size,
+                start_date_time=start,
+                end_date_time=end,
+            )
+            return
+        get_page = self._page_getter(operation, response_types_map, lightweight)
+        for page in iter_pages(
+            lambda continuation_token: get_page(
+                page_size=page_size,
+                start_date_time=start,
+                end_date_time=end,
+                continuation_token=continuation_token,
+            ),
+            prefetch,
+        ):
+            yield from page.orders or []
+
+    def iter_orders(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        page_size: int = MAX_PAGE_SIZE,
+        prefetch: bool = False,
+        lightweight: bool = False,
+        incremental: bool = False,
+    ) -> Iterator[Union[click_and_drop_api.GetOrderInfoResource, OrderInfoView]]:
+        """Iterate over all orders, requesting one page at a time.
+
+        Only the current page is kept in memory.
+
+        Parameters:
+            start: Date and time lower bound for the orders.
+            end: Date and time upper bound for the orders.
+            page_size: The number of orders to request at once, 1 to 100.
+            prefetch: Request the next page while the current one is processed.
+            lightweight:
+                Yield read-only views of the JSON of the orders
+                that validate a field when it is accessed,
+                see click_and_drop_api.simple.views.
+            incremental:
+                Parse each page while it is received and yield its orders
+                before the rest of the page arrives,
+                see click_and_drop_api.simple.json_stream.
+                The pages cannot be prefetched.
+
+        Raises:
+            ValueError: If both prefetch and incremental are set.
+
+        https://api.parcel.royalmail.com/#tag/Orders/operation/GetOrdersAsync
+        """
+        _check_incremental(prefetch, incremental)
+        return self._iter_orders(
+            "get_orders_async",
+            GET_ORDERS_RESPONSE_TYPES,
+            click_and_drop_api.GetOrderInfoResource,
+            start,
+            end,
+            page_size,
+            prefetch,
+            lightweight,
+            incremental,
+        )
+
+    def iter_orders_with_details(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        page_size: int = MAX_PAGE_SIZE,
+        prefetch: bool = False,
+        lightweight: bool = False,
+        incremental: bool = False,
+    ) -> Iterator[Union[click_and_drop_api.GetOrderDetailsResource, OrderDetailsView]]:
+        """Iterate over all orders with their details, requesting one page at a time.
+
+        The parameters are the same as for iter_orders().
+        This is reserved for ChannelShipper customers only.
+
+        https://api.parcel.royalmail.com/#tag/Orders/operation/GetOrdersWithDetailsAsync
+        """
+        _check_incremental(prefetch, incremental)
+        return self._iter_orders(
+            "get_orders_with_details_async",
+            GET_ORDERS_WITH_DETAILS_RESPONSE_TYPES,
+            click_and_drop_api.GetOrderDetailsResource,
+            start,
+            end,
+            page_size,
+            prefetch,
+            lightweight,
+            incremental,
+        )
+
+    def export_orders_with_details(
+        self,
+        start: datetime,
+        end: datetime,
+        windows: Optional[int] = None,
+        page_size: int = MAX_PAGE_SIZE,
+        min_window: timedelta = timedelta(minutes=1),
+        lightweight: bool = False,
+    ) -> Iterator[Union[click_and_drop_api.GetOrderDetailsResource, OrderDetailsView]]:
+        """Export all orders with details from start to end in parallel.
+
+        The time range is split into windows that are paginated concurrently
+        with at most max_workers requests at a time.
+        Windows that contain more than one page are split further,
+        the orders of their first page are requested again by the halves.
+        Each order is yielded once but not in a particular order.
+
+        Parameters:
+            start: Date and time lower bound for the orders.
+            end: Date and time upper bound for the orders.
+            windows: The number of windows to start with, max_workers by default.
+            page_size: The number of orders to request at once, 1 to 100.
+            min_window: Windows of this length are paginated instead of split.
+            lightweight: Yield views of the orders, see iter_orders().
+
+        This is reserved for ChannelShipper customers only.
+
+        https://api.parcel.royalmail.com/#tag/Orders/operation/GetOrdersWithDetailsAsync
+        """
+
+        request = self._page_getter(
+            "get_orders_with_details_async",
+            GET_ORDERS_WITH_DETAILS_RESPONSE_TYPES,
+            lightweight,
+        )
+
+        def get_page(window: TimeWindow, continuation_token: Optional[str]):
+            return request(
+                page_size=page_size,
+                start_date_time=window.start,
+                end_date_time=window.end,
+                continuation_token=continuation_token,
+            )
+
+        return export_orders(
+            get_page,
+            start,
+            end,
+            windows=windows or self.max_workers,
+            max_workers=self.max_workers,
+            min_window=min_window,
+        )
+
+    def sync_orders(
+        self,
+        store: OrderStore,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        overlap: timedelta = timedelta(minutes=10),
+        track_for: timedelta = timedelta(days=30),
+        page_size: int = MAX_PAGE_SIZE,
+    ) -> Iterator[OrderEvent]:
+        """Yield the orders with details that changed since the last sync.
+
+        Only the orders created since the newest order in the store
+        and the stored orders that may still change are requested,
+        see click_and_drop_api.simple.sync.
+        The store is updated as the events are consumed.
+        Dates and times without a time zone are in UTC.
+
+        Parameters:
+            store: The orders of the previous syncs and the checkpoint.
+            start: Date and time lower bound for the orders if the store is empty.
+            end: Date and time upper bound for the orders, now by default.
+            overlap: The time before the newest stored order that is listed again.
+            track_for:
+                How long after their creation orders that are not manifested
+                are requested again to find their changes.
+            page_size: The number of orders to request at once, 1 to 100.
+
+        This is reserved for ChannelShipper customers only.
+
+        https://api.parcel.royalmail.com/#tag/Orders/operation/GetOrdersWithDetailsAsync
+        """
+
+        def get_page(
+            start: Optional[datetime],
+            end: datetime,
+            continuation_token: Optional[str],
+        ) -> click_and_drop_api.GetOrdersDetailsResponse:
+            return self._orders_api.get_orders_with_details_async(
+                page_size=page_size,
+                start_date_time=start,
+                end_date_time=end,
+                continuation_token=continuation_token,
+            )
+
+        def request_orders(
+            chunk: list[Union[str, int]],
+        ) -> list[click_and_drop_api.GetOrderDetailsResource]:
+            try:
+                return self._orders_api.get_specific_orders_with_details_async(
+                    order_identifiers=order_identifiers_to_string(chunk)
+                )
+            except ApiException as error:
+                if error.status == 404:
+                    # none of the orders exists
+                    return []
+                raise
+
+        def get_orders(
+            order_identifiers: list[int],
+        ) -> list[click_and_drop_api.GetOrderDetailsResource]:
+            results = self._map(
+                request_orders, chunk_order_identifiers(list(order_identifiers))
+            )
+            return [order for orders in results for order in orders]
+
+        return sync_orders(
+            store,
+            get_page,
+            get_orders,
+            start=start,
+            end=end or datetime.now(timezone.utc),
+            overlap=overlap,
+            track_for=track_for,
         )
 
     def get_order(
@@ -130,25 +775,91 @@ class ClickAndDrop:
                 One or several Order Identifiers or Order References.
                 Order Identifiers are integer numbers.
                 Order References are strings.
-                The maximum number of identifiers is 100.
+                More than 100 identifiers are deleted in parallel batches of 100.
 
         https://api.parcel.royalmail.com/#tag/Orders/operation/DeleteOrdersAsync
         """
-        return self._orders_api.delete_orders_async(
-            order_identifiers=order_identifiers_to_string(order_identifiers)
-        )
+        chunks = chunk_order_identifiers(order_identifiers)
+        try:
+            results = self._map(
+                lambda chunk: self._orders_api.delete_orders_async(
+                    order_identifiers=order_identifiers_to_string(chunk)
+                ),
+                chunks,
+            )
+        finally:
+            self._invalidate([i for chunk in chunks for i in chunk])
+        if len(results) == 1:
+            return results[0]
+        return merge_delete_orders_resources(results)
 
     def create_orders(
-        self, orders: Union[list[CreateOrder], CreateOrder]
+        self,
+        orders: Union[list[CreateOrder], CreateOrder],
+        batch_size: int = CREATE_ORDERS_BATCH_SIZE,
     ) -> click_and_drop_api.CreateOrdersResponse:
-        """Create a new order.
+        """Create new orders.
+
+        Parameters:
+            orders: The orders to create.
+            batch_size:
+                The maximum number of orders sent in one request.
+                More orders are sent in parallel batches and
+                the responses are merged in the order of the batches.
+                If a batch fails as a whole, its orders are listed in failed_orders.
+
+        Raises:
+            click_and_drop_api.exceptions.ApiException if all orders fit into one request and it fails
 
         https://api.parcel.royalmail.com/#tag/Orders/operation/CreateOrdersAsync
         """
         if not isinstance(orders, list):
             orders = [orders]
-        request = click_and_drop_api.CreateOrdersRequest(items=orders)
-        return self._orders_api.create_orders_async(request)
+        if len(orders) <= batch_size:
+            request = click_and_drop_api.CreateOrdersRequest(items=orders)
+            try:
+                return self._orders_api.create_orders_async(request)
+            finally:
+                self._invalidate_references(orders)
+        return merge_create_orders_responses(
+            [
+                batch.response
+                for batch in self.create_orders_in_batches(orders, batch_size)
+            ]
+        )
+
+    def create_orders_in_batches(
+        self,
+        orders: list[CreateOrder],
+        batch_size: int = CREATE_ORDERS_BATCH_SIZE,
+    ) -> list[CreateOrdersBatch]:
+        """Create many orders in parallel batches.
+
+        At most max_workers batches are sent at the same time.
+
+        Parameters:
+            orders: The orders to create.
+            batch_size: The maximum number of orders sent in one request.
+
+        Returns:
+            The batches in the order of the orders.
+            If a batch fails as a whole, its orders are listed in failed_orders.
+
+        https://api.parcel.royalmail.com/#tag/Orders/operation/CreateOrdersAsync
+        """
+
+        def create_batch(start: int) -> CreateOrdersBatch:
+            batch = orders[start : start + batch_size]
+            request = click_and_drop_api.CreateOrdersRequest(items=batch)
+            try:
+                response = self._orders_api.create_orders_async(request)
+            except ApiException as error:
+                response = create_orders_error_response(batch, error)
+            finally:
+                self._invalidate_references(batch)
+            return CreateOrdersBatch(start, batch, response)
+
+        return self._map(create_batch, list(range(0, len(orders), batch_size)))
 
     def create_order(
         self, order: CreateOrder
@@ -159,6 +870,43 @@ class ClickAndDrop:
         """
         return self.create_orders(order)
 
+    def update_orders_status(
+        self, items: Union[list[UpdateOrderStatus], UpdateOrderStatus]
+    ) -> click_and_drop_api.UpdateOrderStatusResponse:
+        """Set the status of orders.
+
+        Parameters:
+            items:
+                The orders and their new status, at most 100.
+                Either orderIdentifier or orderReference is required.
+
+        https://api.parcel.royalmail.com/#tag/Orders/operation/UpdateOrdersStatusAsync
+        """
+        if not isinstance(items, list):
+            items = [items]
+        try:
+            return self._orders_api.update_orders_status_async(
+                click_and_drop_api.UpdateOrdersStatusRequest(items=items)
+            )
+        finally:
+            self._invalidate(
+                [
+                    item.order_identifier
+                    if item.order_identifier is not None
+                    else item.order_reference
+                    for item in items
+                ]
+            )
+
+    def _invalidate(self, order_identifiers: list[Union[str, int, None]]) -> None:
+        """Remove changed orders from the cache."""
+        if self.cache is not None:
+            self.cache.invalidate(i for i in order_identifiers if i is not None)
+
+    def _invalidate_references(self, orders: list[CreateOrder]) -> None:
+        """Remove orders with the references of new orders from the cache."""
+        self._invalidate([order.order_reference for order in orders])
+
     def get_label(
         self,
         order_identifiers: Union[list[Union[str, int]], str, int],
@@ -197,8 +945,17 @@ class ClickAndDrop:
 
         Label generation only available for orders with postage applied status.
 
+        Raises:
+            ValueError: If there are more than 100 identifiers, use get_labels() instead.
+
         https://api.parcel.royalmail.com/#tag/Labels/operation/GetOrdersLabelAsync
         """
+        chunks = chunk_order_identifiers(order_identifiers)
+        if len(chunks) > 1:
+            raise ValueError(
+                f"Expected at most {MAX_ORDER_IDENTIFIERS} identifiers, "
+                "use get_labels() to get one PDF per batch."
+            )
         return self._labels_api.get_orders_label_async(
             order_identifiers=order_identifiers_to_string(order_identifiers),
             document_type=document_type,
@@ -206,5 +963,98 @@ class ClickAndDrop:
             include_cn=include_cn,
         )
 
+    def get_label_to(
+        self,
+        target: Target,
+        order_identifiers: Union[list[Union[str, int]], str, int],
+        document_type: Literal["postageLabel", "despatchNote", "CN22", "CN23"],
+        include_returns_label: Optional[bool] = None,
+        include_cn: Optional[bool] = None,
+        chunk_size: int = CHUNK_SIZE,
+    ) -> int:
+        """Generate a label for an order and stream the PDF to the target.
+
+        Unlike get_label(), the PDF is never held in memory as a whole.
+        It is written in chunks of chunk_size bytes as it arrives.
+        The other parameters are the same as for get_label().
+
+        Parameters:
+            target:
+                A path, a binary file object or a socket.
+                A path is removed again if the download fails.
+                File objects and sockets are not closed.
+            chunk_size: The number of bytes to read at once.
+
+        Returns:
+            The number of bytes written.
+
+        Raises:
+            ValueError: If there are more than 100 identifiers.
+            click_and_drop_api.exceptions.ApiException: If the status is not 2XX.
+                Nothing is written to the target in this case.
+
+        https://api.parcel.royalmail.com/#tag/Labels/operation/GetOrdersLabelAsync
+        """
+        if len(chunk_order_identifiers(order_identifiers)) > 1:
+            raise ValueError(
+                f"Expected at most {MAX_ORDER_IDENTIFIERS} identifiers, "
+                "use get_label_to() once per batch of identifiers."
+            )
+        response = self._labels_api.get_orders_label_async_without_preload_content(
+            order_identifiers=order_identifiers_to_string(order_identifiers),
+            document_type=document_type,
+            include_returns_label=include_returns_label,
+            include_cn=include_cn,
+        )
+        written = 0
+        try:
+            if not 200 <= response.status <= 299:
+                error = RESTResponse(response)
+                error.read()
+                self._api_client.response_deserialize(
+                    error, GET_ORDERS_LABEL_RESPONSE_TYPES
+                )
+            with open_target(target) as write:
+                for chunk in response.stream(chunk_size):
+                    write(chunk)
+                    written += len(chunk)
+            metrics.response_streamed(written)
+            return written
+        except BaseException as error:
+            # Do not return a connection with unread data to the pool.
+            response.close()
+            metrics.response_streamed(written, error)
+            raise
+        finally:
+            response.release_conn()
+
+    def get_labels(
+        self,
+        order_identifiers: Union[list[Union[str, int]], str, int],
+        document_type: Literal["postageLabel", "despatchNote", "CN22", "CN23"],
+        include_returns_label: Optional[bool] = None,
+        include_cn: Optional[bool] = None,
+    ) -> list[bytearray]:
+        """Generate labels for any number of orders.
+
+        The orders are split into batches of 100 which are requested in parallel.
+        The parameters are the same as for get_label().
+
+        Returns:
+            One PDF file for each batch of 100 orders, in the order of the identifiers.
+        """
+        return self._map(
+            lambda chunk: self.get_label(
+                chunk, document_type, include_returns_label, include_cn
+            ),
+            chunk_order_identifiers(order_identifiers),
+        )
+
 
-__all__ = ["ClickAndDrop"]
+__all__ = [
+    "ClickAndDrop",
+    "CreateOrdersBatch",
+    "MAX_ORDER_IDENTIFIERS",
+    "CREATE_ORDERS_BATCH_SIZE",
+    "MAX_PAGE_SIZE",
+]
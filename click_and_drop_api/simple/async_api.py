@@ -0,0 +1,903 @@
+"""The simple API interface for asyncio.
+
+This requires aiohttp to be installed:
+
+    pip install click_and_drop_api[asyncio]
+"""
+
+from __future__ import annotations
+
+import asyncio
+import io
+import json
+import ssl
+from datetime import datetime
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Literal,
+    Optional,
+    Sequence,
+    TypeVar,
+    Union,
+)
+
+import click_and_drop_api
+from click_and_drop_api import metrics
+from click_and_drop_api.api_client import ApiClient, RequestSerialized
+from click_and_drop_api.exceptions import ApiException, ApiValueError
+from click_and_drop_api.rest import is_socks_proxy_url
+from click_and_drop_api.metrics import RequestHook
+from click_and_drop_api.retry import RateLimiter, RetryPolicy
+
+from .api import (
+    CREATE_ORDERS_BATCH_SIZE,
+    MAX_ORDER_IDENTIFIERS,
+    MAX_PAGE_SIZE,
+    CreateOrdersBatch,
+    _check_incremental,
+    check_key,
+    chunk_order_identifiers,
+    create_orders_error_response,
+    merge_create_orders_responses,
+    merge_delete_orders_resources,
+    order_identifiers_to_string,
+)
+from .response_types import (
+    CREATE_ORDERS_RESPONSE_TYPES,
+    DELETE_ORDERS_RESPONSE_TYPES,
+    GET_ORDERS_LABEL_RESPONSE_TYPES,
+    GET_ORDERS_RESPONSE_TYPES,
+    GET_ORDERS_WITH_DETAILS_RESPONSE_TYPES,
+    GET_SPECIFIC_ORDERS_RESPONSE_TYPES,
+    GET_VERSION_RESPONSE_TYPES,
+    UPDATE_ORDERS_STATUS_RESPONSE_TYPES,
+    ResponseTypesMap,
+)
+from .cache import MemoryOrderCache, OrderCache, merge_cached_orders
+from .coalesce import AsyncOrderLookupCoalescer
+from .pool import HOST
+from .stream import CHUNK_SIZE, Target, open_target
+from .types import CreateOrder, UpdateOrderStatus
+from .json_stream import JSONArrayParser
+from .views import (
+    ModelView,
+    OrderDetailsView,
+    OrderInfoView,
+    deserialize_view,
+    view_type,
+)
+
+T = TypeVar("T")
+
+
+class AsyncRESTResponse(io.IOBase):
+    """The asyncio counterpart of click_and_drop_api.rest.RESTResponse."""
+
+    def __init__(self, resp) -> None:
+        self.response = resp
+        self.status = resp.status
+        self.reason = resp.reason
+        self.data: Optional[bytes] = None
+        self.retries = 0
+
+    async def read(self) -> bytes:
+        if self.data is None:
+            self.data = await self.response.read()
+            self.response.release()
+        return self.data
+
+    @property
+    def headers(self):
+        """Returns a dictionary of response headers."""
+        return self.response.headers
+
+    def getheaders(self):
+        """Returns a dictionary of the response headers; use ``headers`` instead."""
+        return self.response.headers
+
+    def getheader(self, name, default=None):
+        """Returns a given response header; use ``headers.get()`` instead."""
+        return self.response.headers.get(name, default)
+
+
+class AsyncRESTClientObject:
+    """The asyncio counterpart of click_and_drop_api.rest.RESTClientObject.
+
+    All requests share one aiohttp session and its connection pool.
+    The session is created on the first request
+    because it belongs to the running event loop.
+    """
+
+    def __init__(self, configuration: click_and_drop_api.Configuration) -> None:
+        if is_socks_proxy_url(configuration.proxy):
+            raise ApiValueError("SOCKS proxies are not supported with asyncio.")
+        self.maxsize = configuration.connection_pool_maxsize
+        self.proxy = configuration.proxy
+        self.proxy_headers = configuration.proxy_headers
+        self.ssl_context = ssl.create_default_context(
+            cafile=configuration.ssl_ca_cert, cadata=configuration.ca_cert_data
+        )
+        if configuration.cert_file:
+            self.ssl_context.load_cert_chain(
+                configuration.cert_file, keyfile=configuration.key_file
+            )
+        if not configuration.verify_ssl:
+            self.ssl_context.check_hostname = False
+            self.ssl_context.verify_mode = ssl.CERT_NONE
+        self.retry_policy = configuration.retry_policy
+        self.rate_limiter = configuration.rate_limiter
+        self._session = None
+
+    async def close(self) -> None:
+        """Close all connections."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def _get_session(self):
+        if self._session is None:
+            import aiohttp
+
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self.maxsize, ssl=self.ssl_context
+                ),
+                trust_env=True,
+            )
+        return self._session
+
+    async def request(
+        self,
+        method,
+        url,
+        headers=None,
+        body=None,
+        post_params=None,
+        _request_timeout=None,
+    ) -> AsyncRESTResponse:
+        """Perform requests, respecting the rate limit and retry policy.
+
+        The parameters are the same as for RESTClientObject.request.
+        """
+        retries = 0
+        while True:
+            if self.rate_limiter is not None:
+                await asyncio.sleep(self.rate_limiter.reserve())
+            r = await self.send(
+                method,
+                url,
+                headers=headers,
+                body=body,
+                post_params=post_params,
+                _request_timeout=_request_timeout,
+            )
+            r.retries = retries
+            if self.retry_policy is None or not self.retry_policy.is_retry(
+                method, r.status, retries
+            ):
+                return r
+            delay = self.retry_policy.get_backoff(retries, r.getheader("Retry-After"))
+            await r.read()
+            await asyncio.sleep(delay)
+            retries += 1
+
+    async def send(
+        self,
+        method,
+        url,
+        headers=None,
+        body=None,
+        post_params=None,
+        _request_timeout=None,
+    ) -> AsyncRESTResponse:
+        """Perform one request.
+
+        The parameters are the same as for RESTClientObject.send.
+        """
+        import aiohttp
+
+        method = method.upper()
+        if post_params and body:
+            raise ApiValueError(
+                "body parameter cannot be used with post_params parameter."
+            )
+        headers = headers or {}
+
+        timeout = None
+        if isinstance(_request_timeout, (int, float)):
+            timeout = aiohttp.ClientTimeout(total=_request_timeout)
+        elif isinstance(_request_timeout, tuple) and len(_request_timeout) == 2:
+            timeout = aiohttp.ClientTimeout(
+                sock_connect=_request_timeout[0], sock_read=_request_timeout[1]
+            )
+
+        data: Optional[Union[str, bytes]] = None
+        if body is not None:
+            content_type = headers.get("Content-Type")
+            if isinstance(body, (str, bytes)):
+                data = body
+            elif not content_type or "json" in content_type.lower():
+                data = json.dumps(body)
+            else:
+                raise ApiException(
+                    status=0,
+                    reason="Cannot prepare a request message for provided "
+                    "arguments. Please check that your arguments match "
+                    "declared content type.",
+                )
+        elif post_params:
+            data = aiohttp.FormData(post_params)
+
+        try:
+            response = await self._get_session().request(
+                method,
+                url,
+                headers=headers,
+                data=data,
+                timeout=timeout,
+                proxy=self.proxy,
+                proxy_headers=self.proxy_headers,
+            )
+        except aiohttp.ClientSSLError as e:
+            msg = "\n".join([type(e).__name__, str(e)])
+            raise ApiException(status=0, reason=msg)
+        return AsyncRESTResponse(response)
+
+
+class AsyncApiClient(ApiClient):
+    """An ApiClient that sends its requests on the asyncio event loop.
+
+    The generated API classes are synchronous.
+    Use their serialize methods to build the request and
+    send it with AsyncApiClient.call.
+    """
+
+    def _create_rest_client(self, configuration) -> AsyncRESTClientObject:
+        return AsyncRESTClientObject(configuration)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def close(self) -> None:
+        """Close all connections."""
+        await self.rest_client.close()
+
+    async def call_api(  # type: ignore[override]
+        self,
+        method,
+        url,
+        header_params=None,
+        body=None,
+        post_params=None,
+        _request_timeout=None,
+    ) -> AsyncRESTResponse:
+        """Makes the HTTP request (asynchronous)
+
+        The parameters are the same as for ApiClient.call_api.
+        """
+        hooks = self.configuration.request_hooks
+        request = metrics.request_sending(hooks, method, url, body) if hooks else None
+        try:
+            response_data = await self.rest_client.request(
+                method,
+                url,
+                headers=header_params,
+                body=body,
+                post_params=post_params,
+                _request_timeout=_request_timeout,
+            )
+        except BaseException as error:
+            if request is not None:
+                metrics.request_sent(request, error=error)
+            raise
+        if request is not None:
+            metrics.request_sent(request, response_data)
+        return response_data
+
+    async def call(
+        self,
+        request: RequestSerialized,
+        response_types_map: ResponseTypesMap,
+        _request_timeout=None,
+    ) -> Any:
+        """Send a serialized request and return the deserialized data.
+
+        Parameters:
+            request: The result of a serialize method of a generated API.
+            response_types_map: The response types of the operation.
+
+        Raises:
+            click_and_drop_api.exceptions.ApiException if the status is not 2XX
+        """
+        response_data = await self.call_api(*request, _request_timeout=_request_timeout)
+        await response_data.read()
+        return self.response_deserialize(
+            response_data=response_data,
+            response_types_map=response_types_map,
+        ).data
+
+    async def call_view(
+        self,
+        request: RequestSerialized,
+        response_types_map: ResponseTypesMap,
+        _request_timeout=None,
+    ) -> ModelView:
+        """Send a serialized request and return a view of the JSON of the response.
+
+        The parameters are the same as for call().
+        See click_and_drop_api.simple.views.
+
+        Raises:
+            click_and_drop_api.exceptions.ApiException if the status is not 2XX
+        """
+        response_data = await self.call_api(*request, _request_timeout=_request_timeout)
+        await response_data.read()
+        return deserialize_view(self, response_data, response_types_map)
+
+
+async def iter_pages(
+    get_page: Callable[[Optional[str]], Awaitable[Any]], prefetch: bool = False
+) -> AsyncIterator[Any]:
+    """Yield the pages of a list of orders.
+
+    See click_and_drop_api.simple.api.iter_pages.
+    """
+    if not prefetch:
+        continuation_token = None
+        while True:
+            page = await get_page(continuation_token)
+            yield page
+            continuation_token = page.continuation_token
+            if not continuation_token:
+                return
+    next_page: Optional[asyncio.Future] = asyncio.ensure_future(get_page(None))
+    try:
+        while next_page is not None:
+            page = await next_page
+            next_page = (
+                asyncio.ensure_future(get_page(page.continuation_token))
+                if page.continuation_token
+                else None
+            )
+            yield page
+    finally:
+        if next_page is not None:
+            next_page.cancel()
+
+
+def serialize(
+    serializer: Callable[..., RequestSerialized], **params
+) -> RequestSerialized:
+    """Call a serialize method of a generated API with the default options."""
+    return serializer(
+        _request_auth=None,
+        _content_type=None,
+        _headers=None,
+        _host_index=0,
+        **params,
+    )
+
+
+class AsyncClickAndDrop:
+    """The Click & Drop API simplified for asyncio.
+
+    The methods are the same as those of ClickAndDrop.
+    All requests share one connection pool.
+    Close the API when you are done:
+
+        async with AsyncClickAndDrop(key) as api:
+            orders = await api.get_orders([1001, 1002])
+    """
+
+    host = HOST
+    """The Click & Drop API host."""
+
+    def __init__(
+        self,
+        key: str,
+        host: Optional[str] = None,
+        max_workers: int = 5,
+        retry_policy: Optional[RetryPolicy] = RetryPolicy(),
+        rate_limiter: Optional[RateLimiter] = None,
+        cache: Optional[OrderCache] = None,
+        coalesce_delay: Optional[float] = None,
+        request_hooks: Sequence[RequestHook] = (),
+    ):
+        """Create a new API object.
+
+        The parameters are the same as for ClickAndDrop.
+        """
+        self._key = check_key(key)
+        self.max_workers = max_workers
+        self.cache = cache
+        self.coalescer = (
+            None
+            if coalesce_delay is None
+            else AsyncOrderLookupCoalescer(self._request_orders, coalesce_delay)
+        )
+        if host is not None:
+            self.host = host
+        self._configuration = click_and_drop_api.Configuration(host=self.host)
+        self._configuration.api_key["Bearer"] = self._key
+        self._configuration.retry_policy = retry_policy
+        self._configuration.rate_limiter = rate_limiter
+        self._configuration.request_hooks = list(request_hooks)
+        self._api_client = AsyncApiClient(self._configuration)
+        self._version_api = click_and_drop_api.VersionApi(self._api_client)
+        self._orders_api = click_and_drop_api.OrdersApi(self._api_client)
+        self._labels_api = click_and_drop_api.LabelsApi(self._api_client)
+
+    async def __aenter__(self) -> AsyncClickAndDrop:
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def close(self) -> None:
+        """Close all connections."""
+        await self._api_client.close()
+
+    async def _map(
+        self, function: Callable[[Any], Awaitable[T]], chunks: list
+    ) -> list[T]:
+        """Call the function for each chunk concurrently.
+
+        The results are in the order of the chunks.
+        """
+        semaphore = asyncio.Semaphore(self.max_workers)
+
+        async def call(chunk) -> T:
+            async with semaphore:
+                return await function(chunk)
+
+        return await asyncio.gather(*map(call, chunks))
+
+    @property
+    def key(self) -> str:
+        """The API key in use."""
+        return self._key
+
+    async def get_version(self) -> click_and_drop_api.GetVersionResource:
+        """Get the version of the Click & Drop API.
+
+        See ClickAndDrop.get_version.
+        """
+        return await self._api_client.call(
+            serialize(self._version_api._get_version_async_serialize),
+            GET_VERSION_RESPONSE_TYPES,
+        )
+
+    async def get_orders(
+        self, order_identifiers: Union[list[Union[str, int]], str, int]
+    ) -> list[click_and_drop_api.GetOrderInfoResource]:
+        """Get specific orders.
+
+        See ClickAndDrop.get_orders.
+        """
+        if not isinstance(order_identifiers, list):
+            order_identifiers = [order_identifiers]
+        request_orders = (
+            self._request_orders
+            if self.coalescer is None
+            else self.coalescer.get_orders
+        )
+        if self.cache is None:
+            return await request_orders(order_identifiers)
+        cached, missing = await self._call_cache(self.cache.lookup, order_identifiers)
+        requested = await request_orders(missing) if missing else []
+        await self._call_cache(self.cache.update, requested)
+        return merge_cached_orders(order_identifiers, cached, requested)
+
+    async def _request_orders(
+        self, order_identifiers: list[Union[str, int]]
+    ) -> list[click_and_drop_api.GetOrderInfoResource]:
+        """Request specific orders in concurrent batches of 100."""
+        results = await self._map(
+            lambda chunk: self._api_client.call(
+                serialize(
+                    self._orders_api._get_specific_orders_async_serialize,
+                    order_identifiers=order_identifiers_to_string(chunk),
+                ),
+                GET_SPECIFIC_ORDERS_RESPONSE_TYPES,
+            ),
+            chunk_order_identifiers(order_identifiers),
+        )
+        return [order for orders in results for order in orders]
+
+    async def _stream_orders(
+        self,
+        serializer: Callable[..., RequestSerialized],
+        response_types_map: ResponseTypesMap,
+        model: type,
+        lightweight: bool,
+        **params,
+    ) -> AsyncIterator[Any]:
+        """Yield the orders of all pages, parsing each page while it is received.
+
+        See ClickAndDrop._stream_orders.
+        """
+        convert = view_type(model) if lightweight else model.model_validate
+        continuation_token = None
+        while True:
+            parser = JSONArrayParser("orders")
+            response = await self._api_client.call_api(
+                *serialize(serializer, continuation_token=continuation_token, **params)
+            )
+            received = 0
+            try:
+                if not 200 <= response.status <= 299:
+                    await response.read()
+                    self._api_client.response_deserialize(response, response_types_map)
+                async for chunk in response.response.content.iter_chunked(CHUNK_SIZE):
+                    received += len(chunk)
+                    for order in parser.feed(chunk):
+                        yield convert(order)
+                for order in parser.close():
+                    yield convert(order)
+                metrics.response_streamed(received)
+            except GeneratorExit:
+                # The consumer stopped early, discard the rest of the page.
+                response.response.close()
+                metrics.response_streamed(received)
+                raise
+            except BaseException as error:
+                response.response.close()
+                metrics.response_streamed(received, error)
+                raise
+            finally:
+                response.response.release()
+            continuation_token = parser.members.get("continuationToken")
+            if not continuation_token:
+                return
+
+    async def _iter_orders(
+        self,
+        serializer: Callable[..., RequestSerialized],
+        response_types_map: ResponseTypesMap,
+        model: type,
+        start: Optional[datetime],
+        end: Optional[datetime],
+        page_size: int,
+        prefetch: bool,
+        lightweight: bool,
+        incremental: bool,
+    ) -> AsyncIterator[Any]:
+        """Yield the orders of all pages of an operation.
+
+        See ClickAndDrop._iter_orders.
+        """
+        if incremental:
+            async for order in self._stream_orders(
+                serializer,
+                response_types_map,
+                model,
+                lightweight,
+                page_size=page_size,
+                start_date_time=start,
+                end_date_time=end,
+            ):
+                yield order
+            return
+        call = self._api_client.call_view if lightweight else self._api_client.call
+        async for page in iter_pages(
+            lambda continuation_token: call(
+                serialize(
+                    serializer,
+                    page_size=page_size,
+                    start_date_time=start,
+                    end_date_time=end,
+                    continuation_token=continuation_token,
+                ),
+                response_types_map,
+            ),
+            prefetch,
+        ):
+            for order in page.orders or []:
+                yield order
+
+    def iter_orders(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        page_size: int = MAX_PAGE_SIZE,
+        prefetch: bool = False,
+        lightweight: bool = False,
+        incremental: bool = False,
+    ) -> AsyncIterator[Union[click_and_drop_api.GetOrderInfoResource, OrderInfoView]]:
+        """Iterate over all orders, requesting one page at a time.
+
+        See ClickAndDrop.iter_orders.
+        """
+        _check_incremental(prefetch, incremental)
+        return self._iter_orders(
+            self._orders_api._get_orders_async_serialize,
+            GET_ORDERS_RESPONSE_TYPES,
+            click_and_drop_api.GetOrderInfoResource,
+            start,
+            end,
+            page_size,
+            prefetch,
+            lightweight,
+            incremental,
+        )
+
+    def iter_orders_with_details(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        page_size: int = MAX_PAGE_SIZE,
+        prefetch: bool = False,
+        lightweight: bool = False,
+        incremental: bool = False,
+    ) -> AsyncIterator[
+        Union[click_and_drop_api.GetOrderDetailsResource, OrderDetailsView]
+    ]:
+        """Iterate over all orders with their details, requesting one page at a time.
+
+        See ClickAndDrop.iter_orders_with_details.
+        """
+        _check_incremental(prefetch, incremental)
+        return self._iter_orders(
+            self._orders_api._get_orders_with_details_async_serialize,
+            GET_ORDERS_WITH_DETAILS_RESPONSE_TYPES,
+            click_and_drop_api.GetOrderDetailsResource,
+            start,
+            end,
+            page_size,
+            prefetch,
+            lightweight,
+            incremental,
+        )
+
+    async def get_order(
+        self, order_identifier: Union[str, int]
+    ) -> Optional[click_and_drop_api.GetOrderInfoResource]:
+        """Get a specific order or None if not found.
+
+        See ClickAndDrop.get_order.
+        """
+        orders = await self.get_orders(order_identifier)
+        return orders[0] if orders else None
+
+    async def delete_orders(
+        self, order_identifiers: Union[list[Union[str, int]], str, int]
+    ) -> click_and_drop_api.DeleteOrdersResource:
+        """Delete specific orders.
+
+        See ClickAndDrop.delete_orders.
+        """
+        chunks = chunk_order_identifiers(order_identifiers)
+        try:
+            results = await self._map(
+                lambda chunk: self._api_client.call(
+                    serialize(
+                        self._orders_api._delete_orders_async_serialize,
+                        order_identifiers=order_identifiers_to_string(chunk),
+                    ),
+                    DELETE_ORDERS_RESPONSE_TYPES,
+                ),
+                chunks,
+            )
+        finally:
+            await self._invalidate([i for chunk in chunks for i in chunk])
+        if len(results) == 1:
+            return results[0]
+        return merge_delete_orders_resources(results)
+
+    async def _create_orders(
+        self, orders: list[CreateOrder]
+    ) -> click_and_drop_api.CreateOrdersResponse:
+        """Create the orders with one request."""
+        request = click_and_drop_api.CreateOrdersRequest(items=orders)
+        try:
+            return await self._api_client.call(
+                serialize(
+                    self._orders_api._create_orders_async_serialize, request=request
+                ),
+                CREATE_ORDERS_RESPONSE_TYPES,
+            )
+        finally:
+            await self._invalidate([order.order_reference for order in orders])
+
+    async def create_orders(
+        self,
+        orders: Union[list[CreateOrder], CreateOrder],
+        batch_size: int = CREATE_ORDERS_BATCH_SIZE,
+    ) -> click_and_drop_api.CreateOrdersResponse:
+        """Create new orders.
+
+        See ClickAndDrop.create_orders.
+        """
+        if not isinstance(orders, list):
+            orders = [orders]
+        if len(orders) <= batch_size:
+            return await self._create_orders(orders)
+        batches = await self.create_orders_in_batches(orders, batch_size)
+        return merge_create_orders_responses([batch.response for batch in batches])
+
+    async def create_orders_in_batches(
+        self,
+        orders: list[CreateOrder],
+        batch_size: int = CREATE_ORDERS_BATCH_SIZE,
+    ) -> list[CreateOrdersBatch]:
+        """Create many orders in concurrent batches.
+
+        See ClickAndDrop.create_orders_in_batches.
+        """
+
+        async def create_batch(start: int) -> CreateOrdersBatch:
+            batch = orders[start : start + batch_size]
+            try:
+                response = await self._create_orders(batch)
+            except ApiException as error:
+                response = create_orders_error_response(batch, error)
+            return CreateOrdersBatch(start, batch, response)
+
+        return await self._map(create_batch, list(range(0, len(orders), batch_size)))
+
+    async def create_order(
+        self, order: CreateOrder
+    ) -> click_and_drop_api.CreateOrdersResponse:
+        """Create a new order.
+
+        See ClickAndDrop.create_order.
+        """
+        return await self.create_orders(order)
+
+    async def update_orders_status(
+        self, items: Union[list[UpdateOrderStatus], UpdateOrderStatus]
+    ) -> click_and_drop_api.UpdateOrderStatusResponse:
+        """Set the status of orders.
+
+        See ClickAndDrop.update_orders_status.
+        """
+        if not isinstance(items, list):
+            items = [items]
+        request = click_and_drop_api.UpdateOrdersStatusRequest(items=items)
+        try:
+            return await self._api_client.call(
+                serialize(
+                    self._orders_api._update_orders_status_async_serialize,
+                    request=request,
+                ),
+                UPDATE_ORDERS_STATUS_RESPONSE_TYPES,
+            )
+        finally:
+            await self._invalidate(
+                [
+                    item.order_identifier
+                    if item.order_identifier is not None
+                    else item.order_reference
+                    for item in items
+                ]
+            )
+
+    async def _call_cache(self, method: Callable[..., T], *args: Any) -> T:
+        """Call a method of the cache without blocking the event loop.
+
+        Caches other than MemoryOrderCache, e.g. SQLiteOrderCache,
+        may read and write files and are called in a thread.
+        """
+        if isinstance(self.cache, MemoryOrderCache):
+            return method(*args)
+        return await asyncio.to_thread(method, *args)
+
+    async def _invalidate(self, order_identifiers: list[Union[str, int, None]]) -> None:
+        """Remove changed orders from the cache."""
+        if self.cache is not None:
+            await self._call_cache(
+                self.cache.invalidate, [i for i in order_identifiers if i is not None]
+            )
+
+    async def get_label(
+        self,
+        order_identifiers: Union[list[Union[str, int]], str, int],
+        document_type: Literal["postageLabel", "despatchNote", "CN22", "CN23"],
+        include_returns_label: Optional[bool] = None,
+        include_cn: Optional[bool] = None,
+    ) -> bytearray:
+        """Generate a label for an order.
+
+        See ClickAndDrop.get_label.
+        """
+        if len(chunk_order_identifiers(order_identifiers)) > 1:
+            raise ValueError(
+                f"Expected at most {MAX_ORDER_IDENTIFIERS} identifiers, "
+                "use get_labels() to get one PDF per batch."
+            )
+        return await self._api_client.call(
+            serialize(
+                self._labels_api._get_orders_label_async_serialize,
+                order_identifiers=order_identifiers_to_string(order_identifiers),
+                document_type=document_type,
+                include_returns_label=include_returns_label,
+                include_cn=include_cn,
+            ),
+            GET_ORDERS_LABEL_RESPONSE_TYPES,
+        )
+
+    async def get_label_to(
+        self,
+        target: Union[Target, asyncio.StreamWriter],
+        order_identifiers: Union[list[Union[str, int]], str, int],
+        document_type: Literal["postageLabel", "despatchNote", "CN22", "CN23"],
+        include_returns_label: Optional[bool] = None,
+        include_cn: Optional[bool] = None,
+        chunk_size: int = CHUNK_SIZE,
+    ) -> int:
+        """Generate a label for an order and stream the PDF to the target.
+
+        The target can also be an asyncio.StreamWriter which is drained after each chunk.
+        Writes to files and sockets block the event loop.
+
+        See ClickAndDrop.get_label_to.
+        """
+        if len(chunk_order_identifiers(order_identifiers)) > 1:
+            raise ValueError(
+                f"Expected at most {MAX_ORDER_IDENTIFIERS} identifiers, "
+                "use get_label_to() once per batch of identifiers."
+            )
+        response = await self._api_client.call_api(
+            *serialize(
+                self._labels_api._get_orders_label_async_serialize,
+                order_identifiers=order_identifiers_to_string(order_identifiers),
+                document_type=document_type,
+                include_returns_label=include_returns_label,
+                include_cn=include_cn,
+            )
+        )
+        written = 0
+        try:
+            if not 200 <= response.status <= 299:
+                await response.read()
+                self._api_client.response_deserialize(
+                    response, GET_ORDERS_LABEL_RESPONSE_TYPES
+                )
+            chunks = response.response.content.iter_chunked(chunk_size)
+            if isinstance(target, asyncio.StreamWriter):
+                async for chunk in chunks:
+                    target.write(chunk)
+                    await target.drain()
+                    written += len(chunk)
+                metrics.response_streamed(written)
+                return written
+            with open_target(target) as write:
+                async for chunk in chunks:
+                    write(chunk)
+                    written += len(chunk)
+            metrics.response_streamed(written)
+            return written
+        except BaseException as error:
+            # Do not return a connection with unread data to the pool.
+            response.response.close()
+            metrics.response_streamed(written, error)
+            raise
+        finally:
+            response.response.release()
+
+    async def get_labels(
+        self,
+        order_identifiers: Union[list[Union[str, int]], str, int],
+        document_type: Literal["postageLabel", "despatchNote", "CN22", "CN23"],
+        include_returns_label: Optional[bool] = None,
+        include_cn: Optional[bool] = None,
+    ) -> list[bytearray]:
+        """Generate labels for any number of orders, one PDF per batch of 100.
+
+        See ClickAndDrop.get_labels.
+        """
+        return await self._map(
+            lambda chunk: self.get_label(
+                chunk, document_type, include_returns_label, include_cn
+            ),
+            chunk_order_identifiers(order_identifiers),
+        )
+
+
+__all__ = ["AsyncClickAndDrop", "AsyncApiClient", "AsyncRESTClientObject"]
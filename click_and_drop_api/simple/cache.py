@@ -0,0 +1,298 @@
+"""Cache orders to answer repeated lookups without a request.
+
+Orders are cached by their Order Identifier and Order Reference.
+ClickAndDrop invalidates the orders it deletes, creates and updates.
+Changes made by others, e.g. in the web interface, are seen after the ttl.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Iterable, NamedTuple, Optional, Union
+
+import click_and_drop_api
+
+Order = click_and_drop_api.GetOrderInfoResource
+OrderIdentifier = Union[str, int]
+
+
+class CacheStats(NamedTuple):
+    """The number of cache hits and misses."""
+
+    hits: int
+    """The number of identifiers answered from the cache."""
+
+    misses: int
+    """The number of identifiers that had to be requested."""
+
+    @property
+    def hit_ratio(self) -> float:
+        """The share of identifiers answered from the cache, 0 if there were none."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0
+
+
+class OrderCache(ABC):
+    """Base class of the order caches.
+
+    Subclasses store the orders, this class counts hits and misses.
+    All methods are safe to use from several threads.
+    """
+
+    def __init__(self, ttl: float):
+        """Create a new cache.
+
+        Parameters:
+            ttl: The number of seconds an order is cached.
+        """
+        if ttl <= 0:
+            raise ValueError(f"Expected a positive ttl, got {ttl}.")
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._stats_lock = threading.Lock()
+
+    @property
+    def stats(self) -> CacheStats:
+        """The hits and misses so far."""
+        return CacheStats(self.hits, self.misses)
+
+    def lookup(
+        self, order_identifiers: list[OrderIdentifier]
+    ) -> tuple[dict[OrderIdentifier, Order], list[OrderIdentifier]]:
+        """Look up orders.
+
+        Returns:
+            The cached orders by identifier and the identifiers that were not cached.
+        """
+        found = {}
+        missing = []
+        for order_identifier in order_identifiers:
+            order = self.get(order_identifier)
+            if order is None:
+                missing.append(order_identifier)
+            else:
+                found[order_identifier] = order
+        with self._stats_lock:
+            self.hits += len(found)
+            self.misses += len(missing)
+        return found, missing
+
+    @abstractmethod
+    def get(self, order_identifier: OrderIdentifier) -> Optional[Order]:
+        """Return a copy of the cached order or None if it is not cached or expired."""
+
+    @abstractmethod
+    def update(self, orders: Iterable[Order]) -> None:
+        """Cache the orders for ttl seconds."""
+
+    @abstractmethod
+    def invalidate(self, order_identifiers: Iterable[OrderIdentifier]) -> None:
+        """Remove the orders with these identifiers or references."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove all orders."""
+
+
+class MemoryOrderCache(OrderCache):
+    """Keep the least recently used orders in memory."""
+
+    def __init__(self, maxsize: int = 1000, ttl: float = 60):
+        """Create a new cache.
+
+        Parameters:
+            maxsize: The maximum number of orders to cache.
+            ttl: The number of seconds an order is cached.
+        """
+        super().__init__(ttl)
+        self.maxsize = maxsize
+        # identifier -> (expiry time, order), least recently used first
+        self._orders: OrderedDict[int, tuple[float, Order]] = OrderedDict()
+        self._references: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._orders)
+
+    def _identifier(self, order_identifier: OrderIdentifier) -> Optional[int]:
+        if isinstance(order_identifier, int):
+            return order_identifier
+        return self._references.get(order_identifier)
+
+    def get(self, order_identifier: OrderIdentifier) -> Optional[Order]:
+        with self._lock:
+            identifier = self._identifier(order_identifier)
+            entry = self._orders.get(identifier) if identifier is not None else None
+            if entry is None:
+                return None
+            expires, order = entry
+            if expires < time.monotonic():
+                self._remove(identifier)
+                return None
+            self._orders.move_to_end(identifier)
+            return order.model_copy(deep=True)
+
+    def update(self, orders: Iterable[Order]) -> None:
+        expires = time.monotonic() + self.ttl
+        with self._lock:
+            for order in orders:
+                self._remove(order.order_identifier)
+                if order.order_reference in self._references:
+                    # the reference was used by a deleted order
+                    self._remove(self._references[order.order_reference])
+                self._orders[order.order_identifier] = (
+                    expires,
+                    order.model_copy(deep=True),
+                )
+                if order.order_reference is not None:
+                    self._references[order.order_reference] = order.order_identifier
+            while len(self._orders) > self.maxsize:
+                self._remove(next(iter(self._orders)))
+
+    def invalidate(self, order_identifiers: Iterable[OrderIdentifier]) -> None:
+        with self._lock:
+            for order_identifier in order_identifiers:
+                identifier = self._identifier(order_identifier)
+                if identifier is not None:
+                    self._remove(identifier)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._orders.clear()
+            self._references.clear()
+
+    def _remove(self, identifier: int) -> None:
+        entry = self._orders.pop(identifier, None)
+        if (
+            entry is not None
+            and self._references.get(entry[1].order_reference) == identifier
+        ):
+            del self._references[entry[1].order_reference]
+
+
+class SQLiteOrderCache(OrderCache):
+    """Keep the orders in a SQLite database.
+
+    A database file is shared by processes and survives restarts.
+    """
+
+    def __init__(self, path: str = ":memory:", ttl: float = 60):
+        """Create a new cache.
+
+        Parameters:
+            path: The path of the database file.
+            ttl: The number of seconds an order is cached.
+        """
+        super().__init__(ttl)
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS orders (
+                identifier INTEGER PRIMARY KEY,
+                reference TEXT,
+                expires REAL NOT NULL,
+                data TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS orders_reference ON orders (reference);
+            """
+        )
+
+    def close(self) -> None:
+        """Close the database."""
+        self._connection.close()
+
+    def get(self, order_identifier: OrderIdentifier) -> Optional[Order]:
+        column = "identifier" if isinstance(order_identifier, int) else "reference"
+        with self._lock:
+            row = self._connection.execute(
+                f"SELECT data FROM orders WHERE {column} = ? AND expires >= ?",
+                (order_identifier, time.time()),
+            ).fetchone()
+        return None if row is None else Order.from_json(row[0])
+
+    def update(self, orders: Iterable[Order]) -> None:
+        expires = time.time() + self.ttl
+        rows = [
+            (
+                order.order_identifier,
+                order.order_reference,
+                expires,
+                order.model_dump_json(by_alias=True, exclude_none=True),
+            )
+            for order in orders
+        ]
+        with self._lock:
+            with self._connection:
+                self._connection.execute(
+                    "DELETE FROM orders WHERE expires < ?", (time.time(),)
+                )
+                # the references may have been used by deleted orders
+                self._connection.executemany(
+                    "DELETE FROM orders WHERE reference = ?",
+                    [(row[1],) for row in rows if row[1] is not None],
+                )
+                self._connection.executemany(
+                    "INSERT OR REPLACE INTO orders VALUES (?, ?, ?, ?)", rows
+                )
+
+    def invalidate(self, order_identifiers: Iterable[OrderIdentifier]) -> None:
+        order_identifiers = list(order_identifiers)
+        identifiers = [(i,) for i in order_identifiers if isinstance(i, int)]
+        references = [(i,) for i in order_identifiers if isinstance(i, str)]
+        with self._lock:
+            with self._connection:
+                self._connection.executemany(
+                    "DELETE FROM orders WHERE identifier = ?", identifiers
+                )
+                self._connection.executemany(
+                    "DELETE FROM orders WHERE reference = ?", references
+                )
+
+    def clear(self) -> None:
+        with self._lock:
+            with self._connection:
+                self._connection.execute("DELETE FROM orders")
+
+
+def merge_cached_orders(
+    order_identifiers: list[OrderIdentifier],
+    cached: dict[OrderIdentifier, Order],
+    requested: list[Order],
+) -> list[Order]:
+    """Return the orders in the order of the identifiers, each order once.
+
+    Parameters:
+        order_identifiers: The identifiers and references that were looked up.
+        cached: The orders found in the cache by identifier.
+        requested: The orders that were requested from the API.
+    """
+    by_identifier: dict[OrderIdentifier, Order] = {}
+    for order in requested:
+        by_identifier[order.order_identifier] = order
+        if order.order_reference is not None:
+            by_identifier[order.order_reference] = order
+    by_identifier.update(cached)
+    result = []
+    seen = set()
+    for order_identifier in order_identifiers:
+        order = by_identifier.get(order_identifier)
+        if order is not None and order.order_identifier not in seen:
+            seen.add(order.order_identifier)
+            result.append(order)
+    return result
+
+
+__all__ = [
+    "OrderCache",
+    "MemoryOrderCache",
+    "SQLiteOrderCache",
+    "CacheStats",
+    "merge_cached_orders",
+]
@@ -0,0 +1,192 @@
+"""Merge concurrent lookups of orders into one request.
+
+When several threads or tasks look up orders at the same time,
+the first one waits a moment for the others to join.
+Then it requests all their identifiers at once and hands each caller its orders.
+Identifiers that are already requested are not requested again.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from concurrent.futures import Future
+from typing import Awaitable, Callable, Iterable, Optional, Union
+
+import click_and_drop_api
+
+from .cache import merge_cached_orders
+
+Order = click_and_drop_api.GetOrderInfoResource
+OrderIdentifier = Union[str, int]
+Batch = dict[OrderIdentifier, "Future[Optional[Order]]"]
+
+
+class CoalescerBase:
+    """Collect the identifiers that are looked up at the same time.
+
+    The first caller of a batch is its leader.
+    It waits delay seconds, takes the batch and requests it.
+    """
+
+    def __init__(self, delay: float):
+        self.delay = delay
+        self.lookups = 0
+        """The number of identifiers looked up."""
+        self.batches = 0
+        """The number of batches requested."""
+        self._lock = threading.Lock()
+        self._pending: Batch = {}
+        self._in_flight: Batch = {}
+
+    def _join(
+        self, order_identifiers: list[OrderIdentifier]
+    ) -> tuple[list[Future[Optional[Order]]], bool]:
+        """Add the identifiers to the next batch.
+
+        Returns:
+            The futures of the orders and whether the caller leads the batch.
+        """
+        with self._lock:
+            lead = not self._pending
+            futures = []
+            for order_identifier in order_identifiers:
+                future = self._pending.get(order_identifier) or self._in_flight.get(
+                    order_identifier
+                )
+                if future is None:
+                    future = self._pending[order_identifier] = Future()
+                futures.append(future)
+            self.lookups += len(order_identifiers)
+            return futures, lead and bool(self._pending)
+
+    def _take(self) -> Batch:
+        """Take the batch to request, later callers start a new one."""
+        with self._lock:
+            batch, self._pending = self._pending, {}
+            self._in_flight.update(batch)
+            self.batches += 1
+            return batch
+
+    def _resolve(
+        self,
+        batch: Batch,
+        orders: Iterable[Order] = (),
+        error: Optional[BaseException] = None,
+    ) -> None:
+        """Hand the orders or the error to the callers waiting for the batch."""
+        found: dict[OrderIdentifier, Order] = {}
+        for order in orders:
+            found[order.order_identifier] = order
+            if order.order_reference is not None:
+                found[order.order_reference] = order
+        with self._lock:
+            for order_identifier, future in batch.items():
+                if self._in_flight.get(order_identifier) is future:
+                    del self._in_flight[order_identifier]
+        for order_identifier, future in batch.items():
+            if error is None:
+                future.set_result(found.get(order_identifier))
+            else:
+                future.set_exception(error)
+
+
+def merge_results(
+    order_identifiers: list[OrderIdentifier], results: list[Optional[Order]]
+) -> list[Order]:
+    """Return the orders found for the identifiers, each order once."""
+    found = {
+        order_identifier: order
+        for order_identifier, order in zip(order_identifiers, results)
+        if order is not None
+    }
+    return merge_cached_orders(order_identifiers, found, [])
+
+
+class OrderLookupCoalescer(CoalescerBase):
+    """Merge the order lookups of several threads."""
+
+    def __init__(
+        self,
+        request_orders: Callable[[list[OrderIdentifier]], list[Order]],
+        delay: float = 0.01,
+    ):
+        """Create a new coalescer.
+
+        Parameters:
+            request_orders:
+                Request the orders of any number of identifiers,
+                e.g. in batches of 100.
+            delay: The seconds to wait for other lookups to join.
+        """
+        super().__init__(delay)
+        self._request_orders = request_orders
+
+    def get_orders(self, order_identifiers: list[OrderIdentifier]) -> list[Order]:
+        """Look up the orders together with the other threads."""
+        futures, lead = self._join(order_identifiers)
+        if lead:
+            batch: Optional[Batch] = None
+            try:
+                time.sleep(self.delay)
+                batch = self._take()
+                orders = self._request_orders(list(batch))
+            except BaseException as error:
+                self._resolve(self._take() if batch is None else batch, error=error)
+                raise
+            self._resolve(batch, orders)
+        return merge_results(order_identifiers, [future.result() for future in futures])
+
+
+class AsyncOrderLookupCoalescer(CoalescerBase):
+    """Merge the order lookups of several tasks."""
+
+    def __init__(
+        self,
+        request_orders: Callable[[list[OrderIdentifier]], Awaitable[list[Order]]],
+        delay: float = 0.01,
+    ):
+        """Create a new coalescer.
+
+        See OrderLookupCoalescer.
+        """
+        super().__init__(delay)
+        self._request_orders = request_orders
+        # keep the tasks of the batches until they are done
+        self._tasks: set[asyncio.Future[None]] = set()
+
+    async def get_orders(self, order_identifiers: list[OrderIdentifier]) -> list[Order]:
+        """Look up the orders together with the other tasks.
+
+        The batch is requested in a task of its own,
+        so cancelling one caller does not cancel the lookups of the others.
+        """
+        futures, lead = self._join(order_identifiers)
+        if lead:
+            task = asyncio.ensure_future(self._request_batch())
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+        return merge_results(
+            order_identifiers,
+            [await asyncio.shield(asyncio.wrap_future(future)) for future in futures],
+        )
+
+    async def _request_batch(self) -> None:
+        """Wait for the others to join, then request the batch and resolve it."""
+        batch: Optional[Batch] = None
+        try:
+            await asyncio.sleep(self.delay)
+            batch = self._take()
+            orders = await self._request_orders(list(batch))
+        except Exception as error:
+            # the callers receive the error
+            self._resolve(self._take() if batch is None else batch, error=error)
+            return
+        except BaseException as error:
+            self._resolve(self._take() if batch is None else batch, error=error)
+            raise
+        self._resolve(batch, orders)
+
+
+__all__ = ["OrderLookupCoalescer", "AsyncOrderLookupCoalescer"]
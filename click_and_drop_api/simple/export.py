@@ -0,0 +1,104 @@
+"""Export many orders by requesting time windows in parallel."""
+
+from __future__ import annotations
+
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from datetime import datetime, timedelta
+from typing import Callable, Iterator, NamedTuple, Optional
+
+import click_and_drop_api
+
+
+class TimeWindow(NamedTuple):
+    """A range of time to request orders for."""
+
+    start: datetime
+    end: datetime
+
+    @property
+    def duration(self) -> timedelta:
+        """The length of the window."""
+        return self.end - self.start
+
+    def split(self, parts: int = 2) -> list[TimeWindow]:
+        """Split the window into parts of equal length."""
+        return split_time_range(self.start, self.end, parts)
+
+
+def split_time_range(start: datetime, end: datetime, parts: int) -> list[TimeWindow]:
+    """Split the time from start to end into parts of equal length.
+
+    Raises:
+        ValueError: If end is before start or parts is less than 1.
+    """
+    if end < start:
+        raise ValueError(f"Expected start {start} before end {end}.")
+    if parts < 1:
+        raise ValueError(f"Expected at least one part, got {parts}.")
+    step = (end - start) / parts
+    bounds = [start + step * i for i in range(parts)] + [end]
+    return [TimeWindow(bounds[i], bounds[i + 1]) for i in range(parts)]
+
+
+GetPage = Callable[
+    [TimeWindow, Optional[str]], click_and_drop_api.GetOrdersDetailsResponse
+]
+
+
+def export_orders(
+    get_page: GetPage,
+    start: datetime,
+    end: datetime,
+    windows: int,
+    max_workers: int,
+    min_window: timedelta,
+) -> Iterator[click_and_drop_api.GetOrderDetailsResource]:
+    """Yield the orders from start to end, requesting time windows in parallel.
+
+    The time range is split into windows which are paginated concurrently.
+    If the first page of a window has a continuation token, the window is dense
+    and it is split in halves instead, as long as it is longer than min_window.
+    The orders of that page are dropped, the halves request them again.
+    Orders are yielded once, in the order in which their pages arrive.
+
+    Parameters:
+        get_page: Return the page of a window for a continuation token.
+        start: Date and time lower bound for the orders.
+        end: Date and time upper bound for the orders.
+        windows: The number of windows to start with.
+        max_workers: The maximum number of requests sent in parallel.
+        min_window: Windows of this length are not split any more.
+    """
+    seen: set[int] = set()
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    pending: dict[Future, tuple[TimeWindow, Optional[str]]] = {}
+
+    def request(window: TimeWindow, continuation_token: Optional[str] = None):
+        future = executor.submit(get_page, window, continuation_token)
+        pending[future] = (window, continuation_token)
+
+    try:
+        for window in split_time_range(start, end, windows):
+            request(window)
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                window, continuation_token = pending.pop(future)
+                page = future.result()
+                if page.continuation_token:
+                    if continuation_token is None and window.duration > min_window:
+                        for part in window.split():
+                            request(part)
+                        continue
+                    request(window, page.continuation_token)
+                for order in page.orders or []:
+                    if order.order_identifier is None:
+                        yield order
+                    elif order.order_identifier not in seen:
+                        seen.add(order.order_identifier)
+                        yield order
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+__all__ = ["TimeWindow", "split_time_range", "export_orders"]
@@ -0,0 +1,196 @@
+"""Parse the orders of a page while the page is received.
+
+A page of /orders/full with 100 orders is hundreds of kilobytes.
+Deserializing it needs the whole body, its text and all models at once.
+JSONArrayParser is fed the body chunk by chunk as it arrives
+and returns each element of the orders array as soon as it is complete,
+so only the unparsed rest of the body and the current order are kept.
+
+    parser = JSONArrayParser("orders")
+    for chunk in response.stream(CHUNK_SIZE):
+        for order in parser.feed(chunk):
+            ...
+    for order in parser.close():
+        ...
+    continuation_token = parser.members.get("continuationToken")
+"""
+
+from __future__ import annotations
+
+import codecs
+import json
+import re
+from typing import Any, Iterator, Optional
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_DELIMITERS = frozenset(" \t\n\r,:]}")
+
+# What the parser expects next.
+_OBJECT = 0  # the { of the top-level object
+_FIRST_KEY = 1  # a key or the } of an empty object
+_KEY = 2
+_COLON = 3
+_VALUE = 4  # the value of a member that is not the array
+_ARRAY = 5  # the [ of the array or null
+_FIRST_ITEM = 6  # an element or the ] of an empty array
+_ITEM = 7
+_ITEM_END = 8  # , or ]
+_MEMBER_END = 9  # , or }
+_END = 10
+
+
+class JSONArrayParser:
+    """Parse a JSON object incrementally and return the elements of one array member.
+
+    The other members of the object are collected in members.
+    The elements are decoded with json, the same as json.loads would.
+    """
+
+    def __init__(self, key: str, encoding: str = "utf-8"):
+        """Create a new parser.
+
+        Parameters:
+            key: The name of the member whose elements are returned by feed().
+            encoding: The encoding of the body.
+        """
+        self.key = key
+        self.members: dict[str, Any] = {}
+        """The members of the object other than the array, known after close()."""
+        self._decoder = codecs.getincrementaldecoder(encoding)()
+        self._json = json.JSONDecoder()
+        self._buffer = ""
+        self._position = 0
+        self._state = _OBJECT
+        self._member: Optional[str] = None
+
+    def feed(self, data: bytes) -> Iterator[Any]:
+        """Parse the next chunk of the body.
+
+        Consume the returned iterator before feeding the next chunk.
+
+        Returns:
+            An iterator over the elements of the array that the chunk completes.
+            Each element is decoded when the iterator reaches it.
+
+        Raises:
+            ValueError: If the body is not a JSON object or the member not an array.
+        """
+        self._buffer = self._buffer[self._position :] + self._decoder.decode(data)
+        self._position = 0
+        return self._parse(final=False)
+
+    def close(self) -> list[Any]:
+        """Parse the rest of the body after the last chunk.
+
+        Returns:
+            The elements of the array that were completed at the end of the body.
+
+        Raises:
+            ValueError: If the body is incomplete or not valid JSON.
+        """
+        self._buffer = self._buffer[self._position :] + self._decoder.decode(
+            b"", final=True
+        )
+        self._position = 0
+        items = list(self._parse(final=True))
+        rest = self._buffer[self._position :].strip()
+        if self._state != _END:
+            raise ValueError("Expected the rest of the JSON object, got the end.")
+        if rest:
+            raise ValueError(f"Expected the end of the JSON, got {rest[:20]!r}.")
+        return items
+
+    def _decode(self, position: int, final: bool) -> Optional[tuple[Any, int]]:
+        """Decode the value at the position or return None if it is incomplete.
+
+        A value is only complete if whitespace or a delimiter follows it,
+        e.g. 12 might be the start of 123 or 12.5.
+        """
+        try:
+            value, end = self._json.raw_decode(self._buffer, position)
+        except json.JSONDecodeError:
+            if final:
+                raise
+            return None
+        if not final and self._buffer[end : end + 1] not in _DELIMITERS:
+            return None
+        return value, end
+
+    def _expect(self, position: int, expected: str) -> str:
+        """Return the character at the position if it is one of the expected ones."""
+        character = self._buffer[position]
+        if character not in expected:
+            raise ValueError(f"Expected one of {expected!r}, got {character!r}.")
+        return character
+
+    def _parse(self, final: bool) -> Iterator[Any]:
+        """Yield the elements of the array in the buffer and advance the state."""
+        buffer = self._buffer
+        position = self._position
+        state = self._state
+        while True:
+            position = _WHITESPACE.match(buffer, position).end()  # type: ignore[union-attr]
+            if position == len(buffer) or state == _END:
+                break
+            if state == _OBJECT:
+                self._expect(position, "{")
+                position += 1
+                state = _FIRST_KEY
+            elif state == _FIRST_KEY and buffer[position] == "}":
+                position += 1
+                state = _END
+            elif state in (_FIRST_KEY, _KEY):
+                self._expect(position, '"')
+                decoded = self._decode(position, final)
+                if decoded is None:
+                    break
+                self._member, position = decoded
+                state = _COLON
+            elif state == _COLON:
+                self._expect(position, ":")
+                position += 1
+                state = _ARRAY if self._member == self.key else _VALUE
+            elif state == _VALUE:
+                decoded = self._decode(position, final)
+                if decoded is None:
+                    break
+                self.members[self._member], position = decoded  # type: ignore[index]
+                state = _MEMBER_END
+            elif state == _ARRAY and buffer[position] == "[":
+                position += 1
+                state = _FIRST_ITEM
+            elif state == _ARRAY:
+                decoded = self._decode(position, final)
+                if decoded is None:
+                    break
+                if decoded[0] is not None:
+                    raise ValueError(
+                        f"Expected an array or null as {self.key!r}, got {decoded[0]!r}."
+                    )
+                position = decoded[1]
+                state = _MEMBER_END
+            elif state == _FIRST_ITEM and buffer[position] == "]":
+                position += 1
+                state = _MEMBER_END
+            elif state in (_FIRST_ITEM, _ITEM):
+                decoded = self._decode(position, final)
+                if decoded is None:
+                    break
+                item, position = decoded
+                state = _ITEM_END
+                self._position = position
+                self._state = state
+                yield item
+            elif state == _ITEM_END:
+                character = self._expect(position, ",]")
+                position += 1
+                state = _ITEM if character == "," else _MEMBER_END
+            elif state == _MEMBER_END:
+                character = self._expect(position, ",}")
+                position += 1
+                state = _KEY if character == "," else _END
+        self._position = position
+        self._state = state
+
+
+__all__ = ["JSONArrayParser"]
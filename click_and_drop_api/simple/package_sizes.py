@@ -1,19 +1,30 @@
 """Packages sizes for Click and Drop API."""
 
 from __future__ import annotations
-from typing import Literal, NamedTuple, Optional
+import threading
+from itertools import repeat
+from typing import TYPE_CHECKING, Literal, NamedTuple, Optional, Sequence
 
-from click_and_drop_api.models.dimensions_request import DimensionsRequest
-from click_and_drop_api.models.shipment_package_request import ShipmentPackageRequest
 from .shipping_options import (
     get_shipping_options,
     ShippingOption,
-    medium_parcel_force_codes,
+    _medium_parcel_force_codes,
+    _listeners,
 )
 from .errors import InvalidWeight, InvalidDimensions
 
+if TYPE_CHECKING:
+    from click_and_drop_api.models.shipment_package_request import (
+        ShipmentPackageRequest,
+    )
+
 MAX_WEIGHT_IN_GRAMS = 30000
 MIN_WEIGHT_IN_GRAMS = 1
+NUMPY_MIN_PARCELS = 200
+"""classify_package_sizes() uses NumPy, if installed, for this many parcels or more."""
+
+ParcelDimensions = tuple[int, int, int]
+"""The height, width and depth of a parcel in mm, in any order."""
 
 
 class PackageSize(NamedTuple):
@@ -66,6 +77,8 @@ class PackageSize(NamedTuple):
     width_mm: int
     height_mm: int
     shipping_options: list[ShippingOption]
+    length_plus_girth_mm: Optional[int] = None
+    """The maximum of the longest side plus twice the sum of the other sides."""
 
     @property
     def length_mm(self) -> int:
@@ -85,6 +98,9 @@ class PackageSize(NamedTuple):
 
     def get_shipping_option(self, code: str) -> Optional[ShippingOption]:
         """Return a shipping option with the code if it is available for this package size."""
+        index = _index
+        if index.package_sizes_by_code.get(self.code) is self:
+            return index.shipping_options_by_package.get((self.code, code))
         for shipping_option in self.shipping_options:
             if shipping_option.service_code == code:
                 return shipping_option
@@ -102,24 +118,19 @@ class PackageSize(NamedTuple):
         Returns:
             The shipping options that can be used for this package and are also in selected_shipping_options
         """
+        selected = set(selected_shipping_options)
         return [
             shipping_option
             for shipping_option in self.shipping_options
-            if shipping_option.service_code in selected_shipping_options
+            if shipping_option.service_code in selected
         ]
 
     def with_shipping_limited_to(
         self, selected_shipping_options: list[str]
     ) -> PackageSize:
         """Return a copy with limited options for shipping."""
-        return PackageSize(
-            code=self.code,
-            name=self.name,
-            weight_grams=self.weight_grams,
-            depth_mm=self.depth_mm,
-            width_mm=self.width_mm,
-            height_mm=self.height_mm,
-            shipping_options=self.get_shipping_options_in(selected_shipping_options),
+        return self._replace(
+            shipping_options=self.get_shipping_options_in(selected_shipping_options)
         )
 
     @classmethod
@@ -138,16 +149,11 @@ class PackageSize(NamedTuple):
         self, height_in_mms: int, width_in_mms: int, depth_in_mms: int
     ):
         """Can the dimensions be shipped."""
-        # TODO: This needs to be changed for largeParcel
-        dim = self.dimensions_mm
-        asked = tuple(sorted((height_in_mms, width_in_mms, depth_in_mms), reverse=True))
-        return (
-            dim[0] >= asked[0]
-            and dim[1] >= asked[1]
-            and dim[2] >= asked[2]
-            and height_in_mms >= 0
-            and width_in_mms >= 0
-            and depth_in_mms >= 0
+        length, width, height = sorted(
+            (height_in_mms, width_in_mms, depth_in_mms), reverse=True
+        )
+        return height >= 0 and _fits(
+            self.dimensions_mm, self.length_plus_girth_mm, length, width, height
         )
 
     def weight_can_be_shipped(self, weight_in_grams: int):
@@ -184,6 +190,11 @@ class PackageSize(NamedTuple):
         Raises:
             ValueError: If the weight is too heavy or the dimensions are too big.
         """
+        from click_and_drop_api.models.dimensions_request import DimensionsRequest
+        from click_and_drop_api.models.shipment_package_request import (
+            ShipmentPackageRequest,
+        )
+
         if not self.weight_can_be_shipped(weight_in_grams):
             raise InvalidWeight(
                 f"{MIN_WEIGHT_IN_GRAMS}g to {self.weight_grams}g allowed, got {weight_in_grams}g."
@@ -215,92 +226,215 @@ class PackageSize(NamedTuple):
         )
 
 
-packages_sizes = [
-    PackageSize(
-        "letter",
-        "Letter",
-        100,
-        240,
-        165,
-        5,
-        get_shipping_options(
-            "OLP1", "OLP1SF", "OLP2", "OLP2SF", "SD1OLP", "SD2OLP", "SD3OLP"
+def _create_package_sizes() -> list[PackageSize]:
+    """Create the package sizes with the shipping options of the tariff."""
+    return [
+        PackageSize(
+            "letter",
+            "Letter",
+            100,
+            240,
+            165,
+            5,
+            get_shipping_options(
+                "OLP1", "OLP1SF", "OLP2", "OLP2SF", "SD1OLP", "SD2OLP", "SD3OLP"
+            ),
         ),
-    ),
-    PackageSize(
-        "largeLetter",
-        "Large letter",
-        1000,
-        353,
-        250,
-        25,
-        get_shipping_options(
-            "OLP1",
-            "OLP1SF",
-            "OLP2",
-            "OLP2SF",
-            "SD1OLP",
-            "SD2OLP",
-            "SD3OLP",
-            "TOLP24",
-            "TOLP24SF",
-            "TOLP48",
-            "TOLP48SF",
+        PackageSize(
+            "largeLetter",
+            "Large letter",
+            1000,
+            353,
+            250,
+            25,
+            get_shipping_options(
+                "OLP1",
+                "OLP1SF",
+                "OLP2",
+                "OLP2SF",
+                "SD1OLP",
+                "SD2OLP",
+                "SD3OLP",
+                "TOLP24",
+                "TOLP24SF",
+                "TOLP48",
+                "TOLP48SF",
+            ),
         ),
-    ),
-    PackageSize(
-        "smallParcel",
-        "Small parcel",
-        2000,
-        450,
-        350,
-        160,
-        get_shipping_options(
-            "OLP1",
-            "OLP1SF",
-            "OLP2",
-            "OLP2SF",
-            "SD1OLP",
-            "SD2OLP",
-            "SD3OLP",
-            "TOLP24",
-            "TOLP24SF",
-            "TOLP24SFA",
-            "TOLP48",
-            "TOLP48SF",
-            "TOLP48SFA",
+        PackageSize(
+            "smallParcel",
+            "Small parcel",
+            2000,
+            450,
+            350,
+            160,
+            get_shipping_options(
+                "OLP1",
+                "OLP1SF",
+                "OLP2",
+                "OLP2SF",
+                "SD1OLP",
+                "SD2OLP",
+                "SD3OLP",
+                "TOLP24",
+                "TOLP24SF",
+                "TOLP24SFA",
+                "TOLP48",
+                "TOLP48SF",
+                "TOLP48SFA",
+            ),
         ),
-    ),
-    PackageSize(
-        "mediumParcel",
-        "Medium parcel",
-        20000,
-        610,
-        460,
-        460,
-        get_shipping_options(
-            "OLP1",
-            "OLP1SF",
-            "OLP2",
-            "OLP2SF",
-            "SD1OLP",
-            "SD2OLP",
-            "SD3OLP",
-            "TOLP24",
-            "TOLP24SF",
-            "TOLP24SFA",
-            "TOLP48",
-            "TOLP48SF",
-            "TOLP48SFA",
-            *medium_parcel_force_codes,
+        PackageSize(
+            "mediumParcel",
+            "Medium parcel",
+            20000,
+            610,
+            460,
+            460,
+            get_shipping_options(
+                "OLP1",
+                "OLP1SF",
+                "OLP2",
+                "OLP2SF",
+                "SD1OLP",
+                "SD2OLP",
+                "SD3OLP",
+                "TOLP24",
+                "TOLP24SF",
+                "TOLP24SFA",
+                "TOLP48",
+                "TOLP48SF",
+                "TOLP48SFA",
+                *_medium_parcel_force_codes(),
+            ),
         ),
-    ),
-    PackageSize(
-        "largeParcel", "Large parcel", 30000, 1500, 3000, 3000, []
-    ),  # TODO: options
-]
+        PackageSize(
+            "largeParcel",
+            "Large parcel",
+            30000,
+            1500,
+            1500,
+            1500,
+            [],  # TODO: options
+            length_plus_girth_mm=3000,
+        ),
+        # TODO: Missing "parcel" and "documents"
+    ]
+
+
+class _Index(NamedTuple):
+    """The indexes of packages_sizes.
+
+    Use add_shipping_option() to change the shipping options
+    so that the indexes stay up to date.
+    They are rebuilt as a whole and replaced at once
+    when package sizes are added to or removed from packages_sizes.
+    """
 
-# TODO: Missing "parcel" and "documents"
+    length: int
+    """The number of package sizes that were indexed."""
+
+    package_sizes_by_code: dict[str, PackageSize]
+    shipping_options_by_package: dict[tuple[str, str], ShippingOption]
+    package_sizes_by_service_code: dict[str, list[PackageSize]]
+
+
+_index = _Index(0, {}, {}, {})
+_package_sizes_lock = threading.RLock()
+
+
+def _packages_sizes() -> list[PackageSize]:
+    """Return packages_sizes, created with the shipping options on first access."""
+    package_sizes = globals().get("packages_sizes")
+    if package_sizes is None:
+        with _package_sizes_lock:
+            package_sizes = globals().get("packages_sizes")
+            if package_sizes is None:
+                package_sizes = _create_package_sizes()
+                _index_package_sizes(package_sizes)
+                globals()["packages_sizes"] = package_sizes
+    return package_sizes
+
+
+packages_sizes: list[PackageSize]
+"""All package sizes, from the smallest to the largest, created on first access."""
+
+
+def __getattr__(name: str):
+    if name == "packages_sizes":
+        return _packages_sizes()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _index_package_sizes(package_sizes: Optional[list[PackageSize]] = None) -> _Index:
+    """Rebuild the indexes of packages_sizes and return them."""
+    global _index
+    with _package_sizes_lock:
+        if package_sizes is None:
+            package_sizes = _packages_sizes()
+        by_code: dict[str, PackageSize] = {}
+        options: dict[tuple[str, str], ShippingOption] = {}
+        by_service_code: dict[str, list[PackageSize]] = {}
+        for package_size in package_sizes:
+            by_code[package_size.code] = package_size
+            for option in package_size.shipping_options:
+                options[package_size.code, option.service_code] = option
+                sizes = by_service_code.setdefault(option.service_code, [])
+                if not sizes or sizes[-1] is not package_size:
+                    sizes.append(package_size)
+        _index = _Index(len(package_sizes), by_code, options, by_service_code)
+        return _index
+
+
+def _current_index() -> _Index:
+    """Return the indexes, rebuilt if package sizes were added or removed."""
+    index = _index
+    if index.length != len(_packages_sizes()):
+        index = _index_package_sizes()
+    return index
+
+
+def _add_shipping_option(option: ShippingOption, package_codes: Sequence[str]) -> None:
+    """Replace the option in the package sizes and add it to package_codes.
+
+    Only the index entries of the service code are updated.
+    """
+    package_sizes = globals().get("packages_sizes")
+    if package_sizes is None:
+        if not package_codes:
+            # the package sizes are created with the current options
+            return
+        package_sizes = _packages_sizes()
+    code = option.service_code
+    with _package_sizes_lock:
+        index = _index
+        indexed = index.length == len(package_sizes)
+        for package_size in package_sizes:
+            options = package_size.shipping_options
+            offered = False
+            for position, old in enumerate(options):
+                if old.service_code == code:
+                    options[position] = option
+                    offered = True
+            if not offered and package_size.code in package_codes:
+                options.append(option)
+                offered = True
+            if index.package_sizes_by_code.get(package_size.code) is not package_size:
+                indexed = False
+            elif offered:
+                index.shipping_options_by_package[package_size.code, code] = option
+        if not indexed:
+            # packages_sizes was changed
+            _index_package_sizes(package_sizes)
+            return
+        index.package_sizes_by_service_code[code] = [
+            package_size
+            for package_size in package_sizes
+            if (package_size.code, code) in index.shipping_options_by_package
+        ]
+
+
+_listeners.append(_add_shipping_option)
 
 
 def choose_package_size_by_weight(
@@ -317,7 +451,7 @@ def choose_package_size_by_weight(
         If the weight is too heavy, return None.
     """
     if possible_packages_codes is None:
-        possible_packages_sizes = packages_sizes
+        possible_packages_sizes = _packages_sizes()
     else:
         possible_packages_sizes = get_package_sizes(possible_packages_codes)
     for package_size in possible_packages_sizes:
@@ -325,9 +459,144 @@ def choose_package_size_by_weight(
             return package_size
 
 
+def _fits(
+    limit: ParcelDimensions,
+    length_plus_girth: Optional[int],
+    length: int,
+    width: int,
+    height: int,
+) -> bool:
+    """Whether the sorted dimensions fit into the sorted limit."""
+    return (
+        length <= limit[0]
+        and width <= limit[1]
+        and height <= limit[2]
+        and (
+            length_plus_girth is None
+            or length + 2 * (width + height) <= length_plus_girth
+        )
+    )
+
+
+def _classify(
+    package_sizes: Sequence[PackageSize],
+    weights_grams: Sequence[int],
+    dimensions_mm: Optional[Sequence[Optional[ParcelDimensions]]] = None,
+) -> list[Optional[int]]:
+    """Return the index of the first package size that fits each parcel or None."""
+    if dimensions_mm is not None and len(dimensions_mm) != len(weights_grams):
+        raise ValueError(
+            f"Expected {len(weights_grams)} dimensions, got {len(dimensions_mm)}."
+        )
+    if len(weights_grams) >= NUMPY_MIN_PARCELS:
+        try:
+            import numpy
+        except ImportError:
+            pass
+        else:
+            return _classify_with_numpy(
+                numpy, package_sizes, weights_grams, dimensions_mm
+            )
+    limits = [
+        (size.weight_grams, size.dimensions_mm, size.length_plus_girth_mm)
+        for size in package_sizes
+    ]
+    result: list[Optional[int]] = []
+    for weight, dimensions in zip(
+        weights_grams, repeat(None) if dimensions_mm is None else dimensions_mm
+    ):
+        found = None
+        if dimensions is None:
+            length = width = height = 0
+        else:
+            length, width, height = sorted(dimensions, reverse=True)
+        if weight >= MIN_WEIGHT_IN_GRAMS and height >= 0:
+            for index, (max_weight, limit, length_plus_girth) in enumerate(limits):
+                if weight <= max_weight and _fits(
+                    limit, length_plus_girth, length, width, height
+                ):
+                    found = index
+                    break
+        result.append(found)
+    return result
+
+
+def _classify_with_numpy(
+    numpy,
+    package_sizes: Sequence[PackageSize],
+    weights_grams: Sequence[int],
+    dimensions_mm: Optional[Sequence[Optional[ParcelDimensions]]],
+) -> list[Optional[int]]:
+    """_classify() with NumPy arrays, one pass per package size."""
+    weights = numpy.asarray(weights_grams)
+    if dimensions_mm is None:
+        dimensions = numpy.zeros((len(weights), 3))
+    elif isinstance(dimensions_mm, numpy.ndarray):
+        dimensions = dimensions_mm
+    else:
+        # no dimensions fit every package size
+        dimensions = numpy.array(
+            [(0, 0, 0) if d is None else d for d in dimensions_mm]
+        ).reshape(len(weights), 3)
+    dimensions = -numpy.sort(-dimensions, axis=1)
+    length, width, height = dimensions[:, 0], dimensions[:, 1], dimensions[:, 2]
+    result = numpy.full(len(weights), -1)
+    # the smaller package sizes overwrite the larger ones
+    for index in reversed(range(len(package_sizes))):
+        size = package_sizes[index]
+        limit = size.dimensions_mm
+        fits = (
+            (weights <= size.weight_grams)
+            & (length <= limit[0])
+            & (width <= limit[1])
+            & (height <= limit[2])
+        )
+        if size.length_plus_girth_mm is not None:
+            fits &= length + 2 * (width + height) <= size.length_plus_girth_mm
+        result[fits] = index
+    result[(weights < MIN_WEIGHT_IN_GRAMS) | (height < 0)] = -1
+    return [None if index < 0 else index for index in result.tolist()]
+
+
+def classify_package_sizes(
+    weights_grams: Sequence[int],
+    dimensions_mm: Optional[Sequence[Optional[ParcelDimensions]]] = None,
+    possible_packages_codes: Optional[list[str]] = None,
+) -> list[Optional[str]]:
+    """Return the smallest package size that fits each parcel.
+
+    Thousands of parcels are classified at once.
+    NumPy is used if it is installed: pip install click_and_drop_api[numpy]
+
+    Parameters:
+        weights_grams: The weight of each parcel.
+        dimensions_mm:
+            The (height, width, depth) of each parcel in any order,
+            also as a NumPy array of shape (n, 3).
+            None ignores the dimensions of all or one parcel.
+        possible_packages_codes: The package sizes to choose from or None to use all available sizes.
+
+    Returns:
+        The code of the package size for each parcel,
+        None if the parcel is too heavy or too big.
+
+    Raises:
+        ValueError: If the number of dimensions and weights differ.
+    """
+    if possible_packages_codes is None:
+        possible_packages_sizes = _packages_sizes()
+    else:
+        possible_packages_sizes = get_package_sizes(possible_packages_codes)
+    codes = [size.code for size in possible_packages_sizes]
+    return [
+        None if index is None else codes[index]
+        for index in _classify(possible_packages_sizes, weights_grams, dimensions_mm)
+    ]
+
+
 def list_package_sizes() -> list[str]:
     """List all package sizes."""
-    return [package_size.code for package_size in packages_sizes]
+    return [package_size.code for package_size in _packages_sizes()]
 
 
 def get_package_size(code: str) -> PackageSize:
@@ -339,9 +608,9 @@ def get_package_size(code: str) -> PackageSize:
     Raises:
         ValueError
     """
-    for package_size in packages_sizes:
-        if package_size.code == code:
-            return package_size
+    package_size = _current_index().package_sizes_by_code.get(code)
+    if package_size is not None:
+        return package_size
     raise ValueError(
         f"Unknown package size: {code!r}. Got {', '.join(list_package_sizes())}"
     )
@@ -352,13 +621,21 @@ def get_package_sizes(codes: list[str]) -> list[PackageSize]:
     return [get_package_size(code) for code in codes]
 
 
+def package_sizes_supporting(service_code: str) -> list[PackageSize]:
+    """Return the package sizes that offer the shipping option, from small to large."""
+    index = _current_index()
+    return list(index.package_sizes_by_service_code.get(service_code, ()))
+
+
 __all__ = [
     "PackageSize",
     "packages_sizes",
     "get_package_size",
     "choose_package_size_by_weight",
+    "classify_package_sizes",
     "list_package_sizes",
     "get_package_sizes",
+    "package_sizes_supporting",
     "MAX_WEIGHT_IN_GRAMS",
     "MIN_WEIGHT_IN_GRAMS",
 ]
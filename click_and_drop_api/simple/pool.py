@@ -0,0 +1,204 @@
+"""Share warm connections to the API between API objects and threads.
+
+Each ClickAndDrop object opens its own connections by default.
+API objects created with the same ConnectionPool reuse each other's
+established TCP and TLS connections instead.
+shared_connection_pool() returns the pool of this process for an API key.
+
+Thread safety:
+A ConnectionPool and the ClickAndDrop objects that use it
+can be used by any number of threads at the same time.
+At most maxsize connections are kept per host.
+If more threads send requests at once, the pool opens extra connections
+that are closed after use or, with block=True, the threads wait for a free one.
+
+Connections are not shared between processes.
+A forked process, e.g. a gunicorn worker, starts with no shared pools,
+so create them in the worker, not before the fork.
+"""
+
+from __future__ import annotations
+
+import copy
+import os
+import socket
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import NamedTuple, Optional
+
+from urllib3.connection import HTTPConnection
+
+from click_and_drop_api.configuration import Configuration
+from click_and_drop_api.rest import RESTClientObject
+
+HOST = "https://api.parcel.royalmail.com/api/v1"
+"""The host of the pools, the same as ClickAndDrop.host."""
+
+
+class PoolOptions(NamedTuple):
+    """How many connections a pool keeps and how."""
+
+    maxsize: int = 10
+    """The number of connections kept per host.
+
+    Use the number of threads that send requests at the same time.
+    """
+
+    block: bool = False
+    """Wait for a free connection instead of opening extra connections."""
+
+    keep_alive: Optional[int] = 60
+    """Seconds of idleness after which TCP keep-alive probes are sent.
+
+    This keeps idle connections open through firewalls and NAT.
+    None disables TCP keep-alive.
+    """
+
+
+def keep_alive_socket_options(idle: int) -> list[tuple[int, int, int]]:
+    """Return the urllib3 socket options that enable TCP keep-alive.
+
+    Parameters:
+        idle: The seconds of idleness before the first probe.
+    """
+    options = list(HTTPConnection.default_socket_options)
+    options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+    if hasattr(socket, "TCP_KEEPIDLE"):
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, idle))
+    elif hasattr(socket, "TCP_KEEPALIVE"):  # macOS
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPALIVE, idle))
+    return options
+
+
+class ConnectionPool:
+    """Connections to the API shared by API objects and threads.
+
+    Pass it to ClickAndDrop(connection_pool=...).
+    """
+
+    def __init__(
+        self,
+        host: str = HOST,
+        options: PoolOptions = PoolOptions(),
+        configuration: Optional[Configuration] = None,
+    ):
+        """Create a new pool.
+
+        Parameters:
+            host: The API host whose connections prewarm() opens.
+            options: The size of the pool and how connections are kept.
+            configuration:
+                The TLS and proxy settings of the connections,
+                by default those of Configuration().
+        """
+        configuration = (
+            Configuration(host=host)
+            if configuration is None
+            else copy.deepcopy(configuration)
+        )
+        configuration.connection_pool_maxsize = options.maxsize
+        configuration.connection_pool_block = options.block
+        if options.keep_alive is not None:
+            configuration.socket_options = keep_alive_socket_options(options.keep_alive)
+        configuration.pool_manager = None
+        self.host = host
+        self.options = options
+        self.pool_manager = RESTClientObject(configuration).pool_manager
+
+    def prewarm(self, connections: int = 1) -> int:
+        """Open connections to the host before the first requests.
+
+        The TCP and TLS handshakes of the connections happen in parallel.
+        Requests sent afterwards reuse the connections.
+
+        Parameters:
+            connections: The number of connections to open, at most maxsize.
+
+        Returns:
+            The number of connections that were opened.
+        """
+        pool = self.pool_manager.connection_from_url(self.host)
+        taken = [
+            pool._get_conn() for _ in range(min(connections, self.options.maxsize))
+        ]
+        try:
+            closed = [connection for connection in taken if not connection.is_connected]
+            if closed:
+                with ThreadPoolExecutor(len(closed)) as executor:
+                    list(executor.map(lambda connection: connection.connect(), closed))
+            return len(closed)
+        finally:
+            for connection in taken:
+                pool._put_conn(connection)
+
+    def close(self) -> None:
+        """Close all connections that are not in use."""
+        self.pool_manager.clear()
+
+
+_shared_pools: dict[tuple[str, str], ConnectionPool] = {}
+_shared_pools_lock = threading.Lock()
+
+
+def shared_connection_pool(
+    key: str,
+    host: str = HOST,
+    options: Optional[PoolOptions] = None,
+    prewarm: int = 0,
+) -> ConnectionPool:
+    """Return the connection pool of this process for an API key and host.
+
+    The first call creates the pool, later calls return the same pool.
+
+    Parameters:
+        key: The Click & Drop API authorisation key.
+        host: The API host.
+        options: The options of the pool, by default PoolOptions().
+        prewarm: The number of connections to open when the pool is created.
+
+    Raises:
+        ValueError: If the pool exists with other options.
+    """
+    with _shared_pools_lock:
+        pool = _shared_pools.get((key, host))
+        created = pool is None
+        if pool is None:
+            pool = _shared_pools[(key, host)] = ConnectionPool(
+                host, options or PoolOptions()
+            )
+    if options is not None and options != pool.options:
+        raise ValueError(
+            f"The shared connection pool of {host} was created with {pool.options}, "
+            f"not {options}."
+        )
+    if created and prewarm:
+        pool.prewarm(prewarm)
+    return pool
+
+
+def close_shared_connection_pools() -> None:
+    """Close and forget the shared connection pools of this process."""
+    with _shared_pools_lock:
+        pools = list(_shared_pools.values())
+        _shared_pools.clear()
+    for pool in pools:
+        pool.close()
+
+
+def _forget_shared_pools() -> None:
+    """Do not use the connections of the parent process after a fork."""
+    global _shared_pools_lock
+    _shared_pools_lock = threading.Lock()
+    _shared_pools.clear()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_forget_shared_pools)
+
+
+__all__ = [
+    "ConnectionPool",
+    "PoolOptions",
+    "shared_connection_pool",
+    "close_shared_connection_pools",
+]
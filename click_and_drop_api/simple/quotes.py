@@ -0,0 +1,186 @@
+"""Quote the cheapest shipping options for many parcels at once.
+
+The prices of the shipping options do not depend on the weight of a parcel,
+only on the package sizes that offer them.
+Each package size also fits everything that fits into the smaller ones.
+So the cheapest option for a parcel only depends on
+the smallest package size it fits into.
+The ShippingQuoter computes the cheapest option for each package size once
+per query and then classifies the parcels.
+Every compensation tier of an option is quoted,
+so insured parcels get the cheapest tier that covers their value.
+"""
+
+from __future__ import annotations
+
+import re
+from decimal import Decimal
+from typing import NamedTuple, Optional, Sequence
+
+from .package_sizes import ParcelDimensions, PackageSize, _classify, _packages_sizes
+from .shipping_options import ShippingCatalogue, ShippingOption, shipping_catalogue
+
+
+def delivery_hours(delivery_speed: str) -> Optional[int]:
+    """Return the hours until delivery or None if unknown.
+
+    "24 hour (next working day)" is 24 hours.
+    "Guaranteed by 1pm next working day" is also 24 hours.
+    """
+    match = re.search(r"(\d+) hour", delivery_speed)
+    if match:
+        return int(match.group(1))
+    if "next working day" in delivery_speed:
+        return 24
+    return None
+
+
+class Quote(NamedTuple):
+    """The cheapest way to ship a parcel."""
+
+    package_size: PackageSize
+    """The smallest package size that fits the parcel and offers the shipping option."""
+
+    shipping_option: ShippingOption
+    """The cheapest shipping option."""
+
+    @property
+    def gross(self) -> Decimal:
+        """The price including tax."""
+        return self.shipping_option.gross
+
+
+class ShippingQuoter:
+    """Quote the cheapest shipping options for many parcels.
+
+    The shipping options of the package sizes are stored as a table
+    with one row per package size, shipping option and compensation tier,
+    sorted by price.
+    Create the quoter again if the package sizes or their options change.
+    """
+
+    def __init__(
+        self,
+        package_sizes: Optional[Sequence[PackageSize]] = None,
+        catalogue: ShippingCatalogue = shipping_catalogue,
+    ):
+        """Create a new quoter.
+
+        Parameters:
+            package_sizes:
+                The package sizes to choose from, from the smallest to the largest,
+                all package sizes by default.
+                Every package size must fit all parcels of the smaller ones.
+            catalogue:
+                The compensation tiers of the options of the package sizes.
+                Options that are not in the catalogue are quoted as they are.
+        """
+        self.package_sizes = list(
+            _packages_sizes() if package_sizes is None else package_sizes
+        )
+        rows = sorted(
+            (
+                (option.gross, index, option)
+                for index, package_size in enumerate(self.package_sizes)
+                for offered in package_size.shipping_options
+                for option in (
+                    catalogue.tiers(offered.service_code)
+                    if offered in catalogue
+                    else [offered]
+                )
+            ),
+            key=lambda row: (row[0], row[1]),
+        )
+        self.gross: list[Decimal] = [row[0] for row in rows]
+        self.package_index: list[int] = [row[1] for row in rows]
+        self.options: list[ShippingOption] = [row[2] for row in rows]
+        self.service_code: list[str] = [option.service_code for option in self.options]
+        self.compensation: list[Decimal] = [
+            option.compensation for option in self.options
+        ]
+        self.hours: list[Optional[int]] = [
+            delivery_hours(option.delivery_speed) for option in self.options
+        ]
+
+    def classify(
+        self, weight_grams: int, dimensions_mm: Optional[ParcelDimensions] = None
+    ) -> Optional[int]:
+        """Return the index of the smallest package size that fits the parcel.
+
+        Returns:
+            The index into package_sizes or None if the parcel fits into none.
+        """
+        return _classify(self.package_sizes, [weight_grams], [dimensions_mm])[0]
+
+    def cheapest_rows(
+        self,
+        min_compensation: Decimal = Decimal(0),
+        max_delivery_hours: Optional[int] = None,
+        service_codes: Optional[Sequence[str]] = None,
+    ) -> list[Optional[int]]:
+        """Return the cheapest row for parcels of each package size.
+
+        Parameters:
+            min_compensation: The minimum compensation of the option.
+            max_delivery_hours: The maximum hours until delivery.
+            service_codes: The service codes to choose from, all by default.
+
+        Returns:
+            For each package size, the row in the table or None.
+        """
+        allowed = None if service_codes is None else set(service_codes)
+        eligible = [
+            row
+            for row in range(len(self.options))
+            if self.compensation[row] >= min_compensation
+            and (
+                max_delivery_hours is None
+                or (
+                    self.hours[row] is not None
+                    and self.hours[row] <= max_delivery_hours
+                )
+            )
+            and (allowed is None or self.service_code[row] in allowed)
+        ]
+        # The rows are sorted by price and then by package size.
+        return [
+            next((row for row in eligible if self.package_index[row] >= index), None)
+            for index in range(len(self.package_sizes))
+        ]
+
+    def cheapest(
+        self,
+        weights_grams: Sequence[int],
+        dimensions_mm: Optional[Sequence[Optional[ParcelDimensions]]] = None,
+        min_compensation: Decimal = Decimal(0),
+        max_delivery_hours: Optional[int] = None,
+        service_codes: Optional[Sequence[str]] = None,
+    ) -> list[Optional[Quote]]:
+        """Quote the cheapest shipping option for each parcel.
+
+        Parameters:
+            weights_grams: The weight of each parcel.
+            dimensions_mm:
+                The (height, width, depth) of each parcel in any order.
+                None ignores the dimensions of all or one parcel.
+            min_compensation: The minimum compensation of the option.
+            max_delivery_hours: The maximum hours until delivery, e.g. 24.
+            service_codes: The service codes to choose from, all by default.
+
+        Returns:
+            A quote for each parcel or None if it cannot be shipped
+            with the options that meet the requirements.
+        """
+        indices = _classify(self.package_sizes, weights_grams, dimensions_mm)
+        quotes = [
+            None
+            if row is None
+            else Quote(self.package_sizes[self.package_index[row]], self.options[row])
+            for row in self.cheapest_rows(
+                min_compensation, max_delivery_hours, service_codes
+            )
+        ]
+        return [None if index is None else quotes[index] for index in indices]
+
+
+__all__ = ["ShippingQuoter", "Quote", "delivery_hours"]
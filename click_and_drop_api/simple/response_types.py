@@ -0,0 +1,65 @@
+"""The response types of the operations of the generated API.
+
+They are needed to deserialize responses that are not requested
+through the generated API methods.
+"""
+
+from typing import Optional
+
+ResponseTypesMap = dict[str, Optional[str]]
+
+GET_VERSION_RESPONSE_TYPES: ResponseTypesMap = {
+    "200": "GetVersionResource",
+    "500": "ErrorResponse",
+}
+GET_ORDERS_RESPONSE_TYPES: ResponseTypesMap = {
+    "200": "GetOrdersResponse",
+    "400": "ErrorResponse",
+    "401": None,
+    "404": None,
+    "500": "ErrorResponse",
+}
+GET_ORDERS_WITH_DETAILS_RESPONSE_TYPES: ResponseTypesMap = {
+    "200": "GetOrdersDetailsResponse",
+    "400": "ErrorResponse",
+    "401": None,
+    "403": None,
+    "404": None,
+    "500": "ErrorResponse",
+}
+GET_SPECIFIC_ORDERS_RESPONSE_TYPES: ResponseTypesMap = {
+    "200": "List[GetOrderInfoResource]",
+    "400": "List[OrderErrorResponse]",
+    "401": None,
+    "404": None,
+    "500": "ErrorResponse",
+}
+DELETE_ORDERS_RESPONSE_TYPES: ResponseTypesMap = {
+    "200": "DeleteOrdersResource",
+    "400": "List[OrderErrorInfo]",
+    "401": None,
+    "403": None,
+    "404": None,
+    "500": "ErrorResponse",
+}
+CREATE_ORDERS_RESPONSE_TYPES: ResponseTypesMap = {
+    "200": "CreateOrdersResponse",
+    "400": "ErrorResponse",
+    "401": None,
+    "500": "ErrorResponse",
+}
+GET_ORDERS_LABEL_RESPONSE_TYPES: ResponseTypesMap = {
+    "200": "bytearray",
+    "400": "List[OrderErrorResponse]",
+    "401": None,
+    "403": None,
+    "404": None,
+    "500": "ErrorResponse",
+}
+UPDATE_ORDERS_STATUS_RESPONSE_TYPES: ResponseTypesMap = {
+    "200": "UpdateOrderStatusResponse",
+    "400": "List[OrderUpdateError]",
+    "401": None,
+    "404": None,
+    "500": "ErrorResponse",
+}
@@ -1,9 +1,38 @@
 """Shipping options for Click and Drop API."""
 
 from __future__ import annotations
+
+import bisect
+import csv
+import functools
+import importlib
+import os
+import sys
+import threading
+from datetime import date
 from decimal import Decimal as D
-from typing import Literal, NamedTuple, Optional, Sequence
-from .types import PostageDetails
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Iterable,
+    Iterator,
+    Literal,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Union,
+)
+
+if sys.version_info >= (3, 11):
+    from importlib.resources import files
+    from importlib.resources.abc import Traversable
+else:
+    from importlib.abc import Traversable
+    from importlib.resources import files
+
+if TYPE_CHECKING:
+    from .types import PostageDetails
 
 
 class ShippingOption(NamedTuple):
@@ -35,6 +64,8 @@ class ShippingOption(NamedTuple):
         Parameters:
             attribtues: Additional attributes to set on the PostageDetails
         """
+        from .types import PostageDetails
+
         return PostageDetails(
             service_code=self.service_code,
             # carrier_name=self.service,  # it seems that this is not included in the API
@@ -55,742 +86,416 @@ class ShippingOption(NamedTuple):
         return shipping_options[service_code]
 
 
-shipping_options = {}
+class ShippingCatalogue:
+    """The shipping options by service code and compensation tier.
 
+    Some services are offered with several compensation tiers,
+    e.g. PFE24 with £150, £750, £1000 and £2500 compensation.
+    They share the service code but differ in price.
+    """
 
-def add_shipping_option(
-    brand: str,
-    service: str,
-    service_code: str,
-    delivery_speed: str,
-    compensation: D,
-    compensation_currency: str,
-    enhancement: str,
-    tax: D,
-    gross: D,
-):
-    """Add a shipping option to the list of available options."""
-    shipping_options[service_code] = ShippingOption(
-        brand=brand,
-        service=service,
-        service_code=service_code,
-        delivery_speed=delivery_speed,
-        compensation=compensation,
-        compensation_currency=compensation_currency,
-        enhancement=enhancement,
-        tax=tax,
-        gross=gross,
-    )
+    def __init__(self, options: Iterable[ShippingOption] = ()):
+        """Create a new catalogue.
 
+        Parameters:
+            options: The options to add, see add().
+        """
+        self._options: dict[tuple[str, D], ShippingOption] = {}
+        # service code -> tiers and their compensations, sorted by compensation
+        self._tiers: dict[str, list[ShippingOption]] = {}
+        self._compensations: dict[str, list[D]] = {}
+        for option in options:
+            self.add(option)
 
-def list_service_codes() -> list[str]:
-    """All shipping option service codes."""
-    return list(shipping_options.keys())
+    def add(self, option: ShippingOption) -> None:
+        """Add an option.
 
+        An option with the same service code and compensation is replaced.
+        """
+        key = (option.service_code, option.compensation)
+        self._options[key] = option
+        tiers = self._tiers.setdefault(option.service_code, [])
+        compensations = self._compensations.setdefault(option.service_code, [])
+        index = bisect.bisect_left(compensations, option.compensation)
+        if index < len(compensations) and compensations[index] == option.compensation:
+            tiers[index] = option
+        else:
+            tiers.insert(index, option)
+            compensations.insert(index, option.compensation)
+
+    def replace(self, service_code: str, tiers: Iterable[ShippingOption]) -> None:
+        """Replace all tiers of a service code.
+
+        Tiers that are not in tiers are removed,
+        the service code too if tiers is empty.
 
-def check_service_codes(service_codes: Sequence[str]):
-    """Check if all service codes are valid."""
-    for service_code in service_codes:
-        if service_code not in shipping_options:
-            raise ValueError(
-                f"Invalid service code: {service_code}. Should be one of {', '.join(list_service_codes())}"
-            )
+        Raises:
+            ValueError: If a tier has another service code.
+        """
+        tiers = list(tiers)
+        for option in tiers:
+            if option.service_code != service_code:
+                raise ValueError(
+                    f"Expected tiers of {service_code}, got {option.service_code}."
+                )
+        for compensation in self._compensations.get(service_code, ()):
+            del self._options[service_code, compensation]
+        if not tiers:
+            self._tiers.pop(service_code, None)
+            self._compensations.pop(service_code, None)
+            return
+        self._tiers[service_code] = []
+        self._compensations[service_code] = []
+        for option in tiers:
+            self.add(option)
+
+    def get(self, service_code: str, compensation: D) -> ShippingOption:
+        """Return the option of a service code with exactly this compensation.
 
+        Raises:
+            KeyError: If there is no such tier.
+        """
+        return self._options[service_code, compensation]
 
-# Royal Mail 1st Class (£20 compensation)
-# See details
-# 	OLP1
-# 24 hour (next working day)
-# 	Up to £20 		£1.70 	£0.00 	£1.70
-add_shipping_option(
-    "Royal Mail",
-    "Royal Mail 1st Class (£20 compensation)",
-    "OLP1",
-    "24 hour (next working day)",
-    D("20.00"),
-    "GBP",
-    "",
-    D("0.00"),
-    D("1.70"),
-)
+    def tiers(self, service_code: str) -> list[ShippingOption]:
+        """Return the options of a service code from the lowest to the highest compensation."""
+        return list(self._tiers.get(service_code, ()))
 
+    def base(self, service_code: str) -> ShippingOption:
+        """Return the option of a service code with the lowest compensation.
 
-# Royal Mail Signed For 1st Class (£20 compensation)
-# See details
-# 	OLP1SF
-# 24 hour (next working day)
-# 	Up to £20 		£3.60 	£0.00 	£3.60
-add_shipping_option(
-    "Royal Mail",
-    "Royal Mail Signed For 1st Class (£20 compensation)",
-    "OLP1SF",
-    "24 hour (next working day)",
-    D("20.00"),
-    "GBP",
-    "",
-    D("0.00"),
-    D("3.60"),
-)
+        Raises:
+            KeyError: If the service code is unknown.
+        """
+        return self._tiers[service_code][0]
 
-# Royal Mail 2nd Class (£20 compensation)
-# See details
-# 	OLP2
-# 48 hour (2 working days)
-# 	Up to £20 		£0.87 	£0.00 	£0.87
-add_shipping_option(
-    "Royal Mail",
-    "Royal Mail 2nd Class (£20 compensation)",
-    "OLP2",
-    "48 hour (2 working days)",
-    D("20.00"),
-    "GBP",
-    "",
-    D("0.00"),
-    D("0.87"),
-)
+    def cover(self, service_code: str, declared_value: D) -> Optional[ShippingOption]:
+        """Return the cheapest tier of a service code that covers a value.
 
-# Royal Mail Signed For 2nd Class (£20 compensation)
-# See details
-# 	OLP2SF
-# 48 hour (2 working days)
-# 	Up to £20 		£2.77 	£0.00 	£2.77
-add_shipping_option(
-    "Royal Mail",
-    "Royal Mail Signed For 2nd Class (£20 compensation)",
-    "OLP2SF",
-    "48 hour (2 working days)",
-    D("20.00"),
-    "GBP",
-    "",
-    D("0.00"),
-    D("2.77"),
-)
+        Higher tiers cost more, so this is the tier with the lowest
+        compensation of at least declared_value.
+        Services have at most a handful of tiers.
 
-# Royal Mail Special Delivery Guaranteed by 1pm (£750 compensation)
-# See details
-# 	SD1OLP
-# Guaranteed by 1pm next working day
-# 	Up to £750 	Tracked, Email notification, SMS notification 	£8.75 	£0.00 	£8.75
-add_shipping_option(
-    "Royal Mail",
-    "Royal Mail Special Delivery Guaranteed by 1pm (£750 compensation)",
-    "SD1OLP",
-    "Guaranteed by 1pm next working day",
-    D("750.00"),
-    "GBP",
-    "Tracked, Email notification, SMS notification",
-    D("0.00"),
-    D("8.75"),
-)
+        Returns:
+            The option or None if no tier compensates the value.
+        """
+        compensations = self._compensations.get(service_code)
+        if compensations is None:
+            return None
+        index = bisect.bisect_left(compensations, declared_value)
+        if index == len(compensations):
+            return None
+        return self._tiers[service_code][index]
+
+    def service_codes(self) -> list[str]:
+        """The service codes in the order they were added."""
+        return list(self._tiers)
+
+    def clear(self) -> None:
+        """Remove all options."""
+        self._options.clear()
+        self._tiers.clear()
+        self._compensations.clear()
+
+    def __iter__(self) -> Iterator[ShippingOption]:
+        """Iterate over all options, the tiers of a service code by compensation."""
+        for tiers in self._tiers.values():
+            yield from tiers
+
+    def __len__(self) -> int:
+        return len(self._options)
+
+    def __contains__(self, option: object) -> bool:
+        return (
+            isinstance(option, ShippingOption)
+            and self._options.get((option.service_code, option.compensation)) == option
+        )
 
-# Royal Mail Special Delivery Guaranteed by 1pm (£1000 compensation)
-# See details
-# 	SD2OLP
-# Guaranteed by 1pm next working day
-# 	Up to £1000 	Tracked, Email notification, SMS notification 	£11.75 	£0.00 	£11.75
-add_shipping_option(
-    "Royal Mail",
-    "Royal Mail Special Delivery Guaranteed by 1pm (£1000 compensation)",
-    "SD2OLP",
-    "Guaranteed by 1pm next working day",
-    D("1000.00"),
-    "GBP",
-    "Tracked, Email notification, SMS notification",
-    D("0.00"),
-    D("11.75"),
-)
 
-# Royal Mail Special Delivery Guaranteed by 1pm (£2500 compensation)
-# See details
-# 	SD3OLP
-# Guaranteed by 1pm next working day
-# 	Up to £2500 	Tracked, Email notification, SMS notification 	£18.75 	£0.00 	£18.75
-add_shipping_option(
-    "Royal Mail",
-    "Royal Mail Special Delivery Guaranteed by 1pm (£2500 compensation)",
-    "SD3OLP",
-    "Guaranteed by 1pm next working day",
-    D("2500.00"),
-    "GBP",
-    "Tracked, Email notification, SMS notification",
-    D("0.00"),
-    D("18.75"),
-)
+_tariff_lock = threading.RLock()
+_tariff_loaded = False
+_applying: Optional[int] = None
+"""The thread that applies a tariff."""
 
 
-# Tracked 24 (£75 compensation)
-# See details
-# 	TOLP24
-# 24 hour (next working day)
-# 	Up to £75 	Tracked, Email notification, SMS notification, Safeplace 	£3.04 	£0.61 	£3.65
-add_shipping_option(
-    "Royal Mail",
-    "Tracked 24 (£75 compensation)",
-    "TOLP24",
-    "24 hour (next working day)",
-    D("75.00"),
-    "GBP",
-    "Tracked, Email notification, SMS notification, Safeplace",
-    D("0.61"),
-    D("3.65"),
-)
+def _load_tariff() -> None:
+    """Apply the tariff effective today if no tariff was applied yet.
 
-# Tracked 24 with Signature (£75 compensation)
-# See details
-# 	TOLP24SF
-# 24 hour (next working day)
-# 	Up to £75 	Tracked, Email notification, SMS notification 	£4.62 	£0.93 	£5.55
-add_shipping_option(
-    "Royal Mail",
-    "Tracked 24 with Signature (£75 compensation)",
-    "TOLP24SF",
-    "24 hour (next working day)",
-    D("75.00"),
-    "GBP",
-    "Tracked, Email notification, SMS notification",
-    D("0.93"),
-    D("5.55"),
-)
+    Raises:
+        ValueError: If no tariff is effective today.
+    """
+    if _tariff_loaded or _applying == threading.get_ident():
+        return
+    with _tariff_lock:
+        if _tariff_loaded:
+            return
+        try:
+            tariff = get_tariff(directory=TARIFFS)
+        except ValueError as error:
+            raise ValueError(
+                f"{error} Apply a tariff with Tariff.apply() to use the shipping options."
+            ) from None
+        tariff.apply()
 
-# Tracked 48 (£75 compensation)
-# See details
-# 	TOLP48
-# 48 hour (2 working days)
-# 	Up to £75 	Tracked, Email notification, SMS notification, Safeplace 	£2.29 	£0.46 	£2.75
-add_shipping_option(
-    "Royal Mail",
-    "Tracked 48 (£75 compensation)",
-    "TOLP48",
-    "48 hour (2 working days)",
-    D("75.00"),
-    "GBP",
-    "Tracked, Email notification, SMS notification, Safeplace",
-    D("0.46"),
-    D("2.75"),
-)
 
-# Tracked 48 with Signature (£75 compensation)
-# See details
-# 	TOLP48SF
-# 48 hour (2 working days)
-# 	Up to £75 	Tracked, Email notification, SMS notification 	£3.87 	£0.78 	£4.65
-add_shipping_option(
-    "Royal Mail",
-    "Tracked 48 with Signature (£75 compensation)",
-    "TOLP48SF",
-    "48 hour (2 working days)",
-    D("75.00"),
-    "GBP",
-    "Tracked, Email notification, SMS notification",
-    D("0.78"),
-    D("4.65"),
-)
+def _loading(method: Callable) -> Callable:
+    """Wrap a method to load the tariff before it is called."""
 
+    @functools.wraps(method)
+    def load_and_call(self, *args, **kwargs):
+        _load_tariff()
+        return method(self, *args, **kwargs)
 
-# Tracked 24 with Age Verification (£75 compensation)
-# See details
-# 	TOLP24SFA
-# 24 hour (next working day)
-# 	Up to £75 	Tracked, Email notification, SMS notification, Age verified on delivery 	£6.11 	£1.22 	£7.33
-add_shipping_option(
-    "Royal Mail",
-    "Tracked 24 with Age Verification (£75 compensation)",
-    "TOLP24SFA",
-    "24 hour (next working day)",
-    D("75.00"),
-    "GBP",
-    "Tracked, Email notification, SMS notification, Age verified on delivery",
-    D("1.22"),
-    D("7.33"),
-)
+    return load_and_call
 
 
-# Tracked 48 with Age Verification (£75 compensation)
-# See details
-# 	TOLP48SFA
-# 48 hour (2 working days)
-# 	Up to £75 	Tracked, Email notification, SMS notification, Age verified on delivery 	£5.36 	£1.07 	£6.43
-add_shipping_option(
-    "Royal Mail",
-    "Tracked 48 with Age Verification (£75 compensation)",
-    "TOLP48SFA",
-    "48 hour (2 working days)",
-    D("75.00"),
-    "GBP",
-    "Tracked, Email notification, SMS notification, Age verified on delivery",
-    D("1.07"),
-    D("6.43"),
-)
+class _TariffCatalogue(ShippingCatalogue):
+    """The shipping catalogue that loads the tariff on first access."""
 
+    add = _loading(ShippingCatalogue.add)
+    replace = _loading(ShippingCatalogue.replace)
+    get = _loading(ShippingCatalogue.get)
+    tiers = _loading(ShippingCatalogue.tiers)
+    base = _loading(ShippingCatalogue.base)
+    cover = _loading(ShippingCatalogue.cover)
+    service_codes = _loading(ShippingCatalogue.service_codes)
+    clear = _loading(ShippingCatalogue.clear)
+    __iter__ = _loading(ShippingCatalogue.__iter__)
+    __len__ = _loading(ShippingCatalogue.__len__)
+    __contains__ = _loading(ShippingCatalogue.__contains__)
 
-########### Parcel Force
-
-
-# express10 with Signature Comp 1 (£750 compensation)
-# See details
-# 	PFE10SF
-#  Guaranteed by 10am next working day
-# 	Up to £750 	Tracked, Email notification, SMS notification 	£29.37 	£5.88 	£35.25
-add_shipping_option(
-    "Parcel Force",
-    "express10 with Signature Comp 1 (£750 compensation)",
-    "PFE10SF",
-    "Guaranteed by 10am next working day",
-    D("750.00"),
-    "GBP",
-    "Tracked, Email notification, SMS notification",
-    D("5.88"),
-    D("35.25"),
-)
 
+class _TariffOptions(dict):
+    """The shipping options by service code, loaded from the tariff on first access."""
 
-# express10 with Signature Comp 2 (£1000 compensation)
-# See details
-# 	PFE10SF
-# Guaranteed by 10am next working day
-# 	Up to £1000 	Tracked, Email notification, SMS notification 	£48.54 	£9.71 	£58.25
-add_shipping_option(
-    "Parcel Force",
-    "express10 with Signature Comp 2 (£1000 compensation)",
-    "PFE10SF",
-    "Guaranteed by 10am next working day",
-    D("1000.00"),
-    "GBP",
-    "Tracked, Email notification, SMS notification",
-    D("9.71"),
-    D("58.25"),
-)
+    __getitem__ = _loading(dict.__getitem__)
+    __setitem__ = _loading(dict.__setitem__)
+    __delitem__ = _loading(dict.__delitem__)
+    __contains__ = _loading(dict.__contains__)
+    __iter__ = _loading(dict.__iter__)
+    __len__ = _loading(dict.__len__)
+    __repr__ = _loading(dict.__repr__)
+    __eq__ = _loading(dict.__eq__)
+    __ne__ = _loading(dict.__ne__)
+    get = _loading(dict.get)
+    keys = _loading(dict.keys)
+    values = _loading(dict.values)
+    items = _loading(dict.items)
+    copy = _loading(dict.copy)
+    update = _loading(dict.update)
+    pop = _loading(dict.pop)
+    popitem = _loading(dict.popitem)
+    setdefault = _loading(dict.setdefault)
+    clear = _loading(dict.clear)
 
-# express10 with Signature Comp 3 (£2500 compensation)
-# See details
-# 	PFE10SF
-# Guaranteed by 10am next working day
-# 	Up to £2500 	Tracked, Email notification, SMS notification 	£77.71 	£15.54 	£93.25
-add_shipping_option(
-    "Parcel Force",
-    "express10 with Signature Comp 3 (£2500 compensation)",
-    "PFE10SF",
-    "Guaranteed by 10am next working day",
-    D("2500.00"),
-    "GBP",
-    "Tracked, Email notification, SMS notification",
-    D("15.54"),
-    D("93.25"),
-)
 
-# express24 (£150 compensation)
-# See details
-# 	PFE24
-# 24 hour (next working day)
-# 	Up to £150 	Tracked, Email notification, SMS notification, Safeplace 	£9.92 	£1.98 	£11.90
-add_shipping_option(
-    "Parcel Force",
-    "express24 (£150 compensation)",
-    "PFE24",
-    "24 hour (next working day)",
-    D("150.00"),
-    "GBP",
-    "Tracked, Email notification, SMS notification, Safeplace",
-    D("1.98"),
-    D("11.90"),
-)
+shipping_catalogue: ShippingCatalogue = _TariffCatalogue()
+"""All compensation tiers of the shipping options.
 
-# express24 Comp 1 (£750 compensation)
-# See details
-# 	PFE24
-# 24 hour (next working day)
-# 	Up to £750 	Tracked, Email notification, SMS notification, Safeplace 	£15.75 	£3.15 	£18.90
-add_shipping_option(
-    "Parcel Force",
-    "express24 Comp 1 (£750 compensation)",
-    "PFE24",
-    "24 hour (next working day)",
-    D("750.00"),
-    "GBP",
-    "Tracked, Email notification, SMS notification, Safeplace",
-    D("3.15"),
-    D("18.90"),
-)
+The tariff effective today is loaded on first access, see Tariff.
+"""
 
-# express24 Comp 2 (£1000 compensation)
-# See details
-# 	PFE24
-# 24 hour (next working day)
-# 	Up to £1000 	Tracked, Email notification, SMS notification, Safeplace 	£34.92 	£6.98 	£41.90
-add_shipping_option(
-    "Parcel Force",
-    "express24 Comp 2 (£1000 compensation)",
-    "PFE24",
-    "24 hour (next working day)",
-    D("1000.00"),
-    "GBP",
-    "Tracked, Email notification, SMS notification, Safeplace",
-    D("6.98"),
-    D("41.90"),
-)
+shipping_options: dict[str, ShippingOption] = _TariffOptions()
+"""The shipping option of each service code with the lowest compensation.
 
+The tariff effective today is loaded on first access, see Tariff.
+"""
 
-# express24 Comp 3 (£2500 compensation)
-# See details
-# 	PFE24
-# 24 hour (next working day)
-# 	Up to £2500 	Tracked, Email notification, SMS notification, Safeplace 	£64.09 	£12.81 	£76.90
-add_shipping_option(
-    "Parcel Force",
-    "express24 Comp 3 (£2500 compensation)",
-    "PFE24",
-    "24 hour (next working day)",
-    D("2500.00"),
-    "GBP",
-    "Tracked, Email notification, SMS notification, Safeplace",
-    D("12.81"),
-    D("76.90"),
-)
+_listeners: list[Callable[[ShippingOption, Sequence[str]], None]] = []
+"""Called with each added option and the package sizes that offer it."""
 
-# express24 with Signature (£150 compensation)
-# See details
-# 	PFE24SF
-# 24 hour (next working day)
-# 	Up to £150 	Tracked, Email notification, SMS notification 	£11.17 	£2.23 	£13.40
-add_shipping_option(
-    "Parcel Force",
-    "express24 with Signature (£150 compensation)",
-    "PFE24SF",
-    "24 hour (next working day)",
-    D("150.00"),
-    "GBP",
-    "Tracked, Email notification, SMS notification",
-    D("2.23"),
-    D("13.40"),
-)
 
-# express24 with Signature Comp 1 (£750 compensation)
-# See details
-# 	PFE24SF
-# 24 hour (next working day)
-# 	Up to £750 	Tracked, Email notification, SMS notification 	£17.00 	£3.40 	£20.40
-add_shipping_option(
-    "Parcel Force",
-    "express24 with Signature Comp 1 (£750 compensation)",
-    "PFE24SF",
-    "24 hour (next working day)",
-    D("750.00"),
-    "GBP",
-    "Tracked, Email notification, SMS notification",
-    D("3.40"),
-    D("20.40"),
-)
+def add_shipping_option(
+    brand: str,
+    service: str,
+    service_code: str,
+    delivery_speed: str,
+    compensation: D,
+    compensation_currency: str,
+    enhancement: str,
+    tax: D,
+    gross: D,
+    package_sizes: Sequence[str] = (),
+):
+    """Add a shipping option to the list of available options.
+
+    An option with the same service code and compensation replaces the old one.
+    Options of a service code with other compensations are kept as tiers
+    in shipping_catalogue.
+    shipping_options and the package sizes offer the tier with the lowest compensation.
+
+    Parameters:
+        package_sizes: The codes of further package sizes that offer the option.
+    """
+    shipping_catalogue.add(
+        ShippingOption(
+            brand=brand,
+            service=service,
+            service_code=service_code,
+            delivery_speed=delivery_speed,
+            compensation=compensation,
+            compensation_currency=compensation_currency,
+            enhancement=enhancement,
+            tax=tax,
+            gross=gross,
+        )
+    )
+    _offer_base(service_code, package_sizes)
 
-# express24 with Signature Comp 2 (£1000 compensation)
-# See details
-# 	PFE24SF
-# 24 hour (next working day)
-# 	Up to £1000 	Tracked, Email notification, SMS notification 	£36.17 	£7.23 	£43.40
-add_shipping_option(
-    "Parcel Force",
-    "express24 with Signature Comp 2 (£1000 compensation)",
-    "PFE24SF",
-    "24 hour (next working day)",
-    D("1000.00"),
-    "GBP",
-    "Tracked, Email notification, SMS notification",
-    D("7.23"),
-    D("43.40"),
-)
 
-# express24 with Signature Comp 3 (£2500 compensation)
-# See details
-# 	PFE24SF
-# 24 hour (next working day)
-# 	Up to £2500 	Tracked, Email notification, SMS notification 	£65.34 	£13.06 	£78.40
-add_shipping_option(
-    "Parcel Force",
-    "express24 with Signature Comp 3 (£2500 compensation)",
-    "PFE24SF",
-    "24 hour (next working day)",
-    D("2500.00"),
-    "GBP",
-    "Tracked, Email notification, SMS notification",
-    D("13.06"),
-    D("78.40"),
-)
+def _offer_base(service_code: str, package_sizes: Sequence[str] = ()) -> None:
+    """Offer the lowest tier of a service code in shipping_options and the package sizes."""
+    option = shipping_options[service_code] = shipping_catalogue.base(service_code)
+    if package_sizes:
+        # the package sizes listen for new options once they are imported
+        importlib.import_module(".package_sizes", __package__)
+    for listener in _listeners:
+        listener(option, package_sizes)
 
-# express48 (£150 compensation)
-# See details
-# 	PFE48
-# 48 hour (2 working days)
-# 	Up to £150 	Tracked, Email notification, SMS notification, Safeplace 	£9.46 	£1.89 	£11.35
-add_shipping_option(
-    "Parcel Force",
-    "express48 (£150 compensation)",
-    "PFE48",
-    "48 hour (2 working days)",
-    D("150.00"),
-    "GBP",
-    "Tracked, Email notification, SMS notification, Safeplace",
-    D("1.89"),
-    D("11.35"),
-)
 
-# express48 Comp 1 (£750 compensation)
-# See details
-# 	PFE48
-# 48 hour (2 working days)
-# 	Up to £750 	Tracked, Email notification, SMS notification, Safeplace 	£15.29 	£3.06 	£18.35
-add_shipping_option(
-    "Parcel Force",
-    "express48 Comp 1 (£750 compensation)",
-    "PFE48",
-    "48 hour (2 working days)",
-    D("750.00"),
-    "GBP",
-    "Tracked, Email notification, SMS notification, Safeplace",
-    D("3.06"),
-    D("18.35"),
-)
+def list_service_codes() -> list[str]:
+    """All shipping option service codes."""
+    return list(shipping_options.keys())
 
-# express48 Comp 2 (£1000 compensation)
-# See details
-# 	PFE48
-# 48 hour (2 working days)
-# 	Up to £1000 	Tracked, Email notification, SMS notification, Safeplace 	£34.46 	£6.89 	£41.35
-add_shipping_option(
-    "Parcel Force",
-    "express48 Comp 2 (£1000 compensation)",
-    "PFE48",
-    "48 hour (2 working days)",
-    D("1000.00"),
-    "GBP",
-    "Tracked, Email notification, SMS notification, Safeplace",
-    D("6.89"),
-    D("41.35"),
-)
 
-# express48 Comp 3 (£2500 compensation)
-# See details
-# 	PFE48
-# 48 hour (2 working days)
-# 	Up to £2500 	Tracked, Email notification, SMS notification, Safeplace 	£63.63 	£12.72 	£76.35
-add_shipping_option(
-    "Parcel Force",
-    "express48 Comp 3 (£2500 compensation)",
-    "PFE48",
-    "48 hour (2 working days)",
-    D("2500.00"),
-    "GBP",
-    "Tracked, Email notification, SMS notification, Safeplace",
-    D("12.72"),
-    D("76.35"),
-)
+def check_service_codes(service_codes: Sequence[str]):
+    """Check if all service codes are valid."""
+    for service_code in service_codes:
+        if service_code not in shipping_options:
+            raise ValueError(
+                f"Invalid service code: {service_code}. Should be one of {', '.join(list_service_codes())}"
+            )
 
-# express48 with Signature (£150 compensation)
-# See details
-# 	PFE48SF
-# 48 hour (2 working days)
-# 	Up to £150 	Tracked, Email notification, SMS notification 	£10.71 	£2.14 	£12.85
-add_shipping_option(
-    "Parcel Force",
-    "express48 with Signature (£150 compensation)",
-    "PFE48SF",
-    "48 hour (2 working days)",
-    D("150.00"),
-    "GBP",
-    "Tracked, Email notification, SMS notification",
-    D("2.14"),
-    D("12.85"),
-)
 
-# express48 with Signature Comp 1 (£750 compensation)
-# See details
-# 	PFE48SF
-# 48 hour (2 working days)
-# 	Up to £750 	Tracked, Email notification, SMS notification 	£16.54 	£3.31 	£19.85
-add_shipping_option(
-    "Parcel Force",
-    "express48 with Signature Comp 1 (£750 compensation)",
-    "PFE48SF",
-    "48 hour (2 working days)",
-    D("750.00"),
-    "GBP",
-    "Tracked, Email notification, SMS notification",
-    D("3.31"),
-    D("19.85"),
-)
+TariffPath = Union[str, "os.PathLike[str]", Traversable]
+_DECIMAL_FIELDS = {"compensation", "gross", "tax"}
+TARIFFS = files(__package__) / "tariffs"
+"""The directory of the tariffs shipped with this package."""
 
-# express48 with Signature Comp 2 (£1000 compensation)
-# See details
-# 	PFE48SF
-# 48 hour (2 working days)
-# 	Up to £1000 	Tracked, Email notification, SMS notification 	£35.71 	£7.14 	£42.85
-add_shipping_option(
-    "Parcel Force",
-    "express48 with Signature Comp 2 (£1000 compensation)",
-    "PFE48SF",
-    "48 hour (2 working days)",
-    D("1000.00"),
-    "GBP",
-    "Tracked, Email notification, SMS notification",
-    D("7.14"),
-    D("42.85"),
-)
 
-# express48 with Signature Comp 3 (£2500 compensation)
-# See details
-# 	PFE48SF
-# 48 hour (2 working days)
-# 	Up to £2500 	Tracked, Email notification, SMS notification 	£64.88 	£12.97 	£77.85
-add_shipping_option(
-    "Parcel Force",
-    "express48 with Signature Comp 3 (£2500 compensation)",
-    "PFE48SF",
-    "48 hour (2 working days)",
-    D("2500.00"),
-    "GBP",
-    "Tracked, Email notification, SMS notification",
-    D("12.97"),
-    D("77.85"),
-)
+class Tariff(NamedTuple):
+    """The prices of the shipping options from a day on.
 
-# expressAM (£150 compensation)
-# See details
-# 	PFEAM
-# Guaranteed by 12pm next working day
-# 	Up to £150 	Tracked, Email notification, SMS notification, Safeplace 	£13.08 	£2.62 	£15.70
-add_shipping_option(
-    "Parcel Force",
-    "expressAM (£150 compensation)",
-    "PFEAM",
-    "Guaranteed by 12pm next working day",
-    D("150.00"),
-    "GBP",
-    "Tracked, Email notification, SMS notification, Safeplace",
-    D("2.62"),
-    D("15.70"),
-)
+    The tariffs are CSV files in the tariffs directory of this package,
+    named by the day they take effect, e.g. 2025-04-07.csv.
+    The columns are the fields of ShippingOption.
+    To update the prices, add a new file.
+    """
 
-# expressAM Comp 1 (£750 compensation)
-# See details
-# 	PFEAM
-# Guaranteed by 12pm next working day
-# 	Up to £750 	Tracked, Email notification, SMS notification, Safeplace 	£18.91 	£3.79 	£22.70
-add_shipping_option(
-    "Parcel Force",
-    "expressAM Comp 1 (£750 compensation)",
-    "PFEAM",
-    "Guaranteed by 12pm next working day",
-    D("750.00"),
-    "GBP",
-    "Tracked, Email notification, SMS notification, Safeplace",
-    D("3.79"),
-    D("22.70"),
-)
+    effective: date
+    """The first day the prices apply."""
 
-# expressAM Comp 2 (£1000 compensation)
-# See details
-# 	PFEAM
-# Guaranteed by 12pm next working day
-# 	Up to £1000 	Tracked, Email notification, SMS notification, Safeplace 	£38.08 	£7.62 	£45.70
-add_shipping_option(
-    "Parcel Force",
-    "expressAM Comp 2 (£1000 compensation)",
-    "PFEAM",
-    "Guaranteed by 12pm next working day",
-    D("1000.00"),
-    "GBP",
-    "Tracked, Email notification, SMS notification, Safeplace",
-    D("7.62"),
-    D("45.70"),
-)
+    options: list[ShippingOption]
+    """The shipping options, a service code appears once per compensation tier.
 
-# expressAM Comp 3 (£2500 compensation)
-# See details
-# 	PFEAM
-# Guaranteed by 12pm next working day
-# 	Up to £2500 	Tracked, Email notification, SMS notification, Safeplace 	£67.25 	£13.45 	£80.70
-add_shipping_option(
-    "Parcel Force",
-    "expressAM Comp 3 (£2500 compensation)",
-    "PFEAM",
-    "Guaranteed by 12pm next working day",
-    D("2500.00"),
-    "GBP",
-    "Tracked, Email notification, SMS notification, Safeplace",
-    D("13.45"),
-    D("80.70"),
-)
+    See ShippingCatalogue.
+    """
 
-# expressAM with Signature (£150 compensation)
-# See details
-# 	PFEAMSF
-# Guaranteed by 12pm next working day
-# 	Up to £150 	Tracked, Email notification, SMS notification 	£14.33 	£2.87 	£17.20
-add_shipping_option(
-    "Parcel Force",
-    "expressAM with Signature (£150 compensation)",
-    "PFEAMSF",
-    "Guaranteed by 12pm next working day",
-    D("150.00"),
-    "GBP",
-    "Tracked, Email notification, SMS notification",
-    D("2.87"),
-    D("17.20"),
-)
+    @classmethod
+    def from_csv(cls, path: TariffPath, effective: Optional[date] = None) -> Tariff:
+        """Load a tariff from a CSV file.
 
-# expressAM with Signature Comp 1 (£750 compensation)
-# See details
-# 	PFEAMSF
-# Guaranteed by 12pm next working day
-# 	Up to £750 	Tracked, Email notification, SMS notification 	£20.16 	£4.04 	£24.20
-add_shipping_option(
-    "Parcel Force",
-    "expressAM with Signature Comp 1 (£750 compensation)",
-    "PFEAMSF",
-    "Guaranteed by 12pm next working day",
-    D("750.00"),
-    "GBP",
-    "Tracked, Email notification, SMS notification",
-    D("4.04"),
-    D("24.20"),
-)
+        Parameters:
+            path: The file, e.g. one that you wrote with next season's prices.
+            effective: The first day of the prices, by default the name of the file.
 
-# expressAM with Signature Comp 2 (£1000 compensation)
-# See details
-# 	PFEAMSF
-# Guaranteed by 12pm next working day
-# 	Up to £1000 	Tracked, Email notification, SMS notification 	£39.33 	£7.87 	£47.20
-add_shipping_option(
-    "Parcel Force",
-    "expressAM with Signature Comp 2 (£1000 compensation)",
-    "PFEAMSF",
-    "Guaranteed by 12pm next working day",
-    D("1000.00"),
-    "GBP",
-    "Tracked, Email notification, SMS notification",
-    D("7.87"),
-    D("47.20"),
-)
+        Raises:
+            ValueError: If the file name is not a date and effective is not given.
+        """
+        if isinstance(path, (str, os.PathLike)):
+            path = Path(path)
+        if effective is None:
+            effective = date.fromisoformat(path.name.rsplit(".", 1)[0])
+        with path.open(encoding="utf-8", newline="") as file:
+            options = [
+                ShippingOption(
+                    **{
+                        field: D(value) if field in _DECIMAL_FIELDS else value
+                        for field, value in row.items()
+                    }
+                )
+                for row in csv.DictReader(file)
+            ]
+        return cls(effective, options)
+
+    def apply(self) -> None:
+        """Use these prices.
+
+        The tiers of each service code in the tariff replace all its tiers,
+        see ShippingCatalogue.replace().
+        Service codes that are not in the tariff are kept.
+
+        The tariff effective today is loaded when the shipping options are first used.
+        A tariff applied before is used instead.
+        """
+        global _applying, _tariff_loaded
+        with _tariff_lock:
+            applying, _applying = _applying, threading.get_ident()
+            try:
+                tiers: dict[str, list[ShippingOption]] = {}
+                for option in self.options:
+                    tiers.setdefault(option.service_code, []).append(option)
+                for service_code, options in tiers.items():
+                    shipping_catalogue.replace(service_code, options)
+                    _offer_base(service_code)
+            finally:
+                _applying = applying
+            _tariff_loaded = True
+
+
+def _tariff_paths(directory: TariffPath) -> list[tuple[date, Traversable]]:
+    """The CSV files in the directory by effective date."""
+    if isinstance(directory, (str, os.PathLike)):
+        directory = Path(directory)
+    return sorted(
+        (
+            (date.fromisoformat(path.name[: -len(".csv")]), path)
+            for path in directory.iterdir()
+            if path.name.endswith(".csv")
+        ),
+        key=lambda tariff: tariff[0],
+    )
 
-# expressAM with Signature Comp 3 (£2500 compensation)
-# See details
-# 	PFEAMSF
-# Guaranteed by 12pm next working day
-# 	Up to £2500 	Tracked, Email notification, SMS notification 	£68.50 	£13.70 	£82.20
-add_shipping_option(
-    "Parcel Force",
-    "expressAM with Signature Comp 3 (£2500 compensation)",
-    "PFEAMSF",
-    "Guaranteed by 12pm next working day",
-    D("2500.00"),
-    "GBP",
-    "Tracked, Email notification, SMS notification",
-    D("13.70"),
-    D("82.20"),
-)
 
+def list_tariffs(directory: TariffPath = TARIFFS) -> list[date]:
+    """The days on which the tariffs in the directory take effect, oldest first."""
+    return [effective for effective, _ in _tariff_paths(directory)]
 
-medium_parcel_force_codes = [
-    key for key in shipping_options.keys() if key.startswith("PF")
-]
+
+def get_tariff(on: Optional[date] = None, directory: TariffPath = TARIFFS) -> Tariff:
+    """Load the tariff that is effective on a day.
+
+    Only this tariff is read from the directory.
+
+    Parameters:
+        on: The day to ship on, today by default.
+            Use a future day to quote next season's prices.
+        directory: The directory of the CSV files.
+
+    Raises:
+        ValueError: If no tariff is effective on that day.
+    """
+    if on is None:
+        on = date.today()
+    effective = [(day, path) for day, path in _tariff_paths(directory) if day <= on]
+    if not effective:
+        raise ValueError(f"No tariff is effective on {on}.")
+    return Tariff.from_csv(effective[-1][1], effective[-1][0])
+
+
+def _medium_parcel_force_codes() -> list[str]:
+    """The service codes of Parcelforce, offered for medium parcels."""
+    return [code for code in shipping_options if code.startswith("PF")]
+
+
+medium_parcel_force_codes: list[str]
+"""The service codes of Parcelforce, computed on each access."""
+
+
+def __getattr__(name: str):
+    if name == "medium_parcel_force_codes":
+        return _medium_parcel_force_codes()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def get_shipping_options(*options: str) -> list[ShippingOption]:
@@ -800,8 +505,14 @@ def get_shipping_options(*options: str) -> list[ShippingOption]:
 
 __all__ = [
     "shipping_options",
+    "shipping_catalogue",
+    "ShippingCatalogue",
     "get_shipping_options",
     "medium_parcel_force_codes",
     "ShippingOption",
     "list_service_codes",
+    "Tariff",
+    "TARIFFS",
+    "get_tariff",
+    "list_tariffs",
 ]
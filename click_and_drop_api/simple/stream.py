@@ -0,0 +1,41 @@
+"""Write downloaded documents to files, paths and sockets in chunks."""
+
+from __future__ import annotations
+
+import os
+import socket
+from contextlib import contextmanager, suppress
+from typing import BinaryIO, Callable, Iterator, Union
+
+CHUNK_SIZE = 64 * 1024
+"""The number of bytes read from the response at once."""
+
+Target = Union[str, "os.PathLike[str]", BinaryIO, socket.socket]
+"""Where to write a document: a path, a binary file object or a socket."""
+
+
+@contextmanager
+def open_target(target: Target) -> Iterator[Callable[[bytes], object]]:
+    """Yield a function that writes bytes to the target.
+
+    Sockets are written with sendall(), file objects with write().
+    A path is opened for writing and removed again if the download fails
+    so that no partial document is left behind.
+    File objects and sockets are not closed.
+    """
+    if hasattr(target, "sendall"):
+        yield target.sendall
+    elif hasattr(target, "write"):
+        yield target.write
+    else:
+        path = os.fspath(target)
+        try:
+            with open(path, "wb") as file:
+                yield file.write
+        except BaseException:
+            with suppress(FileNotFoundError):
+                os.remove(path)
+            raise
+
+
+__all__ = ["CHUNK_SIZE", "Target", "open_target"]
@@ -0,0 +1,357 @@
+"""Mirror the orders in a local SQLite database, requesting only what changed.
+
+Listing all orders to find the ones that changed requests every page every time.
+An OrderStore keeps the orders that were seen and a checkpoint.
+sync_orders() then requests
+
+- the orders created since the newest stored order, minus an overlap,
+  because the orders can only be listed by the time they were created, and
+- the stored orders that may still change by their identifiers,
+  those that are not manifested and were created within track_for,
+
+and yields an OrderEvent for each order that was inserted, updated or deleted:
+
+    store = OrderStore("orders.db")
+    for event in api.sync_orders(store):
+        warehouse.apply(event.kind, event.order)
+
+The orders of a page are stored once the events of the page were consumed.
+A sync that is interrupted resumes with the continuation token of its last page,
+so an event may be yielded again but is not lost.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Iterator, Literal, NamedTuple, Optional, Sequence
+
+import click_and_drop_api
+
+Order = click_and_drop_api.GetOrderDetailsResource
+
+REFRESH_BATCH = 500
+"""The number of stored orders that are requested again at once."""
+
+
+class OrderEvent(NamedTuple):
+    """An order that changed since the last sync."""
+
+    kind: Literal["insert", "update", "delete"]
+    """Whether the order is new, changed or no longer exists."""
+
+    order: Order
+    """The order, the last stored version if it was deleted."""
+
+
+class SyncCheckpoint(NamedTuple):
+    """The high-water marks of the stored orders and the window of the current sync."""
+
+    created_on: Optional[datetime]
+    """The newest creation time of the stored orders."""
+
+    printed_on: Optional[datetime]
+    """The newest print time of the stored orders."""
+
+    shipped_on: Optional[datetime]
+    """The newest shipping time of the stored orders."""
+
+    manifested_on: Optional[datetime]
+    """The newest manifest time of the stored orders."""
+
+    start: Optional[datetime]
+    """The lower bound of the orders listed by an unfinished sync."""
+
+    end: Optional[datetime]
+    """The upper bound of the orders listed by an unfinished sync."""
+
+    continuation_token: Optional[str]
+    """The token of the next page of an unfinished sync."""
+
+
+def _utc(value: datetime) -> datetime:
+    """Return the datetime in UTC if it has no time zone, not in local time."""
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value
+
+
+def _timestamp(value: Optional[datetime]) -> Optional[float]:
+    return None if value is None else _utc(value).timestamp()
+
+
+def _datetime(value: Optional[float]) -> Optional[datetime]:
+    return None if value is None else datetime.fromtimestamp(value, timezone.utc)
+
+
+class _Row(NamedTuple):
+    """An order as it is stored."""
+
+    identifier: int
+    reference: Optional[str]
+    created_on: Optional[float]
+    printed_on: Optional[float]
+    shipped_on: Optional[float]
+    manifested_on: Optional[float]
+    seen_at: float
+    fingerprint: str
+    data: str
+
+
+class OrderStore:
+    """Keep the synced orders and the checkpoint of the sync in a SQLite database.
+
+    A database file survives restarts, so the next sync continues where it stopped.
+    All methods are safe to use from several threads.
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        """Open a store.
+
+        Parameters:
+            path: The path of the database file.
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS orders (
+                identifier INTEGER PRIMARY KEY,
+                reference TEXT,
+                created_on REAL,
+                printed_on REAL,
+                shipped_on REAL,
+                manifested_on REAL,
+                seen_at REAL NOT NULL,
+                fingerprint TEXT NOT NULL,
+                data TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS orders_created_on ON orders (created_on);
+            CREATE TABLE IF NOT EXISTS checkpoint (
+                id INTEGER PRIMARY KEY CHECK (id = 0),
+                start REAL,
+                "end" REAL NOT NULL,
+                continuation_token TEXT
+            );
+            """
+        )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute("SELECT count(*) FROM orders").fetchone()[0]
+
+    def close(self) -> None:
+        """Close the database."""
+        self._connection.close()
+
+    def get(self, order_identifier: int) -> Optional[Order]:
+        """Return the stored order with this Order Identifier or None."""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT data FROM orders WHERE identifier = ?", (order_identifier,)
+            ).fetchone()
+        return None if row is None else Order.from_json(row[0])
+
+    @property
+    def checkpoint(self) -> SyncCheckpoint:
+        """The high-water marks and the window of an unfinished sync."""
+        with self._lock:
+            marks = self._connection.execute(
+                "SELECT max(created_on), max(printed_on), max(shipped_on),"
+                " max(manifested_on) FROM orders"
+            ).fetchone()
+            window = self._connection.execute(
+                'SELECT start, "end", continuation_token FROM checkpoint'
+            ).fetchone()
+        start, end, continuation_token = window or (None, None, None)
+        return SyncCheckpoint(
+            *map(_datetime, marks), _datetime(start), _datetime(end), continuation_token
+        )
+
+    def start_window(self, start: Optional[datetime], end: datetime) -> None:
+        """Record the window of a new sync before its first page is requested."""
+        with self._lock:
+            with self._connection:
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO checkpoint VALUES (0, ?, ?, NULL)",
+                    (_timestamp(start), _timestamp(end)),
+                )
+
+    def compare(
+        self, orders: list[Order], seen_at: datetime
+    ) -> tuple[list[OrderEvent], list[_Row]]:
+        """Return the events of the orders and the rows to store for them.
+
+        Orders without an Order Identifier cannot be stored and are skipped.
+        """
+        rows = {}
+        for order in orders:
+            if order.order_identifier is None:
+                continue
+            data = order.model_dump_json(by_alias=True, exclude_none=True)
+            rows[order.order_identifier] = (
+                order,
+                _Row(
+                    order.order_identifier,
+                    order.order_reference,
+                    _timestamp(order.created_on),
+                    _timestamp(order.printed_on),
+                    _timestamp(order.shipped_on),
+                    _timestamp(order.manifested_on),
+                    _timestamp(seen_at),
+                    hashlib.blake2b(data.encode(), digest_size=16).hexdigest(),
+                    data,
+                ),
+            )
+        if not rows:
+            return [], []
+        with self._lock:
+            stored = dict(
+                self._connection.execute(
+                    "SELECT identifier, fingerprint FROM orders"
+                    f" WHERE identifier IN ({','.join('?' * len(rows))})",
+                    list(rows),
+                ).fetchall()
+            )
+        events = [
+            OrderEvent("update" if identifier in stored else "insert", order)
+            for identifier, (order, row) in rows.items()
+            if stored.get(identifier) != row.fingerprint
+        ]
+        return events, [row for _, row in rows.values()]
+
+    def commit(
+        self,
+        rows: list[_Row],
+        deleted: Sequence[int] = (),
+        continuation_token: Optional[str] = None,
+    ) -> None:
+        """Store the rows, remove the deleted orders and advance the checkpoint.
+
+        Parameters:
+            rows: The orders of a page as returned by compare().
+            deleted: The Order Identifiers of the orders that no longer exist.
+            continuation_token:
+                The token of the next page of the window,
+                None if the window is finished.
+        """
+        with self._lock:
+            with self._connection:
+                self._connection.executemany(
+                    "INSERT OR REPLACE INTO orders VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+                self._connection.executemany(
+                    "DELETE FROM orders WHERE identifier = ?",
+                    [(identifier,) for identifier in deleted],
+                )
+                if continuation_token is None:
+                    self._connection.execute("DELETE FROM checkpoint")
+                else:
+                    self._connection.execute(
+                        "UPDATE checkpoint SET continuation_token = ?",
+                        (continuation_token,),
+                    )
+
+    def open_orders(
+        self, seen_before: datetime, created_after: datetime
+    ) -> list[tuple[int, Order]]:
+        """Return the orders that may still change by their Order Identifiers.
+
+        Parameters:
+            seen_before: Orders that were requested since are skipped.
+            created_after: Older orders are not expected to change anymore.
+        """
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT identifier, data FROM orders WHERE manifested_on IS NULL"
+                " AND seen_at < ? AND (created_on IS NULL OR created_on >= ?)"
+                " ORDER BY identifier",
+                (_timestamp(seen_before), _timestamp(created_after)),
+            ).fetchall()
+        return [(identifier, Order.from_json(data)) for identifier, data in rows]
+
+    def clear(self) -> None:
+        """Remove all orders and the checkpoint."""
+        with self._lock:
+            with self._connection:
+                self._connection.execute("DELETE FROM orders")
+                self._connection.execute("DELETE FROM checkpoint")
+
+
+GetPage = Callable[
+    [Optional[datetime], datetime, Optional[str]],
+    click_and_drop_api.GetOrdersDetailsResponse,
+]
+GetOrders = Callable[[list[int]], list[Order]]
+
+
+def sync_orders(
+    store: OrderStore,
+    get_page: GetPage,
+    get_orders: GetOrders,
+    start: Optional[datetime],
+    end: datetime,
+    overlap: timedelta,
+    track_for: timedelta,
+) -> Iterator[OrderEvent]:
+    """Yield the events of the orders that changed since the last sync.
+
+    The orders are listed from the newest stored creation time minus overlap to end.
+    An unfinished sync is resumed with its window and continuation token instead.
+    The stored orders that were not listed, are not manifested
+    and were created within track_for before end are then requested again.
+    Those that no longer exist are deleted.
+    Dates and times without a time zone are in UTC.
+
+    Parameters:
+        store: The orders of the previous syncs.
+        get_page: Return the page from start to end for a continuation token.
+        get_orders: Return the orders with these Order Identifiers that exist.
+        start: Date and time lower bound for the orders if the store is empty.
+        end: Date and time upper bound for the orders.
+        overlap:
+            The time before the newest stored order that is listed again
+            for orders that appear late.
+        track_for: How long after their creation orders are requested again.
+    """
+    if start is not None:
+        start = _utc(start)
+    end = _utc(end)
+    checkpoint = store.checkpoint
+    continuation_token = checkpoint.continuation_token
+    if checkpoint.end is None:
+        if checkpoint.created_on is not None:
+            start = checkpoint.created_on - overlap
+        store.start_window(start, end)
+    else:
+        start, end = checkpoint.start, checkpoint.end
+    while True:
+        page = get_page(start, end, continuation_token)
+        events, rows = store.compare(page.orders or [], seen_at=end)
+        yield from events
+        continuation_token = page.continuation_token or None
+        store.commit(rows, continuation_token=continuation_token)
+        if continuation_token is None:
+            break
+    stored = store.open_orders(seen_before=end, created_after=end - track_for)
+    for batch in range(0, len(stored), REFRESH_BATCH):
+        requested = dict(stored[batch : batch + REFRESH_BATCH])
+        orders = get_orders(list(requested))
+        for order in orders:
+            requested.pop(order.order_identifier, None)
+        events, rows = store.compare(orders, seen_at=end)
+        yield from events
+        for order in requested.values():
+            yield OrderEvent("delete", order)
+        store.commit(rows, deleted=list(requested))
+
+
+__all__ = [
+    "OrderStore",
+    "OrderEvent",
+    "SyncCheckpoint",
+    "sync_orders",
+    "REFRESH_BATCH",
+]
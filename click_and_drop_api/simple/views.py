@@ -0,0 +1,365 @@
+"""Read orders without validating every field up front.
+
+Deserializing a page of orders validates each field of each order
+and keeps the values in pydantic models, several kilobytes per order.
+A ModelView wraps the parsed JSON of a response instead
+and validates a field only when it is accessed.
+The fields have the same names and types as those of the model:
+
+    for order in api.iter_orders_with_details(lightweight=True):
+        print(order.order_reference, order.shipping_info.country_code)
+
+A view is read-only.
+A field that does not match the model raises a pydantic.ValidationError
+when it is accessed, not when the page is received.
+to_model() validates the whole order and returns the pydantic model.
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+from typing import (
+    Annotated,
+    Any,
+    ClassVar,
+    NamedTuple,
+    Optional,
+    Union,
+    get_args,
+    get_origin,
+)
+
+from pydantic import BaseModel, TypeAdapter, ValidationError, create_model
+
+from click_and_drop_api import metrics, models
+from click_and_drop_api.models import (
+    CreatePackagesResponse,
+    GetOrderDetailsResource,
+    GetOrderInfoResource,
+    GetOrderLineResult,
+    GetOrdersDetailsResponse,
+    GetOrdersResponse,
+    GetPostalDetailsResult,
+    GetShippingDetailsResult,
+    GetTagDetailsResult,
+)
+
+_view_types: dict[type[BaseModel], type[ModelView]] = {}
+
+_MISSING = object()
+
+
+class _FieldReader(NamedTuple):
+    """How to read a field of a model from the JSON of the model."""
+
+    name: str
+    """The name of the field."""
+
+    alias: str
+    """The key of the field in the JSON."""
+
+    adapter: Optional[TypeAdapter]
+    """Validate the value of a field that is not a model."""
+
+    validator: type[BaseModel]
+    """A model with only this field.
+
+    It reports the errors with the alias of the field
+    and validates the values that the fast paths do not handle.
+    """
+
+    view: Optional[type[ModelView]]
+    """The view of the nested model or the models in the list of the field."""
+
+    is_list: bool
+    """Whether the field is a list of models."""
+
+    def read(self, data: dict[str, Any]) -> Any:
+        """Validate the field of the JSON of a model and return its value."""
+        value = data.get(self.alias, _MISSING)
+        if value is not _MISSING:
+            if self.adapter is not None:
+                try:
+                    return self.adapter.validate_python(value)
+                except ValidationError:
+                    pass
+            elif self.is_list:
+                if isinstance(value, list) and all(
+                    isinstance(item, dict) for item in value
+                ):
+                    return [self.view(item) for item in value]  # type: ignore[misc]
+            elif isinstance(value, dict):
+                return self.view(value)  # type: ignore[misc]
+        value = getattr(self.validator.model_validate(data), self.name)
+        if self.view is None or value is None:
+            return value
+        if self.is_list:
+            return [None if item is None else self.view(item) for item in value]
+        return self.view(value)
+
+
+def _nested_model(annotation: Any) -> tuple[Optional[type[BaseModel]], bool]:
+    """Return the model of an annotation and whether it is a list of that model."""
+    if get_origin(annotation) is Union:
+        arguments = [
+            argument for argument in get_args(annotation) if argument is not type(None)
+        ]
+        if len(arguments) != 1:
+            return None, False
+        annotation = arguments[0]
+    is_list = get_origin(annotation) is list
+    if is_list:
+        annotation = get_args(annotation)[0]
+        if get_origin(annotation) is Union:
+            arguments = get_args(annotation)
+            annotation = arguments[0] if len(arguments) == 2 else None
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation, is_list
+    return None, False
+
+
+def _raw_annotation(annotation: Any) -> Any:
+    """Replace the models in an annotation with the dicts of their JSON."""
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return dict[str, Any]
+    origin = get_origin(annotation)
+    if origin is Union:
+        return Union[
+            tuple(_raw_annotation(argument) for argument in get_args(annotation))
+        ]
+    if origin is list:
+        return list[_raw_annotation(get_args(annotation)[0])]  # type: ignore[misc]
+    return annotation
+
+
+def _make_reader(model: type[BaseModel], name: str) -> _FieldReader:
+    """Create the reader of a field of a model."""
+    info = model.model_fields[name]
+    nested, is_list = _nested_model(info.annotation)
+    if nested is not None:
+        info = copy.copy(info)
+        info.annotation = _raw_annotation(info.annotation)
+    validator = create_model(  # type: ignore[call-overload]
+        model.__name__, __config__=model.model_config, **{name: (info.annotation, info)}
+    )
+    adapter = None
+    if nested is None:
+        annotation = info.annotation
+        if info.metadata:
+            annotation = Annotated[(annotation, *info.metadata)]
+        adapter = TypeAdapter(annotation)
+    return _FieldReader(
+        name=name,
+        alias=info.alias or name,
+        adapter=adapter,
+        validator=validator,
+        view=None if nested is None else view_type(nested),
+        is_list=is_list,
+    )
+
+
+class _Field:
+    """A field of a view that validates its value in the JSON on first access."""
+
+    __slots__ = ("model", "name", "reader")
+
+    def __init__(self, model: type[BaseModel], name: str):
+        self.model = model
+        self.name = name
+        self.reader: Optional[_FieldReader] = None
+
+    def __get__(self, view: Optional[ModelView], owner: Any = None) -> Any:
+        if view is None:
+            return self
+        values = view._values
+        if values is None:
+            values = {}
+            object.__setattr__(view, "_values", values)
+        elif self.name in values:
+            return values[self.name]
+        if self.reader is None:
+            self.reader = _make_reader(self.model, self.name)
+        value = values[self.name] = self.reader.read(view._data)
+        return value
+
+
+class ModelView:
+    """A read-only view of the JSON of a model that validates fields on access.
+
+    Subclasses set the model with the class keyword argument model.
+    Validated fields are kept, so each field is validated at most once.
+    """
+
+    __slots__ = ("_data", "_values")
+
+    model: ClassVar[type[BaseModel]]
+    """The pydantic model whose fields the view provides."""
+
+    def __init_subclass__(cls, model: Optional[type[BaseModel]] = None, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if model is not None:
+            cls.model = model
+            for name in model.model_fields:
+                setattr(cls, name, _Field(model, name))
+            _view_types.setdefault(model, cls)
+
+    def __init__(self, data: dict[str, Any]):
+        """Wrap the JSON of a model.
+
+        Parameters:
+            data: The parsed JSON object with the aliases of the fields as keys.
+
+        Raises:
+            TypeError: If data is not a dict.
+        """
+        if not isinstance(data, dict):
+            raise TypeError(
+                f"Expected a JSON object for {self.model.__name__}, got {data!r}."
+            )
+        object.__setattr__(self, "_data", data)
+        object.__setattr__(self, "_values", None)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is read-only.")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is read-only.")
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ModelView):
+            return NotImplemented
+        return self.model is other.model and self._data == other._data
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._data!r})"
+
+    def __reduce__(self):
+        return type(self), (self._data,)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the JSON of the model, the same dict the view wraps."""
+        return self._data
+
+    def to_model(self) -> BaseModel:
+        """Validate all fields and return the pydantic model.
+
+        Raises:
+            pydantic.ValidationError: If the JSON does not match the model.
+        """
+        return self.model.model_validate(self._data)
+
+
+def view_type(model: type[BaseModel]) -> type[ModelView]:
+    """Return the view class of a model, creating it on first use."""
+    view = _view_types.get(model)
+    if view is None:
+        view = type(
+            f"{model.__name__}View", (ModelView,), {"__slots__": ()}, model=model
+        )
+    return view
+
+
+class CreatePackagesView(ModelView, model=CreatePackagesResponse):
+    """A view of a CreatePackagesResponse."""
+
+    __slots__ = ()
+
+
+class TagView(ModelView, model=GetTagDetailsResult):
+    """A view of a GetTagDetailsResult."""
+
+    __slots__ = ()
+
+
+class OrderLineView(ModelView, model=GetOrderLineResult):
+    """A view of a GetOrderLineResult."""
+
+    __slots__ = ()
+
+
+class PostalDetailsView(ModelView, model=GetPostalDetailsResult):
+    """A view of a GetPostalDetailsResult."""
+
+    __slots__ = ()
+
+
+class ShippingDetailsView(ModelView, model=GetShippingDetailsResult):
+    """A view of a GetShippingDetailsResult."""
+
+    __slots__ = ()
+
+
+class OrderInfoView(ModelView, model=GetOrderInfoResource):
+    """A view of a GetOrderInfoResource, as listed by iter_orders()."""
+
+    __slots__ = ()
+
+
+class OrderDetailsView(ModelView, model=GetOrderDetailsResource):
+    """A view of a GetOrderDetailsResource, as listed by iter_orders_with_details()."""
+
+    __slots__ = ()
+
+
+class OrdersPageView(ModelView, model=GetOrdersResponse):
+    """A view of a page of orders, a GetOrdersResponse."""
+
+    __slots__ = ()
+
+
+class OrdersDetailsPageView(ModelView, model=GetOrdersDetailsResponse):
+    """A view of a page of orders with details, a GetOrdersDetailsResponse."""
+
+    __slots__ = ()
+
+
+def deserialize_view(
+    api_client: Any, response_data: Any, response_types_map: dict[str, Optional[str]]
+) -> ModelView:
+    """Return a view of the JSON of a response instead of its model.
+
+    Parameters:
+        api_client: The ApiClient that received the response.
+        response_data: The response, its body was read.
+        response_types_map: The response types of the operation.
+
+    Raises:
+        click_and_drop_api.exceptions.ApiException: If the status is not 2XX.
+        ValueError: If the body is not a JSON object.
+    """
+    if not 200 <= response_data.status <= 299:
+        api_client.response_deserialize(response_data, response_types_map)
+    model = getattr(models, response_types_map["200"])
+    request = (
+        metrics.response_deserializing(response_data)
+        if api_client.configuration.request_hooks
+        else None
+    )
+    try:
+        view = view_type(model)(json.loads(response_data.data))
+    except BaseException as error:
+        if request is not None:
+            metrics.response_deserialized(request, error)
+        raise
+    if request is not None:
+        metrics.response_deserialized(request)
+    return view
+
+
+__all__ = [
+    "ModelView",
+    "view_type",
+    "deserialize_view",
+    "OrderInfoView",
+    "OrderDetailsView",
+    "OrdersPageView",
+    "OrdersDetailsPageView",
+    "ShippingDetailsView",
+    "PostalDetailsView",
+    "OrderLineView",
+    "TagView",
+    "CreatePackagesView",
+]
@@ -39,11 +39,21 @@ setup(
     url="",
     keywords=["OpenAPI", "OpenAPI-Generator", "ChannelShipper & Royal Mail Public API"],
     install_requires=REQUIRES,
+    extras_require={
+        "asyncio": ["aiohttp >= 3.8.4"],
+        "numpy": ["numpy >= 1.22"],
+        "opentelemetry": ["opentelemetry-api >= 1.20"],
+        "prometheus": ["prometheus-client >= 0.17"],
+        "http2": ["httpx[http2] >= 0.26"],
+    },
     packages=find_packages(exclude=["test", "tests"]),
     include_package_data=True,
     long_description_content_type='text/markdown',
     long_description="""\
     Import your orders, retrieve your orders and generate labels.
     """,  # noqa: E501
-    package_data={"click_and_drop_api": ["py.typed"]},
+    package_data={
+        "click_and_drop_api": ["py.typed"],
+        "click_and_drop_api.simple": ["tariffs/*.csv"],
+    },
 )
\ No newline at end of file
@@ -0,0 +1,77 @@
+"""Fixtures for the hand-written tests of the simple API."""
+
+from __future__ import annotations
+
+import pytest
+
+from click_and_drop_api.mock_server import (
+    API_KEY,
+    H2MockServer,
+    MockRequest,
+    MockResponse,
+    MockServer,
+    new_order,
+    order_details,
+    order_info,
+    pages,
+)
+from click_and_drop_api.simple import ClickAndDrop, package_sizes
+from click_and_drop_api.simple.shipping_options import (
+    shipping_catalogue,
+    shipping_options,
+)
+
+
+@pytest.fixture
+def server():
+    """A local server to send requests to."""
+    server = MockServer()
+    server.start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def h2_server():
+    """A local HTTP/2 server to send requests to."""
+    pytest.importorskip("h2")
+    server = H2MockServer()
+    server.start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def api(server: MockServer) -> ClickAndDrop:
+    """A ClickAndDrop API talking to the local server."""
+    return ClickAndDrop(API_KEY, host=server.host)
+
+
+@pytest.fixture
+def restore_shipping_options():
+    """Undo the options added by a test."""
+    options = dict(shipping_options)
+    tiers = list(shipping_catalogue)
+    offered = [list(size.shipping_options) for size in package_sizes.packages_sizes]
+    yield
+    shipping_options.clear()
+    shipping_options.update(options)
+    shipping_catalogue.clear()
+    for option in tiers:
+        shipping_catalogue.add(option)
+    for size, size_options in zip(package_sizes.packages_sizes, offered):
+        size.shipping_options[:] = size_options
+    package_sizes._index_package_sizes()
+
+
+__all__ = [
+    "API_KEY",
+    "H2MockServer",
+    "MockRequest",
+    "MockResponse",
+    "MockServer",
+    "new_order",
+    "order_details",
+    "order_info",
+    "pages",
+]
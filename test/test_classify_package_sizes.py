@@ -0,0 +1,87 @@
+import random
+
+import pytest
+
+from click_and_drop_api.simple import classify_package_sizes, get_package_size
+from click_and_drop_api.simple import package_sizes
+
+
+@pytest.fixture(params=["python", "numpy"])
+def implementation(request, monkeypatch):
+    """Classify with and without NumPy."""
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+        monkeypatch.setattr(package_sizes, "NUMPY_MIN_PARCELS", 0)
+    else:
+        monkeypatch.setattr(package_sizes, "NUMPY_MIN_PARCELS", float("inf"))
+    return request.param
+
+
+@pytest.mark.parametrize(
+    ("weight", "dimensions", "expected"),
+    [
+        (1, None, "letter"),
+        (100, (5, 240, 165), "letter"),
+        (100, (6, 240, 165), "largeLetter"),
+        (1000, None, "largeLetter"),
+        (1001, (1, 1, 1), "smallParcel"),
+        (50, (460, 10, 10), "mediumParcel"),
+        (20000, (610, 460, 460), "mediumParcel"),
+        (20001, None, "largeParcel"),
+        (30000, (1500, 700, 50), "largeParcel"),
+        (30000, (1500, 700, 51), None),
+        (100, (1501, 10, 10), None),
+        (100, (1000, 1000, 1), None),
+        (30001, None, None),
+        (0, None, None),
+        (100, (-1, 10, 10), None),
+    ],
+)
+def test_classify_one_parcel(implementation, weight, dimensions, expected):
+    assert classify_package_sizes([weight], [dimensions]) == [expected]
+
+
+def test_classify_without_dimensions(implementation):
+    assert classify_package_sizes([50, 500, 1500, 15000, 25000, 35000]) == [
+        "letter",
+        "largeLetter",
+        "smallParcel",
+        "mediumParcel",
+        "largeParcel",
+        None,
+    ]
+
+
+def test_classify_with_possible_package_sizes(implementation):
+    assert classify_package_sizes(
+        [50, 1500], possible_packages_codes=["largeLetter", "mediumParcel"]
+    ) == ["largeLetter", "mediumParcel"]
+
+
+def test_classify_checks_the_number_of_dimensions(implementation):
+    with pytest.raises(ValueError):
+        classify_package_sizes([50, 60], [(1, 1, 1)])
+
+
+def test_numpy_and_python_agree(monkeypatch):
+    numpy = pytest.importorskip("numpy")
+    rng = random.Random(1)
+    weights = [rng.randint(0, 31000) for _ in range(2000)]
+    dimensions = [
+        None if rng.random() < 0.1 else tuple(rng.randint(0, 1600) for _ in range(3))
+        for _ in range(2000)
+    ]
+    monkeypatch.setattr(package_sizes, "NUMPY_MIN_PARCELS", float("inf"))
+    expected = classify_package_sizes(weights, dimensions)
+    monkeypatch.setattr(package_sizes, "NUMPY_MIN_PARCELS", 0)
+    assert classify_package_sizes(weights, dimensions) == expected
+    array = numpy.array([d or (0, 0, 0) for d in dimensions])
+    assert classify_package_sizes(numpy.array(weights), array) == expected
+
+
+def test_dimensions_can_be_shipped_as_large_parcel():
+    package = get_package_size("largeParcel")
+    assert package.dimensions_can_be_shipped(1500, 700, 50)
+    assert package.dimensions_can_be_shipped(50, 1500, 700)
+    assert not package.dimensions_can_be_shipped(1500, 700, 51)
+    assert not package.dimensions_can_be_shipped(1501, 1, 1)
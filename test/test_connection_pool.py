@@ -0,0 +1,124 @@
+"""API objects share the connections of a pool."""
+
+import socket
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from click_and_drop_api.simple import (
+    ClickAndDrop,
+    ConnectionPool,
+    PoolOptions,
+    close_shared_connection_pools,
+    shared_connection_pool,
+)
+from click_and_drop_api.simple import pool as pool_module
+
+from .conftest import API_KEY, order_info
+
+OTHER_KEY = "ffffffff-bbbb-cccc-dddd-eeeeeeeeeeee"
+
+
+@pytest.fixture(autouse=True)
+def forget_shared_pools():
+    yield
+    close_shared_connection_pools()
+
+
+@pytest.fixture
+def orders(server):
+    server.route("GET", "/orders/([^/]+)", body=[order_info(1)])
+
+
+def connections(pool: ConnectionPool) -> int:
+    """The number of connections the pool opened to its host."""
+    return pool.pool_manager.connection_from_url(pool.host).num_connections
+
+
+def test_api_objects_share_the_pool(server, orders):
+    pool = ConnectionPool(server.host)
+    apis = [
+        ClickAndDrop(API_KEY, host=server.host, connection_pool=pool) for _ in range(3)
+    ]
+    for api in apis:
+        assert api._api_client.rest_client.pool_manager is pool.pool_manager
+        api.get_orders([1])
+    assert connections(pool) == 1
+
+
+def test_api_objects_have_their_own_connections_by_default(server):
+    first = ClickAndDrop(API_KEY, host=server.host)
+    second = ClickAndDrop(API_KEY, host=server.host)
+    assert (
+        first._api_client.rest_client.pool_manager
+        is not second._api_client.rest_client.pool_manager
+    )
+
+
+def test_close_keeps_a_shared_pool_open(server, orders):
+    pool = ConnectionPool(server.host)
+    with ClickAndDrop(API_KEY, host=server.host, connection_pool=pool) as api:
+        api.get_orders([1])
+    assert pool.pool_manager.pools
+    with ClickAndDrop(API_KEY, host=server.host) as api:
+        api.get_orders([1])
+    assert not api._api_client.rest_client.pool_manager.pools
+
+
+def test_prewarm(server, orders):
+    pool = ConnectionPool(server.host, PoolOptions(maxsize=4))
+    assert pool.prewarm(3) == 3
+    assert connections(pool) == 3
+    assert pool.prewarm(3) == 0
+    api = ClickAndDrop(API_KEY, host=server.host, connection_pool=pool, max_workers=3)
+    with ThreadPoolExecutor(3) as executor:
+        list(executor.map(lambda _: api.get_orders([1]), range(30)))
+    assert connections(pool) <= 4
+
+
+def test_prewarm_at_most_maxsize(server):
+    pool = ConnectionPool(server.host, PoolOptions(maxsize=2))
+    assert pool.prewarm(5) == 2
+
+
+def test_options(server):
+    pool = ConnectionPool(
+        server.host, PoolOptions(maxsize=3, block=True, keep_alive=30)
+    )
+    connection_pool = pool.pool_manager.connection_from_url(server.host)
+    assert connection_pool.block
+    assert connection_pool.pool.maxsize == 3
+    socket_options = pool.pool_manager.connection_pool_kw["socket_options"]
+    assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in socket_options
+
+
+def test_no_keep_alive(server):
+    pool = ConnectionPool(server.host, PoolOptions(keep_alive=None))
+    assert "socket_options" not in pool.pool_manager.connection_pool_kw
+
+
+def test_shared_pool_per_key_and_host(server):
+    pool = shared_connection_pool(API_KEY, server.host)
+    assert shared_connection_pool(API_KEY, server.host) is pool
+    assert shared_connection_pool(OTHER_KEY, server.host) is not pool
+    assert shared_connection_pool(API_KEY) is not pool
+
+
+def test_shared_pool_with_other_options(server):
+    shared_connection_pool(API_KEY, server.host, PoolOptions(maxsize=2))
+    shared_connection_pool(API_KEY, server.host)
+    with pytest.raises(ValueError):
+        shared_connection_pool(API_KEY, server.host, PoolOptions(maxsize=3))
+
+
+def test_shared_pool_is_prewarmed_once(server):
+    pool = shared_connection_pool(API_KEY, server.host, prewarm=2)
+    assert connections(pool) == 2
+    shared_connection_pool(API_KEY, server.host, prewarm=2)
+    assert connections(pool) == 2
+
+
+def test_forked_process_has_no_shared_pools(server):
+    pool = shared_connection_pool(API_KEY, server.host)
+    pool_module._forget_shared_pools()
+    assert shared_connection_pool(API_KEY, server.host) is not pool
@@ -0,0 +1,107 @@
+"""Responses are deserialized with compiled, cached deserializers."""
+
+import datetime
+import decimal
+import json
+
+import pytest
+import urllib3
+
+from click_and_drop_api import ApiClient, Configuration
+from click_and_drop_api.api_client import json_type_adapter
+from click_and_drop_api.models import GetOrderDetailsResource, GetOrdersResponse
+from click_and_drop_api.rest import RESTResponse
+
+from .conftest import order_details, order_info
+
+ORDERS = {"orders": [order_info(1), order_info(2)], "continuationToken": "2"}
+
+
+@pytest.fixture
+def client():
+    return ApiClient(Configuration())
+
+
+def response(body, status=200, content_type="application/json"):
+    """A RESTResponse that was read."""
+    data = body if isinstance(body, bytes) else json.dumps(body).encode()
+    result = RESTResponse(
+        urllib3.HTTPResponse(
+            data, headers={"Content-Type": content_type}, status=status
+        )
+    )
+    result.read()
+    return result
+
+
+def test_fast_path_equals_from_dict(client):
+    data = client.response_deserialize(
+        response(ORDERS), {"200": "GetOrdersResponse"}
+    ).data
+    assert data == GetOrdersResponse.from_dict(ORDERS)
+
+
+def test_list_of_models(client):
+    body = [order_details(1), order_details(2)]
+    data = client.response_deserialize(
+        response(body), {"200": "List[GetOrderDetailsResource]"}
+    ).data
+    assert data == [GetOrderDetailsResource.from_dict(order) for order in body]
+
+
+@pytest.mark.parametrize(
+    ("response_type", "has_adapter"),
+    [
+        ("GetOrdersResponse", True),
+        ("List[GetOrderInfoResource]", True),
+        ("str", False),
+        ("Dict[str, int]", False),
+        ("bytearray", False),
+        ("Unknown", False),
+    ],
+)
+def test_type_adapters(response_type, has_adapter):
+    assert (json_type_adapter(response_type) is not None) == has_adapter
+
+
+def test_type_adapters_are_cached():
+    assert json_type_adapter("GetOrdersResponse") is json_type_adapter(
+        "GetOrdersResponse"
+    )
+
+
+def test_other_charsets_are_decoded(client):
+    body = json.dumps({"orders": [order_info(1, "ä")]}).encode("latin-1")
+    data = client.response_deserialize(
+        response(body, content_type="application/json; charset=latin-1"),
+        {"200": "GetOrdersResponse"},
+    ).data
+    assert data.orders[0].order_reference == "ä"
+
+
+def test_deserializers_are_compiled_once(client):
+    text = json.dumps([order_info(1), None, order_info(2)])
+    first = client.deserialize(text, "List[GetOrderInfoResource]", None)
+    assert first[1] is None
+    assert first[2].order_identifier == 2
+    deserializers = dict(client._deserializers)
+    assert set(deserializers) == {
+        "List[GetOrderInfoResource]",
+        "GetOrderInfoResource",
+    }
+    client.deserialize(text, "List[GetOrderInfoResource]", None)
+    assert client._deserializers == deserializers
+
+
+@pytest.mark.parametrize(
+    ("value", "response_type", "expected"),
+    [
+        ({"a": 1, "b": None}, "Dict[str, int]", {"a": 1, "b": None}),
+        ([1, 2], "List[float]", [1.0, 2.0]),
+        ("2026-01-02", "date", datetime.date(2026, 1, 2)),
+        ({"any": "thing"}, "object", {"any": "thing"}),
+        ("1.5", "decimal", decimal.Decimal("1.5")),
+    ],
+)
+def test_native_types(client, value, response_type, expected):
+    assert client.deserialize(json.dumps(value), response_type, None) == expected
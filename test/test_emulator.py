@@ -0,0 +1,302 @@
+"""The emulator behaves like the Click & Drop API with state."""
+
+import base64
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from click_and_drop_api import ManifestsApi
+from click_and_drop_api.emulator import (
+    Emulator,
+    EmulatorOptions,
+    decode_continuation_token,
+    encode_continuation_token,
+    parse_order_identifiers,
+    pdf,
+)
+from click_and_drop_api.exceptions import (
+    ApiException,
+    BadRequestException,
+    NotFoundException,
+    ServiceException,
+    UnauthorizedException,
+)
+from click_and_drop_api.models import UpdateOrderStatusRequest
+from click_and_drop_api.simple import ClickAndDrop, CreateOrder, RetryPolicy
+
+from .conftest import API_KEY, new_order
+
+NO_RETRY = RetryPolicy(total=0)
+START = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+class Clock:
+    """A clock that advances one minute per call."""
+
+    def __init__(self):
+        self.now = START
+
+    def __call__(self):
+        self.now += timedelta(minutes=1)
+        return self.now
+
+
+@pytest.fixture
+def emulator():
+    return Emulator(clock=Clock())
+
+
+@pytest.fixture
+def api(emulator):
+    return ClickAndDrop(API_KEY, transport=emulator.transport, retry_policy=NO_RETRY)
+
+
+def postage_order(reference: str, service_code: str = "OLP2") -> CreateOrder:
+    """An order with postage and a package."""
+    order = new_order(reference).to_dict()
+    order["postageDetails"] = {"serviceCode": service_code, "carrierName": "Royal Mail"}
+    order["packages"] = [
+        {
+            "weightInGrams": 120,
+            "packageFormatIdentifier": "largeLetter",
+            "contents": [{"name": "Book", "SKU": "B1", "quantity": 2, "unitValue": 5}],
+        }
+    ]
+    return CreateOrder.from_dict(order)
+
+
+def test_create_and_get_orders(api):
+    response = api.create_orders([postage_order("a"), postage_order('b;/"c')])
+    assert response.success_count == 2
+    identifiers = [order.order_identifier for order in response.created_orders]
+    orders = api.get_orders(['b;/"c', identifiers[0], 9999])
+    assert [order.order_identifier for order in orders] == identifiers[::-1]
+    assert orders[0].order_reference == 'b;/"c'
+
+
+def test_order_details(api):
+    (created,) = api.create_orders([postage_order("a")]).created_orders
+    (order,) = api.iter_orders_with_details()
+    assert order.order_identifier == created.order_identifier
+    assert order.order_status == "new"
+    assert order.weight_in_grams == 120
+    assert order.shipping_details.service_code == "OLP2"
+    assert order.shipping_info.first_name == "Jane"
+    assert order.order_lines[0].line_total == 10
+
+
+def test_duplicate_reference_fails(api):
+    api.create_order(new_order("a"))
+    response = api.create_orders([new_order("a")])
+    assert response.errors_count == 1
+    (error,) = response.failed_orders[0].errors
+    assert error.fields[0].value == "a"
+
+
+def test_invalid_order_fails(emulator):
+    status, _, body = emulator.handle(
+        "POST",
+        "/api/v1/orders",
+        {"Authorization": API_KEY},
+        b'{"items": [{"orderReference": "a"}]}',
+    )
+    assert status == 200
+    assert b'"errorsCount": 1' in body
+    assert b"orderDate" in body
+
+
+def test_delete_orders(api, emulator):
+    api.create_orders([new_order("a"), new_order("b")])
+    response = api.delete_orders(["a", 4242])
+    assert [order.order_reference for order in response.deleted_orders] == ["a"]
+    assert [error.code for error in response.errors] == ["OrderNotFound"]
+    assert [order.order_reference for order in emulator.orders.values()] == ["b"]
+    api.create_order(new_order("a"))
+
+
+@pytest.mark.parametrize("page_size", [1, 2, 25])
+def test_pagination(api, page_size):
+    api.create_orders([new_order(f"ref-{i}") for i in range(7)])
+    orders = list(api.iter_orders(page_size=page_size))
+    assert [order.order_reference for order in orders] == [f"ref-{i}" for i in range(7)]
+
+
+def test_pagination_by_creation_time(api):
+    for i in range(6):
+        api.create_order(new_order(f"ref-{i}"))
+    # the orders are created one minute apart
+    orders = list(
+        api.iter_orders(
+            START + timedelta(minutes=2), START + timedelta(minutes=4), page_size=1
+        )
+    )
+    assert [order.order_reference for order in orders] == ["ref-1", "ref-2", "ref-3"]
+
+
+def test_export_orders_with_details(api):
+    api.create_orders([new_order(f"ref-{i}") for i in range(30)])
+    orders = api.export_orders_with_details(
+        START, START + timedelta(hours=1), windows=4, page_size=3
+    )
+    assert sorted(order.order_reference for order in orders) == sorted(
+        f"ref-{i}" for i in range(30)
+    )
+
+
+def test_invalid_continuation_token(emulator):
+    status, _, _ = emulator.handle(
+        "GET",
+        "/api/v1/orders?continuationToken=nope",
+        {"Authorization": API_KEY},
+        b"",
+    )
+    assert status == 400
+
+
+def test_label(api, emulator):
+    (created,) = api.create_orders([postage_order("a")]).created_orders
+    assert created.tracking_number is None
+    label = api.get_label("a", "postageLabel", include_returns_label=True)
+    assert bytes(label).startswith(b"%PDF-1.4")
+    assert b"/Count 2" in label
+    order = api.get_order("a")
+    assert order.tracking_number
+    assert order.printed_on
+    assert emulator.orders[order.order_identifier].status == "labelGenerated"
+
+
+def test_label_in_create_response(api):
+    order = postage_order("a").to_dict()
+    order["label"] = {"includeLabelInResponse": True}
+    (created,) = api.create_orders([CreateOrder.from_dict(order)]).created_orders
+    assert base64.b64decode(created.label).startswith(b"%PDF")
+    assert created.generated_documents == ["postageLabel"]
+    assert created.tracking_number
+
+
+def test_label_needs_postage(api):
+    api.create_order(new_order("a"))
+    with pytest.raises(BadRequestException):
+        api.get_label("a", "postageLabel", include_returns_label=False)
+
+
+def test_label_of_unknown_order(api):
+    with pytest.raises(NotFoundException):
+        api.get_label(1, "despatchNote")
+
+
+def test_manifest(api, emulator):
+    api.create_orders([postage_order("a"), postage_order("b"), postage_order("c")])
+    api.get_label(["a", "b"], "postageLabel", include_returns_label=False)
+    manifests = ManifestsApi(api._api_client)
+    manifest = manifests.manifest_eligible_async()
+    assert base64.b64decode(manifest.document_pdf).startswith(b"%PDF")
+    number = int(manifest.manifest_number)
+    assert emulator.manifests[number].order_identifiers == [1001, 1002]
+    assert api.get_order("a").manifested_on
+    assert manifests.get_manifest_async(number).status == "Completed"
+    assert manifests.retry_manifest_async(number).manifest_number == number
+    with pytest.raises(BadRequestException):
+        manifests.manifest_eligible_async()
+    with pytest.raises(NotFoundException):
+        manifests.get_manifest_async(number + 1)
+
+
+def test_update_orders_status(api):
+    api.create_orders([postage_order("a"), postage_order("b")])
+    api.get_label(["a", "b"], "postageLabel", include_returns_label=False)
+    response = api.update_orders_status(
+        [
+            UpdateOrderStatusRequest(order_reference="a", status="new"),
+            UpdateOrderStatusRequest(order_reference="b", status="despatched"),
+            UpdateOrderStatusRequest(
+                order_reference="b",
+                status="despatchedByOtherCourier",
+                tracking_number="T1",
+            ),
+            UpdateOrderStatusRequest(order_identifier=1, order_reference="b"),
+            UpdateOrderStatusRequest(order_identifier=9999, status="despatched"),
+        ]
+    )
+    assert [order.status for order in response.updated_orders] == [
+        "new",
+        "despatched",
+    ]
+    assert [error.code for error in response.errors] == [
+        "MissingField",
+        "InvalidIdentifier",
+        "OrderNotFound",
+    ]
+    assert api.get_order("a").tracking_number is None
+    assert api.get_order("b").shipped_on
+
+
+def test_version_needs_no_key():
+    emulator = Emulator(EmulatorOptions(key=API_KEY))
+    api = ClickAndDrop(API_KEY[::-1], transport=emulator.transport)
+    assert api.get_version().release
+    with pytest.raises(UnauthorizedException):
+        api.get_order(1)
+
+
+def test_throttling():
+    emulator = Emulator(EmulatorOptions(rate_limit=1, burst=2))
+    api = ClickAndDrop(API_KEY, transport=emulator.transport, retry_policy=NO_RETRY)
+    api.get_orders([1])
+    api.get_orders([1])
+    with pytest.raises(ApiException) as error:
+        api.get_orders([1])
+    assert error.value.status == 429
+    assert error.value.headers["Retry-After"] == "1"
+
+
+def test_injected_errors_are_retried(emulator):
+    api = ClickAndDrop(
+        API_KEY,
+        transport=emulator.transport,
+        retry_policy=RetryPolicy(backoff_factor=0),
+    )
+    emulator.inject_errors(2, status=503)
+    assert api.get_orders([1]) == []
+    assert emulator.requests == 3
+
+
+def test_error_rate():
+    emulator = Emulator(EmulatorOptions(error_rate=0.5, seed=1))
+    api = ClickAndDrop(API_KEY, transport=emulator.transport, retry_policy=NO_RETRY)
+    failures = 0
+    for _ in range(100):
+        try:
+            api.get_orders([1])
+        except ServiceException:
+            failures += 1
+    assert 30 < failures < 70
+
+
+def test_http_server():
+    with Emulator(EmulatorOptions(latency=0.01)) as emulator:
+        api = ClickAndDrop(API_KEY, host=emulator.host)
+        api.create_orders([postage_order(f"ref-{i}") for i in range(3)])
+        assert len(api.get_labels([1001, 1002, 1003], "despatchNote")) == 1
+        assert len(list(api.iter_orders(page_size=2))) == 3
+    with pytest.raises(RuntimeError):
+        emulator.host
+
+
+def test_parse_order_identifiers():
+    assert parse_order_identifiers("1001;%22a%253Bb%22;%22%22") == [1001, "a;b", ""]
+    with pytest.raises(ValueError):
+        parse_order_identifiers("abc")
+
+
+def test_continuation_token():
+    assert decode_continuation_token(encode_continuation_token(1234)) == 1234
+
+
+def test_pdf():
+    document = pdf([["Hello (world)"], ["Page 2"]])
+    assert document.startswith(b"%PDF-1.4\n")
+    assert document.endswith(b"%%EOF\n")
+    assert b"Hello \\(world\\)" in document
+    startxref = int(document.split(b"startxref\n")[1].split(b"\n")[0])
+    assert document[startxref:].startswith(b"xref")
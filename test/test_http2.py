@@ -0,0 +1,145 @@
+"""Requests are multiplexed over HTTP/2 with httpx."""
+
+import gc
+import io
+import threading
+import time
+from functools import partial
+
+import pytest
+
+from click_and_drop_api.configuration import Configuration
+from click_and_drop_api.exceptions import NotFoundException
+from click_and_drop_api.simple import ClickAndDrop, ConnectionPool, RetryPolicy
+
+from .conftest import API_KEY, new_order, order_info
+
+httpx = pytest.importorskip("httpx")
+pytest.importorskip("h2")
+
+from click_and_drop_api.http2 import HTTP2RESTClientObject, timeout  # noqa: E402
+
+PRIOR_KNOWLEDGE = partial(HTTP2RESTClientObject, http1=False)
+PDF = b"%PDF-1.4\n" + bytes(range(256)) * 4096
+
+
+@pytest.fixture
+def api(h2_server):
+    return ClickAndDrop(
+        API_KEY,
+        host=h2_server.host,
+        transport=PRIOR_KNOWLEDGE,
+        retry_policy=RetryPolicy(backoff_factor=0),
+    )
+
+
+def test_get_orders(api, h2_server):
+    h2_server.route("GET", "/orders/([^/]+)", body=[order_info(1)])
+    (order,) = api.get_orders([1])
+    assert order.order_identifier == 1
+    (request,) = h2_server.requests
+    assert request.headers["authorization"] == API_KEY
+
+
+def test_create_orders(api, h2_server):
+    h2_server.route(
+        "POST",
+        "/orders",
+        body={"successCount": 1, "errorsCount": 0, "createdOrders": []},
+    )
+    api.create_orders([new_order("ref-1")])
+    (request,) = h2_server.requests
+    assert request.json()["items"][0]["orderReference"] == "ref-1"
+
+
+def test_error(api, h2_server):
+    h2_server.route("GET", "/orders/([^/]+)", status=404, body={"code": "NotFound"})
+    with pytest.raises(NotFoundException):
+        api.get_order(1)
+
+
+def test_retry(api, h2_server):
+    responses = [(429, {"code": "Error"}), [order_info(1)]]
+    h2_server.route("GET", "/orders/([^/]+)", lambda request: responses.pop(0))
+    assert len(api.get_orders([1])) == 1
+    assert len(h2_server.requests) == 2
+
+
+def test_stream_label(api, h2_server):
+    h2_server.route("GET", "/orders/(.*)/label", body=PDF)
+    file = io.BytesIO()
+    assert api.get_label_to(file, 1, "postageLabel", chunk_size=1000) == len(PDF)
+    assert file.getvalue() == PDF
+
+
+def test_concurrent_requests_share_a_connection(api, h2_server):
+    running = 0
+    most_running = 0
+    lock = threading.Lock()
+
+    def label(request):
+        nonlocal running, most_running
+        with lock:
+            running += 1
+            most_running = max(most_running, running)
+        time.sleep(0.05)
+        with lock:
+            running -= 1
+        return PDF
+
+    h2_server.route("GET", "/orders/(.*)/label", label)
+    api.get_label(1, "postageLabel")
+    labels = api.get_labels(list(range(500)), "postageLabel")
+    assert labels == [PDF] * 5
+    assert most_running == 5
+    assert h2_server.connections == 1
+
+
+def test_close(api, h2_server):
+    h2_server.route("GET", "/orders/([^/]+)", body=[order_info(1)])
+    rest_client = api._api_client.rest_client
+    _, _, (_, thread, _), _ = rest_client._close.peek()
+    with api:
+        api.get_orders([1])
+    assert rest_client.client.is_closed
+    assert rest_client._loop.is_closed()
+    assert not thread.is_alive()
+    rest_client.close()
+
+
+def test_closed_when_garbage_collected():
+    rest_client = HTTP2RESTClientObject(Configuration())
+    client, loop = rest_client.client, rest_client._loop
+    del rest_client
+    gc.collect()
+    assert client.is_closed
+    assert loop.is_closed()
+
+
+def test_falls_back_to_http1(server):
+    server.route("GET", "/orders/([^/]+)", body=[order_info(1)])
+    api = ClickAndDrop(API_KEY, host=server.host, transport=HTTP2RESTClientObject)
+    assert len(api.get_orders([1])) == 1
+
+
+def test_connection_pool_is_not_supported(server):
+    with pytest.raises(ValueError):
+        ClickAndDrop(
+            API_KEY,
+            host=server.host,
+            connection_pool=ConnectionPool(server.host),
+            transport=HTTP2RESTClientObject,
+        )
+
+
+@pytest.mark.parametrize(
+    ("request_timeout", "expected"),
+    [
+        (None, httpx.Timeout(None)),
+        (5, httpx.Timeout(5)),
+        (2.5, httpx.Timeout(2.5)),
+        ((1, 10), httpx.Timeout(None, connect=1, read=10)),
+    ],
+)
+def test_timeout(request_timeout, expected):
+    assert timeout(request_timeout) == expected
@@ -0,0 +1,118 @@
+"""The packages import their attributes on first access."""
+
+import subprocess
+import sys
+
+import pytest
+
+import click_and_drop_api
+import click_and_drop_api.api
+import click_and_drop_api.models
+import click_and_drop_api.simple
+
+
+def run(code: str) -> str:
+    """Run the code in a new interpreter and return what it prints."""
+    return subprocess.run(
+        [sys.executable, "-c", code], check=True, capture_output=True, text=True
+    ).stdout.strip()
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "import click_and_drop_api",
+        "import click_and_drop_api.models",
+        "import click_and_drop_api.simple",
+        "from click_and_drop_api.simple import ShippingQuoter, packages_sizes",
+    ],
+)
+def test_no_models_are_imported(statement):
+    modules = run(
+        f"{statement}\n"
+        "import sys\n"
+        "print(sorted(m for m in sys.modules if m.startswith('click_and_drop_api.models.')))"
+    )
+    assert modules == "[]"
+
+
+def test_no_tariff_is_loaded():
+    loaded = run(
+        "import sys, click_and_drop_api.simple\n"
+        "print(sys.modules['click_and_drop_api.simple.shipping_options']._tariff_loaded,"
+        " 'click_and_drop_api.simple.package_sizes' in sys.modules,"
+        " 'click_and_drop_api.simple.quotes' in sys.modules)"
+    )
+    assert loaded == "False False False"
+
+
+def test_package_sizes_offer_options_added_before_their_import():
+    codes = run(
+        "from decimal import Decimal as D\n"
+        "from click_and_drop_api.simple import add_shipping_option\n"
+        "add_shipping_option('Brand', 'Service', 'NEW', '24 hours',"
+        " D(20), 'GBP', '', D(0), D(1), package_sizes=['letter'])\n"
+        "from click_and_drop_api.simple import get_package_size\n"
+        "print(get_package_size('letter').get_shipping_option('NEW').service_code)"
+    )
+    assert codes == "NEW"
+
+
+def test_only_the_model_used_is_imported():
+    modules = run(
+        "import sys, click_and_drop_api\n"
+        "click_and_drop_api.GetVersionResource\n"
+        "print(sorted(m for m in sys.modules if m.startswith('click_and_drop_api.models.')))"
+    )
+    assert modules == "['click_and_drop_api.models.get_version_resource']"
+
+
+@pytest.mark.parametrize(
+    "package",
+    [
+        click_and_drop_api,
+        click_and_drop_api.api,
+        click_and_drop_api.models,
+        click_and_drop_api.simple,
+    ],
+)
+def test_all_names_are_available(package):
+    for name in package.__all__:
+        assert getattr(package, name) is not None
+        assert name in dir(package)
+
+
+def test_names_are_the_same_classes():
+    from click_and_drop_api.models.address_request import AddressRequest
+
+    assert click_and_drop_api.AddressRequest is AddressRequest
+    assert click_and_drop_api.models.AddressRequest is AddressRequest
+    assert click_and_drop_api.simple.Address is AddressRequest
+
+
+def test_star_import():
+    names = run(
+        "from click_and_drop_api import *\n"
+        "from click_and_drop_api.models import *\n"
+        "print(ApiClient.__name__, OrdersApi.__name__, GetOrderInfoResource.__name__)"
+    )
+    assert names == "ApiClient OrdersApi GetOrderInfoResource"
+
+
+def test_submodules_are_available():
+    assert run(
+        "import click_and_drop_api\nprint(click_and_drop_api.models.__name__)"
+    ) == ("click_and_drop_api.models")
+
+
+def test_shipping_options_is_the_mapping():
+    assert isinstance(click_and_drop_api.simple.shipping_options, dict)
+
+
+@pytest.mark.parametrize(
+    "package",
+    [click_and_drop_api, click_and_drop_api.models, click_and_drop_api.simple],
+)
+def test_unknown_attribute(package):
+    with pytest.raises(AttributeError, match="has no attribute 'Unknown'"):
+        package.Unknown
@@ -0,0 +1,223 @@
+"""Request hooks receive the phases, sizes and retries of each request."""
+
+import asyncio
+import io
+import logging
+
+import pytest
+
+from click_and_drop_api.exceptions import ApiException, NotFoundException
+from click_and_drop_api.metrics import RequestHook, RequestMetrics
+from click_and_drop_api.simple import AsyncClickAndDrop, ClickAndDrop, RetryPolicy
+
+from .conftest import API_KEY, new_order, order_info
+
+
+class Recorder(RequestHook):
+    """Remember the metrics passed to the hook."""
+
+    def __init__(self):
+        self.before: list[RequestMetrics] = []
+        self.after: list[RequestMetrics] = []
+
+    def before_request(self, metrics):
+        self.before.append(metrics)
+
+    def after_request(self, metrics):
+        self.after.append(metrics)
+
+
+@pytest.fixture
+def recorder():
+    return Recorder()
+
+
+@pytest.fixture
+def api(server, recorder):
+    return ClickAndDrop(
+        API_KEY,
+        host=server.host,
+        retry_policy=RetryPolicy(backoff_factor=0),
+        request_hooks=[recorder],
+    )
+
+
+def test_get_orders(api, server, recorder):
+    server.route("GET", "/orders/([^/]+)", body=[order_info(1)])
+    api.get_orders([1])
+    (before,) = recorder.before
+    (after,) = recorder.after
+    assert before.method == "GET"
+    assert before.resource_path == "/orders/{orderIdentifiers}"
+    assert before.url == server.host + "/orders/1"
+    assert before.status is None
+    assert before.started > 0
+    assert after.status == 200
+    assert after.bytes_out == 0
+    assert after.bytes_in > 0
+    assert after.retries == 0
+    assert after.error is None
+    assert after.serialize_seconds > 0
+    assert after.network_seconds > 0
+    assert after.deserialize_seconds > 0
+    assert after.seconds == pytest.approx(
+        after.serialize_seconds + after.network_seconds + after.deserialize_seconds
+    )
+
+
+def test_request_body_size(api, server, recorder):
+    server.route(
+        "POST",
+        "/orders",
+        body={"successCount": 0, "errorsCount": 0, "createdOrders": []},
+    )
+    api.create_orders([new_order()])
+    (request,) = server.requests
+    (after,) = recorder.after
+    assert after.method == "POST"
+    assert after.resource_path == "/orders"
+    assert after.bytes_out == len(request.body)
+
+
+def test_retries(api, server, recorder):
+    responses = [(429, {"code": "Error"}), [order_info(1)]]
+    server.route("GET", "/orders/([^/]+)", lambda request: responses.pop(0))
+    api.get_orders([1])
+    (after,) = recorder.after
+    assert after.status == 200
+    assert after.retries == 1
+
+
+def test_error_status(api, server, recorder):
+    server.route("GET", "/orders/([^/]+)", status=404, body={"code": "NotFound"})
+    with pytest.raises(NotFoundException):
+        api.get_order(1)
+    (after,) = recorder.after
+    assert after.status == 404
+    assert isinstance(after.error, ApiException)
+
+
+def test_connection_error(recorder):
+    api = ClickAndDrop(
+        API_KEY, host="http://127.0.0.1:1/api/v1", request_hooks=[recorder]
+    )
+    with pytest.raises(Exception) as error:
+        api.get_version()
+    (before,) = recorder.before
+    (after,) = recorder.after
+    assert before.resource_path == "/version"
+    assert after.status is None
+    assert after.error is error.value
+
+
+def test_failing_hook_is_logged(server, recorder, caplog):
+    class Failing(RequestHook):
+        def after_request(self, metrics):
+            raise RuntimeError("broken")
+
+    server.route("GET", "/orders/([^/]+)", body=[order_info(1)])
+    api = ClickAndDrop(API_KEY, host=server.host, request_hooks=[Failing(), recorder])
+    with caplog.at_level(logging.ERROR, "click_and_drop_api.metrics"):
+        assert len(api.get_orders([1])) == 1
+    assert "Failing.after_request() failed" in caplog.text
+    assert len(recorder.after) == 1
+
+
+def test_no_hooks(server):
+    server.route("GET", "/orders/([^/]+)", body=[order_info(1)])
+    api = ClickAndDrop(API_KEY, host=server.host)
+    assert api._configuration.request_hooks == []
+    assert len(api.get_orders([1])) == 1
+
+
+def test_streamed_label(api, server, recorder):
+    pdf = b"%PDF-1.4\n" + bytes(1000)
+    server.route("GET", "/orders/(.*)/label", body=pdf)
+    api.get_label_to(io.BytesIO(), 1, "postageLabel")
+    (after,) = recorder.after
+    assert after.resource_path == "/orders/{orderIdentifiers}/label"
+    assert after.status == 200
+    assert after.bytes_in == len(pdf)
+
+
+def test_async(server, recorder):
+    server.route("GET", "/orders/([^/]+)", body=[order_info(1)])
+
+    async def get_orders():
+        async with AsyncClickAndDrop(
+            API_KEY, host=server.host, request_hooks=[recorder]
+        ) as api:
+            await asyncio.gather(api.get_orders([1]), api.get_orders([2]))
+
+    asyncio.run(get_orders())
+    assert len(recorder.before) == len(recorder.after) == 2
+    assert {after.url for after in recorder.after} == {
+        server.host + "/orders/1",
+        server.host + "/orders/2",
+    }
+    for after in recorder.after:
+        assert after.resource_path == "/orders/{orderIdentifiers}"
+        assert after.status == 200
+        assert after.bytes_in > 0
+
+
+def test_prometheus(server):
+    prometheus_client = pytest.importorskip("prometheus_client")
+    from click_and_drop_api.metrics import PrometheusHook
+
+    registry = prometheus_client.CollectorRegistry()
+    server.route("GET", "/orders/([^/]+)", body=[order_info(1)])
+    api = ClickAndDrop(
+        API_KEY, host=server.host, request_hooks=[PrometheusHook(registry)]
+    )
+    api.get_orders([1])
+    labels = {"method": "GET", "resource_path": "/orders/{orderIdentifiers}"}
+    assert (
+        registry.get_sample_value(
+            "click_and_drop_request_duration_seconds_count",
+            {**labels, "status": "200"},
+        )
+        == 1
+    )
+    assert (
+        registry.get_sample_value(
+            "click_and_drop_request_phase_seconds_count",
+            {**labels, "phase": "network"},
+        )
+        == 1
+    )
+    assert (
+        registry.get_sample_value("click_and_drop_response_size_bytes_sum", labels) > 0
+    )
+
+
+def test_open_telemetry(server):
+    pytest.importorskip("opentelemetry.sdk")
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+        InMemorySpanExporter,
+    )
+    from opentelemetry.trace import SpanKind, StatusCode
+
+    from click_and_drop_api.metrics import OpenTelemetryHook
+
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    server.route("GET", "/orders/([^/]+)", status=404, body={"code": "NotFound"})
+    api = ClickAndDrop(
+        API_KEY,
+        host=server.host,
+        request_hooks=[OpenTelemetryHook(provider.get_tracer(__name__))],
+    )
+    with pytest.raises(NotFoundException):
+        api.get_order(1)
+    (span,) = exporter.get_finished_spans()
+    assert span.name == "GET /orders/{orderIdentifiers}"
+    assert span.kind == SpanKind.CLIENT
+    assert span.attributes["http.response.status_code"] == 404
+    assert span.attributes["url.full"] == server.host + "/orders/1"
+    assert span.attributes["error.type"] == "NotFoundException"
+    assert span.status.status_code == StatusCode.ERROR
+    assert span.end_time > span.start_time
@@ -0,0 +1,131 @@
+from decimal import Decimal
+
+import pytest
+
+from click_and_drop_api.simple import PackageSize, ShippingQuoter, packages_sizes
+from click_and_drop_api.simple.quotes import delivery_hours
+from click_and_drop_api.simple.shipping_options import shipping_catalogue
+
+
+@pytest.fixture(scope="module")
+def quoter():
+    return ShippingQuoter()
+
+
+def codes(quotes):
+    return [
+        None
+        if quote is None
+        else (quote.package_size.code, quote.shipping_option.service_code)
+        for quote in quotes
+    ]
+
+
+@pytest.mark.parametrize(
+    ("speed", "hours"),
+    [
+        ("24 hour (next working day)", 24),
+        ("48 hour (2 working days)", 48),
+        ("Guaranteed by 1pm next working day", 24),
+        ("Guaranteed by 10am next working day", 24),
+        ("Whenever", None),
+    ],
+)
+def test_delivery_hours(speed, hours):
+    assert delivery_hours(speed) == hours
+
+
+@pytest.mark.parametrize(
+    ("weight", "dimensions", "expected"),
+    [
+        (50, None, "letter"),
+        (50, (10, 300, 10), "largeLetter"),
+        (500, None, "largeLetter"),
+        (1500, None, "smallParcel"),
+        (5000, (400, 400, 400), "mediumParcel"),
+        (5000, (700, 10, 10), "largeParcel"),
+        (5000, (3100, 10, 10), None),
+        (25000, None, "largeParcel"),
+        (0, None, None),
+        (30001, None, None),
+    ],
+)
+def test_classify(quoter, weight, dimensions, expected):
+    index = quoter.classify(weight, dimensions)
+    assert (None if index is None else quoter.package_sizes[index].code) == expected
+
+
+def test_cheapest_matches_a_scan_of_all_options(quoter):
+    weights = [1, 100, 101, 1000, 1500, 2000, 2001, 20000, 20001]
+    for quote, weight in zip(quoter.cheapest(weights), weights):
+        fitting = [
+            size for size in packages_sizes if size.weight_can_be_shipped(weight)
+        ]
+        options = [option for size in fitting for option in size.shipping_options]
+        if not options:
+            assert quote is None
+            continue
+        assert quote.gross == min(option.gross for option in options)
+        assert quote.package_size in fitting
+        assert quote.shipping_option in quote.package_size.shipping_options
+
+
+def test_cheapest_with_requirements(quoter):
+    weights = [50, 1500, 5000]
+    fast = quoter.cheapest(weights, max_delivery_hours=24)
+    assert all(
+        delivery_hours(quote.shipping_option.delivery_speed) <= 24 for quote in fast
+    )
+    insured = quoter.cheapest(weights, min_compensation=Decimal(500))
+    assert all(quote.shipping_option.compensation >= 500 for quote in insured)
+    assert [quote.gross for quote in insured] == [
+        min(
+            tier.gross
+            for option in quote.package_size.shipping_options
+            for tier in shipping_catalogue.tiers(option.service_code)
+            if tier.compensation >= 500
+        )
+        for quote in insured
+    ]
+
+
+def test_cheapest_insured_tier(quoter):
+    (quote,) = quoter.cheapest(
+        [5000], min_compensation=Decimal(900), service_codes=["PFE24"]
+    )
+    assert quote.shipping_option == shipping_catalogue.cover("PFE24", Decimal(900))
+    assert quote.shipping_option.compensation == 1000
+    (quote,) = quoter.cheapest([5000], service_codes=["PFE24"])
+    assert quote.shipping_option.compensation == 150
+    assert quoter.cheapest(
+        [5000], min_compensation=Decimal(3000), service_codes=["PFE24"]
+    ) == [None]
+
+
+def test_cheapest_chooses_the_smallest_package_size_offering_the_service(quoter):
+    assert codes(quoter.cheapest([50, 1500], service_codes=["TOLP48"])) == [
+        ("largeLetter", "TOLP48"),
+        ("smallParcel", "TOLP48"),
+    ]
+    assert codes(quoter.cheapest([5000], service_codes=["OLP1"])) == [
+        ("mediumParcel", "OLP1")
+    ]
+
+
+def test_cheapest_returns_none_if_nothing_fits(quoter):
+    quotes = quoter.cheapest(
+        [50, 25000, 50], [None, None, (1000, 10, 10)], service_codes=["OLP2"]
+    )
+    assert quotes == [quotes[0], None, None]
+    assert quoter.cheapest([50], service_codes=[]) == [None]
+
+
+def test_cheapest_checks_the_number_of_dimensions(quoter):
+    with pytest.raises(ValueError):
+        quoter.cheapest([50, 60], [(1, 1, 1)])
+
+
+def test_custom_package_sizes():
+    letter = PackageSize.get("letter")
+    quoter = ShippingQuoter([letter.with_shipping_limited_to(["OLP1"])])
+    assert codes(quoter.cheapest([50, 500])) == [("letter", "OLP1"), None]
@@ -0,0 +1,156 @@
+"""Retry throttled and failed requests and limit the request rate."""
+
+import asyncio
+import time
+from email.utils import formatdate
+
+import pytest
+
+from click_and_drop_api.exceptions import ServiceException
+from click_and_drop_api.simple import (
+    AsyncClickAndDrop,
+    ClickAndDrop,
+    RateLimiter,
+    RetryPolicy,
+)
+from click_and_drop_api.retry import parse_retry_after
+
+from .conftest import API_KEY, new_order, order_info
+
+NO_BACKOFF = RetryPolicy(backoff_factor=0)
+
+
+def fail_first(count, status=429, headers=None):
+    """A handler that fails count times before it succeeds."""
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        if len(calls) <= count:
+            return status, {"code": "Error"}, headers or {}
+        return [order_info(1)]
+
+    return handler
+
+
+@pytest.fixture
+def api(server):
+    return ClickAndDrop(API_KEY, host=server.host, retry_policy=NO_BACKOFF)
+
+
+@pytest.mark.parametrize(
+    ("method", "status", "attempt", "expected"),
+    [
+        ("GET", 429, 0, True),
+        ("POST", 429, 0, True),
+        ("GET", 503, 0, True),
+        ("DELETE", 500, 2, True),
+        ("POST", 503, 0, False),
+        ("PUT", 500, 0, False),
+        ("GET", 400, 0, False),
+        ("GET", 429, 3, False),
+    ],
+)
+def test_is_retry(method, status, attempt, expected):
+    assert RetryPolicy().is_retry(method, status, attempt) == expected
+
+
+def test_backoff_grows_with_jitter():
+    policy = RetryPolicy(backoff_factor=1, backoff_max=5)
+    for attempt, maximum in [(0, 1), (1, 2), (2, 4), (5, 5)]:
+        delays = [policy.get_backoff(attempt) for _ in range(100)]
+        assert all(0 <= delay <= maximum for delay in delays)
+        assert len(set(delays)) > 1
+
+
+def test_retry_after_takes_precedence():
+    assert RetryPolicy().get_backoff(0, "2") == 2
+    assert RetryPolicy().get_backoff(0, "100") == 30
+    assert RetryPolicy(respect_retry_after=False).get_backoff(0, "2") <= 0.5
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [("3", 3), ("0.5", 0.5), ("-1", 0), ("Wed, 21 Oct 2015 07:28:00 GMT", 0)],
+)
+def test_parse_retry_after(header, expected):
+    assert parse_retry_after(header) == expected
+
+
+def test_parse_retry_after_date():
+    assert 8 < parse_retry_after(formatdate(time.time() + 10, usegmt=True)) <= 10
+
+
+def test_parse_malformed_retry_after():
+    assert parse_retry_after("soon") is None
+
+
+def test_throttled_request_is_retried(api, server):
+    server.route("GET", "/orders/1", fail_first(2, 429, {"Retry-After": "0"}))
+    assert api.get_order(1).order_identifier == 1
+    assert len(server.requests) == 3
+
+
+def test_give_up_after_total_retries(api, server):
+    server.route("GET", "/orders/1", fail_first(10, 503))
+    with pytest.raises(ServiceException):
+        api.get_order(1)
+    assert len(server.requests) == 4
+
+
+def test_create_orders_is_not_retried_on_server_error(api, server):
+    server.route("POST", "/orders", status=503, body={"code": "Error"})
+    with pytest.raises(ServiceException):
+        api.create_order(new_order())
+    assert len(server.requests) == 1
+
+
+def test_no_retries(server):
+    api = ClickAndDrop(API_KEY, host=server.host, retry_policy=None)
+    server.route("GET", "/orders/1", fail_first(1, 503))
+    with pytest.raises(ServiceException):
+        api.get_order(1)
+
+
+def test_rate_limiter_allows_a_burst():
+    limiter = RateLimiter(10, burst=3)
+    assert [limiter.reserve() for _ in range(3)] == [0, 0, 0]
+    assert limiter.reserve() == pytest.approx(0.1, abs=0.01)
+    assert limiter.reserve() == pytest.approx(0.2, abs=0.01)
+
+
+def test_rate_limiter_try_acquire_takes_no_token_when_throttled():
+    limiter = RateLimiter(10, burst=2)
+    assert [limiter.try_acquire() for _ in range(2)] == [0, 0]
+    assert limiter.try_acquire() == pytest.approx(0.1, abs=0.01)
+    assert limiter.try_acquire() == pytest.approx(0.1, abs=0.01)
+
+
+def test_rate_limiter_rejects_bad_rate():
+    with pytest.raises(ValueError):
+        RateLimiter(0)
+
+
+def test_rate_limit_is_shared(server):
+    server.route("GET", "/orders/1", body=[order_info(1)])
+    limiter = RateLimiter(20, burst=1)
+    apis = [ClickAndDrop(API_KEY, host=server.host, rate_limiter=limiter) for _ in "ab"]
+    start = time.monotonic()
+    for _ in range(3):
+        for api in apis:
+            api.get_order(1)
+    assert time.monotonic() - start >= 0.25
+
+
+def test_async_retry(server):
+    pytest.importorskip("aiohttp")
+    server.route("GET", "/orders/1", fail_first(2, 429, {"Retry-After": "0"}))
+
+    async def main():
+        async with AsyncClickAndDrop(
+            API_KEY, host=server.host, rate_limiter=RateLimiter(100)
+        ) as api:
+            return await api.get_order(1)
+
+    assert asyncio.run(main()).order_identifier == 1
+    assert len(server.requests) == 3
@@ -0,0 +1,50 @@
+"""Request bodies are serialized to JSON by pydantic in one pass."""
+
+import json
+
+import pytest
+
+from click_and_drop_api import ApiClient, Configuration
+from click_and_drop_api.models import CreateOrdersRequest
+
+from .conftest import new_order
+
+
+@pytest.fixture
+def client():
+    return ApiClient(Configuration())
+
+
+def without_dates(data):
+    """Remove the order dates because their time zone is written differently."""
+    for order in data["items"]:
+        assert order.pop("orderDate").startswith("2026-01-01T00:00:00")
+    return data
+
+
+def test_models_are_serialized_to_bytes(client):
+    request = CreateOrdersRequest(items=[new_order(f"ref-{i}") for i in range(3)])
+    body = client.serialize_body(request)
+    assert isinstance(body, bytes)
+    assert without_dates(json.loads(body)) == without_dates(
+        client.sanitize_for_serialization(request)
+    )
+
+
+def test_none_is_excluded(client):
+    body = json.loads(client.serialize_body(CreateOrdersRequest(items=[new_order()])))
+    assert "sender" not in body["items"][0]
+    assert "plannedDespatchDate" not in body["items"][0]
+
+
+@pytest.mark.parametrize("body", [{"a": 1}, [1, 2], "text"])
+def test_other_bodies_are_sanitized(client, body):
+    assert client.serialize_body(body) == body
+
+
+def test_created_orders_are_sent_as_json(api, server):
+    server.route("POST", "/orders", body={"successCount": 1, "createdOrders": []})
+    api.create_order(new_order("sent"))
+    (request,) = server.requests
+    assert request.headers["Content-Type"] == "application/json"
+    assert request.json()["items"][0]["orderReference"] == "sent"
@@ -1,6 +1,23 @@
-from click_and_drop_api.simple import list_service_codes, check_service_codes
-from click_and_drop_api.simple.package_sizes import PackageSize, get_package_size
-from click_and_drop_api.simple.shipping_options import ShippingOption
+import sys
+import threading
+from decimal import Decimal as D
+
+from click_and_drop_api.simple import (
+    list_service_codes,
+    check_service_codes,
+    package_sizes,
+)
+from click_and_drop_api.simple.package_sizes import (
+    PackageSize,
+    get_package_size,
+    package_sizes_supporting,
+)
+from click_and_drop_api.simple.shipping_options import (
+    ShippingCatalogue,
+    ShippingOption,
+    add_shipping_option,
+    shipping_catalogue,
+)
 import pytest
 
 
@@ -149,3 +166,205 @@ def test_negative_values_not_ok():
 def test_dimensions():
     p = PackageSize("letter", "Letter", 100, 401, 301, 501, [])
     assert p.dimensions_mm == (501, 401, 301)
+
+
+def test_get_shipping_option():
+    assert get_package_size("letter").get_shipping_option("OLP2").service_code == "OLP2"
+    assert get_package_size("letter").get_shipping_option("TOLP48") is None
+    copy = get_package_size("letter").with_shipping_limited_to(["OLP1"])
+    assert copy.get_shipping_option("OLP1").service_code == "OLP1"
+    assert copy.get_shipping_option("OLP2") is None
+
+
+def test_unknown_package_size():
+    with pytest.raises(ValueError, match="Unknown package size: 'box'"):
+        get_package_size("box")
+
+
+@pytest.mark.parametrize(
+    ("service_code", "expected"),
+    [
+        ("OLP1", ["letter", "largeLetter", "smallParcel", "mediumParcel"]),
+        ("TOLP48", ["largeLetter", "smallParcel", "mediumParcel"]),
+        ("TOLP24SFA", ["smallParcel", "mediumParcel"]),
+        ("PFE24", ["mediumParcel"]),
+        ("unknown", []),
+    ],
+)
+def test_package_sizes_supporting(service_code, expected):
+    sizes = package_sizes_supporting(service_code)
+    assert [size.code for size in sizes] == expected
+    assert all(size.get_shipping_option(service_code) for size in sizes)
+
+
+def test_add_shipping_option_to_package_sizes(restore_shipping_options):
+    add_shipping_option(
+        "Royal Mail",
+        "Test",
+        "TEST1",
+        "24 hour (next working day)",
+        D("20.00"),
+        "GBP",
+        "",
+        D("0.00"),
+        D("1.00"),
+        package_sizes=["letter", "largeLetter"],
+    )
+    option = ShippingOption.with_code("TEST1")
+    assert get_package_size("letter").get_shipping_option("TEST1") is option
+    assert get_package_size("smallParcel").get_shipping_option("TEST1") is None
+    assert [size.code for size in package_sizes_supporting("TEST1")] == [
+        "letter",
+        "largeLetter",
+    ]
+
+
+def test_add_shipping_option_updates_only_its_index(
+    restore_shipping_options, monkeypatch
+):
+    def fail():
+        raise AssertionError("All package sizes were indexed again.")
+
+    monkeypatch.setattr(package_sizes, "_index_package_sizes", fail)
+    add_shipping_option(
+        "Royal Mail",
+        "Test",
+        "TEST1",
+        "24 hour (next working day)",
+        D("20.00"),
+        "GBP",
+        "",
+        D("0.00"),
+        D("1.00"),
+        package_sizes=["smallParcel"],
+    )
+    assert [size.code for size in package_sizes_supporting("TEST1")] == ["smallParcel"]
+    assert get_package_size("letter").get_shipping_option("OLP2").gross == D("0.87")
+
+
+def test_package_sizes_supporting_a_new_package_size(restore_shipping_options):
+    option = ShippingOption.with_code("OLP1")._replace(service_code="TEST2")
+    documents = PackageSize("documents", "Documents", 100, 300, 200, 5, [option])
+    package_sizes.packages_sizes.append(documents)
+    try:
+        assert package_sizes_supporting("TEST2") == [documents]
+    finally:
+        package_sizes.packages_sizes.remove(documents)
+        package_sizes._index_package_sizes()
+
+
+def test_unknown_codes_do_not_index_again(monkeypatch):
+    def fail():
+        raise AssertionError("All package sizes were indexed again.")
+
+    get_package_size("letter")
+    monkeypatch.setattr(package_sizes, "_index_package_sizes", fail)
+    with pytest.raises(ValueError):
+        get_package_size("nope")
+    assert package_sizes_supporting("NOPE") == []
+
+
+def test_lookups_while_package_sizes_change(restore_shipping_options):
+    option = ShippingOption.with_code("OLP1")._replace(service_code="TEST2")
+    documents = PackageSize("documents", "Documents", 100, 300, 200, 5, [option])
+    stop = threading.Event()
+
+    def change():
+        while not stop.is_set():
+            package_sizes.packages_sizes.append(documents)
+            package_sizes_supporting("TEST2")
+            package_sizes.packages_sizes.remove(documents)
+            package_sizes_supporting("TEST2")
+
+    thread = threading.Thread(target=change)
+    interval = sys.getswitchinterval()
+    # switch threads often, also while the indexes are rebuilt
+    sys.setswitchinterval(1e-6)
+    thread.start()
+    try:
+        for _ in range(2000):
+            medium_parcel = get_package_size("mediumParcel")
+            assert medium_parcel.get_shipping_option("OLP1") is not None
+            assert medium_parcel in package_sizes_supporting("OLP1")
+    finally:
+        stop.set()
+        thread.join()
+        sys.setswitchinterval(interval)
+
+
+def test_add_shipping_option_replaces_the_old_one(restore_shipping_options):
+    add_shipping_option(
+        "Royal Mail",
+        "Royal Mail 2nd Class (£20 compensation)",
+        "OLP2",
+        "48 hour (2 working days)",
+        D("20.00"),
+        "GBP",
+        "",
+        D("0.00"),
+        D("0.99"),
+    )
+    for size in package_sizes_supporting("OLP2"):
+        assert size.get_shipping_option("OLP2").gross == D("0.99")
+        assert D("0.87") not in [option.gross for option in size.shipping_options]
+    assert len(package_sizes_supporting("OLP2")) == 4
+
+
+def test_catalogue_keeps_all_compensation_tiers():
+    tiers = shipping_catalogue.tiers("PFE24")
+    assert [option.compensation for option in tiers] == [
+        D("150.00"),
+        D("750.00"),
+        D("1000.00"),
+        D("2500.00"),
+    ]
+    assert [option.gross for option in tiers] == sorted(
+        option.gross for option in tiers
+    )
+    assert shipping_catalogue.get("PFE24", D(750)).gross == D("18.90")
+    assert ShippingOption.with_code("PFE24") == tiers[0]
+    assert get_package_size("mediumParcel").get_shipping_option("PFE24") == tiers[0]
+
+
+@pytest.mark.parametrize(
+    ("declared_value", "compensation"),
+    [
+        (D(0), D(150)),
+        (D(150), D(150)),
+        (D("150.01"), D(750)),
+        (D(999), D(1000)),
+        (D(2500), D(2500)),
+        (D("2500.01"), None),
+    ],
+)
+def test_catalogue_cover(declared_value, compensation):
+    option = shipping_catalogue.cover("PFE24", declared_value)
+    assert (option and option.compensation) == compensation
+
+
+def test_catalogue_cover_unknown_code():
+    assert shipping_catalogue.cover("unknown", D(1)) is None
+    assert shipping_catalogue.tiers("unknown") == []
+
+
+def test_catalogue_replaces_the_same_tier():
+    option = ShippingOption.with_code("PFE48")
+    catalogue = ShippingCatalogue([option, option._replace(compensation=D(500))])
+    catalogue.add(option._replace(gross=D("99.00")))
+    assert len(catalogue) == 2
+    assert catalogue.base("PFE48").gross == D("99.00")
+    assert option not in catalogue
+    assert catalogue.service_codes() == ["PFE48"]
+
+
+def test_add_shipping_option_keeps_other_tiers(restore_shipping_options):
+    base = ShippingOption.with_code("OLP2")
+    add_shipping_option(
+        **base._replace(compensation=D("50.00"), gross=D("2.00"))._asdict()
+    )
+    assert shipping_catalogue.tiers("OLP2") == [
+        base,
+        base._replace(compensation=D("50.00"), gross=D("2.00")),
+    ]
+    assert ShippingOption.with_code("OLP2") == base
+    assert get_package_size("letter").get_shipping_option("OLP2") == base
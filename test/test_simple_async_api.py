@@ -0,0 +1,139 @@
+"""Test the asyncio interface of the simple API."""
+
+import asyncio
+
+import pytest
+
+from click_and_drop_api.exceptions import BadRequestException
+from click_and_drop_api.simple import AsyncClickAndDrop, CreateOrder
+
+from .conftest import API_KEY, order_info
+
+pytest.importorskip("aiohttp")
+
+VERSION = {"commit": "abc", "build": "1", "releaseDate": "2026-01-01T00:00:00Z"}
+
+
+def run(server, coroutine_function):
+    """Run the coroutine function with an AsyncClickAndDrop."""
+
+    async def main():
+        async with AsyncClickAndDrop(API_KEY, host=server.host) as api:
+            return await coroutine_function(api)
+
+    return asyncio.run(main())
+
+
+def test_get_version(server):
+    server.route("GET", "/version", body=VERSION)
+    version = run(server, lambda api: api.get_version())
+    assert version.commit == "abc"
+
+
+def test_key_is_sent(server):
+    server.route("GET", "/orders/1", body=[])
+    run(server, lambda api: api.get_orders(1))
+    assert server.requests[0].headers["Authorization"] == API_KEY
+
+
+def test_get_orders(server):
+    server.route(
+        "GET", "/orders/(.*)", lambda request: [order_info(1), order_info(2, "x")]
+    )
+    orders = run(server, lambda api: api.get_orders([1, "x"]))
+    assert [order.order_identifier for order in orders] == [1, 2]
+    assert server.requests[0].match.group(1) == '1;"x"'
+
+
+def test_get_order_not_found(server):
+    server.route("GET", "/orders/(.*)", body=[])
+    assert run(server, lambda api: api.get_order(1)) is None
+
+
+def test_many_requests_in_parallel(server):
+    server.route(
+        "GET",
+        "/orders/(.*)",
+        lambda request: [order_info(int(request.match.group(1)))],
+    )
+
+    async def get_orders(api):
+        return await asyncio.gather(*(api.get_order(i) for i in range(1, 51)))
+
+    orders = run(server, get_orders)
+    assert [order.order_identifier for order in orders] == list(range(1, 51))
+
+
+def test_create_order(server):
+    server.route(
+        "POST",
+        "/orders",
+        body={"successCount": 1, "errorsCount": 0, "createdOrders": [order_info(9)]},
+    )
+    order = CreateOrder.from_dict(
+        {
+            "recipient": {
+                "address": {
+                    "fullName": "A",
+                    "addressLine1": "B",
+                    "city": "C",
+                    "countryCode": "GB",
+                }
+            },
+            "orderDate": "2026-01-01T00:00:00Z",
+            "subtotal": 1,
+            "shippingCostCharged": 1,
+            "total": 2,
+        }
+    )
+    response = run(server, lambda api: api.create_order(order))
+    assert response.success_count == 1
+    assert server.requests[0].json()["items"][0]["total"] == 2
+
+
+def test_delete_orders(server):
+    server.route(
+        "DELETE",
+        "/orders/(.*)",
+        body={"deletedOrders": [{"orderIdentifier": 1}], "errors": []},
+    )
+    response = run(server, lambda api: api.delete_orders(1))
+    assert response.deleted_orders[0].order_identifier == 1
+
+
+def test_get_label(server):
+    server.route("GET", "/orders/(.*)/label", body=b"%PDF-1.4")
+    label = run(server, lambda api: api.get_label(1, "postageLabel", False))
+    assert label == b"%PDF-1.4"
+    assert server.requests[0].query == {
+        "documentType": "postageLabel",
+        "includeReturnsLabel": "false",
+    }
+
+
+def test_error(server):
+    server.route(
+        "GET",
+        "/orders/(.*)",
+        status=400,
+        body=[{"accountOrderNumber": 1, "code": "X", "message": "bad"}],
+    )
+    with pytest.raises(BadRequestException) as error:
+        run(server, lambda api: api.get_orders(1))
+    assert error.value.data[0].message == "bad"
+
+
+def test_no_urllib3_pool_is_created(monkeypatch):
+    from click_and_drop_api import rest
+    from click_and_drop_api.simple import AsyncApiClient
+
+    def fail(*args, **kwargs):
+        raise AssertionError("A synchronous REST client was created.")
+
+    monkeypatch.setattr(rest.RESTClientObject, "__init__", fail)
+
+    async def main():
+        async with AsyncApiClient() as client:
+            return type(client.rest_client).__name__
+
+    assert asyncio.run(main()) == "AsyncRESTClientObject"
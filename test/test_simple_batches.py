@@ -0,0 +1,93 @@
+"""Requests with more than 100 order identifiers are split into batches."""
+
+import asyncio
+import time
+
+import pytest
+
+from click_and_drop_api.simple import AsyncClickAndDrop
+from click_and_drop_api.simple.api import chunk_order_identifiers
+
+from .conftest import API_KEY, order_info
+
+
+def ids_of(request):
+    """The order identifiers of a request."""
+    return [int(i) for i in request.match.group(1).split(";")]
+
+
+def get_orders(request):
+    """Answer slower for the first batches so that they arrive out of order."""
+    ids = ids_of(request)
+    time.sleep(0.05 if ids[0] == 1 else 0)
+    return [order_info(i) for i in ids]
+
+
+@pytest.mark.parametrize(
+    ("count", "sizes"),
+    [(0, []), (1, [1]), (100, [100]), (101, [100, 1]), (250, [100, 100, 50])],
+)
+def test_chunk_sizes(count, sizes):
+    chunks = chunk_order_identifiers(list(range(count)))
+    assert [len(chunk) for chunk in chunks] == sizes
+    assert [i for chunk in chunks for i in chunk] == list(range(count))
+
+
+def test_chunk_single_identifier():
+    assert chunk_order_identifiers("ref") == [["ref"]]
+
+
+def test_get_many_orders(api, server):
+    server.route("GET", "/orders/([^/]*)", get_orders)
+    orders = api.get_orders(list(range(1, 251)))
+    assert [order.order_identifier for order in orders] == list(range(1, 251))
+    assert sorted(len(ids_of(request)) for request in server.requests) == [50, 100, 100]
+
+
+def test_few_orders_use_one_request(api, server):
+    server.route("GET", "/orders/([^/]*)", get_orders)
+    assert len(api.get_orders(list(range(1, 101)))) == 100
+    assert len(server.requests) == 1
+
+
+def test_delete_many_orders(api, server):
+    server.route(
+        "DELETE",
+        "/orders/([^/]*)",
+        lambda request: {
+            "deletedOrders": [{"orderIdentifier": i} for i in ids_of(request)[1:]],
+            "errors": [{"orderIdentifier": ids_of(request)[0], "code": "X"}],
+        },
+    )
+    result = api.delete_orders(list(range(1, 202)))
+    assert len(result.deleted_orders) == 198
+    assert [error.order_identifier for error in result.errors] == [1, 101, 201]
+
+
+def test_get_label_refuses_too_many_orders(api, server):
+    with pytest.raises(ValueError):
+        api.get_label(list(range(101)), "postageLabel", False)
+    assert server.requests == []
+
+
+def test_get_labels(api, server):
+    server.route(
+        "GET",
+        "/orders/([^/]*)/label",
+        lambda request: str(ids_of(request)[0]).encode(),
+    )
+    labels = api.get_labels(list(range(1, 202)), "postageLabel", False)
+    assert labels == [b"1", b"101", b"201"]
+
+
+def test_async_get_many_orders(server):
+    pytest.importorskip("aiohttp")
+    server.route("GET", "/orders/([^/]*)", get_orders)
+
+    async def main():
+        async with AsyncClickAndDrop(API_KEY, host=server.host) as api:
+            return await api.get_orders(list(range(1, 251)))
+
+    orders = asyncio.run(main())
+    assert [order.order_identifier for order in orders] == list(range(1, 251))
+    assert len(server.requests) == 3
@@ -0,0 +1,210 @@
+"""Orders are answered from a cache and invalidated when they change."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from click_and_drop_api.models import GetOrderInfoResource
+from click_and_drop_api.simple import (
+    AsyncClickAndDrop,
+    ClickAndDrop,
+    MemoryOrderCache,
+    SQLiteOrderCache,
+    UpdateOrderStatus,
+)
+
+from .conftest import API_KEY, new_order, order_info
+
+
+def get_orders(request):
+    """Return the orders of the identifiers and references in the path."""
+    orders = []
+    for i in request.match.group(1).split(";"):
+        if i.startswith('"'):
+            orders.append(order_info(int(i.strip('"').split("-")[1])))
+        else:
+            orders.append(order_info(int(i)))
+    return orders
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def cache(request, tmp_path):
+    if request.param == "memory":
+        yield MemoryOrderCache(ttl=60)
+    else:
+        cache = SQLiteOrderCache(str(tmp_path / "cache.sqlite"), ttl=60)
+        yield cache
+        cache.close()
+
+
+@pytest.fixture
+def cached_api(server, cache):
+    server.route("GET", "/orders/([^/]+)", get_orders)
+    return ClickAndDrop(API_KEY, host=server.host, cache=cache)
+
+
+def order(order_identifier):
+    return GetOrderInfoResource.from_dict(order_info(order_identifier))
+
+
+def test_second_lookup_is_cached(cached_api, server, cache):
+    assert cached_api.get_order(1).order_identifier == 1
+    assert cached_api.get_order(1).order_identifier == 1
+    assert len(server.requests) == 1
+    assert cache.stats == (1, 1)
+    assert cache.stats.hit_ratio == 0.5
+
+
+def test_reference_and_identifier_share_an_entry(cached_api, server):
+    cached_api.get_order(1)
+    assert cached_api.get_order("ref-1").order_identifier == 1
+    assert len(server.requests) == 1
+
+
+def test_only_missing_orders_are_requested(cached_api, server):
+    cached_api.get_orders([1, 2])
+    orders = cached_api.get_orders([3, 2, "ref-1", 1])
+    assert [order.order_identifier for order in orders] == [3, 2, 1]
+    assert server.requests[-1].match.group(1) == "3"
+
+
+def test_delete_invalidates(cached_api, server, cache):
+    server.route("DELETE", "/orders/(.*)", body={"deletedOrders": []})
+    cached_api.get_orders([1, 2])
+    cached_api.delete_orders("ref-1")
+    assert cache.get(1) is None
+    assert cache.get(2) is not None
+
+
+def test_create_invalidates_the_reference(cached_api, server, cache):
+    server.route("POST", "/orders", body={"successCount": 1, "createdOrders": []})
+    cached_api.get_order(1)
+    cached_api.create_order(new_order("ref-1"))
+    assert cache.get("ref-1") is None
+
+
+def test_status_update_invalidates(cached_api, server, cache):
+    server.route("PUT", "/orders/status", body={"updatedOrders": []})
+    cached_api.get_orders([1, 2])
+    cached_api.update_orders_status(
+        [
+            UpdateOrderStatus(order_identifier=1, status="despatched"),
+            UpdateOrderStatus(order_reference="ref-2", status="despatched"),
+        ]
+    )
+    assert cache.get(1) is None
+    assert cache.get(2) is None
+    assert server.requests_to("PUT", "/orders/status")[0].json() == {
+        "items": [
+            {"orderIdentifier": 1, "status": "despatched"},
+            {"orderReference": "ref-2", "status": "despatched"},
+        ]
+    }
+
+
+def test_failed_update_invalidates(cached_api, server, cache):
+    server.route("PUT", "/orders/status", status=404, body=None)
+    cached_api.get_order(1)
+    with pytest.raises(Exception):
+        cached_api.update_orders_status(
+            UpdateOrderStatus(order_identifier=1, status="new")
+        )
+    assert cache.get(1) is None
+
+
+def test_orders_expire(cache):
+    cache.ttl = 0.01
+    cache.update([order(1)])
+    assert cache.get(1) is not None
+    time.sleep(0.02)
+    assert cache.get(1) is None
+    assert cache.get("ref-1") is None
+
+
+def test_cached_orders_are_copies(cache):
+    cache.update([order(1)])
+    cache.get(1).order_reference = "changed"
+    assert cache.get(1).order_reference == "ref-1"
+
+
+def test_reused_reference(cache):
+    cache.update([order(1)])
+    cache.update([GetOrderInfoResource.from_dict(order_info(2, "ref-1"))])
+    assert cache.get("ref-1").order_identifier == 2
+    assert cache.get(1) is None
+    cache.invalidate([2])
+    assert cache.get("ref-1") is None
+
+
+def test_clear(cache):
+    cache.update([order(1)])
+    cache.clear()
+    assert cache.get(1) is None
+
+
+def test_least_recently_used_orders_are_evicted():
+    cache = MemoryOrderCache(maxsize=2)
+    cache.update([order(1), order(2)])
+    cache.get(1)
+    cache.update([order(3)])
+    assert cache.get(2) is None
+    assert cache.get("ref-2") is None
+    assert cache.get(1) is not None
+    assert len(cache) == 2
+
+
+def test_sqlite_cache_is_shared(tmp_path):
+    path = str(tmp_path / "cache.sqlite")
+    SQLiteOrderCache(path).update([order(1)])
+    assert SQLiteOrderCache(path).get("ref-1").order_identifier == 1
+
+
+def test_invalid_ttl():
+    with pytest.raises(ValueError):
+        MemoryOrderCache(ttl=0)
+
+
+def test_async_cache(server, cache):
+    pytest.importorskip("aiohttp")
+    server.route("GET", "/orders/([^/]+)", get_orders)
+    server.route("DELETE", "/orders/(.*)", body={"deletedOrders": []})
+
+    async def main():
+        async with AsyncClickAndDrop(API_KEY, host=server.host, cache=cache) as api:
+            await api.get_orders([1, 2])
+            orders = await api.get_orders([2, 1])
+            await api.delete_orders(1)
+            await api.get_order(1)
+            return orders
+
+    assert [order.order_identifier for order in asyncio.run(main())] == [2, 1]
+    assert len(server.requests_to("GET", "/orders/.*")) == 2
+    assert cache.stats == (2, 3)
+
+
+def test_async_sqlite_cache_is_used_in_a_thread(server, tmp_path, monkeypatch):
+    pytest.importorskip("aiohttp")
+    server.route("GET", "/orders/([^/]+)", get_orders)
+    server.route("DELETE", "/orders/(.*)", body={"deletedOrders": []})
+    cache = SQLiteOrderCache(str(tmp_path / "cache.sqlite"))
+    threads = set()
+    for name in ["lookup", "update", "invalidate"]:
+        method = getattr(cache, name)
+
+        def record(*args, method=method):
+            threads.add(threading.get_ident())
+            return method(*args)
+
+        monkeypatch.setattr(cache, name, record)
+
+    async def main():
+        async with AsyncClickAndDrop(API_KEY, host=server.host, cache=cache) as api:
+            await api.get_orders([1, 2])
+            await api.delete_orders(1)
+
+    asyncio.run(main())
+    cache.close()
+    assert threads
+    assert threading.get_ident() not in threads
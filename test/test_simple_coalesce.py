@@ -0,0 +1,136 @@
+"""Concurrent lookups of orders are merged into one request."""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from click_and_drop_api.exceptions import ApiException
+from click_and_drop_api.models import GetOrderInfoResource
+from click_and_drop_api.simple import (
+    AsyncClickAndDrop,
+    AsyncOrderLookupCoalescer,
+    ClickAndDrop,
+)
+
+from .conftest import API_KEY, order_info
+
+
+def get_orders(request):
+    """Return the orders of the identifiers in the path."""
+    time.sleep(0.05)
+    return [
+        order_info(int(i))
+        for i in request.match.group(1).split(";")
+        if not i.startswith('"')
+    ]
+
+
+@pytest.fixture
+def coalescing_api(server):
+    server.route("GET", "/orders/([^/]+)", get_orders)
+    return ClickAndDrop(API_KEY, host=server.host, coalesce_delay=0.05, max_workers=5)
+
+
+def look_up(api, identifiers):
+    """Look up each list of identifiers in its own thread at the same time."""
+    barrier = threading.Barrier(len(identifiers))
+
+    def get_orders(ids):
+        barrier.wait()
+        return [order.order_identifier for order in api.get_orders(ids)]
+
+    with ThreadPoolExecutor(len(identifiers)) as executor:
+        return list(executor.map(get_orders, identifiers))
+
+
+def test_concurrent_lookups_are_merged(coalescing_api, server):
+    results = look_up(coalescing_api, [[i] for i in range(20)])
+    assert results == [[i] for i in range(20)]
+    (request,) = server.requests
+    assert sorted(map(int, request.match.group(1).split(";"))) == list(range(20))
+    assert coalescing_api.coalescer.lookups == 20
+    assert coalescing_api.coalescer.batches == 1
+
+
+def test_overlapping_identifiers_are_requested_once(coalescing_api, server):
+    results = look_up(coalescing_api, [[1, 2], [2, 3], [3, 1, 4]])
+    assert results == [[1, 2], [2, 3], [3, 1, 4]]
+    (request,) = server.requests
+    assert sorted(map(int, request.match.group(1).split(";"))) == [1, 2, 3, 4]
+
+
+def test_batches_respect_the_identifier_limit(coalescing_api, server):
+    look_up(coalescing_api, [list(range(i, i + 50)) for i in range(0, 250, 50)])
+    sizes = sorted(len(r.match.group(1).split(";")) for r in server.requests)
+    assert sizes == [50, 100, 100]
+
+
+def test_lookups_join_requests_in_flight(coalescing_api, server):
+    with ThreadPoolExecutor(2) as executor:
+        first = executor.submit(coalescing_api.get_order, 1)
+        time.sleep(0.07)  # the first request is sent but not answered
+        second = executor.submit(coalescing_api.get_order, 1)
+        assert first.result().order_identifier == 1
+        assert second.result().order_identifier == 1
+    assert len(server.requests) == 1
+
+
+def test_orders_not_found(coalescing_api):
+    assert coalescing_api.get_order("missing") is None
+
+
+def test_errors_reach_all_callers(server):
+    server.route("GET", "/orders/([^/]+)", status=404, body=None)
+    api = ClickAndDrop(API_KEY, host=server.host, coalesce_delay=0.05)
+    barrier = threading.Barrier(3)
+
+    def get_order(i):
+        barrier.wait()
+        with pytest.raises(ApiException):
+            api.get_order(i)
+
+    with ThreadPoolExecutor(3) as executor:
+        list(executor.map(get_order, range(3)))
+    assert len(server.requests) == 1
+    assert api.coalescer._in_flight == {}
+
+
+def test_async_lookups_are_merged(server):
+    pytest.importorskip("aiohttp")
+    server.route("GET", "/orders/([^/]+)", get_orders)
+
+    async def main():
+        async with AsyncClickAndDrop(
+            API_KEY, host=server.host, coalesce_delay=0.05
+        ) as api:
+            return await asyncio.gather(*(api.get_order(i) for i in range(10)))
+
+    orders = asyncio.run(main())
+    assert [order.order_identifier for order in orders] == list(range(10))
+    assert len(server.requests) == 1
+
+
+def test_cancelled_caller_does_not_cancel_the_others():
+    requests = []
+
+    async def request_orders(identifiers):
+        requests.append(identifiers)
+        await asyncio.sleep(0.05)
+        return [GetOrderInfoResource.from_dict(order_info(i)) for i in identifiers]
+
+    async def main():
+        coalescer = AsyncOrderLookupCoalescer(request_orders, delay=0.01)
+        lead = asyncio.ensure_future(coalescer.get_orders([1, 2]))
+        others = [asyncio.ensure_future(coalescer.get_orders([i])) for i in (1, 2)]
+        await asyncio.sleep(0.03)
+        lead.cancel()
+        orders = await asyncio.gather(*others)
+        with pytest.raises(asyncio.CancelledError):
+            await lead
+        return [[order.order_identifier for order in found] for found in orders]
+
+    assert asyncio.run(main()) == [[1], [2]]
+    assert requests == [[1, 2]]
@@ -0,0 +1,100 @@
+"""Create many orders in batches."""
+
+import asyncio
+
+import pytest
+
+from click_and_drop_api.exceptions import BadRequestException
+from click_and_drop_api.simple import AsyncClickAndDrop
+
+from .conftest import API_KEY, new_order, order_info
+
+
+def create_orders(request):
+    """Create all orders except those with a reference ending in 7."""
+    items = request.json()["items"]
+    if items[0]["orderReference"] == "fail":
+        return 500, {"code": "Error"}
+    created = [item for item in items if not item["orderReference"].endswith("7")]
+    failed = [item for item in items if item["orderReference"].endswith("7")]
+    return {
+        "successCount": len(created),
+        "errorsCount": len(failed),
+        "createdOrders": [
+            order_info(int(item["orderReference"]), item["orderReference"])
+            for item in created
+        ],
+        "failedOrders": [
+            {"order": item, "errors": [{"errorCode": 1}]} for item in failed
+        ],
+    }
+
+
+@pytest.fixture
+def orders(server):
+    server.route("POST", "/orders", create_orders)
+    return [new_order(str(i)) for i in range(1000, 1250)]
+
+
+def test_one_request_for_few_orders(api, server, orders):
+    response = api.create_orders(orders[:100])
+    assert response.success_count == 90
+    assert len(server.requests) == 1
+
+
+def test_merge_batches(api, server, orders):
+    response = api.create_orders(orders)
+    assert response.success_count == 225
+    assert response.errors_count == 25
+    assert [order.order_identifier for order in response.created_orders] == [
+        i for i in range(1000, 1250) if i % 10 != 7
+    ]
+    assert [order.order.order_reference for order in response.failed_orders] == [
+        str(i) for i in range(1000, 1250) if i % 10 == 7
+    ]
+    assert sorted(len(request.json()["items"]) for request in server.requests) == [
+        50,
+        100,
+        100,
+    ]
+
+
+def test_batch_size(api, server, orders):
+    api.create_orders(orders, batch_size=10)
+    assert len(server.requests) == 25
+
+
+def test_batches_map_to_input(api, orders):
+    batches = api.create_orders_in_batches(orders, batch_size=30)
+    assert [batch.start for batch in batches] == list(range(0, 250, 30))
+    for batch in batches:
+        assert [orders[i] for i in batch.indices] == batch.orders
+
+
+def test_failed_batch_is_reported(api, orders):
+    orders[100] = new_order("fail")
+    response = api.create_orders(orders)
+    assert response.success_count == 135
+    assert response.errors_count == 115
+    failed = response.failed_orders[10]
+    assert failed.order.order_reference == "fail"
+    assert failed.errors[0].error_code == 500
+
+
+def test_single_request_raises_errors(api, server):
+    server.route("POST", "/orders", status=400, body={"code": "X"})
+    with pytest.raises(BadRequestException):
+        api.create_order(new_order())
+
+
+def test_async_batches(server, orders):
+    pytest.importorskip("aiohttp")
+
+    async def main():
+        async with AsyncClickAndDrop(API_KEY, host=server.host) as api:
+            return await api.create_orders(orders, batch_size=50)
+
+    response = asyncio.run(main())
+    assert response.success_count == 225
+    assert len(response.created_orders) == 225
+    assert len(server.requests) == 5
@@ -0,0 +1,143 @@
+"""Export orders in parallel time windows."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from dateutil.parser import isoparse
+
+from click_and_drop_api.models import GetOrdersDetailsResponse
+from click_and_drop_api.simple.export import (
+    TimeWindow,
+    export_orders,
+    split_time_range,
+)
+
+from .conftest import order_details
+
+START = datetime(2026, 1, 1, tzinfo=timezone.utc)
+END = datetime(2026, 2, 1, tzinfo=timezone.utc)
+
+
+def orders_in_january(count):
+    """Orders created evenly in January, more at the start of the month."""
+    step = (END - START) / count
+    return [
+        order_details(i, (START + step * i * i / count).isoformat())
+        for i in range(count)
+    ]
+
+
+def windowed_pages(orders):
+    """Filter the orders by createdOn including both bounds and paginate them."""
+
+    created = [(isoparse(order["createdOn"]), order) for order in orders]
+
+    def handler(request):
+        start = isoparse(request.query["startDateTime"])
+        end = isoparse(request.query["endDateTime"])
+        selected = [
+            order for created_on, order in created if start <= created_on <= end
+        ]
+        offset = int(request.query.get("continuationToken", 0))
+        page_end = offset + int(request.query["pageSize"])
+        page = {"orders": selected[offset:page_end]}
+        if page_end < len(selected):
+            page["continuationToken"] = str(page_end)
+        return page
+
+    return handler
+
+
+def test_split_time_range():
+    windows = split_time_range(START, END, 4)
+    assert windows[0].start == START
+    assert windows[-1].end == END
+    assert all(a.end == b.start for a, b in zip(windows, windows[1:]))
+    assert len({window.duration for window in windows}) == 1
+
+
+def test_split_window():
+    window = TimeWindow(START, END)
+    assert window.split() == [
+        TimeWindow(START, START + (END - START) / 2),
+        TimeWindow(START + (END - START) / 2, END),
+    ]
+
+
+def test_invalid_range():
+    with pytest.raises(ValueError):
+        split_time_range(END, START, 2)
+    with pytest.raises(ValueError):
+        split_time_range(START, END, 0)
+
+
+def test_export_all_orders_once(api, server):
+    orders = orders_in_january(500)
+    server.route("GET", "/orders/full", windowed_pages(orders))
+    exported = list(api.export_orders_with_details(START, END, windows=4, page_size=20))
+    identifiers = [order.order_identifier for order in exported]
+    assert sorted(identifiers) == list(range(500))
+
+
+def test_dense_windows_are_split(api, server):
+    server.route("GET", "/orders/full", windowed_pages(orders_in_january(500)))
+    list(api.export_orders_with_details(START, END, windows=2, page_size=20))
+    windows = {
+        (request.query["startDateTime"], request.query["endDateTime"])
+        for request in server.requests
+    }
+    assert len(windows) > 2
+
+
+def test_dense_window_is_requested_once_before_it_is_split():
+    window = TimeWindow(START, END)
+    first, second = window.split()
+    pages = {
+        # order 5 was deleted before the halves were requested
+        (window, None): ([1, 5], "page-2"),
+        (first, None): ([1], None),
+        (second, None): ([2, 3], "page-2"),
+        (second, "page-2"): ([4], None),
+    }
+    requests = []
+
+    def get_page(window, continuation_token):
+        requests.append((window, continuation_token))
+        identifiers, token = pages[window, continuation_token]
+        return GetOrdersDetailsResponse.from_dict(
+            {
+                "orders": [order_details(i) for i in identifiers],
+                "continuationToken": token,
+            }
+        )
+
+    exported = export_orders(
+        get_page, START, END, windows=1, max_workers=1, min_window=timedelta(days=16)
+    )
+    assert sorted(order.order_identifier for order in exported) == [1, 2, 3, 4]
+    # each page once, the halves in any order
+    assert sorted(map(repr, requests)) == sorted(map(repr, pages))
+
+
+def test_requests_of_a_dense_window(api, server):
+    server.route("GET", "/orders/full", windowed_pages(orders_in_january(40)))
+    exported = list(
+        api.export_orders_with_details(
+            START, END, windows=1, page_size=20, min_window=timedelta(days=16)
+        )
+    )
+    assert len(exported) == 40
+    # the window, two pages of its dense first half and one of the second half
+    requests = [tuple(sorted(request.query.items())) for request in server.requests]
+    assert len(requests) == len(set(requests)) == 4
+
+
+def test_small_windows_are_paginated(api, server):
+    server.route("GET", "/orders/full", windowed_pages(orders_in_january(100)))
+    exported = list(
+        api.export_orders_with_details(
+            START, END, windows=1, page_size=20, min_window=timedelta(days=31)
+        )
+    )
+    assert len(exported) == 100
+    assert len(server.requests) == 5
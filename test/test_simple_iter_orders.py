@@ -0,0 +1,94 @@
+"""Iterate over the pages of orders."""
+
+import asyncio
+import threading
+from datetime import datetime, timezone
+
+import pytest
+
+from click_and_drop_api.simple import AsyncClickAndDrop
+
+from .conftest import API_KEY, order_details, order_info, pages
+
+
+@pytest.fixture(params=[False, True], ids=["sequential", "prefetch"])
+def prefetch(request):
+    return request.param
+
+
+def test_iterate_over_all_pages(api, server, prefetch):
+    server.route("GET", "/orders", pages([order_info(i) for i in range(1, 251)]))
+    orders = api.iter_orders(page_size=100, prefetch=prefetch)
+    assert [order.order_identifier for order in orders] == list(range(1, 251))
+    assert [request.query.get("continuationToken") for request in server.requests] == [
+        None,
+        "100",
+        "200",
+    ]
+
+
+def test_empty_list(api, server, prefetch):
+    server.route("GET", "/orders", body={"orders": []})
+    assert list(api.iter_orders(prefetch=prefetch)) == []
+
+
+def test_pages_are_requested_lazily(api, server):
+    server.route("GET", "/orders", pages([order_info(i) for i in range(1, 251)]))
+    orders = api.iter_orders(page_size=100)
+    assert next(orders).order_identifier == 1
+    assert len(server.requests) == 1
+
+
+def test_prefetch_next_page(api, server):
+    requested = threading.Event()
+    handler = pages([order_info(i) for i in range(1, 251)])
+
+    def get_orders(request):
+        if request.query.get("continuationToken") == "100":
+            requested.set()
+        return handler(request)
+
+    server.route("GET", "/orders", get_orders)
+    orders = api.iter_orders(page_size=100, prefetch=True)
+    next(orders)
+    assert requested.wait(1)
+
+
+def test_time_range_is_sent(api, server):
+    server.route("GET", "/orders", body={"orders": []})
+    start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    end = datetime(2026, 2, 1, tzinfo=timezone.utc)
+    list(api.iter_orders(start, end, page_size=10))
+    query = server.requests[0].query
+    assert query["startDateTime"].startswith("2026-01-01T00:00:00")
+    assert query["endDateTime"].startswith("2026-02-01T00:00:00")
+    assert query["pageSize"] == "10"
+
+
+def test_iterate_with_details(api, server, prefetch):
+    server.route("GET", "/orders/full", pages([order_details(i) for i in range(1, 8)]))
+    orders = api.iter_orders_with_details(page_size=3, prefetch=prefetch)
+    assert [order.order_lines[0].quantity for order in orders] == [1] * 7
+    assert len(server.requests) == 3
+
+
+def test_async_iterate(server, prefetch):
+    pytest.importorskip("aiohttp")
+    server.route("GET", "/orders", pages([order_info(i) for i in range(1, 251)]))
+    server.route("GET", "/orders/full", pages([order_details(i) for i in range(1, 8)]))
+
+    async def main():
+        async with AsyncClickAndDrop(API_KEY, host=server.host) as api:
+            orders = [
+                order.order_identifier
+                async for order in api.iter_orders(page_size=100, prefetch=prefetch)
+            ]
+            details = [
+                order.order_identifier
+                async for order in api.iter_orders_with_details(
+                    page_size=3, prefetch=prefetch
+                )
+            ]
+            return orders, details
+
+    assert asyncio.run(main()) == (list(range(1, 251)), list(range(1, 8)))
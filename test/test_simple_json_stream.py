@@ -0,0 +1,218 @@
+"""Parse the orders of a page while the page is received."""
+
+import asyncio
+import io
+import json
+from urllib.parse import urlsplit
+
+import pytest
+import urllib3
+
+from click_and_drop_api.exceptions import BadRequestException
+from click_and_drop_api.models import GetOrderDetailsResource, GetOrderInfoResource
+from click_and_drop_api.rest import RESTClientObject, RESTResponse
+from click_and_drop_api.simple import AsyncClickAndDrop, ClickAndDrop
+from click_and_drop_api.simple.json_stream import JSONArrayParser
+from click_and_drop_api.simple.views import OrderDetailsView
+
+from .conftest import API_KEY, order_details, order_info, pages
+
+
+def parse(body: bytes, chunk_size: int):
+    """Feed the body in chunks and return the elements and the other members."""
+    parser = JSONArrayParser("orders")
+    items = []
+    for start in range(0, len(body), chunk_size):
+        items.extend(parser.feed(body[start : start + chunk_size]))
+    items.extend(parser.close())
+    return items, parser.members
+
+
+PAGES = [
+    {"orders": [order_details(i) for i in range(3)], "continuationToken": "3"},
+    {"continuationToken": None, "orders": []},
+    {"orders": None},
+    {},
+    {"before": {"orders": [1]}, "orders": [1, 2.5, "]", [], {}, None, True]},
+    {"orders": [{"name": 'Café "Zoë" \\ ☃'}], "count": 12},
+]
+
+
+@pytest.mark.parametrize("page", PAGES)
+@pytest.mark.parametrize("chunk_size", [1, 2, 5, 64, 10000])
+@pytest.mark.parametrize("indent", [None, 2])
+def test_same_as_json_loads(page, chunk_size, indent):
+    body = json.dumps(page, indent=indent, ensure_ascii=False).encode()
+    members = dict(page)
+    orders = members.pop("orders", None) or []
+    assert parse(body, chunk_size) == (orders, members)
+
+
+def test_elements_are_returned_when_complete():
+    parser = JSONArrayParser("orders")
+    assert list(parser.feed(b'{"orders": [{"a": 1}, {"a"')) == [{"a": 1}]
+    assert list(parser.feed(b": 2}, 3")) == [{"a": 2}]
+    assert list(parser.feed(b"4]")) == [34]
+    assert list(parser.feed(b', "continuationToken": "x"}')) == []
+    assert parser.close() == []
+    assert parser.members == {"continuationToken": "x"}
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        b"[1]",
+        b'{"orders": [1,]}',
+        b'{"orders": [1}',
+        b'{"orders": 5}',
+        b'{"a": 1,}',
+        b'{"orders": [1]',
+        b'{"a": 1} x',
+        b'{"orders": [1] "b": 2}',
+        b"",
+    ],
+)
+def test_invalid_json(body):
+    with pytest.raises(ValueError):
+        parse(body, 3)
+
+
+class RecordingRESTClientObject(RESTClientObject):
+    """Answers with the mock server in the same process and keeps the bodies."""
+
+    def __init__(self, configuration, server):
+        self.server = server
+        self.bodies: list[io.BytesIO] = []
+        self.retry_policy = None
+        self.rate_limiter = None
+
+    def send(
+        self,
+        method,
+        url,
+        headers=None,
+        body=None,
+        post_params=None,
+        _request_timeout=None,
+    ):
+        url = urlsplit(url)
+        status, response_headers, content = self.server.handle(
+            method, f"{url.path}?{url.query}", dict(headers or {}), body or b""
+        )
+        self.bodies.append(io.BytesIO(content))
+        return RESTResponse(
+            urllib3.HTTPResponse(
+                body=self.bodies[-1],
+                headers=response_headers,
+                status=status,
+                preload_content=False,
+            )
+        )
+
+
+@pytest.fixture
+def client(server):
+    return RecordingRESTClientObject(None, server)
+
+
+@pytest.fixture
+def recorded_api(client):
+    return ClickAndDrop(API_KEY, transport=lambda configuration: client)
+
+
+def large_order(order_identifier: int) -> dict:
+    order = order_details(order_identifier)
+    order["specialInstructions"] = "x" * 2000
+    return order
+
+
+def test_first_order_before_the_end_of_the_page(recorded_api, client, server):
+    server.route("GET", "/orders/full", pages([large_order(i) for i in range(100)]))
+    orders = recorded_api.iter_orders_with_details(incremental=True)
+    first = next(orders)
+    assert isinstance(first, GetOrderDetailsResource)
+    assert first.order_identifier == 0
+    (body,) = client.bodies
+    assert body.tell() < len(body.getvalue()) / 2
+    assert [order.order_identifier for order in orders] == list(range(1, 100))
+
+
+def test_iterate_over_all_pages(api, server):
+    server.route("GET", "/orders", pages([order_info(i) for i in range(1, 251)]))
+    orders = list(api.iter_orders(page_size=100, incremental=True))
+    assert {type(order) for order in orders} == {GetOrderInfoResource}
+    assert [order.order_identifier for order in orders] == list(range(1, 251))
+    assert [request.query.get("continuationToken") for request in server.requests] == [
+        None,
+        "100",
+        "200",
+    ]
+
+
+def test_lightweight(api, server):
+    server.route("GET", "/orders/full", pages([order_details(i) for i in range(1, 8)]))
+    orders = list(
+        api.iter_orders_with_details(page_size=3, lightweight=True, incremental=True)
+    )
+    assert {type(order) for order in orders} == {OrderDetailsView}
+    assert [order.order_identifier for order in orders] == list(range(1, 8))
+
+
+def test_empty_list(api, server):
+    server.route("GET", "/orders", body={"orders": []})
+    assert list(api.iter_orders(incremental=True)) == []
+
+
+def test_error_is_raised(api, server):
+    server.route("GET", "/orders", status=400, body={"code": "Bad", "message": "no"})
+    with pytest.raises(BadRequestException):
+        list(api.iter_orders(incremental=True))
+
+
+def test_stop_early(api, server):
+    server.route("GET", "/orders/full", pages([large_order(i) for i in range(100)]))
+    orders = api.iter_orders_with_details(incremental=True)
+    assert next(orders).order_identifier == 0
+    orders.close()
+    server.route("GET", "/orders", body={"orders": [order_info(1)]})
+    assert len(list(api.iter_orders(incremental=True))) == 1
+
+
+@pytest.mark.parametrize("method", ["iter_orders", "iter_orders_with_details"])
+def test_prefetch_is_not_supported(api, method):
+    with pytest.raises(ValueError):
+        getattr(api, method)(prefetch=True, incremental=True)
+
+
+@pytest.mark.parametrize("method", ["iter_orders", "iter_orders_with_details"])
+def test_async_prefetch_is_not_supported(method):
+    pytest.importorskip("aiohttp")
+
+    async def main():
+        async with AsyncClickAndDrop(API_KEY) as api:
+            getattr(api, method)(prefetch=True, incremental=True)
+
+    with pytest.raises(ValueError):
+        asyncio.run(main())
+
+
+def test_async_iterate(server):
+    pytest.importorskip("aiohttp")
+    server.route("GET", "/orders", pages([order_info(i) for i in range(1, 6)]))
+    server.route("GET", "/orders/full", pages([large_order(i) for i in range(100)]))
+
+    async def main():
+        async with AsyncClickAndDrop(API_KEY, host=server.host) as api:
+            orders = [
+                order.order_identifier
+                async for order in api.iter_orders(page_size=2, incremental=True)
+            ]
+            details = [
+                order.order_identifier
+                async for order in api.iter_orders_with_details(
+                    lightweight=True, incremental=True
+                )
+            ]
+            return orders, details
+
+    assert asyncio.run(main()) == (list(range(1, 6)), list(range(100)))
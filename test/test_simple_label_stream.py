@@ -0,0 +1,139 @@
+"""Labels are streamed to files, paths and sockets in chunks."""
+
+import asyncio
+import io
+import socket
+import threading
+
+import pytest
+
+from click_and_drop_api.exceptions import ApiException
+from click_and_drop_api.simple import AsyncClickAndDrop
+
+from .conftest import API_KEY
+
+PDF = b"%PDF-1.4\n" + bytes(range(256)) * 1000
+
+
+@pytest.fixture
+def label(server):
+    server.route("GET", "/orders/(.*)/label", body=PDF)
+
+
+def test_stream_to_file_object(api, server, label):
+    file = io.BytesIO()
+    assert api.get_label_to(
+        file, [1, 2], "postageLabel", False, chunk_size=1000
+    ) == len(PDF)
+    assert file.getvalue() == PDF
+    (request,) = server.requests
+    assert request.match.group(1) == "1;2"
+    assert request.query["documentType"] == "postageLabel"
+
+
+def test_stream_to_path(api, label, tmp_path):
+    path = tmp_path / "label.pdf"
+    api.get_label_to(path, 1, "despatchNote")
+    assert path.read_bytes() == PDF
+    api.get_label_to(str(path), 1, "despatchNote")
+    assert path.read_bytes() == PDF
+
+
+def test_stream_to_socket(api, label):
+    sender, receiver = socket.socketpair()
+    received = bytearray()
+
+    def receive():
+        with receiver:
+            while chunk := receiver.recv(65536):
+                received.extend(chunk)
+
+    thread = threading.Thread(target=receive)
+    thread.start()
+    with sender:
+        assert api.get_label_to(sender, 1, "CN22") == len(PDF)
+    thread.join(5)
+    assert bytes(received) == PDF
+
+
+def test_error_writes_nothing(api, server, tmp_path):
+    server.route(
+        "GET",
+        "/orders/(.*)/label",
+        status=404,
+        body={"code": "NotFound", "message": "no label"},
+    )
+    path = tmp_path / "label.pdf"
+    with pytest.raises(ApiException) as error:
+        api.get_label_to(path, 1, "CN22")
+    assert error.value.status == 404
+    assert not path.exists()
+
+
+def test_failed_write_removes_the_file(api, label, tmp_path, monkeypatch):
+    path = tmp_path / "label.pdf"
+
+    def stream(self, amount=None, decode_content=None):
+        yield b"%PDF"
+        raise ConnectionError()
+
+    monkeypatch.setattr("urllib3.response.HTTPResponse.stream", stream)
+    with pytest.raises(ConnectionError):
+        api.get_label_to(path, 1, "CN22")
+    assert not path.exists()
+
+
+def test_too_many_identifiers(api):
+    with pytest.raises(ValueError):
+        api.get_label_to(io.BytesIO(), list(range(101)), "CN22")
+
+
+def test_async_stream_to_file_object(server, label):
+    pytest.importorskip("aiohttp")
+    file = io.BytesIO()
+
+    async def main():
+        async with AsyncClickAndDrop(API_KEY, host=server.host) as api:
+            return await api.get_label_to(file, 1, "CN23", chunk_size=1000)
+
+    assert asyncio.run(main()) == len(PDF)
+    assert file.getvalue() == PDF
+
+
+def test_async_stream_to_stream_writer(server, label):
+    pytest.importorskip("aiohttp")
+
+    async def main():
+        received = asyncio.get_running_loop().create_future()
+
+        async def receive(reader, writer):
+            received.set_result(await reader.read())
+            writer.close()
+
+        listener = await asyncio.start_server(receive, "127.0.0.1", 0)
+        port = listener.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        async with AsyncClickAndDrop(API_KEY, host=server.host) as api:
+            written = await api.get_label_to(writer, 1, "CN23")
+        writer.close()
+        await writer.wait_closed()
+        data = await received
+        listener.close()
+        await listener.wait_closed()
+        return written, data
+
+    assert asyncio.run(main()) == (len(PDF), PDF)
+
+
+def test_async_error(server):
+    pytest.importorskip("aiohttp")
+    server.route("GET", "/orders/(.*)/label", status=404, body={"code": "NotFound"})
+    file = io.BytesIO()
+
+    async def main():
+        async with AsyncClickAndDrop(API_KEY, host=server.host) as api:
+            await api.get_label_to(file, 1, "CN23")
+
+    with pytest.raises(ApiException):
+        asyncio.run(main())
+    assert file.getvalue() == b""
@@ -0,0 +1,210 @@
+"""Sync the orders into a local store, requesting only what changed."""
+
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from click_and_drop_api import ManifestsApi
+from click_and_drop_api.emulator import Emulator
+from click_and_drop_api.models import GetOrderDetailsResource, GetOrdersDetailsResponse
+from click_and_drop_api.simple import ClickAndDrop, OrderStore, RetryPolicy
+from click_and_drop_api.simple.sync import sync_orders
+
+from .conftest import API_KEY, new_order, order_details
+from .test_emulator import START, Clock, postage_order
+
+END = START + timedelta(days=1)
+
+
+@pytest.fixture
+def emulator():
+    return Emulator(clock=Clock())
+
+
+@pytest.fixture
+def api(emulator):
+    return ClickAndDrop(
+        API_KEY, transport=emulator.transport, retry_policy=RetryPolicy(total=0)
+    )
+
+
+@pytest.fixture
+def store():
+    store = OrderStore()
+    yield store
+    store.close()
+
+
+@pytest.fixture
+def local_time_zone(monkeypatch):
+    """A local time zone five hours behind UTC."""
+    if not hasattr(time, "tzset"):
+        pytest.skip("The local time zone cannot be changed.")
+    monkeypatch.setenv("TZ", "EST+05")
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
+
+
+def changes(events) -> list[tuple[str, str]]:
+    return [(event.kind, event.order.order_reference) for event in events]
+
+
+def test_first_sync_inserts_all_orders(api, store):
+    api.create_orders([new_order(f"ref-{i}") for i in range(5)])
+    events = list(api.sync_orders(store, end=END))
+    assert changes(events) == [("insert", f"ref-{i}") for i in range(5)]
+    assert {type(event.order) for event in events} == {GetOrderDetailsResource}
+    assert len(store) == 5
+    assert store.get(1001).order_reference == "ref-0"
+    checkpoint = store.checkpoint
+    assert checkpoint.created_on == events[0].order.created_on
+    assert checkpoint.printed_on is None
+    assert checkpoint.end is checkpoint.continuation_token is None
+
+
+def test_unchanged_orders_have_no_events(api, store):
+    api.create_orders([new_order(f"ref-{i}") for i in range(5)])
+    list(api.sync_orders(store, end=END))
+    assert list(api.sync_orders(store, end=END + timedelta(hours=1))) == []
+
+
+def test_only_new_orders_are_listed(api, emulator, store):
+    # 100 orders are created per request, one minute apart
+    for batch in range(0, 250, 100):
+        api.create_orders(
+            [new_order(f"ref-{i}") for i in range(batch, min(batch + 100, 250))]
+        )
+    options = {"overlap": timedelta(0), "track_for": timedelta(0)}
+    list(api.sync_orders(store, end=END, **options))
+    api.create_order(new_order("new"))
+    requests = emulator.requests
+    events = list(api.sync_orders(store, end=END + timedelta(hours=1), **options))
+    assert changes(events) == [("insert", "new")]
+    # the last 50 orders and the new one
+    assert emulator.requests - requests == 1
+
+
+def test_updated_orders(api, store):
+    api.create_orders([postage_order("a"), postage_order("b")])
+    list(api.sync_orders(store, end=END))
+    api.get_label("a", "postageLabel", include_returns_label=False)
+    events = list(api.sync_orders(store, end=END + timedelta(hours=1)))
+    assert changes(events) == [("update", "a")]
+    assert events[0].order.printed_on is not None
+    assert store.get(events[0].order.order_identifier) == events[0].order
+    assert store.checkpoint.printed_on == events[0].order.printed_on
+
+
+def test_deleted_orders(api, store):
+    api.create_orders([new_order("a"), new_order("b")])
+    list(api.sync_orders(store, end=END))
+    api.delete_orders(["a"])
+    (event,) = api.sync_orders(store, end=END + timedelta(hours=1))
+    assert (event.kind, event.order.order_reference) == ("delete", "a")
+    assert store.get(event.order.order_identifier) is None
+    assert len(store) == 1
+
+
+def test_manifested_orders_are_not_requested_again(api, emulator, store):
+    api.create_orders([postage_order("a"), postage_order("b")])
+    api.get_label(["a"], "postageLabel", include_returns_label=False)
+    ManifestsApi(api._api_client).manifest_eligible_async()
+    list(api.sync_orders(store, end=END))
+    api.delete_orders(["a", "b"])
+    events = list(api.sync_orders(store, end=END + timedelta(hours=1)))
+    assert changes(events) == [("delete", "b")]
+
+
+def test_old_orders_are_not_requested_again(api, store):
+    api.create_orders([new_order("a")])
+    list(api.sync_orders(store, end=END))
+    api.delete_orders(["a"])
+    assert list(api.sync_orders(store, end=END + timedelta(days=31))) == []
+
+
+def test_interrupted_sync_resumes(api, emulator, store):
+    api.create_orders([new_order(f"ref-{i}") for i in range(5)])
+    events = api.sync_orders(store, end=END, page_size=2)
+    assert changes(next(events) for _ in range(3)) == [
+        ("insert", "ref-0"),
+        ("insert", "ref-1"),
+        ("insert", "ref-2"),
+    ]
+    events.close()
+    checkpoint = store.checkpoint
+    assert checkpoint.end == END
+    assert checkpoint.continuation_token
+    assert len(store) == 2
+    # the page of ref-2 was not stored
+    events = list(api.sync_orders(store, end=END + timedelta(hours=1), page_size=2))
+    assert changes(events) == [("insert", f"ref-{i}") for i in range(2, 5)]
+    assert store.checkpoint.end is None
+
+
+def test_store_survives_restarts(api, tmp_path):
+    path = str(tmp_path / "orders.db")
+    api.create_orders([new_order("a")])
+    store = OrderStore(path)
+    list(api.sync_orders(store, end=END))
+    store.close()
+    store = OrderStore(path)
+    try:
+        assert len(store) == 1
+        assert list(api.sync_orders(store, end=END + timedelta(hours=1))) == []
+    finally:
+        store.close()
+
+
+def test_window_starts_before_the_newest_order(store):
+    windows = []
+    created_on = datetime(2026, 1, 1, 12, tzinfo=timezone.utc)
+
+    def get_page(start, end, continuation_token):
+        windows.append((start, end, continuation_token))
+        return GetOrdersDetailsResponse.from_dict({"orders": [order_details(1)]})
+
+    def sync(end):
+        return list(
+            sync_orders(
+                store,
+                get_page,
+                get_orders=lambda identifiers: [],
+                start=None,
+                end=end,
+                overlap=timedelta(minutes=10),
+                track_for=timedelta(days=1),
+            )
+        )
+
+    assert changes(sync(END)) == [("insert", "ref-1")]
+    assert sync(END + timedelta(hours=1)) == []
+    assert windows == [
+        (None, END, None),
+        (created_on - timedelta(minutes=10), END + timedelta(hours=1), None),
+    ]
+
+
+def test_clear(api, store):
+    api.create_orders([new_order("a")])
+    list(api.sync_orders(store, end=END))
+    store.clear()
+    assert len(store) == 0
+    assert store.checkpoint.created_on is None
+    assert changes(api.sync_orders(store, end=END)) == [("insert", "a")]
+
+
+def test_naive_datetimes_are_in_utc(api, store, local_time_zone):
+    api.create_orders([new_order("a"), new_order("b")])
+    events = api.sync_orders(store, end=END.replace(tzinfo=None), page_size=1)
+    next(events)
+    events.close()
+    assert store.checkpoint.end == END
+    end = (END + timedelta(hours=1)).replace(tzinfo=None)
+    assert changes(api.sync_orders(store, end=end)) == [
+        ("insert", "a"),
+        ("insert", "b"),
+    ]
+    assert list(api.sync_orders(store, end=end)) == []
@@ -0,0 +1,155 @@
+"""Read orders as views that validate their fields on access."""
+
+import asyncio
+import pickle
+from datetime import datetime, timezone
+
+import pytest
+from pydantic import ValidationError
+
+from click_and_drop_api.exceptions import BadRequestException
+from click_and_drop_api.models import GetOrderDetailsResource, GetOrderInfoResource
+from click_and_drop_api.simple import AsyncClickAndDrop
+from click_and_drop_api.simple.views import (
+    OrderDetailsView,
+    OrderInfoView,
+    OrderLineView,
+    PostalDetailsView,
+    view_type,
+)
+
+from .conftest import API_KEY, order_details, order_info, pages
+
+
+def test_fields_have_the_types_of_the_model():
+    order = OrderDetailsView(order_details(1))
+    assert order.order_identifier == 1
+    assert order.created_on == datetime(2026, 1, 1, 12, tzinfo=timezone.utc)
+    assert order.order_status is None
+    assert isinstance(order.shipping_info, PostalDetailsView)
+    assert order.shipping_info.country_code == "GB"
+    assert [type(line) for line in order.order_lines] == [OrderLineView]
+    assert order.order_lines[0].quantity == 1
+    assert order.tags is None
+
+
+def test_same_values_as_the_model():
+    data = order_details(1)
+    data["tags"] = [{"key": "a", "value": "b"}]
+    model = GetOrderDetailsResource.from_dict(data)
+    view = OrderDetailsView(data)
+    for name in GetOrderDetailsResource.model_fields:
+        value = getattr(view, name)
+        if isinstance(value, list):
+            value = [item.to_model() for item in value]
+        elif hasattr(value, "to_model"):
+            value = value.to_model()
+        assert value == getattr(model, name), name
+    assert view.to_model() == model
+
+
+def test_invalid_field_raises_on_access():
+    order = OrderInfoView({"orderIdentifier": "1", "createdOn": "yesterday"})
+    assert order.order_reference is None
+    with pytest.raises(ValidationError) as error:
+        _ = order.order_identifier
+    assert error.value.errors()[0]["loc"] == ("orderIdentifier",)
+    with pytest.raises(ValidationError):
+        _ = order.created_on
+
+
+def test_missing_required_field():
+    order = OrderDetailsView({"orderIdentifier": 1})
+    assert order.order_identifier == 1
+    with pytest.raises(ValidationError):
+        _ = order.shipping_info
+    with pytest.raises(ValidationError):
+        order.to_model()
+
+
+def test_fields_are_validated_once():
+    order = OrderDetailsView(order_details(1))
+    assert order.shipping_info is order.shipping_info
+    assert order.order_lines is order.order_lines
+
+
+def test_read_only():
+    order = OrderInfoView(order_info(1))
+    with pytest.raises(AttributeError):
+        order.order_identifier = 2
+    with pytest.raises(AttributeError):
+        del order.order_identifier
+    with pytest.raises(AttributeError):
+        _ = order.unknown
+    assert not hasattr(order, "__dict__")
+
+
+def test_not_a_json_object():
+    with pytest.raises(TypeError):
+        OrderInfoView([order_info(1)])
+
+
+def test_equality_and_pickle():
+    order = OrderInfoView(order_info(1))
+    assert order == OrderInfoView(order_info(1))
+    assert order != OrderInfoView(order_info(2))
+    assert pickle.loads(pickle.dumps(order)) == order
+    assert order.to_dict() == order_info(1)
+    assert "order_reference" in dir(order)
+
+
+def test_view_type():
+    assert view_type(GetOrderInfoResource) is OrderInfoView
+    assert view_type(GetOrderDetailsResource) is OrderDetailsView
+
+
+def test_iter_orders(api, server):
+    server.route("GET", "/orders", pages([order_info(i) for i in range(1, 251)]))
+    orders = list(api.iter_orders(page_size=100, lightweight=True))
+    assert {type(order) for order in orders} == {OrderInfoView}
+    assert [order.order_identifier for order in orders] == list(range(1, 251))
+    assert len(server.requests) == 3
+
+
+def test_iter_orders_with_details(api, server):
+    server.route("GET", "/orders/full", pages([order_details(i) for i in range(1, 8)]))
+    orders = api.iter_orders_with_details(page_size=3, prefetch=True, lightweight=True)
+    assert [order.order_lines[0].quantity for order in orders] == [1] * 7
+
+
+def test_export_orders_with_details(api, server):
+    server.route("GET", "/orders/full", body={"orders": [order_details(1)]})
+    start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    (order,) = api.export_orders_with_details(
+        start, start.replace(month=2), windows=1, lightweight=True
+    )
+    assert isinstance(order, OrderDetailsView)
+
+
+def test_error_is_raised(api, server):
+    server.route("GET", "/orders", status=400, body={"code": "Bad", "message": "no"})
+    with pytest.raises(BadRequestException):
+        list(api.iter_orders(lightweight=True))
+
+
+def test_async_iterate(server):
+    pytest.importorskip("aiohttp")
+    server.route("GET", "/orders", pages([order_info(i) for i in range(1, 6)]))
+    server.route("GET", "/orders/full", pages([order_details(i) for i in range(1, 6)]))
+
+    async def main():
+        async with AsyncClickAndDrop(API_KEY, host=server.host) as api:
+            orders = [
+                order async for order in api.iter_orders(page_size=2, lightweight=True)
+            ]
+            details = [
+                order
+                async for order in api.iter_orders_with_details(
+                    page_size=2, lightweight=True
+                )
+            ]
+            return orders, details
+
+    orders, details = asyncio.run(main())
+    assert [order.order_identifier for order in orders] == list(range(1, 6))
+    assert [order.shipping_info.city for order in details] == ["London"] * 5
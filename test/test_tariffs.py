@@ -0,0 +1,166 @@
+from datetime import date
+from decimal import Decimal as D
+
+import pytest
+
+from click_and_drop_api.simple import ShippingQuoter, get_package_size
+from click_and_drop_api.simple.shipping_options import (
+    TARIFFS,
+    ShippingCatalogue,
+    ShippingOption,
+    Tariff,
+    get_tariff,
+    list_tariffs,
+    shipping_catalogue,
+    shipping_options,
+)
+
+from .test_lazy_imports import run
+
+HEADER = "brand,service,service_code,delivery_speed,compensation,gross,compensation_currency,enhancement,tax\n"
+
+
+def write_tariff(path, gross, compensation="20"):
+    path.write_text(
+        HEADER
+        + f"Royal Mail,Royal Mail 2nd Class (£{compensation} compensation),OLP2,48 hour (2 working days),{compensation}.00,{gross},GBP,,0.00\n",
+        encoding="utf-8",
+    )
+
+
+@pytest.fixture
+def tariffs(tmp_path):
+    """A directory with this and next season's prices."""
+    write_tariff(tmp_path / "2025-04-07.csv", "0.87")
+    write_tariff(tmp_path / "2026-04-06.csv", "0.91")
+    (tmp_path / "README.md").write_text("not a tariff")
+    return tmp_path
+
+
+def test_the_shipped_tariff_is_loaded():
+    assert date(2025, 4, 7) in list_tariffs()
+    tariff = get_tariff(date(2025, 4, 7), TARIFFS)
+    assert tariff.effective == date(2025, 4, 7)
+    assert ShippingOption.with_code("OLP1") in tariff.options
+    assert {option.service_code for option in tariff.options} == set(shipping_options)
+
+
+def test_all_compensation_tiers_are_kept():
+    tariff = get_tariff(date(2025, 4, 7))
+    tiers = [option for option in tariff.options if option.service_code == "PFE24"]
+    assert [option.compensation for option in tiers] == [
+        D("150.00"),
+        D("750.00"),
+        D("1000.00"),
+        D("2500.00"),
+    ]
+
+
+def test_list_tariffs(tariffs):
+    assert list_tariffs(tariffs) == [date(2025, 4, 7), date(2026, 4, 6)]
+
+
+@pytest.mark.parametrize(
+    ("on", "gross"),
+    [
+        (date(2025, 4, 7), D("0.87")),
+        (date(2026, 4, 5), D("0.87")),
+        (date(2026, 4, 6), D("0.91")),
+        (date(2030, 1, 1), D("0.91")),
+    ],
+)
+def test_get_the_effective_tariff(tariffs, on, gross):
+    tariff = get_tariff(on, str(tariffs))
+    assert [option.gross for option in tariff.options] == [gross]
+
+
+def test_no_tariff_is_effective(tariffs):
+    with pytest.raises(ValueError, match="No tariff is effective on 2025-04-06."):
+        get_tariff(date(2025, 4, 6), tariffs)
+
+
+def test_load_a_file_with_any_name(tmp_path):
+    path = tmp_path / "next-season.csv"
+    write_tariff(path, "0.95")
+    tariff = Tariff.from_csv(path, date(2027, 4, 1))
+    assert tariff.effective == date(2027, 4, 1)
+    assert tariff.options[0].gross == D("0.95")
+    with pytest.raises(ValueError):
+        Tariff.from_csv(path)
+
+
+def test_apply_a_tariff(tariffs, restore_shipping_options):
+    get_tariff(date(2026, 4, 6), tariffs).apply()
+    assert ShippingOption.with_code("OLP2").gross == D("0.91")
+    assert get_package_size("letter").get_shipping_option("OLP2").gross == D("0.91")
+    assert ShippingOption.with_code("OLP1").gross == D("1.70")
+
+
+def test_apply_a_tariff_with_other_tiers(tmp_path, restore_shipping_options):
+    path = tmp_path / "2026-04-06.csv"
+    write_tariff(path, "0.91", compensation="25")
+    (option,) = Tariff.from_csv(path).options
+    get_tariff(date(2025, 4, 7), TARIFFS).apply()
+    Tariff.from_csv(path).apply()
+    assert shipping_catalogue.tiers("OLP2") == [option]
+    assert shipping_catalogue.base("OLP2") == option
+    assert ShippingOption.with_code("OLP2") == option
+    assert get_package_size("letter").get_shipping_option("OLP2") == option
+    (quote,) = ShippingQuoter().cheapest([50], service_codes=["OLP2"])
+    assert quote.shipping_option == option
+    assert quote.gross == D("0.91")
+
+
+def test_replace_the_tiers_of_a_service_code():
+    options = get_tariff(date(2025, 4, 7)).options
+    catalogue = ShippingCatalogue(options)
+    tiers = catalogue.tiers("PFE24")
+    catalogue.replace("PFE24", tiers[2:0:-1])
+    assert catalogue.tiers("PFE24") == tiers[1:3]
+    assert tiers[0] not in catalogue
+    assert catalogue.cover("PFE24", D(100)) == tiers[1]
+    catalogue.replace("PFE24", [])
+    assert "PFE24" not in catalogue.service_codes()
+    assert len(catalogue) == len(options) - len(tiers)
+    with pytest.raises(ValueError):
+        catalogue.replace("OLP2", tiers)
+
+
+def shipping_options_module(tariffs) -> str:
+    """The code that imports the module with the tariffs in a new interpreter."""
+    return (
+        "import sys\n"
+        "import click_and_drop_api.simple.shipping_options\n"
+        "module = sys.modules['click_and_drop_api.simple.shipping_options']\n"
+        f"module.TARIFFS = {str(tariffs)!r}\n"
+    )
+
+
+def test_the_tariff_is_loaded_on_first_access(tariffs):
+    output = run(
+        shipping_options_module(tariffs)
+        + "print(module._tariff_loaded, module.shipping_options['OLP2'].gross)"
+    )
+    assert output == f"False {get_tariff(None, tariffs).options[0].gross}"
+
+
+def test_no_tariff_is_effective_on_first_access(tmp_path):
+    output = run(
+        shipping_options_module(tmp_path) + "try:\n"
+        "    module.shipping_options['OLP2']\n"
+        "except ValueError as error:\n"
+        "    print(error)"
+    )
+    assert output == (
+        f"No tariff is effective on {date.today()}."
+        " Apply a tariff with Tariff.apply() to use the shipping options."
+    )
+
+
+def test_apply_a_tariff_before_first_access(tmp_path, tariffs):
+    output = run(
+        shipping_options_module(tmp_path)
+        + f"module.get_tariff(None, {str(tariffs)!r}).apply()\n"
+        "print(list(module.shipping_options), module.medium_parcel_force_codes)"
+    )
+    assert output == "['OLP2'] []"